@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.e2e_benchmark import (
+    BenchmarkResult,
+    BenchmarkSettings,
+    EndToEndBenchmark,
+    MetricComparison,
+    compare_results,
+)
+from benchmarks.micro_benchmark import (
+    DEFAULT_STEPS,
+    DEFAULT_TICKETS,
+    MicroBenchmark,
+    MicroBenchmarkResult,
+    exponent_regressions,
+    run_micro_benchmark,
+)
+from benchmarks.scaling_plot import render_scaling_svg
+
+app = typer.Typer(add_completion=False, help="Throughput benchmarks of Open Ticket AI pipelines.")
+console = Console()
+
+DEFAULT_CONFIG = Path("deployment/config.yml")
+DEFAULT_RESULTS_DIR = Path("benchmarks/results")
+
+
+@app.command()
+def run(
+    config: Annotated[
+        Path, typer.Argument(help="Config whose orchestrator pipelines are benchmarked.")
+    ] = DEFAULT_CONFIG,
+    tickets: Annotated[int, typer.Option(help="Tickets each fake ticket system starts with.")] = 200,
+    latency_ms: Annotated[float, typer.Option(help="Mean latency of every ticket system call.")] = 20.0,
+    jitter_ms: Annotated[float, typer.Option(help="Maximum deviation from the latency.")] = 5.0,
+    inference_ms: Annotated[float, typer.Option(help="CPU time spent per classification.")] = 50.0,
+    body_size: Annotated[int, typer.Option(help="Ticket body length in characters.")] = 500,
+    max_cycles: Annotated[int | None, typer.Option(help="Stop after this many cycles.")] = None,
+    name: Annotated[str, typer.Option(help="Label stored with the result; defaults to the config file name.")] = "",
+    output: Annotated[Path | None, typer.Option("--output", "-o", help="Where to write the JSON result.")] = None,
+    baseline: Annotated[Path | None, typer.Option(help="Compare against this result and fail on regressions.")] = None,
+    tolerance: Annotated[float, typer.Option(help="Relative worsening tolerated before a metric regresses.")] = 0.1,
+) -> None:
+    """Run the pipelines of CONFIG against stand-in services and report throughput and latency."""
+    settings = BenchmarkSettings(
+        tickets=tickets,
+        latency=timedelta(milliseconds=latency_ms),
+        jitter=timedelta(milliseconds=jitter_ms),
+        inference_time=timedelta(milliseconds=inference_ms),
+        body_size=body_size,
+        max_cycles=max_cycles,
+    )
+    result = asyncio.run(EndToEndBenchmark(config, settings, name=name).run())
+    _print_result(result)
+    output = output or DEFAULT_RESULTS_DIR / f"{result.name}-{result.created_at:%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(result.model_dump_json(indent=2))
+    console.print(f"Result written to {output}")
+    if baseline is not None:
+        _compare(_load(baseline), result, tolerance)
+
+
+@app.command()
+def compare(
+    baseline: Annotated[Path, typer.Argument(help="Result of the reference run.")],
+    current: Annotated[Path, typer.Argument(help="Result of the run to check.")],
+    tolerance: Annotated[float, typer.Option(help="Relative worsening tolerated before a metric regresses.")] = 0.1,
+) -> None:
+    """Compare two results; exits with status 1 if a metric got worse by more than the tolerance."""
+    _compare(_load(baseline), _load(current), tolerance)
+
+
+@app.command()
+def micro(
+    steps: Annotated[str, typer.Option(help="Comma-separated pipeline lengths to sweep.")] = ",".join(
+        map(str, DEFAULT_STEPS)
+    ),
+    tickets: Annotated[str, typer.Option(help="Comma-separated payload sizes (tickets) to sweep.")] = ",".join(
+        map(str, DEFAULT_TICKETS)
+    ),
+    operation: Annotated[list[str] | None, typer.Option(help="Only measure these operations.")] = None,
+    min_time: Annotated[float, typer.Option(help="Seconds each operation runs per repeat and size.")] = 0.05,
+    output: Annotated[Path | None, typer.Option("--output", "-o", help="Where to write the JSON result.")] = None,
+    plot: Annotated[Path | None, typer.Option(help="Where to write the SVG scaling curves.")] = None,
+    baseline: Annotated[
+        Path | None, typer.Option(help="Fail if a time exponent grew by more than the tolerance against this result.")
+    ] = None,
+    tolerance: Annotated[float, typer.Option(help="Tolerated growth of a time exponent.")] = 0.3,
+) -> None:
+    """Sweep pipeline length and payload size and measure time and allocations of core operations."""
+    benchmark = MicroBenchmark(steps=_sizes(steps), tickets=_sizes(tickets), min_time=min_time)
+    result = run_micro_benchmark(benchmark, operation or ())
+    _print_micro_result(result)
+    stamp = f"{result.created_at:%Y%m%d-%H%M%S}"
+    output = output or DEFAULT_RESULTS_DIR / f"micro-{stamp}.json"
+    plot = plot or output.with_suffix(".svg")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(result.model_dump_json(indent=2))
+    plot.write_text(render_scaling_svg(result))
+    console.print(f"Result written to {output}, scaling curves to {plot}")
+    if baseline is not None:
+        regressions = exponent_regressions(
+            MicroBenchmarkResult.model_validate_json(baseline.read_text()), result, tolerance
+        )
+        for regression in regressions:
+            console.print(f"[red]Scaling regression: {regression}[/red]")
+        if regressions:
+            raise typer.Exit(code=1)
+
+
+def _sizes(value: str) -> list[int]:
+    return [int(size) for size in value.split(",") if size.strip()]
+
+
+def _load(path: Path) -> BenchmarkResult:
+    return BenchmarkResult.model_validate_json(path.read_text())
+
+
+def _compare(baseline: BenchmarkResult, current: BenchmarkResult, tolerance: float) -> None:
+    if baseline.settings != current.settings:
+        console.print("[yellow]The runs used different settings; the comparison may be meaningless.[/yellow]")
+    comparisons = compare_results(baseline, current, tolerance)
+    _print_comparisons(baseline, current, comparisons)
+    if any(comparison.regressed for comparison in comparisons):
+        raise typer.Exit(code=1)
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    table = Table(title=f"Benchmark {result.name}")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("Tickets processed", str(result.tickets_processed))
+    table.add_row("Cycles", str(result.cycles))
+    table.add_row("Tickets/s", f"{result.tickets_per_second:.2f}")
+    for percentile in ("p50", "p95", "p99"):
+        table.add_row(f"Latency {percentile} ms", f"{getattr(result.latency_seconds, percentile) * 1000:.1f}")
+    table.add_row("Wall s", f"{result.wall_seconds:.2f}")
+    table.add_row("CPU s", f"{result.cpu_seconds:.2f}")
+    table.add_row("Peak RSS MiB", f"{result.peak_rss_bytes / 1024 / 1024:.0f}")
+    console.print(table)
+
+
+def _print_micro_result(result: MicroBenchmarkResult) -> None:
+    table = Table(title="Scaling of core operations")
+    table.add_column("Operation")
+    table.add_column("Dimension")
+    table.add_column("Sizes", justify="right")
+    table.add_column("µs per call", justify="right")
+    table.add_column("KiB allocated", justify="right")
+    table.add_column("Exponent", justify="right")
+    for operation in result.operations():
+        for dimension, exponent in result.exponents[operation].items():
+            series = result.series(operation, dimension)
+            table.add_row(
+                operation,
+                dimension,
+                " ".join(str(point.size) for point in series),
+                " ".join(f"{point.seconds_per_call * 1e6:.0f}" for point in series),
+                " ".join(f"{point.allocated_bytes / 1024:.0f}" for point in series),
+                f"{exponent:.2f}",
+            )
+    console.print(table)
+
+
+def _print_comparisons(
+    baseline: BenchmarkResult, current: BenchmarkResult, comparisons: list[MetricComparison]
+) -> None:
+    table = Table(title=f"{baseline.name} → {current.name}")
+    table.add_column("Metric")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    for comparison in comparisons:
+        change = f"{comparison.change:+.1%}"
+        table.add_row(
+            comparison.metric,
+            f"{comparison.baseline:.4g}",
+            f"{comparison.current:.4g}",
+            f"[red]{change}[/red]" if comparison.regressed else change,
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
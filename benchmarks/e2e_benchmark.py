@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import math
+import platform
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Literal, cast
+
+import yaml
+from injector import Injector
+from pydantic import Field
+
+from benchmarks.stand_ins import FAKE_TICKET_SYSTEM, STAND_INS, STUB_CLASSIFIER, FakeTicketSystemService
+from open_ticket_ai.core.base_model import StrictBaseModel
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.config_diff import pipe_tree
+from open_ticket_ai.core.config.config_models import OpenTicketAIConfig
+from open_ticket_ai.core.dependency_injection.container import AppModule
+from open_ticket_ai.core.logging.logging_iface import LoggerFactory
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig
+from open_ticket_ai.core.profiling.startup_profiler import peak_rss_bytes
+
+# Services injected under these pipe parameter names are replaced by stand-ins.
+_TICKET_SYSTEM_PARAM = "ticket_system"
+_CLASSIFIER_PARAM = "classification_service"
+
+
+class BenchmarkSettings(StrictBaseModel):
+    tickets: int = Field(default=200, gt=0, description="Tickets each fake ticket system starts with.")
+    latency: timedelta = Field(default=timedelta(milliseconds=20), description="Mean ticket system call latency.")
+    jitter: timedelta = Field(default=timedelta(milliseconds=5), description="Maximum deviation from the latency.")
+    inference_time: timedelta = Field(default=timedelta(milliseconds=50), description="CPU time per classification.")
+    body_size: int = Field(default=500, ge=0, description="Ticket body length in characters.")
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
+        default="WARNING", description="Overrides the configured log level so console output does not dominate."
+    )
+    max_cycles: int | None = Field(
+        default=None, gt=0, description="Stop after this many cycles; by default once a cycle writes nothing."
+    )
+    seed: int = Field(default=0, description="Seed of the latency jitter.")
+
+
+class LatencySummary(StrictBaseModel):
+    p50: float
+    p95: float
+    p99: float
+    mean: float
+    max: float
+
+    @classmethod
+    def of(cls, latencies: list[float]) -> LatencySummary:
+        if not latencies:
+            return cls(p50=0.0, p95=0.0, p99=0.0, mean=0.0, max=0.0)
+        ordered = sorted(latencies)
+        return cls(
+            p50=_percentile(ordered, 50),
+            p95=_percentile(ordered, 95),
+            p99=_percentile(ordered, 99),
+            mean=sum(ordered) / len(ordered),
+            max=ordered[-1],
+        )
+
+
+class BenchmarkResult(StrictBaseModel):
+    name: str = Field(description="Label of the run, e.g. the branch or commit measured.")
+    config: str = Field(description="Configuration file the pipelines were taken from.")
+    created_at: datetime
+    python: str
+    settings: BenchmarkSettings
+    cycles: int = Field(description="Cycles run, each processing every pipeline once.")
+    tickets_processed: int = Field(description="Tickets written to at least once.")
+    wall_seconds: float = Field(description="Wall clock time until the last cycle that processed a ticket.")
+    cpu_seconds: float = Field(description="Process CPU time over the same span.")
+    tickets_per_second: float
+    latency_seconds: LatencySummary = Field(description="Time from a ticket's first fetch to its last write.")
+    peak_rss_bytes: int = Field(description="Peak resident set size of the whole benchmark process.")
+
+
+class MetricComparison(StrictBaseModel):
+    metric: str
+    baseline: float
+    current: float
+    change: float = Field(description="Relative change, positive when the current run is better.")
+    regressed: bool
+
+
+# Metric path in BenchmarkResult and whether higher values are better.
+COMPARED_METRICS: dict[str, bool] = {
+    "tickets_per_second": True,
+    "latency_seconds.p50": False,
+    "latency_seconds.p95": False,
+    "latency_seconds.p99": False,
+    "cpu_seconds": False,
+    "peak_rss_bytes": False,
+}
+
+
+def load_benchmark_config(path: Path) -> OpenTicketAIConfig:
+    """Read the ``open_ticket_ai`` section of a config file, without env or dotenv overrides."""
+    raw: dict[str, Any] = yaml.safe_load(path.read_text()) or {}
+    section = next((raw[key] for key in ("open_ticket_ai", "otai", "cfg") if key in raw), {})
+    return OpenTicketAIConfig.model_validate(section)
+
+
+def with_stand_ins(config: OpenTicketAIConfig, settings: BenchmarkSettings) -> OpenTicketAIConfig:
+    """Replace every service injected as ticket system or classification service by a stand-in.
+
+    Services that inject a ticket system themselves, such as caches, are kept and their inner
+    service is replaced. The fake ticket systems are seeded in the queues the fetch pipes search.
+    """
+    pipes = pipe_tree(config)
+    injects = [*(pipe.injects for pipe in pipes), *(service.injects for service in config.services.values())]
+    services = dict(config.services)
+    for param_name, service_id in (item for injected in injects for item in injected.items()):
+        service = services.get(service_id)
+        if service is None or _TICKET_SYSTEM_PARAM in service.injects:
+            continue
+        if param_name == _TICKET_SYSTEM_PARAM:
+            params = {
+                "tickets": settings.tickets,
+                "queues": _searched_queues(pipes),
+                "body_size": settings.body_size,
+                "latency": settings.latency,
+                "jitter": settings.jitter,
+                "seed": settings.seed,
+            }
+            services[service_id] = service.model_copy(
+                update={"use": FAKE_TICKET_SYSTEM, "injects": {}, "params": params}
+            )
+        elif param_name == _CLASSIFIER_PARAM:
+            params = {"inference_time": settings.inference_time}
+            services[service_id] = service.model_copy(update={"use": STUB_CLASSIFIER, "injects": {}, "params": params})
+    logging_config = config.infrastructure.logging.model_copy(update={"level": settings.log_level})
+    infrastructure = config.infrastructure.model_copy(update={"logging": logging_config})
+    return config.model_copy(update={"services": services, "infrastructure": infrastructure})
+
+
+def benchmarked_pipes(config: OpenTicketAIConfig) -> list[PipeConfig]:
+    """The pipes the orchestrator runs per cycle; runner triggers are skipped so cycles run back to back."""
+    steps = [PipeConfig.model_validate(step) for step in config.orchestrator.params.get("steps", [])]
+    return [PipeConfig.model_validate(step.params["run"]) if "run" in step.params else step for step in steps]
+
+
+def _searched_queues(pipes: list[PipeConfig]) -> list[str]:
+    queues: dict[str, None] = {}
+    for pipe in pipes:
+        queue = (pipe.params.get("ticket_search_criteria") or {}).get("queue") or {}
+        if isinstance(queue.get("name"), str):
+            queues[queue["name"]] = None
+    return list(queues) or ["OpenTicketAI::Incoming"]
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    # Nearest-rank percentile of an already sorted list.
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+class EndToEndBenchmark:
+    """Runs the pipelines of a configuration against stand-in services until the tickets are processed.
+
+    Services and pipes the first cycle would build are built before measuring, so the result
+    reflects steady-state throughput rather than startup.
+    """
+
+    def __init__(self, config_path: Path, settings: BenchmarkSettings, name: str = "") -> None:
+        self._config_path = config_path
+        self._settings = settings
+        self._name = name or f"{config_path.parent.name}-{config_path.stem}".strip("-")
+
+    async def run(self) -> BenchmarkResult:
+        config = with_stand_ins(load_benchmark_config(self._config_path), self._settings)
+        injector = Injector([AppModule(AppConfig(open_ticket_ai=config), extra_components=STAND_INS)])
+        pipe_factory = injector.get(PipeFactory)
+        try:
+            return await self._measure(config, pipe_factory)
+        finally:
+            await pipe_factory.aclose()
+            injector.get(LoggerFactory).shutdown()
+
+    async def _measure(self, config: OpenTicketAIConfig, pipe_factory: PipeFactory) -> BenchmarkResult:
+        context = PipeContext.empty()
+        pipes = [await pipe_factory.create_pipe(pipe_config, context) for pipe_config in benchmarked_pipes(config)]
+        ticket_systems: list[FakeTicketSystemService] = []
+        for service_id, service_config in config.services.items():
+            if service_config.use == FAKE_TICKET_SYSTEM:
+                ticket_systems.append(cast(FakeTicketSystemService, await pipe_factory.get_service(service_id)))
+
+        started, cpu_started = time.perf_counter(), time.process_time()
+        finished, cpu_finished = started, cpu_started
+        cycles = 0
+        while self._settings.max_cycles is None or cycles < self._settings.max_cycles:
+            writes = sum(service.timings.writes for service in ticket_systems)
+            for pipe in pipes:
+                await pipe.process(context)
+            cycles += 1
+            if sum(service.timings.writes for service in ticket_systems) == writes:
+                break
+            finished, cpu_finished = time.perf_counter(), time.process_time()
+
+        latencies = [latency for service in ticket_systems for latency in service.timings.latencies()]
+        wall_seconds = finished - started
+        return BenchmarkResult(
+            name=self._name,
+            config=str(self._config_path),
+            created_at=datetime.now(UTC),
+            python=platform.python_version(),
+            settings=self._settings,
+            cycles=cycles,
+            tickets_processed=len(latencies),
+            wall_seconds=wall_seconds,
+            cpu_seconds=cpu_finished - cpu_started,
+            tickets_per_second=len(latencies) / wall_seconds if wall_seconds else 0.0,
+            latency_seconds=LatencySummary.of(latencies),
+            peak_rss_bytes=peak_rss_bytes(),
+        )
+
+
+def compare_results(
+    baseline: BenchmarkResult, current: BenchmarkResult, tolerance: float = 0.1
+) -> list[MetricComparison]:
+    """Compare the headline metrics; a metric regressed when it got worse by more than ``tolerance``."""
+    comparisons: list[MetricComparison] = []
+    baseline_values, current_values = baseline.model_dump(), current.model_dump()
+    for metric, higher_is_better in COMPARED_METRICS.items():
+        old, new = float(_lookup(baseline_values, metric)), float(_lookup(current_values, metric))
+        difference = new - old if higher_is_better else old - new
+        change = difference / old if old else 0.0
+        comparisons.append(
+            MetricComparison(metric=metric, baseline=old, current=new, change=change, regressed=change < -tolerance)
+        )
+    return comparisons
+
+
+def _lookup(values: dict[str, Any], path: str) -> Any:
+    for key in path.split("."):
+        values = values[key]
+    return values
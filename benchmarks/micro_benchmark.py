@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import math
+import platform
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from injector import Injector
+from pydantic import Field
+
+from open_ticket_ai.core._util.hashes import freeze
+from open_ticket_ai.core.base_model import StrictBaseModel
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.config_models import InfrastructureConfig, OpenTicketAIConfig
+from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
+from open_ticket_ai.core.dependency_injection.container import AppModule
+from open_ticket_ai.core.injectables.injectable_models import InjectableConfigBase
+from open_ticket_ai.core.logging.logging_iface import LoggerFactory
+from open_ticket_ai.core.logging.logging_models import LoggingConfig
+from open_ticket_ai.core.pipes.pipe import Pipe
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig, PipeResult
+from open_ticket_ai.core.template_rendering.template_renderer import TemplateRenderer
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedEntity, UnifiedNote, UnifiedTicket
+
+type Dimension = Literal["steps", "tickets"]
+
+_DIMENSIONS: tuple[Dimension, ...] = ("steps", "tickets")
+
+DEFAULT_STEPS = (5, 10, 25, 50, 100, 200)
+DEFAULT_TICKETS = (1, 10, 100, 1000)
+# Size of the dimension that is not swept.
+FIXED_STEPS = 10
+FIXED_TICKETS = 10
+
+_EXPRESSION_PIPE = "base:ExpressionPipe"
+_EXPRESSION = "{{ get_pipe_result('fetch', 'fetched_tickets') | length }}"
+
+
+@dataclass(frozen=True, slots=True)
+class Workload:
+    """A pipeline of ``steps`` finished steps, one of which fetched ``tickets`` tickets."""
+
+    steps: int
+    tickets: int
+    context: PipeContext
+    scope: dict[str, Any]
+    results: list[PipeResult]
+    registry: ComponentRegistry
+
+    @classmethod
+    def build(cls, steps: int, tickets: int) -> Workload:
+        fetched = [
+            UnifiedTicket(
+                id=str(number),
+                subject=f"Ticket {number}",
+                body="Lorem ipsum dolor sit amet. " * 8,
+                queue=UnifiedEntity(id="1", name="Incoming"),
+                priority=UnifiedEntity(id="3", name="3 normal"),
+                notes=[UnifiedNote(subject="Created", body="Ticket created by mail.")],
+            ).model_dump()
+            for number in range(tickets)
+        ]
+        results = [PipeResult.success(data={"fetched_tickets": fetched})]
+        results += [PipeResult.success(f"Step {number}", data={"value": number}) for number in range(1, steps)]
+        context = PipeContext.empty()
+        for number, result in enumerate(results):
+            context = context.with_pipe_result("fetch" if number == 0 else f"step_{number}", result)
+        registry = ComponentRegistry()
+        for number in range(steps):
+            registry.register(f"bench:Pipe{number}", type(f"Pipe{number}", (Pipe,), {}))
+        return cls(steps, tickets, context, context.model_dump(), results, registry)
+
+
+class Environment:
+    """Template renderer and component registry of a minimal app, shared by all workloads."""
+
+    def __init__(self) -> None:
+        config = OpenTicketAIConfig(
+            infrastructure=InfrastructureConfig(logging=LoggingConfig(level="WARNING")),
+            services={"jinja_default": InjectableConfigBase(use="base:JinjaRenderer")},
+        )
+        self.otai_config = config
+        self.injector = Injector([AppModule(AppConfig(open_ticket_ai=config))])
+        self.template_renderer = self.injector.get(TemplateRenderer)
+        self.logger_factory = self.injector.get(LoggerFactory)
+        self.registry = self.injector.get(ComponentRegistry)
+        self.expression_params_model = self.registry.get_pipe(by_identifier=_EXPRESSION_PIPE).ParamsModel
+
+    def pipe_factory(self) -> PipeFactory:
+        return PipeFactory(self.template_renderer, self.logger_factory, self.otai_config, self.registry)
+
+
+@dataclass(frozen=True, slots=True)
+class Operation:
+    """``run`` is timed; ``setup`` prepares its argument and is not."""
+
+    name: str
+    run: Callable[[Workload, Any], Any | Awaitable[Any]]
+    setup: Callable[[Workload], Any] = lambda _: None
+
+
+def operations(environment: Environment) -> list[Operation]:
+    expression_pipe = PipeConfig(id="expression", use=_EXPRESSION_PIPE, params={"expression": _EXPRESSION})
+    return [
+        Operation(
+            "PipeFactory.create_pipe",
+            setup=lambda _: environment.pipe_factory(),
+            run=lambda workload, factory: factory.create_pipe(expression_pipe, workload.context),
+        ),
+        Operation(
+            "TemplateRenderer.render_to_model",
+            run=lambda workload, _: environment.template_renderer.render_to_model(
+                to_model=environment.expression_params_model,
+                from_raw_dict={"expression": _EXPRESSION},
+                with_scope=workload.scope,
+            ),
+        ),
+        Operation(
+            "PipeContext.with_pipe_result",
+            run=lambda workload, _: workload.context.with_pipe_result("next", PipeResult.success()),
+        ),
+        Operation("PipeContext.__hash__", run=lambda workload, _: hash(workload.context)),
+        Operation("freeze", run=lambda workload, _: freeze(workload.context.pipe_results)),
+        Operation("PipeResult.union", run=lambda workload, _: PipeResult.union(workload.results)),
+        Operation("ComponentRegistry.find", run=lambda workload, _: workload.registry.find(by_type=Pipe)),
+    ]
+
+
+class MicroBenchmarkPoint(StrictBaseModel):
+    operation: str
+    dimension: Dimension = Field(description="The swept size; the other one is fixed.")
+    steps: int
+    tickets: int
+    seconds_per_call: float = Field(description="Best mean time per call over the repeats.")
+    allocated_bytes: int = Field(description="Peak memory allocated by one call, measured with tracemalloc.")
+
+    @property
+    def size(self) -> int:
+        return self.steps if self.dimension == "steps" else self.tickets
+
+
+class MicroBenchmarkResult(StrictBaseModel):
+    created_at: datetime
+    python: str
+    points: list[MicroBenchmarkPoint]
+    exponents: dict[str, dict[Dimension, float]] = Field(
+        description=(
+            "Per operation and dimension, the slope of log(time) over log(size): about 0 for constant, 1 for "
+            "linear and 2 for quadratic cost."
+        )
+    )
+
+    def series(self, operation: str, dimension: Dimension) -> list[MicroBenchmarkPoint]:
+        return [point for point in self.points if point.operation == operation and point.dimension == dimension]
+
+    def operations(self) -> list[str]:
+        return list(dict.fromkeys(point.operation for point in self.points))
+
+
+class MicroBenchmark:
+    """Sweeps pipeline length and payload size and measures per-operation time and allocations."""
+
+    def __init__(
+        self,
+        steps: Sequence[int] = DEFAULT_STEPS,
+        tickets: Sequence[int] = DEFAULT_TICKETS,
+        min_time: float = 0.05,
+        repeats: int = 3,
+    ) -> None:
+        self._sizes: list[tuple[Dimension, int, int]] = [
+            *(("steps", size, FIXED_TICKETS) for size in steps),
+            *(("tickets", FIXED_STEPS, size) for size in tickets),
+        ]
+        self._min_time = min_time
+        self._repeats = repeats
+
+    async def run(self, only: Sequence[str] = ()) -> MicroBenchmarkResult:
+        environment = Environment()
+        selected = [operation for operation in operations(environment) if not only or operation.name in only]
+        points: list[MicroBenchmarkPoint] = []
+        try:
+            for dimension, steps, tickets in self._sizes:
+                workload = Workload.build(steps, tickets)
+                for operation in selected:
+                    seconds = await self._time(operation, workload)
+                    points.append(
+                        MicroBenchmarkPoint(
+                            operation=operation.name,
+                            dimension=dimension,
+                            steps=steps,
+                            tickets=tickets,
+                            seconds_per_call=seconds,
+                            allocated_bytes=await self._allocated(operation, workload),
+                        )
+                    )
+        finally:
+            environment.logger_factory.shutdown()
+        result = MicroBenchmarkResult(
+            created_at=datetime.now(UTC), python=platform.python_version(), points=points, exponents={}
+        )
+        for operation in result.operations():
+            result.exponents[operation] = {
+                dimension: scaling_exponent(
+                    [(point.size, point.seconds_per_call) for point in result.series(operation, dimension)]
+                )
+                for dimension in _DIMENSIONS
+            }
+        return result
+
+    async def _time(self, operation: Operation, workload: Workload) -> float:
+        await _call(operation, workload, operation.setup(workload))
+        best = math.inf
+        for _ in range(self._repeats):
+            calls, elapsed = 0, 0.0
+            while calls == 0 or elapsed < self._min_time:
+                argument = operation.setup(workload)
+                started = time.perf_counter()
+                await _call(operation, workload, argument)
+                elapsed += time.perf_counter() - started
+                calls += 1
+            best = min(best, elapsed / calls)
+        return best
+
+    @staticmethod
+    async def _allocated(operation: Operation, workload: Workload) -> int:
+        argument = operation.setup(workload)
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            await _call(operation, workload, argument)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return max(0, peak - before)
+
+
+async def _call(operation: Operation, workload: Workload, argument: Any) -> Any:
+    result = operation.run(workload, argument)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def scaling_exponent(samples: Sequence[tuple[int, float]]) -> float:
+    """Least-squares slope of ``log(value)`` over ``log(size)`` for the larger half of the sizes.
+
+    Small sizes are left out because fixed per-call costs hide how an operation scales there.
+    """
+    ordered = sorted((size, value) for size, value in samples if size > 0 and value > 0)
+    logs = [(math.log(size), math.log(value)) for size, value in ordered[len(ordered) // 2 - 1 :]]
+    if len(logs) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    variance = sum((x - mean_x) ** 2 for x, _ in logs)
+    if variance == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / variance
+
+
+def exponent_regressions(
+    baseline: MicroBenchmarkResult, current: MicroBenchmarkResult, tolerance: float = 0.3
+) -> list[str]:
+    """Operations and dimensions whose time exponent grew by more than ``tolerance``."""
+    return [
+        f"{operation} by {dimension}: {baseline_exponent:.2f} -> {exponent:.2f}"
+        for operation, exponents in current.exponents.items()
+        for dimension, exponent in exponents.items()
+        if (baseline_exponent := baseline.exponents.get(operation, {}).get(dimension)) is not None
+        and exponent - baseline_exponent > tolerance
+    ]
+
+
+def run_micro_benchmark(benchmark: MicroBenchmark, only: Sequence[str] = ()) -> MicroBenchmarkResult:
+    return asyncio.run(benchmark.run(only))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable
+from html import escape
+
+from benchmarks.micro_benchmark import Dimension, MicroBenchmarkPoint, MicroBenchmarkResult
+
+_PANEL_WIDTH, _PANEL_HEIGHT = 460, 300
+_MARGIN_LEFT, _MARGIN_TOP, _MARGIN_BOTTOM = 70, 40, 45
+_LEGEND_WIDTH = 320
+_COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#17becf")
+
+type Metric = Callable[[MicroBenchmarkPoint], float]
+
+_METRICS: tuple[tuple[str, Metric], ...] = (
+    ("time per call (s)", lambda point: point.seconds_per_call),
+    ("allocated per call (bytes)", lambda point: float(point.allocated_bytes)),
+)
+_DIMENSION_LABELS: dict[Dimension, str] = {"steps": "pipeline steps", "tickets": "tickets in payload"}
+
+
+def render_scaling_svg(result: MicroBenchmarkResult) -> str:
+    """Log-log scaling curves: one panel per metric and swept dimension, one line per operation."""
+    operations = result.operations()
+    dimensions = [
+        dimension for dimension in _DIMENSION_LABELS if any(result.series(op, dimension) for op in operations)
+    ]
+    width = _PANEL_WIDTH * max(1, len(dimensions)) + _LEGEND_WIDTH
+    height = _PANEL_HEIGHT * len(_METRICS)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="sans-serif" font-size="11">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+    ]
+    for row, (metric_label, metric) in enumerate(_METRICS):
+        for column, dimension in enumerate(dimensions):
+            series = {operation: result.series(operation, dimension) for operation in operations}
+            parts.extend(
+                _panel(
+                    column * _PANEL_WIDTH,
+                    row * _PANEL_HEIGHT,
+                    f"{metric_label} by {_DIMENSION_LABELS[dimension]}",
+                    {
+                        operation: [(point.size, metric(point)) for point in points]
+                        for operation, points in series.items()
+                    },
+                )
+            )
+    parts.extend(_legend(_PANEL_WIDTH * len(dimensions) + 10, _MARGIN_TOP, operations, result))
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def _panel(left: float, top: float, title: str, series: dict[str, list[tuple[int, float]]]) -> list[str]:
+    values = [(x, y) for points in series.values() for x, y in points if x > 0 and y > 0]
+    plot_left, plot_top = left + _MARGIN_LEFT, top + _MARGIN_TOP
+    plot_width = _PANEL_WIDTH - _MARGIN_LEFT - 20
+    plot_height = _PANEL_HEIGHT - _MARGIN_TOP - _MARGIN_BOTTOM
+    parts = [
+        f'<text x="{left + _PANEL_WIDTH / 2}" y="{top + 20}" text-anchor="middle" font-weight="bold">'
+        f"{escape(title)}</text>",
+        f'<rect x="{plot_left}" y="{plot_top}" width="{plot_width}" height="{plot_height}" fill="none" stroke="#999"/>',
+    ]
+    if not values:
+        return parts
+    x_range = _log_range(x for x, _ in values)
+    y_range = _log_range(y for _, y in values)
+
+    def position(x: float, y: float) -> tuple[float, float]:
+        return (
+            plot_left + (math.log10(x) - x_range[0]) / (x_range[1] - x_range[0]) * plot_width,
+            plot_top + plot_height - (math.log10(y) - y_range[0]) / (y_range[1] - y_range[0]) * plot_height,
+        )
+
+    for exponent in range(math.floor(x_range[0]), math.ceil(x_range[1]) + 1):
+        x, _ = position(10**exponent, 10 ** y_range[0])
+        if plot_left <= x <= plot_left + plot_width:
+            parts.append(
+                f'<line x1="{x:.1f}" y1="{plot_top}" x2="{x:.1f}" y2="{plot_top + plot_height}" stroke="#eee"/>'
+            )
+            parts.append(
+                f'<text x="{x:.1f}" y="{plot_top + plot_height + 15}" text-anchor="middle">{10**exponent:g}</text>'
+            )
+    for exponent in range(math.floor(y_range[0]), math.ceil(y_range[1]) + 1):
+        _, y = position(10 ** x_range[0], 10**exponent)
+        if plot_top <= y <= plot_top + plot_height:
+            parts.append(
+                f'<line x1="{plot_left}" y1="{y:.1f}" x2="{plot_left + plot_width}" y2="{y:.1f}" stroke="#eee"/>'
+            )
+            parts.append(f'<text x="{plot_left - 5}" y="{y + 4:.1f}" text-anchor="end">{10.0**exponent:.0e}</text>')
+
+    for index, points in enumerate(series.values()):
+        color = _COLORS[index % len(_COLORS)]
+        coordinates = [position(x, y) for x, y in points if x > 0 and y > 0]
+        if not coordinates:
+            continue
+        path = " ".join(f"{x:.1f},{y:.1f}" for x, y in coordinates)
+        parts.append(f'<polyline points="{path}" fill="none" stroke="{color}" stroke-width="2"/>')
+        parts.extend(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="3" fill="{color}"/>' for x, y in coordinates)
+    return parts
+
+
+def _legend(left: float, top: float, operations: list[str], result: MicroBenchmarkResult) -> list[str]:
+    parts = [f'<text x="{left}" y="{top - 10}" font-weight="bold">time exponent (steps / tickets)</text>']
+    for index, operation in enumerate(operations):
+        y = top + 10 + index * 20
+        exponents = " / ".join(f"{value:.2f}" for value in result.exponents.get(operation, {}).values())
+        parts.append(f'<rect x="{left}" y="{y - 9}" width="12" height="12" fill="{_COLORS[index % len(_COLORS)]}"/>')
+        parts.append(f'<text x="{left + 18}" y="{y + 1}">{escape(operation)} ({exponents})</text>')
+    return parts
+
+
+def _log_range(values: Iterable[float]) -> tuple[float, float]:
+    logs = [math.log10(value) for value in values]
+    low, high = min(logs), max(logs)
+    if high - low < 1e-9:
+        low, high = low - 0.5, high + 0.5
+    padding = (high - low) * 0.05
+    return low - padding, high + padding
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, ClassVar
+
+from pydantic import Field
+
+from open_ticket_ai import StrictBaseModel
+from open_ticket_ai.core.ai_classification_services.classification_models import (
+    ClassificationRequest,
+    ClassificationResult,
+)
+from open_ticket_ai.core.ai_classification_services.classification_service import ClassificationService
+from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
+from open_ticket_ai.core.ticket_system_integration.unified_models import (
+    TicketSearchCriteria,
+    UnifiedEntity,
+    UnifiedNote,
+    UnifiedTicket,
+)
+
+FAKE_TICKET_SYSTEM = "benchmarks:FakeTicketSystemService"
+STUB_CLASSIFIER = "benchmarks:StubClassificationService"
+
+
+class FakeTicketSystemServiceParams(StrictBaseModel):
+    tickets: int = Field(default=1000, ge=0, description="Number of tickets created on start.")
+    queues: list[str] = Field(
+        default_factory=lambda: ["OpenTicketAI::Incoming"], description="Queues the tickets are spread over."
+    )
+    body_size: int = Field(default=500, ge=0, description="Length of each ticket body in characters.")
+    latency: timedelta = Field(default=timedelta(milliseconds=20), description="Mean duration of every call.")
+    jitter: timedelta = Field(
+        default=timedelta(milliseconds=5), description="Calls take the latency plus or minus up to this much."
+    )
+    seed: int = Field(default=0, description="Seed of the latency jitter, so runs are repeatable.")
+
+
+@dataclass(slots=True)
+class TicketTimings:
+    """When each ticket was first returned to the pipeline and when it was last written to."""
+
+    first_fetched: dict[str, float] = field(default_factory=dict)
+    last_written: dict[str, float] = field(default_factory=dict)
+    writes: int = 0
+
+    def latencies(self) -> list[float]:
+        return [
+            written - self.first_fetched[ticket_id]
+            for ticket_id, written in self.last_written.items()
+            if ticket_id in self.first_fetched
+        ]
+
+
+class FakeTicketSystemService(TicketSystemService):
+    """In-memory ticket system that behaves like a remote one under load.
+
+    Every call waits for the configured latency; searches use a per-queue index, so cost does not
+    grow with the number of tickets in other queues. Tickets are frozen models, so they are
+    returned without copying.
+    """
+
+    ParamsModel: ClassVar[type[FakeTicketSystemServiceParams]] = FakeTicketSystemServiceParams
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._random = random.Random(self._params.seed)  # noqa: S311 - jitter, not cryptography
+        self._tickets: dict[str, UnifiedTicket] = {}
+        self._by_queue: dict[str | None, dict[str, None]] = {}
+        self.timings = TicketTimings()
+        body = ("Lorem ipsum dolor sit amet. " * (self._params.body_size // 28 + 1))[: self._params.body_size]
+        queues = self._params.queues or [None]
+        for number in range(1, self._params.tickets + 1):
+            queue = queues[number % len(queues)]
+            self._store(
+                UnifiedTicket(
+                    id=str(number),
+                    subject=f"Benchmark ticket {number}",
+                    body=body,
+                    queue=UnifiedEntity(name=queue) if queue is not None else None,
+                    priority=UnifiedEntity(name="3 normal"),
+                    notes=[],
+                )
+            )
+
+    async def create_ticket(self, ticket: UnifiedTicket | None = None, **_: Any) -> UnifiedTicket:
+        await self._wait()
+        created = (ticket or UnifiedTicket()).model_copy(update={"id": str(len(self._tickets) + 1)})
+        self._store(created)
+        return created
+
+    async def update_ticket(self, ticket_id: str, updates: UnifiedTicket | None = None, **_: Any) -> bool:
+        await self._wait()
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None:
+            return False
+        changes = updates.model_dump(exclude_unset=True, exclude_none=True) if updates else {}
+        self._store(UnifiedTicket.model_validate(ticket.model_dump() | changes))
+        self._written(ticket_id)
+        return True
+
+    async def find_tickets(self, criteria: TicketSearchCriteria | None = None, **_: Any) -> list[UnifiedTicket]:
+        await self._wait()
+        criteria = criteria or TicketSearchCriteria()
+        found: list[UnifiedTicket] = []
+        for ticket_id in self._candidates(criteria):
+            if len(found) == criteria.offset + criteria.limit:
+                break
+            ticket = self._tickets[ticket_id]
+            if criteria.queue is None or criteria.queue.id is None or _queue_id(ticket) == criteria.queue.id:
+                found.append(ticket)
+        fetched = found[criteria.offset :]
+        now = time.perf_counter()
+        for ticket in fetched:
+            self.timings.first_fetched.setdefault(str(ticket.id), now)
+        return fetched
+
+    async def find_first_ticket(
+        self, criteria: TicketSearchCriteria | None = None, **kwargs: Any
+    ) -> UnifiedTicket | None:
+        limited = (criteria or TicketSearchCriteria()).model_copy(update={"limit": 1})
+        tickets = await self.find_tickets(limited, **kwargs)
+        return tickets[0] if tickets else None
+
+    async def get_ticket(self, ticket_id: str) -> UnifiedTicket | None:
+        await self._wait()
+        ticket = self._tickets.get(ticket_id)
+        return ticket
+
+    async def add_note(self, ticket_id: str, note: UnifiedNote | None = None, **_: Any) -> bool:
+        await self._wait()
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None:
+            return False
+        self._tickets[ticket_id] = ticket.model_copy(update={"notes": [*(ticket.notes or []), note or UnifiedNote()]})
+        self._written(ticket_id)
+        return True
+
+    def _candidates(self, criteria: TicketSearchCriteria) -> Iterable[str]:
+        if criteria.queue is None or criteria.queue.name is None:
+            return self._tickets
+        return self._by_queue.get(criteria.queue.name, {})
+
+    def _store(self, ticket: UnifiedTicket) -> None:
+        ticket_id = str(ticket.id)
+        previous = self._tickets.get(ticket_id)
+        if previous is not None:
+            self._by_queue.get(_queue_name(previous), {}).pop(ticket_id, None)
+        self._tickets[ticket_id] = ticket
+        self._by_queue.setdefault(_queue_name(ticket), {})[ticket_id] = None
+
+    def _written(self, ticket_id: str) -> None:
+        self.timings.last_written[ticket_id] = time.perf_counter()
+        self.timings.writes += 1
+
+    async def _wait(self) -> None:
+        latency = self._params.latency.total_seconds()
+        jitter = self._params.jitter.total_seconds()
+        await asyncio.sleep(max(0.0, latency + self._random.uniform(-jitter, jitter)))
+
+
+def _queue_name(ticket: UnifiedTicket) -> str | None:
+    return ticket.queue.name if ticket.queue else None
+
+
+def _queue_id(ticket: UnifiedTicket) -> str | None:
+    return ticket.queue.id if ticket.queue else None
+
+
+class StubClassificationServiceParams(StrictBaseModel):
+    inference_time: timedelta = Field(
+        default=timedelta(milliseconds=50),
+        description="CPU time spent per classification; the event loop is blocked meanwhile, like with a local model.",
+    )
+    labels: list[str] = Field(
+        default_factory=lambda: ["Benchmark::A", "Benchmark::B", "Benchmark::C"],
+        min_length=1,
+        description="Labels returned, chosen deterministically from the text.",
+    )
+    min_confidence: float = Field(default=0.5, ge=0.0, le=1.0, description="Lowest confidence returned.")
+
+
+class StubClassificationService(ClassificationService):
+    """Returns a label derived from a hash of the text after burning the configured inference time."""
+
+    ParamsModel: ClassVar[type[StubClassificationServiceParams]] = StubClassificationServiceParams
+
+    def classify(self, req: ClassificationRequest) -> ClassificationResult:
+        deadline = time.perf_counter() + self._params.inference_time.total_seconds()
+        digest = hashlib.sha256(f"{req.model_name}\n{req.text}".encode()).digest()
+        seed = int.from_bytes(digest[:8])
+        while time.perf_counter() < deadline:
+            digest = hashlib.sha256(digest).digest()
+        labels = self._params.labels
+        spread = 1.0 - self._params.min_confidence
+        return ClassificationResult(
+            label=labels[seed % len(labels)],
+            confidence=self._params.min_confidence + spread * ((seed >> 16) % 1000) / 1000,
+        )
+
+    async def aclassify(self, req: ClassificationRequest) -> ClassificationResult:
+        return self.classify(req)
+
+
+STAND_INS: dict[str, type[TicketSystemService | ClassificationService]] = {
+    FAKE_TICKET_SYSTEM: FakeTicketSystemService,
+    STUB_CLASSIFIER: StubClassificationService,
+}
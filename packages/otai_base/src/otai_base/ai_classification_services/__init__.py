@@ -0,0 +1,9 @@
+from otai_base.ai_classification_services.batching_classification_service import (
+    BatchingClassificationService,
+    BatchingClassificationServiceParams,
+)
+
+__all__ = [
+    "BatchingClassificationService",
+    "BatchingClassificationServiceParams",
+]
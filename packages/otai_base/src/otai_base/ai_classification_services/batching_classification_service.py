@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Any, ClassVar
+
+from open_ticket_ai import StrictBaseModel
+from open_ticket_ai.core.ai_classification_services.classification_models import (
+    ClassificationRequest,
+    ClassificationResult,
+)
+from open_ticket_ai.core.ai_classification_services.classification_service import ClassificationService
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+from pydantic import Field
+
+_BATCH_SIZE = METRICS.histogram(
+    "otai_classification_batch_size",
+    "Requests classified together by a batching classification service.",
+    ("service",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+
+
+class BatchingClassificationServiceParams(StrictBaseModel):
+    max_batch_size: int = Field(default=32, gt=0, description="Most requests classified in one batch.")
+    max_wait: timedelta = Field(
+        default=timedelta(milliseconds=10),
+        description="How long the first request of a batch waits for more requests before the batch is classified.",
+    )
+
+
+type _Pending = tuple[ClassificationRequest, asyncio.Future[ClassificationResult]]
+
+
+class BatchingClassificationService(ClassificationService):
+    """Coalesces concurrent ``aclassify`` calls into batches for the wrapped classification service.
+
+    Requests are collected until ``max_batch_size`` are pending or the first one waited
+    ``max_wait``. The batch is then classified with the wrapped service's ``classify_batch`` in a
+    worker thread, so the event loop keeps collecting the next batch meanwhile. One batch is
+    classified at a time. ``classify`` is passed straight through.
+    """
+
+    ParamsModel: ClassVar[type[BatchingClassificationServiceParams]] = BatchingClassificationServiceParams
+
+    def __init__(self, classification_service: ClassificationService, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._classification_service = classification_service
+        self._pending: list[_Pending] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+        self._classifying = asyncio.Lock()
+
+    def classify(self, req: ClassificationRequest) -> ClassificationResult:
+        return self._classification_service.classify(req)
+
+    async def aclassify(self, req: ClassificationRequest) -> ClassificationResult:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ClassificationResult] = loop.create_future()
+        self._pending.append((req, future))
+        if len(self._pending) >= self._params.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._params.max_wait.total_seconds(), self._flush)
+        return await future
+
+    async def astop(self) -> None:
+        self._flush()
+        await asyncio.gather(*self._batches, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._classify(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _classify(self, batch: list[_Pending]) -> None:
+        try:
+            async with self._classifying:
+                _BATCH_SIZE.labels(self.injectable_id).observe(len(batch))
+                results = await asyncio.to_thread(self._classify_batch, [req for req, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+    def _classify_batch(self, requests: Sequence[ClassificationRequest]) -> list[ClassificationResult]:
+        classify_batch = getattr(self._classification_service, "classify_batch", None)
+        if classify_batch is None:
+            return [self._classification_service.classify(req) for req in requests]
+        return classify_batch(requests)
@@ -1,13 +1,25 @@
 from open_ticket_ai import Injectable, Plugin
 
+from otai_base.ai_classification_services import BatchingClassificationService
+from otai_base.claim_stores import SqliteClaimStore
+from otai_base.pipes.claim_pipes import ClaimTicketsPipe, ReleaseTicketsPipe
 from otai_base.pipes.classification_pipe import ClassificationPipe
 from otai_base.pipes.composite_pipe import CompositePipe
+from otai_base.pipes.enqueue_tickets_pipe import EnqueueTicketsPipe
 from otai_base.pipes.expression_pipe import ExpressionPipe
 from otai_base.pipes.interval_trigger_pipe import IntervalTrigger
+from otai_base.pipes.ledger_pipes import FilterProcessedTicketsPipe, MarkTicketsProcessedPipe
 from otai_base.pipes.orchestrators.simple_sequential_orchestrator import SimpleSequentialOrchestrator
 from otai_base.pipes.pipe_runners.simple_sequential_runner import SimpleSequentialRunner
+from otai_base.pipes.pipe_runners.work_queue_runner import WorkQueueRunner
 from otai_base.pipes.ticket_system_pipes import AddNotePipe, FetchTicketsPipe, UpdateTicketPipe
+from otai_base.pipes.webhook_tickets_pipe import WebhookTicketsPipe
+from otai_base.rate_limiting import RateLimitedService
 from otai_base.template_renderers.jinja_renderer import JinjaRenderer
+from otai_base.ticket_ledgers import ProcessedTicketLedgerService
+from otai_base.ticket_system_services import CachingTicketSystemService
+from otai_base.webhooks import WebhookIngestionService
+from otai_base.work_queues import SqliteWorkQueueService
 
 
 class BasePlugin(Plugin):
@@ -22,5 +34,19 @@ class BasePlugin(Plugin):
             CompositePipe,
             ExpressionPipe,
             IntervalTrigger,
+            WebhookTicketsPipe,
+            FilterProcessedTicketsPipe,
+            MarkTicketsProcessedPipe,
+            ClaimTicketsPipe,
+            ReleaseTicketsPipe,
+            EnqueueTicketsPipe,
+            WorkQueueRunner,
             JinjaRenderer,
+            CachingTicketSystemService,
+            WebhookIngestionService,
+            BatchingClassificationService,
+            SqliteWorkQueueService,
+            ProcessedTicketLedgerService,
+            SqliteClaimStore,
+            RateLimitedService,
         ]
@@ -0,0 +1,3 @@
+from otai_base.claim_stores.sqlite_claim_store import SqliteClaimStore, SqliteClaimStoreParams
+
+__all__ = ["SqliteClaimStore", "SqliteClaimStoreParams"]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Sequence
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, ClassVar
+
+from open_ticket_ai import StrictBaseModel
+from open_ticket_ai.core.claims.claim_store import ClaimStore
+from pydantic import Field
+
+type Clock = Callable[[], float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS claims (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+# Takes a key that is free, expired or already held by the claiming owner; changes no row otherwise.
+_CLAIM = """
+INSERT INTO claims (key, owner, expires_at) VALUES (?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+WHERE claims.owner = excluded.owner OR claims.expires_at <= ?
+"""
+
+
+class SqliteClaimStoreParams(StrictBaseModel):
+    path: Path = Field(
+        default=Path("otai_claims.sqlite3"),
+        description="SQLite database file; processes sharing it never hold a claim on the same key at once.",
+    )
+
+
+class SqliteClaimStore(ClaimStore):
+    """Claims kept in a local SQLite database in WAL mode, for processes on one host.
+
+    Each call runs in one ``BEGIN IMMEDIATE`` transaction, so SQLite's file lock makes claiming
+    atomic across the processes sharing the database file. Expired claims are taken over by the
+    next claimant. For instances on several hosts use a store on shared storage instead; SQLite
+    files on network file systems do not lock reliably.
+    """
+
+    ParamsModel: ClassVar[type[SqliteClaimStoreParams]] = SqliteClaimStoreParams
+
+    def __init__(self, *args: Any, clock: Clock = time.time, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._clock = clock
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    async def astart(self) -> None:
+        await asyncio.to_thread(self._connect)
+
+    async def astop(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    async def claim(self, keys: Sequence[str], owner: str, ttl: timedelta) -> list[str]:
+        now = self._clock()
+        expires_at = now + ttl.total_seconds()
+
+        def claim(connection: sqlite3.Connection) -> list[str]:
+            return [key for key in keys if connection.execute(_CLAIM, (key, owner, expires_at, now)).rowcount]
+
+        return await self._transaction(claim)
+
+    async def release(self, keys: Sequence[str], owner: str) -> int:
+        def release(connection: sqlite3.Connection) -> int:
+            before = connection.total_changes
+            connection.executemany("DELETE FROM claims WHERE key = ? AND owner = ?", [(key, owner) for key in keys])
+            return connection.total_changes - before
+
+        return await self._transaction(release)
+
+    async def _transaction[T](self, work: Callable[[sqlite3.Connection], T]) -> T:
+        return await asyncio.to_thread(self._run_in_transaction, work)
+
+    def _run_in_transaction[T](self, work: Callable[[sqlite3.Connection], T]) -> T:
+        with self._lock:
+            connection = self._connection or self._connect_locked()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(connection)
+            except BaseException:
+                connection.rollback()
+                raise
+            connection.commit()
+            return result
+
+    def _connect(self) -> None:
+        with self._lock:
+            if self._connection is None:
+                self._connect_locked()
+
+    def _connect_locked(self) -> sqlite3.Connection:
+        self._params.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._params.path, isolation_level=None, check_same_thread=False, timeout=30)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.executescript(_SCHEMA)
+        pruned = connection.execute("DELETE FROM claims WHERE expires_at <= ?", (self._clock(),)).rowcount
+        self._connection = connection
+        self._logger.info("🔒 Claim store opened at %s, %d expired claims pruned", self._params.path, pruned)
+        return connection
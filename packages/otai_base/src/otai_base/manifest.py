@@ -0,0 +1,40 @@
+from open_ticket_ai import PluginManifest
+
+MANIFEST = PluginManifest(
+    injectables={
+        "SimpleSequentialOrchestrator": (
+            "otai_base.pipes.orchestrators.simple_sequential_orchestrator:SimpleSequentialOrchestrator"
+        ),
+        "SimpleSequentialRunner": "otai_base.pipes.pipe_runners.simple_sequential_runner:SimpleSequentialRunner",
+        "AddNotePipe": "otai_base.pipes.ticket_system_pipes.add_note_pipe:AddNotePipe",
+        "FetchTicketsPipe": "otai_base.pipes.ticket_system_pipes.fetch_tickets_pipe:FetchTicketsPipe",
+        "UpdateTicketPipe": "otai_base.pipes.ticket_system_pipes.update_ticket_pipe:UpdateTicketPipe",
+        "ClassificationPipe": "otai_base.pipes.classification_pipe:ClassificationPipe",
+        "CompositePipe": "otai_base.pipes.composite_pipe:CompositePipe",
+        "ExpressionPipe": "otai_base.pipes.expression_pipe:ExpressionPipe",
+        "IntervalTrigger": "otai_base.pipes.interval_trigger_pipe:IntervalTrigger",
+        "WebhookTicketsPipe": "otai_base.pipes.webhook_tickets_pipe:WebhookTicketsPipe",
+        "FilterProcessedTicketsPipe": (
+            "otai_base.pipes.ledger_pipes.filter_processed_tickets_pipe:FilterProcessedTicketsPipe"
+        ),
+        "MarkTicketsProcessedPipe": "otai_base.pipes.ledger_pipes.mark_tickets_processed_pipe:MarkTicketsProcessedPipe",
+        "ClaimTicketsPipe": "otai_base.pipes.claim_pipes.claim_tickets_pipe:ClaimTicketsPipe",
+        "ReleaseTicketsPipe": "otai_base.pipes.claim_pipes.release_tickets_pipe:ReleaseTicketsPipe",
+        "EnqueueTicketsPipe": "otai_base.pipes.enqueue_tickets_pipe:EnqueueTicketsPipe",
+        "WorkQueueRunner": "otai_base.pipes.pipe_runners.work_queue_runner:WorkQueueRunner",
+        "JinjaRenderer": "otai_base.template_renderers.jinja_renderer:JinjaRenderer",
+        "CachingTicketSystemService": (
+            "otai_base.ticket_system_services.caching_ticket_system_service:CachingTicketSystemService"
+        ),
+        "WebhookIngestionService": "otai_base.webhooks.webhook_ingestion_service:WebhookIngestionService",
+        "BatchingClassificationService": (
+            "otai_base.ai_classification_services.batching_classification_service:BatchingClassificationService"
+        ),
+        "SqliteWorkQueueService": "otai_base.work_queues.sqlite_work_queue_service:SqliteWorkQueueService",
+        "ProcessedTicketLedgerService": (
+            "otai_base.ticket_ledgers.processed_ticket_ledger_service:ProcessedTicketLedgerService"
+        ),
+        "RateLimitedService": "otai_base.rate_limiting.rate_limited_service:RateLimitedService",
+        "SqliteClaimStore": "otai_base.claim_stores.sqlite_claim_store:SqliteClaimStore",
+    }
+)
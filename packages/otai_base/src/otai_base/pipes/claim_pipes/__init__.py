@@ -0,0 +1,10 @@
+from otai_base.pipes.claim_pipes.claim_tickets_pipe import ClaimTicketsParams, ClaimTicketsPipe, ticket_claim_key
+from otai_base.pipes.claim_pipes.release_tickets_pipe import ReleaseTicketsParams, ReleaseTicketsPipe
+
+__all__ = [
+    "ClaimTicketsParams",
+    "ClaimTicketsPipe",
+    "ReleaseTicketsParams",
+    "ReleaseTicketsPipe",
+    "ticket_claim_key",
+]
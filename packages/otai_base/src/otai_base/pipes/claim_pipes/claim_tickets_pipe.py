@@ -0,0 +1,50 @@
+from datetime import timedelta
+from typing import Any, ClassVar
+
+from open_ticket_ai import Pipe, StrictBaseModel
+from open_ticket_ai.core.claims.claim_store import ClaimStore, claim_owner
+from open_ticket_ai.core.pipes.pipe_models import PipeResult
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+from pydantic import Field
+
+
+def ticket_claim_key(ticket_id: str) -> str:
+    return f"ticket:{ticket_id}"
+
+
+class ClaimTicketsParams(StrictBaseModel):
+    tickets: list[UnifiedTicket] = Field(description="Tickets to claim, usually the 'fetched_tickets' of a fetch step.")
+    ttl: timedelta = Field(
+        default=timedelta(minutes=10),
+        description="How long the claims last; longer than a pipeline run, as others take the tickets over after it.",
+    )
+    owner: str | None = Field(default=None, description="Claim owner; this process's hostname and pid when unset.")
+
+
+class ClaimTicketsPipe(Pipe[ClaimTicketsParams]):
+    """Claims tickets in a ``ClaimStore`` so that other processes and instances skip them.
+
+    Tickets claimed by someone else are dropped, and the rest are returned under the
+    ``fetched_tickets`` data key, like ``FetchTicketsPipe`` does. Fails when no ticket is left so
+    that dependent steps are skipped. Release the claims with a ``ReleaseTicketsPipe`` in the
+    ``finally_steps`` of the composite pipe, which run even when a later step fails; claims of a
+    process that died expire after ``ttl``. Tickets without an id cannot be claimed and are kept.
+    """
+
+    ParamsModel: ClassVar[type[ClaimTicketsParams]] = ClaimTicketsParams
+
+    def __init__(self, claim_store: ClaimStore, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._claim_store = claim_store
+
+    async def _process(self, *_: Any, **__: Any) -> PipeResult:
+        tickets = self._params.tickets
+        keys = [ticket_claim_key(ticket.id) for ticket in tickets if ticket.id is not None]
+        owner = self._params.owner or claim_owner()
+        claimed = set(await self._claim_store.claim(keys, owner, self._params.ttl))
+        mine = [ticket for ticket in tickets if ticket.id is None or ticket_claim_key(ticket.id) in claimed]
+        if len(mine) < len(tickets):
+            self._logger.info("⏭️ Skipping %d ticket(s) claimed by others", len(tickets) - len(mine))
+        if not mine:
+            return PipeResult.failure("Every ticket is claimed by others.")
+        return PipeResult.success(data={"fetched_tickets": mine, "contended_count": len(tickets) - len(mine)})
@@ -0,0 +1,45 @@
+from typing import Any, ClassVar
+
+from open_ticket_ai import Pipe, StrictBaseModel
+from open_ticket_ai.core.claims.claim_store import ClaimStore, claim_owner
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_models import PipeResult
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+from pydantic import Field
+
+from otai_base.pipes.claim_pipes.claim_tickets_pipe import ticket_claim_key
+
+
+class ReleaseTicketsParams(StrictBaseModel):
+    tickets: list[UnifiedTicket] = Field(default_factory=list, description="Tickets whose claims to release.")
+    claim_step: str | None = Field(
+        default=None,
+        description="Id of a ClaimTicketsPipe step whose claimed tickets to release as well; none if it claimed none.",
+    )
+    owner: str | None = Field(default=None, description="Claim owner; this process's hostname and pid when unset.")
+
+
+class ReleaseTicketsPipe(Pipe[ReleaseTicketsParams]):
+    """Releases the claims ``ClaimTicketsPipe`` took, once the tickets are processed.
+
+    Run it in the ``finally_steps`` of a composite pipe with ``claim_step`` set, so the claims are
+    also released when a step fails and the tickets are not locked until their ``ttl`` runs out.
+    """
+
+    ParamsModel: ClassVar[type[ReleaseTicketsParams]] = ReleaseTicketsParams
+
+    def __init__(self, claim_store: ClaimStore, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._claim_store = claim_store
+
+    async def _process(self, context: PipeContext) -> PipeResult:
+        tickets = [*self._params.tickets, *self._claimed_tickets(context)]
+        keys = [ticket_claim_key(ticket.id) for ticket in tickets if ticket.id is not None]
+        released = await self._claim_store.release(keys, self._params.owner or claim_owner())
+        return PipeResult.success(data={"released_count": released})
+
+    def _claimed_tickets(self, context: PipeContext) -> list[UnifiedTicket]:
+        if self._params.claim_step is None or not context.has_succeeded(self._params.claim_step):
+            return []
+        claimed = context.pipe_results[self._params.claim_step].get("data", {}).get("fetched_tickets", [])
+        return [UnifiedTicket.model_validate(ticket) for ticket in claimed]
@@ -34,13 +34,11 @@ class ClassificationPipe(Pipe[ClassificationPipeParams]):
         self._classification_service = classification_service
 
     async def _process(self, *_: Any, **__: Any) -> PipeResult:
-        text_preview = self._preview_text(self._params.text)
+        self._logger.info("🤖 Classifying text with model: %s", self._params.model_name)
+        self._logger.debug(lambda: f"Text preview: {self._preview_text(self._params.text)}")
+        self._logger.debug("Text length: %d characters", len(self._params.text))
 
-        self._logger.info(f"🤖 Classifying text with model: {self._params.model_name}")
-        self._logger.debug(f"Text preview: {text_preview}")
-        self._logger.debug(f"Text length: {len(self._params.text)} characters")
-
-        classification_result: ClassificationResult = self._classification_service.classify(
+        classification_result: ClassificationResult = await self._classification_service.aclassify(
             ClassificationRequest(
                 text=self._params.text,
                 model_name=self._params.model_name,
@@ -48,14 +46,14 @@ class ClassificationPipe(Pipe[ClassificationPipeParams]):
             )
         )
 
-        result_message = (
-            f"✅ Classification result: {classification_result.label} "
-            f"(confidence: {classification_result.confidence:.4f})"
+        self._logger.info(
+            "✅ Classification result: %s (confidence: %.4f)",
+            classification_result.label,
+            classification_result.confidence,
         )
-        self._logger.info(result_message)
 
         if hasattr(classification_result, "scores") and classification_result.scores:
-            self._logger.debug(f"All scores: {classification_result.scores}")
+            self._logger.debug("All scores: %s", classification_result.scores)
 
         return PipeResult.success(data=classification_result.model_dump())
 
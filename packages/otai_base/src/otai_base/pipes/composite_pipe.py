@@ -15,6 +15,16 @@ class CompositePipeParams(BaseModel):
             description="List of pipe configurations representing the steps in the composite pipe.",
         ),
     ]
+    finally_steps: Annotated[
+        list[PipeConfig],
+        NoRenderField(
+            default_factory=list,
+            description=(
+                "Steps that run after the steps even when one of them failed or raised, e.g. to release claims. "
+                "They see the results of the steps that ran."
+            ),
+        ),
+    ]
 
 
 class CompositePipe[ParamsT: CompositePipeParams = CompositePipeParams](Pipe[ParamsT]):
@@ -27,13 +37,22 @@ class CompositePipe[ParamsT: CompositePipeParams = CompositePipeParams](Pipe[Par
     async def _process_steps(self, context: PipeContext) -> list[PipeResult]:
         context = context.with_parent(self._params)
         results = []
-        for step_config in self._params.steps or []:
-            result: PipeResult = await self._process_step(step_config, context)
-            context = context.with_pipe_result(step_config.id, result)
-            if result.has_failed():
-                self._logger.warning(f"Step '{step_config.id}' failed. Skipping remaining steps in composite pipe.")
-                break
-            results.append(result)
+        try:
+            for step_config in self._params.steps or []:
+                result: PipeResult = await self._process_step(step_config, context)
+                context = context.with_pipe_result(step_config.id, result)
+                if result.has_failed():
+                    self._logger.warning(f"Step '{step_config.id}' failed. Skipping remaining steps in composite pipe.")
+                    break
+                results.append(result)
+        finally:
+            for step_config in self._params.finally_steps:
+                result = await self._process_step(step_config, context)
+                context = context.with_pipe_result(step_config.id, result)
+                if result.has_failed():
+                    self._logger.warning(f"Finally step '{step_config.id}' failed.")
+                else:
+                    results.append(result)
         return results
 
     @final
@@ -0,0 +1,37 @@
+from typing import Any, ClassVar
+
+from open_ticket_ai import Pipe, StrictBaseModel
+from open_ticket_ai.core.pipes.pipe_models import PipeResult
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+from pydantic import Field
+
+from otai_base.work_queues.sqlite_work_queue_service import SqliteWorkQueueService
+
+
+class EnqueueTicketsParams(StrictBaseModel):
+    tickets: list[UnifiedTicket] = Field(
+        description="Tickets to enqueue, usually the 'fetched_tickets' of a fetch step."
+    )
+    queue: str = Field(default="tickets", description="Name of the work queue.")
+
+
+class EnqueueTicketsPipe(Pipe[EnqueueTicketsParams]):
+    """Adds tickets to a ``SqliteWorkQueueService`` queue for a ``WorkQueueRunner`` to process.
+
+    Tickets are keyed by their id, so a ticket that is fetched again while it still waits in the
+    queue is not enqueued twice. Tickets without an id are always enqueued.
+    """
+
+    ParamsModel: ClassVar[type[EnqueueTicketsParams]] = EnqueueTicketsParams
+
+    def __init__(self, work_queue: SqliteWorkQueueService, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._work_queue = work_queue
+
+    async def _process(self, *_: Any, **__: Any) -> PipeResult:
+        tickets = self._params.tickets
+        enqueued = await self._work_queue.enqueue(
+            self._params.queue, [(ticket.id, ticket.model_dump(mode="json")) for ticket in tickets]
+        )
+        self._logger.info("📥 Enqueued %d of %d ticket(s) to '%s'", enqueued, len(tickets), self._params.queue)
+        return PipeResult.success(data={"enqueued": enqueued, "duplicates": len(tickets) - enqueued})
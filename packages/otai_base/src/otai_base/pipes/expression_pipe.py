@@ -28,8 +28,8 @@ class ExpressionPipe(Pipe[ExpressionParams]):
     async def _process(self, *_: Any, **__: Any) -> PipeResult:
         self._logger.debug("📐 Expression pipe returning value")
         if isinstance(self._params.expression, str):
-            expr_preview = self._preview_expression(self._params.expression)
-            self._logger.debug(f"Expression: {expr_preview}")
+            expression = self._params.expression
+            self._logger.debug(lambda: f"Expression: {self._preview_expression(expression)}")
 
         if isinstance(self._params.expression, FailMarker):
             self._logger.debug("Expression evaluated to FailMarker, returning failure.")
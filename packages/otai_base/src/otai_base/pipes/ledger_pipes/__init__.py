@@ -0,0 +1,15 @@
+from otai_base.pipes.ledger_pipes.filter_processed_tickets_pipe import (
+    FilterProcessedTicketsParams,
+    FilterProcessedTicketsPipe,
+)
+from otai_base.pipes.ledger_pipes.mark_tickets_processed_pipe import (
+    MarkTicketsProcessedParams,
+    MarkTicketsProcessedPipe,
+)
+
+__all__ = [
+    "FilterProcessedTicketsParams",
+    "FilterProcessedTicketsPipe",
+    "MarkTicketsProcessedParams",
+    "MarkTicketsProcessedPipe",
+]
@@ -0,0 +1,37 @@
+from typing import Any, ClassVar
+
+from open_ticket_ai import Pipe, StrictBaseModel
+from open_ticket_ai.core.pipes.pipe_models import PipeResult
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+from pydantic import Field
+
+from otai_base.ticket_ledgers.processed_ticket_ledger_service import ProcessedTicketLedgerService
+
+
+class FilterProcessedTicketsParams(StrictBaseModel):
+    tickets: list[UnifiedTicket] = Field(
+        description="Tickets to filter, usually the 'fetched_tickets' of a fetch step."
+    )
+
+
+class FilterProcessedTicketsPipe(Pipe[FilterProcessedTicketsParams]):
+    """Drops tickets a ``ProcessedTicketLedgerService`` has recorded as processed.
+
+    The remaining tickets are returned under the ``fetched_tickets`` data key, like
+    ``FetchTicketsPipe`` does. Fails when no ticket is left so that dependent steps are skipped.
+    """
+
+    ParamsModel: ClassVar[type[FilterProcessedTicketsParams]] = FilterProcessedTicketsParams
+
+    def __init__(self, ledger: ProcessedTicketLedgerService, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._ledger = ledger
+
+    async def _process(self, *_: Any, **__: Any) -> PipeResult:
+        tickets = self._params.tickets
+        new = await self._ledger.filter_new(tickets)
+        if len(new) < len(tickets):
+            self._logger.info("⏭️ Skipping %d already processed ticket(s)", len(tickets) - len(new))
+        if not new:
+            return PipeResult.failure("No unprocessed tickets.")
+        return PipeResult.success(data={"fetched_tickets": new, "skipped_count": len(tickets) - len(new)})
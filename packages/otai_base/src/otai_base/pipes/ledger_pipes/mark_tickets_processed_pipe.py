@@ -0,0 +1,30 @@
+from typing import Any, ClassVar
+
+from open_ticket_ai import Pipe, StrictBaseModel
+from open_ticket_ai.core.pipes.pipe_models import PipeResult
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+from pydantic import Field
+
+from otai_base.ticket_ledgers.processed_ticket_ledger_service import ProcessedTicketLedgerService
+
+
+class MarkTicketsProcessedParams(StrictBaseModel):
+    tickets: list[UnifiedTicket] = Field(description="Tickets to record as processed, as they were fetched.")
+
+
+class MarkTicketsProcessedPipe(Pipe[MarkTicketsProcessedParams]):
+    """Records tickets in a ``ProcessedTicketLedgerService``; usually the last step of a pipeline.
+
+    Record the tickets as fetched, before the pipeline changed them, so that the next search
+    returning the same content finds them in the ledger.
+    """
+
+    ParamsModel: ClassVar[type[MarkTicketsProcessedParams]] = MarkTicketsProcessedParams
+
+    def __init__(self, ledger: ProcessedTicketLedgerService, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._ledger = ledger
+
+    async def _process(self, *_: Any, **__: Any) -> PipeResult:
+        await self._ledger.record(self._params.tickets)
+        return PipeResult.success(data={"recorded_count": len(self._params.tickets)})
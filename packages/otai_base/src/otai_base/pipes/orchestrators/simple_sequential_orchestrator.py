@@ -1,10 +1,15 @@
 import asyncio
+import contextlib
 from datetime import timedelta
-from typing import Annotated, ClassVar
+from typing import Annotated, Any, ClassVar, Literal
 
-from open_ticket_ai import NoRenderField, StrictBaseModel
+from open_ticket_ai import NoRenderField, StrictBaseModel, WrongConfigError
+from open_ticket_ai.core.claims.claim_store import ClaimStore
+from open_ticket_ai.core.claims.leader_election import LeaderElection
 from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
-from open_ticket_ai.core.pipes.pipe_models import PipeConfig, PipeResult
+from open_ticket_ai.core.pipes.pipe_models import RUN_ON_PARAM, PipeConfig, PipeResult, without_run_on
+from open_ticket_ai.core.profiling.cycle_profiler import PROFILER
+from open_ticket_ai.core.tracing.tracer import TRACER
 from pydantic import BaseModel, Field
 
 from otai_base.pipes.composite_pipe import CompositePipe
@@ -15,25 +20,93 @@ class SimpleSequentialOrchestratorParams(StrictBaseModel):
     exception_sleep: timedelta = Field(default=timedelta(seconds=5), description="Sleep time in minutes")
     always_retry: bool = Field(default=True, description="Whether to always retry failed steps")
     steps: Annotated[list[PipeConfig], NoRenderField(default_factory=list, description="Steps to execute")]
+    leader_ttl: timedelta = Field(
+        default=timedelta(seconds=30),
+        description="Lease of the leader election; another instance takes over within it when the leader dies.",
+    )
+    leader_election: str | None = Field(
+        default=None, description="Name of the leader election shared by the instances; by default the orchestrator id."
+    )
+
+
+type RunOn = Literal["leader", "all"]
 
 
 class SimpleSequentialOrchestrator(CompositePipe[SimpleSequentialOrchestratorParams]):
+    """Runs its steps one after another in a loop until stopped.
+
+    A step with ``run_on: leader`` in its params runs only on the instance that currently leads
+    the election held in the injected ``claim_store``; the other steps run on every instance.
+    """
+
     ParamsModel: ClassVar[type[BaseModel]] = SimpleSequentialOrchestratorParams
 
+    def __init__(self, *args: Any, claim_store: ClaimStore | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stop_requested = asyncio.Event()
+        self._steps = [_split_run_on(step) for step in self._params.steps]
+        self._election: LeaderElection | None = None
+        if any(run_on == "leader" for _, run_on in self._steps):
+            if claim_store is None:
+                raise WrongConfigError(
+                    f"Orchestrator '{self._config.id}' has steps with 'run_on: leader' but no injected 'claim_store'."
+                )
+            self._election = LeaderElection(
+                claim_store, self._params.leader_election or self._config.id, self._params.leader_ttl, self._logger
+            )
+
+    def request_stop(self) -> None:
+        """Return from ``process`` once the running cycle has finished; pending sleeps end immediately."""
+        self._stop_requested.set()
+
     async def _process_steps(self, context: PipeContext):
-        context = context.with_parent(self._params)
-        for step_config in self._params.steps:
+        # The steps are left out of the parent params so that steps keep their context, and with it
+        # their cached pipes, when other steps change.
+        context = context.model_copy(update={"parent_params": self._params.model_dump(exclude={"steps"})})
+        for step_config, run_on in self._steps:
+            if run_on == "leader" and not (self._election is not None and self._election.is_leader):
+                continue
             await self._process_step(step_config, context)
 
     async def _process(self, context: PipeContext) -> PipeResult:
-        while True:
+        self._stop_requested.clear()
+        election = TRACER.create_task(self._election.maintain()) if self._election is not None else None
+        try:
+            await self._run_cycles(context)
+        finally:
+            if election is not None:
+                election.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await election
+        return PipeResult.success("Orchestrator stopped")
+
+    async def _run_cycles(self, context: PipeContext) -> None:
+        while not self._stop_requested.is_set():
             try:
                 self._logger.debug("Orchestrator cycle started")
-                await self._process_steps(context)
-                await asyncio.sleep(self._params.orchestrator_sleep.total_seconds())
+                # Every cycle is a trace of its own; the orchestrator's process span spans all of them.
+                PROFILER.cycle_started()
+                try:
+                    with TRACER.span("orchestrator.cycle", new_trace=True, orchestrator_id=self._config.id):
+                        await self._process_steps(context)
+                finally:
+                    PROFILER.cycle_finished()
+                await self._sleep(self._params.orchestrator_sleep)
 
             except Exception:
                 self._logger.exception("Orchestrator encountered an error")
                 if not self._params.always_retry:
                     raise
-                await asyncio.sleep(self._params.exception_sleep.total_seconds())
+                await self._sleep(self._params.exception_sleep)
+
+    async def _sleep(self, duration: timedelta) -> None:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._stop_requested.wait(), timeout=duration.total_seconds())
+
+
+def _split_run_on(step: PipeConfig) -> tuple[PipeConfig, RunOn]:
+    """Take ``run_on`` out of the step params, which the step's own params model may not accept."""
+    run_on = step.params.get(RUN_ON_PARAM, "all")
+    if run_on not in ("leader", "all"):
+        raise WrongConfigError(f"Step '{step.id}' has run_on '{run_on}'; expected 'leader' or 'all'.")
+    return without_run_on(step), run_on
@@ -0,0 +1,127 @@
+import asyncio
+import contextlib
+from datetime import timedelta
+from typing import Annotated, Any, ClassVar
+
+from open_ticket_ai import LoggerFactory, NoRenderField, Pipe, PipeFactory, StrictBaseModel
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig, PipeResult
+from open_ticket_ai.core.tracing.tracer import TRACER
+from pydantic import BaseModel, Field
+
+from otai_base.work_queues.sqlite_work_queue_service import LeasedItem, SqliteWorkQueueService
+
+
+class WorkQueueRunnerParams(StrictBaseModel):
+    run: Annotated[PipeConfig, NoRenderField(description="Pipe run for every leased ticket")]
+    queue: str = Field(default="tickets", description="Name of the work queue to consume.")
+    workers: int = Field(default=4, gt=0, description="Tickets processed at the same time.")
+    max_items: int | None = Field(
+        default=None, gt=0, description="Most tickets processed per run; by default until the queue is empty."
+    )
+    result_id: str | None = Field(
+        default=None,
+        description="Pipe id under which the leased ticket is handed to 'run' as 'fetched_tickets'; "
+        "by default the id of this runner.",
+    )
+    visibility_timeout: timedelta | None = Field(
+        default=None, description="Lease time per ticket; by default the work queue's visibility timeout."
+    )
+
+
+class WorkQueueRunner(Pipe[WorkQueueRunnerParams]):
+    """Processes tickets leased from a ``SqliteWorkQueueService`` with several concurrent workers.
+
+    Each ticket runs ``run`` in its own context, where it is the only ``fetched_tickets`` entry of
+    the pipe result ``result_id``. A ticket is acked when ``run`` succeeds or is skipped, and
+    nacked, i.e. retried later or dead-lettered, when it fails or raises. While a ticket is
+    processed its lease is extended so slow pipelines do not get it handed out twice. Note that a
+    ``CompositePipe`` reports success when a step fails after earlier steps succeeded.
+    """
+
+    ParamsModel: ClassVar[type[BaseModel]] = WorkQueueRunnerParams
+
+    def __init__(
+        self,
+        config: PipeConfig,
+        logger_factory: LoggerFactory,
+        pipe_factory: PipeFactory,
+        work_queue: SqliteWorkQueueService,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(config, logger_factory, *args, **kwargs)
+        self._factory = pipe_factory
+        self._work_queue = work_queue
+        self._remaining: int | None = None
+        self._counts = {"processed": 0, "failed": 0}
+
+    async def _process(self, context: PipeContext) -> PipeResult:
+        self._remaining = self._params.max_items
+        self._counts = {"processed": 0, "failed": 0}
+        async with asyncio.TaskGroup() as workers:
+            for _ in range(self._params.workers):
+                workers.create_task(self._work(context))
+        if not any(self._counts.values()):
+            return PipeResult.skipped(f"Work queue '{self._params.queue}' is empty.")
+        self._logger.info(
+            "📤 Processed %d ticket(s) from '%s', %d failed",
+            self._counts["processed"],
+            self._params.queue,
+            self._counts["failed"],
+        )
+        return PipeResult.success(data=dict(self._counts))
+
+    async def _work(self, context: PipeContext) -> None:
+        while self._remaining is None or self._remaining > 0:
+            if self._remaining is not None:
+                self._remaining -= 1
+            items = await self._work_queue.lease(self._params.queue, 1, self._params.visibility_timeout)
+            if not items:
+                return
+            (item,) = items
+            async with self._keep_leased(item):
+                error = await self._run(item, context)
+            if error is None:
+                await self._work_queue.ack(item)
+                self._counts["processed"] += 1
+            else:
+                self._logger.warning(f"Ticket {item.key} from '{item.queue}' failed (attempt {item.attempts}): {error}")
+                await self._work_queue.nack(item, error)
+                self._counts["failed"] += 1
+
+    async def _run(self, item: LeasedItem, context: PipeContext) -> str | None:
+        result_id = self._params.result_id or self._config.id
+        context = context.with_pipe_result(result_id, PipeResult.success(data={"fetched_tickets": [item.payload]}))
+        try:
+            # Every ticket has its own context, so its pipes are not worth caching.
+            pipe = await self._factory.create_pipe(self._params.run, context, cache=False)
+            try:
+                result = await pipe.process(context)
+            finally:
+                await pipe.astop()
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+        return (result.message or "Pipe failed.") if result.has_failed() else None
+
+    @contextlib.asynccontextmanager
+    async def _keep_leased(self, item: LeasedItem) -> Any:
+        timeout = self._params.visibility_timeout
+        interval = (timeout or self._work_queue.visibility_timeout).total_seconds() / 3
+
+        async def heartbeat() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                # A failed extension is retried on the next beat; should they all fail the lease expires as usual.
+                try:
+                    await self._work_queue.extend_lease(item, timeout)
+                except Exception:
+                    self._logger.exception(f"Failed to extend the lease of ticket {item.key} from '{item.queue}'")
+
+        task = TRACER.create_task(heartbeat())
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
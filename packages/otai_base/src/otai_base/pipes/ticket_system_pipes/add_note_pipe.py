@@ -28,16 +28,12 @@ class AddNotePipe(TicketSystemPipe[AddNoteParams]):
     async def _process(self, *_: Any, **__: Any) -> PipeResult:
         ticket_id_str = str(self._params.ticket_id)
 
-        self._logger.info(f"📌 Adding note to ticket: {ticket_id_str}")
-        self._logger.debug(
-            f"Note subject: {self._params.note.subject if hasattr(self._params.note, 'subject') else 'N/A'}"
-        )
-
-        note_preview = self._preview_note(self._params.note)
-        self._logger.debug(f"Note preview: {note_preview}")
+        self._logger.info("📌 Adding note to ticket: %s", ticket_id_str)
+        self._logger.debug("Note subject: %s", getattr(self._params.note, "subject", "N/A"))
+        self._logger.debug(lambda: f"Note preview: {self._preview_note(self._params.note)}")
 
         await self._ticket_system.add_note(ticket_id_str, self._params.note)
-        self._logger.info(f"✅ Successfully added note to ticket {ticket_id_str}")
+        self._logger.info("✅ Successfully added note to ticket %s", ticket_id_str)
         return PipeResult(succeeded=True, data={})
 
     def _preview_note(self, note: UnifiedNote) -> str:
@@ -1,8 +1,9 @@
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Literal
 
 from open_ticket_ai import StrictBaseModel
 from open_ticket_ai.core.pipes.pipe_models import PipeResult
-from open_ticket_ai.core.ticket_system_integration.unified_models import TicketSearchCriteria
+from open_ticket_ai.core.ticket_system_integration.unified_models import TicketSearchCriteria, UnifiedTicket
+from open_ticket_ai.core.workers.worker_shard import current_shard
 from pydantic import Field
 
 from otai_base.pipes.ticket_system_pipes.ticket_system_pipe import TicketSystemPipe
@@ -12,16 +13,40 @@ class FetchTicketsParams(StrictBaseModel):
     ticket_search_criteria: TicketSearchCriteria = Field(
         description="Search criteria including queue, limit, and offset for querying tickets from the ticket system."
     )
+    shard_by: Literal["id", "queue"] = Field(
+        default="id",
+        description=(
+            "With several worker processes, each keeps the fetched tickets whose id or queue hashes to it, "
+            "up to the search limit."
+        ),
+    )
 
 
 class FetchTicketsPipe(TicketSystemPipe[FetchTicketsParams]):
+    """Fetches the tickets matching the search criteria.
+
+    With several worker processes every worker runs the same search and keeps the tickets of its
+    shard. The search limit is multiplied by the number of workers, so each worker still gets up to
+    ``limit`` tickets per run and the workers together process ``limit`` times their number.
+    """
+
     ParamsModel: ClassVar[type[FetchTicketsParams]] = FetchTicketsParams
 
     async def _process(self, *_: Any, **__: Any) -> PipeResult:
         search_criteria = self._params.ticket_search_criteria
+        shard = current_shard()
+        if shard.count > 1:
+            search_criteria = search_criteria.model_copy(update={"limit": search_criteria.limit * shard.count})
+        tickets = await self._ticket_system.find_tickets(search_criteria)
+        owned = [ticket for ticket in tickets if shard.owns(self._shard_key(ticket))]
         return PipeResult(
             succeeded=True,
             data={
-                "fetched_tickets": (await self._ticket_system.find_tickets(search_criteria)),
+                "fetched_tickets": owned[: self._params.ticket_search_criteria.limit],
             },
         )
+
+    def _shard_key(self, ticket: UnifiedTicket) -> str | None:
+        if self._params.shard_by == "queue":
+            return (ticket.queue.name or ticket.queue.id) if ticket.queue else None
+        return ticket.id
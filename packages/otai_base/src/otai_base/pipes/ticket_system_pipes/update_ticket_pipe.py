@@ -19,8 +19,8 @@ class UpdateTicketPipe(TicketSystemPipe[UpdateTicketParams]):
     ParamsModel: ClassVar[type[UpdateTicketParams]] = UpdateTicketParams
 
     async def _process(self, *_: Any, **__: Any) -> PipeResult:
-        self._logger.info(f"📝 Updating ticket: {self._params.ticket_id}")
-        self._logger.debug(f"Update data: {self._params.updated_ticket.model_dump(exclude_none=True)}")
+        self._logger.info("📝 Updating ticket: %s", self._params.ticket_id)
+        self._logger.debug(lambda: f"Update data: {self._params.updated_ticket.model_dump(exclude_none=True)}")
 
         success = await self._ticket_system.update_ticket(
             ticket_id=str(self._params.ticket_id),
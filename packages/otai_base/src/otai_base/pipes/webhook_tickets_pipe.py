@@ -0,0 +1,38 @@
+from datetime import timedelta
+from typing import Any, ClassVar
+
+from open_ticket_ai import Pipe, StrictBaseModel
+from open_ticket_ai.core.pipes.pipe_models import PipeResult
+from pydantic import Field
+
+from otai_base.webhooks.webhook_ingestion_service import WebhookIngestionService
+
+
+class WebhookTicketsParams(StrictBaseModel):
+    max_tickets: int = Field(default=1, gt=0, description="Maximum number of received tickets handed out per run.")
+    wait_timeout: timedelta = Field(
+        default=timedelta(seconds=1),
+        description="How long to wait for the first ticket before the pipe fails with 'no tickets received'.",
+    )
+
+
+class WebhookTicketsPipe(Pipe[WebhookTicketsParams]):
+    """Hands out tickets received by a ``WebhookIngestionService`` as soon as they arrive.
+
+    The result uses the same ``fetched_tickets`` data key as ``FetchTicketsPipe``, so it can replace a
+    polling fetch step without changing the steps that follow. Fails when no ticket arrived within
+    ``wait_timeout`` so that dependent steps are skipped.
+    """
+
+    ParamsModel: ClassVar[type[WebhookTicketsParams]] = WebhookTicketsParams
+
+    def __init__(self, webhook_source: WebhookIngestionService, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._webhook_source = webhook_source
+
+    async def _process(self, *_: Any, **__: Any) -> PipeResult:
+        tickets = await self._webhook_source.receive(self._params.max_tickets, self._params.wait_timeout)
+        if not tickets:
+            return PipeResult.failure("No tickets received.")
+        self._logger.info("📨 Received %d ticket(s) via webhook", len(tickets))
+        return PipeResult.success(data={"fetched_tickets": tickets})
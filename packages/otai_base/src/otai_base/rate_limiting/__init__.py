@@ -0,0 +1,3 @@
+from otai_base.rate_limiting.rate_limited_service import RateLimitedService, RateLimitedServiceParams
+
+__all__ = ["RateLimitedService", "RateLimitedServiceParams"]
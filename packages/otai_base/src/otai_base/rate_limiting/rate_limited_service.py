@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import timedelta
+from typing import Any, ClassVar
+
+from open_ticket_ai import Injectable, StrictBaseModel
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+from pydantic import Field
+
+type Clock = Callable[[], float]
+
+_LIFECYCLE_METHODS = frozenset({"astart", "astop"})
+
+_WAIT = METRICS.histogram(
+    "otai_rate_limit_wait_seconds",
+    "Time calls waited for a free slot, a token and the end of a backoff before they started.",
+    ("service",),
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60),
+)
+_IN_FLIGHT = METRICS.gauge("otai_rate_limit_in_flight", "Calls to the wrapped service in progress.", ("service",))
+_WAITING = METRICS.gauge("otai_rate_limit_waiting", "Calls waiting to be let through.", ("service",))
+_BACKOFFS = METRICS.counter(
+    "otai_rate_limit_backoffs_total", "Calls that failed with a throttling or overload error.", ("service",)
+)
+_RATE = METRICS.gauge("otai_rate_limit_requests_per_second", "Current rate of the token bucket.", ("service",))
+
+
+class RateLimitedServiceParams(StrictBaseModel):
+    requests_per_second: float | None = Field(
+        default=None, gt=0, description="Most calls started per second; unlimited when unset."
+    )
+    burst: int = Field(default=1, gt=0, description="Calls that may start at once after an idle period.")
+    max_in_flight: int | None = Field(default=None, gt=0, description="Most calls in progress at the same time.")
+    methods: list[str] | None = Field(
+        default=None, description="Coroutine methods to limit; by default every public one of the wrapped service."
+    )
+    backoff_status_codes: list[int] = Field(
+        default_factory=lambda: [429, 500, 502, 503, 504],
+        description="HTTP status codes of errors that mean the backend is throttling or overloaded.",
+    )
+    backoff_on_timeout: bool = Field(default=True, description="Treat timeouts as overload, too.")
+    backoff: timedelta = Field(
+        default=timedelta(seconds=1), description="Pause after an overload error; doubles while they continue."
+    )
+    max_backoff: timedelta = Field(default=timedelta(seconds=60), description="Upper bound of the pause.")
+    min_rate_fraction: float = Field(
+        default=0.1, gt=0, le=1, description="Lowest fraction of requests_per_second that overload errors lower it to."
+    )
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, capacity: int, clock: Clock) -> None:
+        self.rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._clock = clock
+        self._updated = clock()
+        # Held while waiting for a token, so waiting calls are let through in order.
+        self._lock = asyncio.Lock()
+
+    async def take(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RateLimitedService(Injectable[RateLimitedServiceParams]):
+    """Limits the calls to another service so that its backend is not overloaded.
+
+    Configure it as a service that injects the wrapped one as ``service`` and inject it wherever
+    the wrapped service was injected. Its attributes are those of the wrapped service; the
+    coroutine methods are let through at most ``requests_per_second``, with up to ``burst`` at
+    once, and with at most ``max_in_flight`` running. Synchronous methods are passed through.
+
+    An error with one of the ``backoff_status_codes``, read from ``error.response.status_code``
+    as raised by e.g. httpx, or a timeout pauses all calls for ``backoff``, or the ``Retry-After``
+    the backend sent, doubling while the errors continue. It also halves the rate, down to
+    ``min_rate_fraction``; every successful call then raises it again by a tenth of the
+    configured rate. Failed calls are not retried, since they may not be safe to repeat.
+    """
+
+    ParamsModel: ClassVar[type[RateLimitedServiceParams]] = RateLimitedServiceParams
+
+    def __init__(self, service: Any, *args: Any, clock: Clock = time.monotonic, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._service = service
+        self._clock = clock
+        self._slots = asyncio.Semaphore(self._params.max_in_flight) if self._params.max_in_flight else None
+        rate = self._params.requests_per_second
+        self._bucket = _TokenBucket(rate, self._params.burst, clock) if rate else None
+        self._paused_until = 0.0
+        self._consecutive_backoffs = 0
+        self._limited: dict[str, Callable[..., Awaitable[Any]]] = {}
+        if rate:
+            _RATE.labels(self.injectable_id).set(rate)
+
+    @property
+    def wrapped_service(self) -> Any:
+        return self._service
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the wrapper itself lacks, i.e. those of the wrapped service.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attribute = getattr(self._service, name)
+        if not inspect.iscoroutinefunction(attribute) or not self._governs(name):
+            return attribute
+        limited = self._limited.get(name)
+        if limited is None:
+            limited = self._limited[name] = self._limit(attribute)
+        return limited
+
+    def _governs(self, name: str) -> bool:
+        if self._params.methods is not None:
+            return name in self._params.methods
+        return name not in _LIFECYCLE_METHODS
+
+    def _limit(self, method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(method)
+        async def limited(*args: Any, **kwargs: Any) -> Any:
+            async with self._admitted():
+                try:
+                    result = await method(*args, **kwargs)
+                except Exception as error:
+                    if self._is_overload(error):
+                        self._back_off(error)
+                    raise
+                self._recover()
+                return result
+
+        return limited
+
+    @contextlib.asynccontextmanager
+    async def _admitted(self) -> AsyncIterator[None]:
+        started = self._clock()
+        waiting = _WAITING.labels(self.injectable_id)
+        waiting.inc()
+        try:
+            if self._slots is not None:
+                await self._slots.acquire()
+            try:
+                while (pause := self._paused_until - self._clock()) > 0:
+                    await asyncio.sleep(pause)
+                if self._bucket is not None:
+                    await self._bucket.take()
+            except BaseException:
+                if self._slots is not None:
+                    self._slots.release()
+                raise
+        finally:
+            waiting.dec()
+        _WAIT.labels(self.injectable_id).observe(self._clock() - started)
+        in_flight = _IN_FLIGHT.labels(self.injectable_id)
+        in_flight.inc()
+        try:
+            yield
+        finally:
+            in_flight.dec()
+            if self._slots is not None:
+                self._slots.release()
+
+    def _is_overload(self, error: Exception) -> bool:
+        if self._params.backoff_on_timeout and _is_timeout(error):
+            return True
+        return _status_code(error) in self._params.backoff_status_codes
+
+    def _back_off(self, error: Exception) -> None:
+        _BACKOFFS.labels(self.injectable_id).inc()
+        now = self._clock()
+        # Calls that were already running when the pause began fail for the same reason; they
+        # do not make the pause longer.
+        if now < self._paused_until:
+            return
+        self._consecutive_backoffs += 1
+        pause = self._params.backoff.total_seconds() * 2 ** (self._consecutive_backoffs - 1)
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            pause = max(pause, retry_after)
+        pause = min(pause, self._params.max_backoff.total_seconds())
+        self._paused_until = now + pause
+        if self._bucket is not None and self._params.requests_per_second is not None:
+            lowest = self._params.requests_per_second * self._params.min_rate_fraction
+            self._set_rate(self._bucket, max(lowest, self._bucket.rate / 2))
+        self._logger.warning(f"Backend of '{self.injectable_id}' is overloaded ({error!r}); pausing for {pause:.1f}s")
+
+    def _recover(self) -> None:
+        self._consecutive_backoffs = 0
+        configured = self._params.requests_per_second
+        if self._bucket is not None and configured is not None and self._bucket.rate < configured:
+            self._set_rate(self._bucket, min(configured, self._bucket.rate + configured / 10))
+
+    def _set_rate(self, bucket: _TokenBucket, rate: float) -> None:
+        bucket.rate = rate
+        _RATE.labels(self.injectable_id).set(rate)
+
+
+def _status_code(error: Exception) -> int | None:
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is None:
+        status = getattr(error, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Seconds from a ``Retry-After`` header of the error's response; dates are not supported."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_timeout(error: Exception) -> bool:
+    # httpx and other clients raise timeouts that do not derive from the built-in TimeoutError.
+    return any(cls.__name__.endswith(("Timeout", "TimeoutError", "TimeoutException")) for cls in type(error).__mro__)
@@ -1,3 +1,4 @@
+from ast import literal_eval, parse
 from typing import Any, ClassVar
 
 from injector import inject
@@ -14,6 +15,8 @@ from otai_base.template_renderers.jinja_renderer_extras import (
     has_failed,
 )
 
+_JINJA_MARKERS = ("{{", "{%", "{#")
+
 
 class JinjaRenderer(TemplateRenderer):
     ParamsModel: ClassVar[type[BaseModel]] = StrictBaseModel
@@ -23,6 +26,17 @@ class JinjaRenderer(TemplateRenderer):
         super().__init__(config, logger_factory)
         self._jinja_env = NativeEnvironment(trim_blocks=True, lstrip_blocks=True, enable_async=True)
 
+    def is_template(self, value: str) -> bool:
+        # The native environment normalizes newlines, strips a trailing one and turns empty output and
+        # Python literals into values, so only strings that pass through unchanged count as static.
+        if not value or "\r" in value or value.endswith("\n") or any(m in value for m in _JINJA_MARKERS):
+            return True
+        try:
+            literal_eval(parse(value, mode="eval"))
+        except (ValueError, SyntaxError, MemoryError):
+            return False
+        return True
+
     async def _render(self, template_str: str, context: dict[str, Any]) -> Any:
         self._jinja_env.globals.update(context)
         self._jinja_env.globals["at_path"] = at_path
@@ -0,0 +1,6 @@
+from otai_base.ticket_ledgers.processed_ticket_ledger_service import (
+    ProcessedTicketLedgerService,
+    ProcessedTicketLedgerServiceParams,
+)
+
+__all__ = ["ProcessedTicketLedgerService", "ProcessedTicketLedgerServiceParams"]
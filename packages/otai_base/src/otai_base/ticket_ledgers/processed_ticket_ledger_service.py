@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, ClassVar
+
+from open_ticket_ai import Injectable, StrictBaseModel
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+from pydantic import BaseModel, Field
+
+type Clock = Callable[[], float]
+type LedgerKey = tuple[str, str, str]
+
+_TICKETS = METRICS.counter(
+    "otai_ledger_tickets_total",
+    "Tickets checked against the processed-ticket ledger, by outcome: new or duplicate.",
+    ("ledger", "outcome"),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed_tickets (
+    ticket_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    pipeline_version TEXT NOT NULL,
+    processed_at REAL NOT NULL,
+    PRIMARY KEY (ticket_id, content_hash, pipeline_version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS processed_tickets_age ON processed_tickets (processed_at);
+"""
+# Stays below SQLite's default limit of bound parameters per statement.
+_LOOKUP_CHUNK = 300
+
+
+class ProcessedTicketLedgerServiceParams(StrictBaseModel):
+    pipeline_version: str = Field(
+        default="1", description="Bump to process every ticket again, e.g. after changing models or prompts."
+    )
+    hashed_fields: list[str] = Field(
+        default_factory=lambda: ["subject", "body"],
+        description="Ticket fields whose change makes a processed ticket count as new again.",
+    )
+    path: Path | None = Field(
+        default=None, description="SQLite file keeping the ledger across restarts; in memory only when unset."
+    )
+    max_entries: int = Field(default=100_000, gt=0, description="Most entries kept in memory, least recent dropped.")
+    retention: timedelta = Field(
+        default=timedelta(days=30), description="How long a processed ticket is remembered in the SQLite file."
+    )
+
+
+class ProcessedTicketLedgerService(Injectable[ProcessedTicketLedgerServiceParams]):
+    """Remembers which tickets a pipeline has processed, keyed by ticket id, content hash and pipeline version.
+
+    A ticket counts as processed until one of its ``hashed_fields`` changes or the
+    ``pipeline_version`` is bumped. Lookups are answered from memory. With a ``path`` the ledger
+    is also written to SQLite, which is asked in one query per batch for tickets not in memory, so
+    it survives restarts and can be shared by processes on one host. Tickets without an id are
+    never treated as processed.
+    """
+
+    ParamsModel: ClassVar[type[BaseModel]] = ProcessedTicketLedgerServiceParams
+
+    def __init__(self, *args: Any, clock: Clock = time.time, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._clock = clock
+        self._entries: OrderedDict[LedgerKey, None] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    async def astart(self) -> None:
+        if self._params.path is not None:
+            await asyncio.to_thread(self._connect)
+
+    async def astop(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def key(self, ticket: UnifiedTicket) -> LedgerKey | None:
+        if ticket.id is None:
+            return None
+        content = ticket.model_dump(mode="json", include=set(self._params.hashed_fields))
+        content_hash = hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()[:32]
+        return ticket.id, content_hash, self._params.pipeline_version
+
+    async def filter_new(self, tickets: Sequence[UnifiedTicket]) -> list[UnifiedTicket]:
+        """The tickets not processed yet, in their original order."""
+        keys = [self.key(ticket) for ticket in tickets]
+        processed = {key for key in keys if key in self._entries}
+        unknown = [key for key in keys if key is not None and key not in processed]
+        if unknown and self._params.path is not None:
+            processed.update(await asyncio.to_thread(self._stored, unknown))
+        new = [ticket for ticket, key in zip(tickets, keys, strict=True) if key not in processed]
+        for key in processed:
+            self._remember(key)
+        _TICKETS.labels(self.injectable_id, "new").inc(len(new))
+        _TICKETS.labels(self.injectable_id, "duplicate").inc(len(tickets) - len(new))
+        return new
+
+    async def record(self, tickets: Sequence[UnifiedTicket]) -> None:
+        """Mark the tickets, in their current content, as processed."""
+        keys = [key for ticket in tickets if (key := self.key(ticket)) is not None]
+        for key in keys:
+            self._remember(key)
+        if keys and self._params.path is not None:
+            await asyncio.to_thread(self._store, keys)
+
+    def _remember(self, key: LedgerKey) -> None:
+        self._entries[key] = None
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._params.max_entries:
+            self._entries.popitem(last=False)
+
+    def _stored(self, keys: list[LedgerKey]) -> list[LedgerKey]:
+        stored: list[LedgerKey] = []
+        with self._lock:
+            connection = self._connection or self._connect_locked()
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start : start + _LOOKUP_CHUNK]
+                rows = ", ".join("(?, ?, ?)" for _ in chunk)
+                stored.extend(
+                    connection.execute(
+                        "SELECT ticket_id, content_hash, pipeline_version FROM processed_tickets "
+                        f"WHERE (ticket_id, content_hash, pipeline_version) IN (VALUES {rows})",
+                        [part for key in chunk for part in key],
+                    ).fetchall()
+                )
+        return stored
+
+    def _store(self, keys: list[LedgerKey]) -> None:
+        now = self._clock()
+        with self._lock:
+            connection = self._connection or self._connect_locked()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO processed_tickets VALUES (?, ?, ?, ?)", [(*key, now) for key in keys]
+                )
+
+    def _connect(self) -> None:
+        with self._lock:
+            if self._connection is None:
+                self._connect_locked()
+
+    def _connect_locked(self) -> sqlite3.Connection:
+        path = self._params.path
+        if path is None:
+            raise RuntimeError(f"Ledger '{self.injectable_id}' has no SQLite path.")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.executescript(_SCHEMA)
+        with connection:
+            pruned = connection.execute(
+                "DELETE FROM processed_tickets WHERE processed_at < ?",
+                (self._clock() - self._params.retention.total_seconds(),),
+            ).rowcount
+        self._connection = connection
+        self._logger.info("📒 Ticket ledger opened at %s, %d expired entries pruned", path, pruned)
+        return connection
@@ -0,0 +1,11 @@
+from otai_base.ticket_system_services.caching_ticket_system_service import (
+    CacheStats,
+    CachingTicketSystemService,
+    CachingTicketSystemServiceParams,
+)
+
+__all__ = [
+    "CacheStats",
+    "CachingTicketSystemService",
+    "CachingTicketSystemServiceParams",
+]
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, ClassVar
+
+from open_ticket_ai import StrictBaseModel
+from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
+from open_ticket_ai.core.ticket_system_integration.unified_models import (
+    TicketRevision,
+    TicketSearchCriteria,
+    UnifiedNote,
+    UnifiedTicket,
+)
+from pydantic import Field
+
+type Clock = Callable[[], float]
+
+
+class CachingTicketSystemServiceParams(StrictBaseModel):
+    ttl: timedelta = Field(
+        default=timedelta(seconds=30),
+        description="How long a cached ticket is served without asking the wrapped ticket system again.",
+    )
+    max_size: int = Field(default=1024, gt=0, description="Maximum number of tickets kept in the LRU cache.")
+    search_ttl: timedelta = Field(
+        default=timedelta(0),
+        description=(
+            "How long search results are reused for identical criteria. Zero disables search result caching, "
+            "so new tickets are always seen on the next search."
+        ),
+    )
+    report_every: int = Field(
+        default=0,
+        ge=0,
+        description="Log the cache hit rate every N lookups. Zero disables periodic reporting.",
+    )
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+@dataclass(slots=True)
+class _CacheEntry[T]:
+    value: T
+    expires_at: float
+    version: str | None = None
+
+
+class CachingTicketSystemService(TicketSystemService):
+    """Read-through cache in front of another ticket system service.
+
+    Tickets are cached by id in an LRU with a TTL. Expired entries are revalidated with
+    ``get_ticket_revision`` so backends supporting conditional requests can answer with
+    "not modified" instead of resending the ticket. Writes through ``update_ticket`` and
+    ``add_note`` invalidate the ticket and all cached search results.
+    """
+
+    ParamsModel: ClassVar[type[CachingTicketSystemServiceParams]] = CachingTicketSystemServiceParams
+
+    def __init__(
+        self,
+        ticket_system: TicketSystemService,
+        *args: Any,
+        clock: Clock = time.monotonic,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._ticket_system = ticket_system
+        self._clock = clock
+        self._tickets: OrderedDict[str, _CacheEntry[UnifiedTicket | None]] = OrderedDict()
+        self._searches: OrderedDict[TicketSearchCriteria, _CacheEntry[list[UnifiedTicket]]] = OrderedDict()
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    async def get_ticket(self, ticket_id: str) -> UnifiedTicket | None:
+        key = str(ticket_id)
+        entry = self._tickets.get(key)
+        now = self._clock()
+        if entry is not None and entry.expires_at > now:
+            self._tickets.move_to_end(key)
+            self._record_lookup(hit=True)
+            return entry.value
+
+        revision = await self._ticket_system.get_ticket_revision(key, entry.version if entry else None)
+        if entry is not None and not revision.modified:
+            self._stats.revalidations += 1
+            self._record_lookup(hit=True)
+            self._store_ticket(key, entry.value, revision.version or entry.version)
+            return entry.value
+
+        self._record_lookup(hit=False)
+        self._store_ticket(key, revision.ticket, revision.version)
+        return revision.ticket
+
+    async def get_ticket_revision(self, ticket_id: str, known_version: str | None = None) -> TicketRevision:
+        return await self._ticket_system.get_ticket_revision(ticket_id, known_version)
+
+    async def find_tickets(self, criteria: TicketSearchCriteria | None = None, **kwargs: Any) -> list[UnifiedTicket]:
+        search_ttl = self._params.search_ttl.total_seconds()
+        if criteria is None or kwargs or search_ttl <= 0:
+            return self._store_found(await self._ticket_system.find_tickets(criteria, **kwargs))
+
+        entry = self._searches.get(criteria)
+        if entry is not None and entry.expires_at > self._clock():
+            self._searches.move_to_end(criteria)
+            self._record_lookup(hit=True)
+            return list(entry.value)
+
+        self._record_lookup(hit=False)
+        tickets = self._store_found(await self._ticket_system.find_tickets(criteria))
+        self._searches[criteria] = _CacheEntry(value=tickets, expires_at=self._clock() + search_ttl)
+        self._searches.move_to_end(criteria)
+        self._trim(self._searches)
+        return list(tickets)
+
+    async def find_first_ticket(
+        self, criteria: TicketSearchCriteria | None = None, **kwargs: Any
+    ) -> UnifiedTicket | None:
+        tickets = await self.find_tickets(criteria, **kwargs)
+        return tickets[0] if tickets else None
+
+    async def create_ticket(self, ticket: UnifiedTicket | None = None, **kwargs: Any) -> Any:
+        self._invalidate_searches()
+        return await self._ticket_system.create_ticket(ticket, **kwargs)
+
+    async def update_ticket(self, ticket_id: str, updates: UnifiedTicket | None = None, **kwargs: Any) -> bool:
+        self.invalidate(ticket_id)
+        try:
+            return await self._ticket_system.update_ticket(ticket_id, updates, **kwargs)
+        finally:
+            self.invalidate(ticket_id)
+
+    async def add_note(self, ticket_id: str, note: UnifiedNote | None = None, **kwargs: Any) -> bool:
+        self.invalidate(ticket_id)
+        try:
+            return await self._ticket_system.add_note(ticket_id, note, **kwargs)
+        finally:
+            self.invalidate(ticket_id)
+
+    def invalidate(self, ticket_id: str) -> None:
+        if self._tickets.pop(str(ticket_id), None) is not None:
+            self._stats.invalidations += 1
+        self._invalidate_searches()
+
+    def clear(self) -> None:
+        self._tickets.clear()
+        self._searches.clear()
+
+    def _store_found(self, tickets: list[UnifiedTicket]) -> list[UnifiedTicket]:
+        for ticket in tickets:
+            if ticket.id:
+                self._store_ticket(ticket.id, ticket, None)
+        return tickets
+
+    def _store_ticket(self, ticket_id: str, ticket: UnifiedTicket | None, version: str | None) -> None:
+        self._tickets[ticket_id] = _CacheEntry(
+            value=ticket, expires_at=self._clock() + self._params.ttl.total_seconds(), version=version
+        )
+        self._tickets.move_to_end(ticket_id)
+        self._trim(self._tickets)
+
+    def _trim(self, entries: OrderedDict[Any, Any]) -> None:
+        while len(entries) > self._params.max_size:
+            entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def _invalidate_searches(self) -> None:
+        self._searches.clear()
+
+    def _record_lookup(self, *, hit: bool) -> None:
+        if hit:
+            self._stats.hits += 1
+        else:
+            self._stats.misses += 1
+        report_every = self._params.report_every
+        if report_every and self._stats.lookups % report_every == 0:
+            self._logger.info(
+                f"📊 Ticket cache hit rate {self._stats.hit_rate:.1%} "
+                f"({self._stats.hits} hits, {self._stats.misses} misses, "
+                f"{self._stats.revalidations} revalidated, {len(self._tickets)} cached)"
+            )
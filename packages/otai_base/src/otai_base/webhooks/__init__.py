@@ -0,0 +1,9 @@
+from otai_base.webhooks.webhook_ingestion_service import WebhookIngestionService, WebhookIngestionServiceParams
+from otai_base.webhooks.webhook_payloads import OTOBOWebhookPayload, ZammadWebhookPayload
+
+__all__ = [
+    "OTOBOWebhookPayload",
+    "WebhookIngestionService",
+    "WebhookIngestionServiceParams",
+    "ZammadWebhookPayload",
+]
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import json
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Any, ClassVar, Self
+
+from open_ticket_ai import Injectable, StrictBaseModel
+from open_ticket_ai.core.http.local_http_server import HttpRequest, HttpResponse, LocalHttpServer
+from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+from pydantic import BaseModel, Field, ValidationError, model_validator
+
+from otai_base.webhooks.webhook_payloads import OTOBOWebhookPayload, ZammadWebhookPayload
+
+_TOKEN_HEADER = "X-OTAI-Token"
+_ZAMMAD_SIGNATURE_HEADER = "X-Hub-Signature"
+
+
+class WebhookIngestionServiceParams(StrictBaseModel):
+    host: str = Field(
+        default="127.0.0.1",
+        description="Interface the webhook listener binds to; other than loopback it needs an auth token or secret.",
+    )
+    port: int = Field(default=8085, ge=0, le=65535, description="Port of the webhook listener; 0 picks a free port.")
+    zammad_path: str = Field(default="/webhooks/zammad", description="Path receiving Zammad webhook calls.")
+    otobo_path: str = Field(
+        default="/webhooks/otobo", description="Path receiving OTOBO/Znuny GenericInterface invoker calls."
+    )
+    queue_size: int = Field(
+        default=1000, gt=0, description="Maximum number of received tickets waiting to be processed."
+    )
+    max_body_bytes: int = Field(default=1024 * 1024, gt=0, description="Maximum accepted request body size.")
+    auth_token: str | None = Field(
+        default=None,
+        description=f"Shared token expected in the '{_TOKEN_HEADER}' header or 'token' query parameter.",
+    )
+    zammad_hmac_secret: str | None = Field(
+        default=None,
+        description=f"Zammad webhook HMAC SHA1 token used to verify the '{_ZAMMAD_SIGNATURE_HEADER}' header.",
+    )
+    hydrate_tickets: bool = Field(
+        default=True,
+        description="Load tickets that arrive with only an id from the injected ticket system before handing out.",
+    )
+
+    @model_validator(mode="after")
+    def _require_credentials_off_loopback(self) -> Self:
+        if not _is_loopback(self.host) and self.auth_token is None and self.zammad_hmac_secret is None:
+            raise ValueError(
+                f"The webhook listener on '{self.host}' is reachable from other hosts; "
+                "set 'auth_token' or 'zammad_hmac_secret', or bind it to 127.0.0.1."
+            )
+        return self
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class WebhookIngestionService(Injectable[WebhookIngestionServiceParams]):
+    """Receives ticket webhooks over HTTP and buffers them in a bounded in-process queue.
+
+    The listener starts when the pipe factory starts the service, or on first use. When the queue
+    is full, requests are answered with ``503`` so the sending ticket system retries later instead
+    of tickets being dropped.
+    """
+
+    ParamsModel: ClassVar[type[BaseModel]] = WebhookIngestionServiceParams
+
+    def __init__(self, *args: Any, ticket_system: TicketSystemService | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._ticket_system = ticket_system
+        self._queue: asyncio.Queue[UnifiedTicket] = asyncio.Queue(maxsize=self._params.queue_size)
+        self._server = LocalHttpServer(
+            self._handle_request,
+            logger=self._logger,
+            host=self._params.host,
+            port=self._params.port,
+            max_body_bytes=self._params.max_body_bytes,
+        )
+        self._start_lock = asyncio.Lock()
+        self.rejected_count = 0
+
+    @property
+    def port(self) -> int:
+        return self._server.port
+
+    @property
+    def queued_count(self) -> int:
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        if self._server.is_running:
+            return
+        async with self._start_lock:
+            await self._server.start()
+
+    async def aclose(self) -> None:
+        await self._server.aclose()
+
+    async def astart(self) -> None:
+        await self.start()
+
+    async def astop(self) -> None:
+        await self.aclose()
+
+    def enqueue(self, ticket: UnifiedTicket) -> bool:
+        try:
+            self._queue.put_nowait(ticket)
+        except asyncio.QueueFull:
+            self.rejected_count += 1
+            return False
+        return True
+
+    async def receive(self, max_tickets: int, wait_timeout: timedelta) -> list[UnifiedTicket]:
+        """Wait up to ``wait_timeout`` for the first ticket, then drain up to ``max_tickets`` without waiting."""
+        await self.start()
+        try:
+            first = await asyncio.wait_for(self._queue.get(), timeout=wait_timeout.total_seconds())
+        except TimeoutError:
+            return []
+        tickets = [first]
+        while len(tickets) < max_tickets and not self._queue.empty():
+            tickets.append(self._queue.get_nowait())
+        return [await self._hydrate(ticket) for ticket in tickets]
+
+    async def _hydrate(self, ticket: UnifiedTicket) -> UnifiedTicket:
+        if not self._params.hydrate_tickets or self._ticket_system is None or ticket.id is None:
+            return ticket
+        if ticket.subject or ticket.body:
+            return ticket
+        try:
+            loaded = await self._ticket_system.get_ticket(ticket.id)
+        except Exception as e:
+            self._logger.warning(f"Could not load ticket {ticket.id}; handing out the webhook payload instead: {e!r}")
+            return ticket
+        return loaded or ticket
+
+    async def _handle_request(self, request: HttpRequest) -> HttpResponse:
+        if request.path not in (self._params.zammad_path, self._params.otobo_path):
+            return HttpResponse.json(HTTPStatus.NOT_FOUND, {"error": f"unknown path {request.path}"})
+        if request.method != "POST":
+            return HttpResponse.json(HTTPStatus.METHOD_NOT_ALLOWED, {"error": "only POST is supported"})
+        if not self._is_authorized(request):
+            return HttpResponse.json(HTTPStatus.UNAUTHORIZED, {"error": "invalid webhook credentials"})
+
+        try:
+            payload = json.loads(request.body or b"{}")
+            ticket = self._to_unified_ticket(request.path, payload)
+        except (ValueError, ValidationError) as e:
+            self._logger.warning(f"Rejected webhook payload on {request.path}: {e}")
+            return HttpResponse.json(HTTPStatus.BAD_REQUEST, {"error": "invalid payload"})
+
+        if not self.enqueue(ticket):
+            self._logger.warning(f"Webhook queue full ({self._params.queue_size}); rejecting ticket {ticket.id}")
+            return HttpResponse.json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "queue full"})
+        self._logger.debug(f"📨 Queued ticket {ticket.id} from {request.path}")
+        return HttpResponse.json(HTTPStatus.ACCEPTED, {"queued": ticket.id})
+
+    def _to_unified_ticket(self, path: str, payload: Any) -> UnifiedTicket:
+        if path == self._params.zammad_path:
+            return ZammadWebhookPayload.model_validate(payload).to_unified_ticket()
+        return OTOBOWebhookPayload.model_validate(payload).to_unified_ticket()
+
+    def _is_authorized(self, request: HttpRequest) -> bool:
+        token = self._params.auth_token
+        if token is not None:
+            presented = request.header(_TOKEN_HEADER) or request.query.get("token") or ""
+            if not hmac.compare_digest(presented, token):
+                return False
+        secret = self._params.zammad_hmac_secret
+        if secret is not None and request.path == self._params.zammad_path:
+            expected = "sha1=" + hmac.new(secret.encode(), request.body, hashlib.sha1).hexdigest()
+            if not hmac.compare_digest(request.header(_ZAMMAD_SIGNATURE_HEADER) or "", expected):
+                return False
+        return True
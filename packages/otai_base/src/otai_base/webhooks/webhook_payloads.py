@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from typing import Any
+
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedEntity, UnifiedNote, UnifiedTicket
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
+
+
+class _LenientModel(BaseModel):
+    model_config = ConfigDict(extra="ignore", populate_by_name=True, coerce_numbers_to_str=True)
+
+
+def _entity_from(value: Any, entity_id: Any = None) -> UnifiedEntity | None:
+    if isinstance(value, dict):
+        entity_id = value.get("id", entity_id)
+        value = value.get("name") or value.get("login") or value.get("email")
+    if value is None and entity_id is None:
+        return None
+    return UnifiedEntity(
+        id=str(entity_id) if entity_id is not None else None,
+        name=str(value) if value is not None else None,
+    )
+
+
+class ZammadWebhookArticle(_LenientModel):
+    id: str | None = None
+    subject: str | None = None
+    body: str | None = None
+    content_type: str | None = None
+
+
+class ZammadWebhookTicket(_LenientModel):
+    id: str
+    title: str | None = None
+    group: Any = None
+    group_id: str | None = None
+    priority: Any = None
+    priority_id: str | None = None
+    customer: Any = None
+    customer_id: str | None = None
+    articles: list[ZammadWebhookArticle] | None = None
+
+
+class ZammadWebhookPayload(_LenientModel):
+    """Body sent by Zammad webhooks (``Manage > Webhooks``) attached to a trigger."""
+
+    ticket: ZammadWebhookTicket
+    article: ZammadWebhookArticle | None = None
+
+    def to_unified_ticket(self) -> UnifiedTicket:
+        articles = list(self.ticket.articles or [])
+        if self.article is not None and all(a.id != self.article.id for a in articles):
+            articles.append(self.article)
+        notes = [
+            UnifiedNote(
+                id=article.id,
+                subject=article.subject or "",
+                body=article.body or "",
+                content_type=article.content_type,
+            )
+            for article in articles
+        ]
+        return UnifiedTicket(
+            id=self.ticket.id,
+            subject=self.ticket.title or "",
+            queue=_entity_from(self.ticket.group, self.ticket.group_id),
+            priority=_entity_from(self.ticket.priority, self.ticket.priority_id),
+            customer=_entity_from(self.ticket.customer, self.ticket.customer_id),
+            notes=notes,
+            body=notes[0].body if notes else "",
+        )
+
+
+class OTOBOWebhookArticle(_LenientModel):
+    article_id: str | None = Field(default=None, validation_alias=AliasChoices("ArticleID", "article_id"))
+    subject: str | None = Field(default=None, validation_alias=AliasChoices("Subject", "subject"))
+    body: str | None = Field(default=None, validation_alias=AliasChoices("Body", "body"))
+    content_type: str | None = Field(default=None, validation_alias=AliasChoices("ContentType", "content_type"))
+
+
+class OTOBOWebhookTicket(_LenientModel):
+    ticket_id: str = Field(validation_alias=AliasChoices("TicketID", "ticket_id"))
+    title: str | None = Field(default=None, validation_alias=AliasChoices("Title", "title"))
+    queue: str | None = Field(default=None, validation_alias=AliasChoices("Queue", "queue"))
+    queue_id: str | None = Field(default=None, validation_alias=AliasChoices("QueueID", "queue_id"))
+    priority: str | None = Field(default=None, validation_alias=AliasChoices("Priority", "priority"))
+    priority_id: str | None = Field(default=None, validation_alias=AliasChoices("PriorityID", "priority_id"))
+    customer_user_id: str | None = Field(
+        default=None, validation_alias=AliasChoices("CustomerUserID", "customer_user_id")
+    )
+    articles: list[OTOBOWebhookArticle] = Field(
+        default_factory=list, validation_alias=AliasChoices("Article", "Articles", "articles")
+    )
+
+    @field_validator("articles", mode="before")
+    @classmethod
+    def _wrap_single_article(cls, value: Any) -> Any:
+        if isinstance(value, dict):
+            return [value]
+        return value or []
+
+
+class OTOBOWebhookEvent(_LenientModel):
+    event: str | None = Field(default=None, validation_alias=AliasChoices("Event", "event"))
+    ticket_id: str | None = Field(default=None, validation_alias=AliasChoices("TicketID", "ticket_id"))
+
+
+class OTOBOWebhookPayload(_LenientModel):
+    """Body sent by an OTOBO/Znuny GenericInterface HTTP::REST invoker (e.g. ``Ticket::Generic``).
+
+    Invokers configured without ticket data only send the ``Event`` block; such tickets carry just
+    their id and are completed by the ingestion service when a ticket system is injected.
+    """
+
+    event: OTOBOWebhookEvent | None = Field(default=None, validation_alias=AliasChoices("Event", "event"))
+    ticket: OTOBOWebhookTicket | None = Field(default=None, validation_alias=AliasChoices("Ticket", "ticket"))
+
+    def to_unified_ticket(self) -> UnifiedTicket:
+        if self.ticket is None:
+            if self.event is None or self.event.ticket_id is None:
+                raise ValueError("OTOBO/Znuny payload contains neither 'Ticket' nor 'Event.TicketID'.")
+            return UnifiedTicket(id=self.event.ticket_id)
+        notes = [
+            UnifiedNote(
+                id=article.article_id,
+                subject=article.subject or "",
+                body=article.body or "",
+                content_type=article.content_type,
+            )
+            for article in self.ticket.articles
+        ]
+        return UnifiedTicket(
+            id=self.ticket.ticket_id,
+            subject=self.ticket.title or "",
+            queue=_entity_from(self.ticket.queue, self.ticket.queue_id),
+            priority=_entity_from(self.ticket.priority, self.ticket.priority_id),
+            customer=_entity_from(self.ticket.customer_user_id),
+            notes=notes,
+            body=notes[0].body if notes else "",
+        )
@@ -0,0 +1,15 @@
+from otai_base.work_queues.sqlite_work_queue_service import (
+    DeadLetter,
+    LeasedItem,
+    QueueStats,
+    SqliteWorkQueueService,
+    SqliteWorkQueueServiceParams,
+)
+
+__all__ = [
+    "DeadLetter",
+    "LeasedItem",
+    "QueueStats",
+    "SqliteWorkQueueService",
+    "SqliteWorkQueueServiceParams",
+]
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, ClassVar
+
+from open_ticket_ai import Injectable, StrictBaseModel
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+from pydantic import BaseModel, Field
+
+type Clock = Callable[[], float]
+
+_ITEMS = METRICS.counter(
+    "otai_work_queue_items_total",
+    "Work queue items by event: enqueued, leased, acked, retried or dead_lettered.",
+    ("queue", "event"),
+)
+_WAIT = METRICS.histogram(
+    "otai_work_queue_wait_seconds",
+    "Time from enqueueing an item until it was first leased.",
+    ("queue",),
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    queue TEXT NOT NULL,
+    dedupe_key TEXT,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_token TEXT,
+    enqueued_at REAL NOT NULL,
+    last_error TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS queue_items_dedupe ON queue_items (queue, dedupe_key);
+CREATE INDEX IF NOT EXISTS queue_items_available ON queue_items (queue, available_at);
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id INTEGER PRIMARY KEY,
+    queue TEXT NOT NULL,
+    dedupe_key TEXT,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    enqueued_at REAL NOT NULL,
+    failed_at REAL NOT NULL,
+    last_error TEXT
+);
+"""
+_TO_DEAD_LETTERS = """
+INSERT INTO dead_letters (id, queue, dedupe_key, payload, attempts, enqueued_at, failed_at, last_error)
+SELECT id, queue, dedupe_key, payload, attempts, enqueued_at, ?, COALESCE(?, last_error) FROM queue_items
+"""
+
+
+class SqliteWorkQueueServiceParams(StrictBaseModel):
+    path: Path = Field(
+        default=Path("otai_work_queue.sqlite3"),
+        description="SQLite database file; processes sharing it share the queues.",
+    )
+    visibility_timeout: timedelta = Field(
+        default=timedelta(minutes=5),
+        description="How long a leased item stays invisible to other consumers before it is handed out again.",
+    )
+    max_attempts: int = Field(
+        default=5, gt=0, description="Leases per item before a failure moves it to the dead letters."
+    )
+    retry_delay: timedelta = Field(
+        default=timedelta(seconds=30), description="Delay before a failed item is retried; doubles per attempt."
+    )
+    max_retry_delay: timedelta = Field(default=timedelta(minutes=15), description="Upper bound of the retry delay.")
+
+
+class LeasedItem(StrictBaseModel):
+    id: int
+    queue: str
+    key: str | None = Field(default=None, description="Deduplication key, e.g. the ticket id.")
+    payload: dict[str, Any]
+    attempts: int = Field(description="Number of leases including this one.")
+    lease_token: str
+    enqueued_at: float
+
+
+class DeadLetter(StrictBaseModel):
+    id: int
+    queue: str
+    key: str | None = None
+    payload: dict[str, Any]
+    attempts: int
+    enqueued_at: float
+    failed_at: float
+    last_error: str | None = None
+
+
+class QueueStats(StrictBaseModel):
+    ready: int = Field(description="Items that can be leased now.")
+    delayed: int = Field(description="Failed items waiting for their retry delay.")
+    leased: int = Field(description="Items leased by a consumer, including expired leases.")
+    dead: int = Field(description="Items in the dead letters.")
+
+
+class SqliteWorkQueueService(Injectable[SqliteWorkQueueServiceParams]):
+    """Durable work queues in a local SQLite database in WAL mode, without a broker.
+
+    ``lease`` hands out items for ``visibility_timeout``. A consumer then calls ``ack`` when it is
+    done or ``nack`` to retry the item later. Items whose lease expires, e.g. because the consumer
+    crashed, are handed out again. After ``max_attempts`` leases a failing item moves to the dead
+    letters. Items with a key are enqueued at most once while they are in the queue.
+
+    Several processes can share the database file. Calls run in a worker thread so the event loop
+    does not wait for disk syncs.
+    """
+
+    ParamsModel: ClassVar[type[BaseModel]] = SqliteWorkQueueServiceParams
+
+    def __init__(self, *args: Any, clock: Clock = time.time, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._clock = clock
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def visibility_timeout(self) -> timedelta:
+        return self._params.visibility_timeout
+
+    async def astart(self) -> None:
+        await asyncio.to_thread(self._connect)
+
+    async def astop(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    async def enqueue(self, queue: str, items: Sequence[tuple[str | None, dict[str, Any]]]) -> int:
+        """Add ``(key, payload)`` items and return how many were new; keys already queued are skipped."""
+        now = self._clock()
+        rows = [(queue, key, json.dumps(payload), now, now) for key, payload in items]
+
+        def enqueue(connection: sqlite3.Connection) -> int:
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT INTO queue_items (queue, dedupe_key, payload, available_at, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (queue, dedupe_key) DO NOTHING",
+                rows,
+            )
+            return connection.total_changes - before
+
+        added = await self._transaction(enqueue)
+        _ITEMS.labels(queue, "enqueued").inc(added)
+        return added
+
+    async def lease(self, queue: str, limit: int = 1, visibility_timeout: timedelta | None = None) -> list[LeasedItem]:
+        """Lease up to ``limit`` available items, oldest first."""
+        timeout = (visibility_timeout or self._params.visibility_timeout).total_seconds()
+        now = self._clock()
+        token = uuid.uuid4().hex
+
+        def lease(connection: sqlite3.Connection) -> list[tuple[Any, ...]]:
+            # Expired leases of items out of attempts mean the consumer kept crashing on them.
+            exhausted = "queue = ? AND lease_token IS NOT NULL AND available_at <= ? AND attempts >= ?"
+            exhausted_args = (queue, now, self._params.max_attempts)
+            moved = connection.execute(
+                f"{_TO_DEAD_LETTERS} WHERE {exhausted}", (now, "lease expired", *exhausted_args)
+            ).rowcount
+            connection.execute(f"DELETE FROM queue_items WHERE {exhausted}", exhausted_args)
+            _ITEMS.labels(queue, "dead_lettered").inc(moved)
+            return connection.execute(
+                "UPDATE queue_items SET lease_token = ?, attempts = attempts + 1, available_at = ? "
+                "WHERE id IN (SELECT id FROM queue_items WHERE queue = ? AND available_at <= ? ORDER BY id LIMIT ?) "
+                "RETURNING id, dedupe_key, payload, attempts, enqueued_at",
+                (token, now + timeout, queue, now, limit),
+            ).fetchall()
+
+        rows = await self._transaction(lease)
+        items = [
+            LeasedItem(
+                id=item_id,
+                queue=queue,
+                key=key,
+                payload=json.loads(payload),
+                attempts=attempts,
+                lease_token=token,
+                enqueued_at=enqueued_at,
+            )
+            for item_id, key, payload, attempts, enqueued_at in sorted(rows)
+        ]
+        _ITEMS.labels(queue, "leased").inc(len(items))
+        for item in items:
+            if item.attempts == 1:
+                _WAIT.labels(queue).observe(max(0.0, now - item.enqueued_at))
+        return items
+
+    async def ack(self, item: LeasedItem) -> bool:
+        """Remove a processed item; ``False`` if its lease expired and it was handed out again."""
+        acked = await self._transaction(
+            lambda connection: (
+                connection.execute(
+                    "DELETE FROM queue_items WHERE id = ? AND lease_token = ?", (item.id, item.lease_token)
+                ).rowcount
+            )
+        )
+        _ITEMS.labels(item.queue, "acked").inc(acked)
+        return acked == 1
+
+    async def nack(self, item: LeasedItem, error: str | None = None) -> bool:
+        """Retry a failed item after the retry delay, or move it to the dead letters when out of attempts."""
+        now = self._clock()
+        dead = item.attempts >= self._params.max_attempts
+        delay = min(
+            self._params.retry_delay.total_seconds() * 2 ** (item.attempts - 1),
+            self._params.max_retry_delay.total_seconds(),
+        )
+
+        def nack(connection: sqlite3.Connection) -> int:
+            owned = "id = ? AND lease_token = ?"
+            if not dead:
+                return connection.execute(
+                    f"UPDATE queue_items SET lease_token = NULL, available_at = ?, last_error = ? WHERE {owned}",
+                    (now + delay, error, item.id, item.lease_token),
+                ).rowcount
+            moved = connection.execute(f"{_TO_DEAD_LETTERS} WHERE {owned}", (now, error, item.id, item.lease_token))
+            connection.execute(f"DELETE FROM queue_items WHERE {owned}", (item.id, item.lease_token))
+            return moved.rowcount
+
+        changed = await self._transaction(nack)
+        _ITEMS.labels(item.queue, "dead_lettered" if dead else "retried").inc(changed)
+        return changed == 1
+
+    async def extend_lease(self, item: LeasedItem, visibility_timeout: timedelta | None = None) -> bool:
+        """Keep a long-running item invisible for another visibility timeout from now."""
+        timeout = (visibility_timeout or self._params.visibility_timeout).total_seconds()
+        extended = await self._transaction(
+            lambda connection: (
+                connection.execute(
+                    "UPDATE queue_items SET available_at = ? WHERE id = ? AND lease_token = ?",
+                    (self._clock() + timeout, item.id, item.lease_token),
+                ).rowcount
+            )
+        )
+        return extended == 1
+
+    async def stats(self, queue: str) -> QueueStats:
+        now = self._clock()
+
+        def stats(connection: sqlite3.Connection) -> QueueStats:
+            ready, delayed, leased = connection.execute(
+                "SELECT "
+                "COALESCE(SUM(lease_token IS NULL AND available_at <= ?), 0), "
+                "COALESCE(SUM(lease_token IS NULL AND available_at > ?), 0), "
+                "COALESCE(SUM(lease_token IS NOT NULL), 0) "
+                "FROM queue_items WHERE queue = ?",
+                (now, now, queue),
+            ).fetchone()
+            (dead,) = connection.execute("SELECT COUNT(*) FROM dead_letters WHERE queue = ?", (queue,)).fetchone()
+            return QueueStats(ready=ready, delayed=delayed, leased=leased, dead=dead)
+
+        return await self._transaction(stats)
+
+    async def dead_letters(self, queue: str, limit: int = 100) -> list[DeadLetter]:
+        rows = await self._transaction(
+            lambda connection: connection.execute(
+                "SELECT id, dedupe_key, payload, attempts, enqueued_at, failed_at, last_error "
+                "FROM dead_letters WHERE queue = ? ORDER BY failed_at LIMIT ?",
+                (queue, limit),
+            ).fetchall()
+        )
+        return [
+            DeadLetter(
+                id=item_id,
+                queue=queue,
+                key=key,
+                payload=json.loads(payload),
+                attempts=attempts,
+                enqueued_at=enqueued_at,
+                failed_at=failed_at,
+                last_error=last_error,
+            )
+            for item_id, key, payload, attempts, enqueued_at, failed_at, last_error in rows
+        ]
+
+    async def requeue_dead_letters(self, queue: str) -> int:
+        """Give every dead letter of ``queue`` a fresh set of attempts."""
+        now = self._clock()
+
+        def requeue(connection: sqlite3.Connection) -> int:
+            moved = connection.execute(
+                "INSERT INTO queue_items (queue, dedupe_key, payload, available_at, enqueued_at, last_error) "
+                "SELECT queue, dedupe_key, payload, ?, enqueued_at, last_error FROM dead_letters WHERE queue = ? "
+                "ON CONFLICT (queue, dedupe_key) DO NOTHING",
+                (now, queue),
+            ).rowcount
+            connection.execute("DELETE FROM dead_letters WHERE queue = ?", (queue,))
+            return moved
+
+        return await self._transaction(requeue)
+
+    async def _transaction[T](self, work: Callable[[sqlite3.Connection], T]) -> T:
+        return await asyncio.to_thread(self._run_in_transaction, work)
+
+    def _run_in_transaction[T](self, work: Callable[[sqlite3.Connection], T]) -> T:
+        with self._lock:
+            connection = self._connection or self._connect_locked()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(connection)
+            except BaseException:
+                connection.rollback()
+                raise
+            connection.commit()
+            return result
+
+    def _connect(self) -> None:
+        with self._lock:
+            if self._connection is None:
+                self._connect_locked()
+
+    def _connect_locked(self) -> sqlite3.Connection:
+        self._params.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._params.path, isolation_level=None, check_same_thread=False, timeout=30)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.executescript(_SCHEMA)
+        self._connection = connection
+        self._logger.info("📥 Work queue database opened at %s", self._params.path)
+        return connection
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+from collections.abc import Sequence
+
+import pytest
+from open_ticket_ai import InjectableConfig
+from open_ticket_ai.core.ai_classification_services.classification_models import (
+    ClassificationRequest,
+    ClassificationResult,
+)
+from open_ticket_ai.core.ai_classification_services.classification_service import ClassificationService
+
+from otai_base.ai_classification_services import BatchingClassificationService
+
+
+class RecordingClassificationService(ClassificationService):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.batches: list[list[str]] = []
+        self.threads: set[int] = set()
+
+    def classify(self, req: ClassificationRequest) -> ClassificationResult:
+        return ClassificationResult(label=req.text.upper(), confidence=1.0)
+
+    async def aclassify(self, req: ClassificationRequest) -> ClassificationResult:
+        return self.classify(req)
+
+    def classify_batch(self, requests: Sequence[ClassificationRequest]) -> list[ClassificationResult]:
+        if any(req.text == "boom" for req in requests):
+            raise RuntimeError("model failed")
+        self.batches.append([req.text for req in requests])
+        self.threads.add(threading.get_ident())
+        return super().classify_batch(requests)
+
+
+def _batching(logger_factory, inner: ClassificationService, **params) -> BatchingClassificationService:
+    config = InjectableConfig(id="batching", params=params)
+    return BatchingClassificationService(inner, config, logger_factory)
+
+
+def _request(text: str) -> ClassificationRequest:
+    return ClassificationRequest(text=text, model_name="model")
+
+
+async def test_concurrent_requests_are_classified_in_batches_off_the_event_loop(logger_factory):
+    inner = RecordingClassificationService(InjectableConfig(id="inner"), logger_factory)
+    service = _batching(logger_factory, inner, max_batch_size=3, max_wait="PT1S")
+
+    results = await asyncio.gather(*(service.aclassify(_request(text)) for text in "abcdef"))
+
+    assert [result.label for result in results] == list("ABCDEF")
+    assert inner.batches == [["a", "b", "c"], ["d", "e", "f"]]
+    assert threading.get_ident() not in inner.threads
+
+
+async def test_an_incomplete_batch_is_classified_after_max_wait(logger_factory):
+    inner = RecordingClassificationService(InjectableConfig(id="inner"), logger_factory)
+    service = _batching(logger_factory, inner, max_batch_size=10, max_wait="PT0.01S")
+
+    result = await asyncio.wait_for(service.aclassify(_request("x")), timeout=1)
+
+    assert result.label == "X"
+    assert inner.batches == [["x"]]
+
+
+async def test_a_failing_batch_fails_every_request_in_it(logger_factory):
+    inner = RecordingClassificationService(InjectableConfig(id="inner"), logger_factory)
+    service = _batching(logger_factory, inner, max_batch_size=2)
+
+    results = await asyncio.gather(
+        service.aclassify(_request("ok")), service.aclassify(_request("boom")), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    with pytest.raises(RuntimeError, match="model failed"):
+        await service.aclassify(_request("boom"))
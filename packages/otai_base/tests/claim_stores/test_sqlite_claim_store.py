@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+import pytest
+from open_ticket_ai import InjectableConfig
+
+from otai_base.claim_stores import SqliteClaimStore
+
+TTL = timedelta(seconds=60)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+async def make_store(tmp_path, logger_factory, clock):
+    stores: list[SqliteClaimStore] = []
+
+    async def _make() -> SqliteClaimStore:
+        config = InjectableConfig(id="claims", params={"path": str(tmp_path / "claims.sqlite3")})
+        store = SqliteClaimStore(config, logger_factory, clock=clock)
+        await store.astart()
+        stores.append(store)
+        return store
+
+    yield _make
+    for store in stores:
+        await store.astop()
+
+
+async def test_a_key_is_held_by_one_owner_across_processes(make_store) -> None:
+    first, second = await make_store(), await make_store()
+
+    assert await first.claim(["a", "b"], "worker-1", TTL) == ["a", "b"]
+    assert await second.claim(["b", "c"], "worker-2", TTL) == ["c"]
+    assert await first.claim(["a", "b", "c"], "worker-1", TTL) == ["a", "b"]
+
+
+async def test_released_and_expired_claims_can_be_taken_over(make_store, clock) -> None:
+    store = await make_store()
+    await store.claim(["a", "b"], "worker-1", TTL)
+
+    assert await store.release(["a", "b"], "worker-2") == 0
+    assert await store.release(["a"], "worker-1") == 1
+    assert await store.claim(["a", "b"], "worker-2", TTL) == ["a"]
+
+    clock.now += TTL.total_seconds()
+    assert await store.claim(["b"], "worker-2", TTL) == ["b"]
+
+
+async def test_claiming_again_renews_the_claim(make_store, clock) -> None:
+    store = await make_store()
+    await store.claim(["a"], "worker-1", TTL)
+
+    clock.now += 50
+    assert await store.claim(["a"], "worker-1", TTL) == ["a"]
+    clock.now += 50
+
+    assert await store.claim(["a"], "worker-2", TTL) == []
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 from _pytest.logging import LogCaptureFixture
 from open_ticket_ai import LoggingConfig
 from open_ticket_ai.core.logging.logging_models import LogLevel
-from open_ticket_ai.core.logging.stdlib_logging_adapter import StdlibLoggerFactory, create_logger_factory
+from open_ticket_ai.core.logging.stdlib_logging_adapter import (
+    BoundedQueueHandler,
+    StdlibLoggerFactory,
+    create_logger_factory,
+)
 
 
 def test_create_logger_factory_returns_stdlib_factory() -> None:
@@ -53,3 +58,106 @@ def test_logger_writes_to_file(tmp_path: Path) -> None:
     log_content = log_file.read_text()
     assert "Info message" in log_content
     assert "Error message" in log_content
+
+
+def test_queued_logging_writes_file_on_shutdown(tmp_path: Path) -> None:
+    log_file = tmp_path / "queued.log"
+    factory = create_logger_factory(LoggingConfig(log_to_file=True, log_file_path=str(log_file), use_queue=True))
+    logger = factory.create("queued_logger")
+
+    for index in range(100):
+        logger.info(f"Queued message {index}")
+    factory.shutdown()
+
+    log_content = log_file.read_text()
+    assert "Queued message 0" in log_content
+    assert "Queued message 99" in log_content
+    assert factory.dropped_records == 0
+
+
+def test_queued_records_show_args_as_they_were_when_logged(tmp_path: Path) -> None:
+    log_file = tmp_path / "queued.log"
+    factory = create_logger_factory(LoggingConfig(log_to_file=True, log_file_path=str(log_file), use_queue=True))
+    queue_handler = next(h for h in logging.getLogger().handlers if isinstance(h, BoundedQueueHandler))
+    queue_handler.listener.stop()
+    logger = factory.create("queued_logger")
+    ticket = {"status": "new"}
+
+    logger.info("Ticket: %s", ticket)
+    try:
+        int("not a number")
+    except ValueError:
+        logger.exception("Failed")
+    ticket["status"] = "closed"
+    queue_handler.listener.start()
+    factory.shutdown()
+
+    log_content = log_file.read_text()
+    assert "Ticket: {'status': 'new'}" in log_content
+    assert "ValueError: invalid literal" in log_content
+
+
+def test_queued_logging_counts_dropped_records_when_queue_is_full(tmp_path: Path) -> None:
+    log_file = tmp_path / "overflow.log"
+    factory = create_logger_factory(
+        LoggingConfig(log_to_file=True, log_file_path=str(log_file), use_queue=True, queue_size=1)
+    )
+    queue_handler = next(h for h in logging.getLogger().handlers if isinstance(h, BoundedQueueHandler))
+    # Nothing drains the queue while the listener is stopped.
+    queue_handler.listener.stop()
+    logger = factory.create("overflow_logger")
+
+    logger.info("Kept message")
+    dropped = 2
+    for _ in range(dropped):
+        logger.info("Dropped message")
+    queue_handler.listener.start()
+    factory.shutdown()
+
+    log_content = log_file.read_text()
+    assert factory.dropped_records == dropped
+    assert "Kept message" in log_content
+    assert "Dropped message" not in log_content
+    assert "Dropped 2 log records" in log_content
+
+
+def test_deferred_message_is_not_built_when_level_is_disabled(caplog: LogCaptureFixture) -> None:
+    logger = StdlibLoggerFactory(LoggingConfig()).create("lazy_logger")
+    build_message = MagicMock(return_value="Expensive message")
+
+    with caplog.at_level(logging.INFO):
+        logger.debug(build_message)
+        logger.info(build_message)
+        assert not logger.is_enabled_for("DEBUG")
+
+    build_message.assert_called_once()
+    assert [record.getMessage() for record in caplog.records] == ["Expensive message"]
+
+
+def test_logged_args_are_truncated_and_redacted(caplog: LogCaptureFixture) -> None:
+    logger = StdlibLoggerFactory(LoggingConfig(max_payload_length=40)).create("payload_logger")
+
+    with caplog.at_level(logging.INFO):
+        logger.info("Config: %s", {"api_token": "secret-value", "url": "https://example.com"})
+        logger.info("Tickets: %s", ["ticket"] * 100)
+        logger.info("Count: %d", 3)
+
+    config_message, tickets_message, count_message = (record.getMessage() for record in caplog.records)
+    assert "secret-value" not in config_message
+    assert "'api_token': '***'" in config_message
+    assert tickets_message.endswith("... (truncated)")
+    assert "'ticket', " * 10 not in tickets_message
+    assert count_message == "Count: 3"
+
+
+def test_large_args_are_only_rendered_up_to_the_payload_length(caplog: LogCaptureFixture) -> None:
+    logger = StdlibLoggerFactory(LoggingConfig(max_payload_length=40)).create("payload_logger")
+    item = MagicMock()
+    item.__repr__ = MagicMock(return_value="item")
+    items = [item] * 10_000
+
+    with caplog.at_level(logging.INFO):
+        logger.info("Items: %s", {"items": items, "text": "x" * 1_000_000})
+
+    assert caplog.records[0].getMessage().startswith("Items: {'items': [item, item")
+    assert item.__repr__.call_count < len(items) / 100
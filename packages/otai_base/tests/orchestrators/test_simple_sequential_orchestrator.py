@@ -5,11 +5,12 @@ from typing import Any, ClassVar
 from unittest.mock import MagicMock
 
 import pytest
-from open_ticket_ai import LoggerFactory, Pipe
+from open_ticket_ai import InjectableConfig, LoggerFactory, Pipe, WrongConfigError
 from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
 from open_ticket_ai.core.pipes.pipe_models import PipeConfig, PipeResult
 from pydantic import BaseModel
 
+from otai_base.claim_stores import SqliteClaimStore
 from otai_base.pipes.orchestrators.simple_sequential_orchestrator import SimpleSequentialOrchestrator
 
 
@@ -124,3 +125,85 @@ async def test_context_isolation(orchestrator_setup, empty_context):
     for context in spy_pipe2.captured_contexts:
         assert context.parent_params is not None, "Context parent should be set"
         assert context.pipe_results == {}, "Context pipe_results should be empty (isolated)"
+
+
+@pytest.mark.asyncio
+async def test_request_stop_finishes_the_running_cycle(orchestrator_setup, empty_context):
+    orchestrator, spy_pipe1, spy_pipe2 = orchestrator_setup
+
+    task = asyncio.create_task(orchestrator.process(empty_context))
+    await asyncio.sleep(0.05)
+    orchestrator.request_stop()
+    result = await asyncio.wait_for(task, timeout=1)
+
+    assert result.succeeded
+    assert spy_pipe1.call_count == spy_pipe2.call_count
+    assert "steps" not in spy_pipe1.captured_contexts[0].parent_params
+
+
+def _replica(logger_factory, claim_store) -> tuple[SimpleSequentialOrchestrator, SpyPipe, SpyPipe]:
+    report = SpyPipe(config=PipeConfig(id="report", use="test.report", params={}), logger_factory=logger_factory)
+    tickets = SpyPipe(config=PipeConfig(id="tickets", use="test.tickets", params={}), logger_factory=logger_factory)
+    factory = MagicMock()
+
+    async def create_pipe_async(config, *args, **kwargs):
+        assert "run_on" not in config.params
+        return report if config.id == "report" else tickets
+
+    factory.create_pipe = create_pipe_async
+    config = PipeConfig(
+        id="orchestrator",
+        use="base:SimpleSequentialOrchestrator",
+        params={
+            "orchestrator_sleep": timedelta(seconds=0.001),
+            "leader_ttl": timedelta(seconds=1),
+            "steps": [
+                PipeConfig(id="report", use="test.report", params={"run_on": "leader"}),
+                PipeConfig(id="tickets", use="test.tickets", params={"run_on": "all"}),
+            ],
+        },
+    )
+    orchestrator = SimpleSequentialOrchestrator(
+        config=config, logger_factory=logger_factory, pipe_factory=factory, claim_store=claim_store
+    )
+    return orchestrator, report, tickets
+
+
+async def test_leader_steps_run_on_one_replica_and_move_when_it_stops(tmp_path, logger_factory, empty_context):
+    store = SqliteClaimStore(
+        InjectableConfig(id="claims", params={"path": str(tmp_path / "claims.sqlite3")}), logger_factory
+    )
+    first, first_report, first_tickets = _replica(logger_factory, store)
+    second, second_report, second_tickets = _replica(logger_factory, store)
+    # Both replicas run in this process, so they need owners of their own.
+    first._election._owner, second._election._owner = "replica-1", "replica-2"
+
+    first_task = asyncio.create_task(first.process(empty_context))
+    await asyncio.sleep(0.05)
+    second_task = asyncio.create_task(second.process(empty_context))
+    await asyncio.sleep(0.2)
+
+    assert first_report.call_count > 0
+    assert second_report.call_count == 0
+    assert first_tickets.call_count > 0
+    assert second_tickets.call_count > 0
+
+    first.request_stop()
+    await first_task
+    await asyncio.sleep(0.3)
+    second.request_stop()
+    await second_task
+    await store.astop()
+
+    assert second_report.call_count > 0
+
+
+def test_leader_steps_need_a_claim_store(logger_factory, mock_pipe_factory):
+    config = PipeConfig(
+        id="orchestrator",
+        use="base:SimpleSequentialOrchestrator",
+        params={"steps": [PipeConfig(id="report", use="test.report", params={"run_on": "leader"})]},
+    )
+
+    with pytest.raises(WrongConfigError):
+        SimpleSequentialOrchestrator(config=config, logger_factory=logger_factory, pipe_factory=mock_pipe_factory)
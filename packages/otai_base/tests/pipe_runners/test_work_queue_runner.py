@@ -0,0 +1,120 @@
+import asyncio
+import sqlite3
+from datetime import timedelta
+from typing import ClassVar
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from open_ticket_ai import InjectableConfig, Pipe
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig, PipeResult
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+from pydantic import BaseModel
+
+from otai_base.pipes.enqueue_tickets_pipe import EnqueueTicketsPipe
+from otai_base.pipes.pipe_runners.work_queue_runner import WorkQueueRunner
+from otai_base.work_queues import SqliteWorkQueueService
+
+
+class EmptyParams(BaseModel):
+    pass
+
+
+class TicketPipe(Pipe[EmptyParams]):
+    """Fails for tickets with the subject 'fail', raises for 'raise' and takes a while for 'slow'."""
+
+    ParamsModel: ClassVar[type[BaseModel]] = EmptyParams
+    seen: ClassVar[list[str]] = []
+
+    async def _process(self, context: PipeContext) -> PipeResult:
+        (ticket,) = context.pipe_results["intake"]["data"]["fetched_tickets"]
+        TicketPipe.seen.append(ticket["id"])
+        if ticket["subject"] == "slow":
+            await asyncio.sleep(0.07)
+        if ticket["subject"] == "raise":
+            raise RuntimeError("boom")
+        if ticket["subject"] == "fail":
+            return PipeResult.failure("rejected")
+        return PipeResult.success()
+
+
+@pytest.fixture
+async def work_queue(tmp_path, logger_factory):
+    config = InjectableConfig(id="work_queue", params={"path": str(tmp_path / "queue.sqlite3")})
+    queue = SqliteWorkQueueService(config, logger_factory)
+    await queue.astart()
+    yield queue
+    await queue.astop()
+
+
+@pytest.fixture
+def pipe_factory(logger_factory) -> MagicMock:
+    async def create_pipe(config: PipeConfig, context: PipeContext, *, cache: bool = True) -> Pipe:
+        return TicketPipe(config=config, logger_factory=logger_factory)
+
+    factory = MagicMock()
+    factory.create_pipe = create_pipe
+    TicketPipe.seen = []
+    return factory
+
+
+async def _enqueue(work_queue, logger_factory, tickets: list[UnifiedTicket]) -> PipeResult:
+    config = PipeConfig(
+        id="enqueue",
+        use="base:EnqueueTicketsPipe",
+        params={"tickets": [ticket.model_dump() for ticket in tickets]},
+    )
+    pipe = EnqueueTicketsPipe(work_queue=work_queue, config=config, logger_factory=logger_factory)
+    return await pipe.process(PipeContext.empty())
+
+
+def _runner(work_queue, pipe_factory, logger_factory, **params) -> WorkQueueRunner:
+    config = PipeConfig(
+        id="intake",
+        use="base:WorkQueueRunner",
+        params={"run": {"id": "process", "use": "tests:TicketPipe"}, "workers": 2, **params},
+    )
+    return WorkQueueRunner(
+        config=config, logger_factory=logger_factory, pipe_factory=pipe_factory, work_queue=work_queue
+    )
+
+
+async def test_enqueue_skips_tickets_already_waiting(work_queue, logger_factory) -> None:
+    tickets = [UnifiedTicket(id="1", subject="ok"), UnifiedTicket(id="2", subject="ok")]
+    await _enqueue(work_queue, logger_factory, tickets)
+
+    result = await _enqueue(work_queue, logger_factory, [*tickets, UnifiedTicket(id="3", subject="ok")])
+
+    assert result.data == {"enqueued": 1, "duplicates": 2}
+
+
+async def test_runner_acks_processed_tickets_and_retries_failed_ones(work_queue, pipe_factory, logger_factory) -> None:
+    subjects = {"1": "ok", "2": "fail", "3": "raise", "4": "ok"}
+    await _enqueue(work_queue, logger_factory, [UnifiedTicket(id=id_, subject=s) for id_, s in subjects.items()])
+
+    result = await _runner(work_queue, pipe_factory, logger_factory).process(PipeContext.empty())
+
+    assert result.data == {"processed": 2, "failed": 2}
+    assert sorted(TicketPipe.seen) == ["1", "2", "3", "4"]
+    stats = await work_queue.stats("tickets")
+    assert (stats.ready, stats.delayed, stats.leased) == (0, 2, 0)
+
+
+async def test_runner_stops_after_max_items_and_skips_an_empty_queue(work_queue, pipe_factory, logger_factory) -> None:
+    await _enqueue(work_queue, logger_factory, [UnifiedTicket(id=str(n), subject="ok") for n in range(5)])
+    runner = _runner(work_queue, pipe_factory, logger_factory, max_items=3)
+
+    assert (await runner.process(PipeContext.empty())).data == {"processed": 3, "failed": 0}
+    assert (await runner.process(PipeContext.empty())).data == {"processed": 2, "failed": 0}
+    assert (await runner.process(PipeContext.empty())).was_skipped
+
+
+async def test_runner_keeps_processing_when_extending_a_lease_fails(work_queue, pipe_factory, logger_factory) -> None:
+    await _enqueue(work_queue, logger_factory, [UnifiedTicket(id="1", subject="slow")])
+    work_queue.extend_lease = AsyncMock(side_effect=sqlite3.OperationalError("database is locked"))
+    runner = _runner(work_queue, pipe_factory, logger_factory, workers=1, visibility_timeout=timedelta(milliseconds=90))
+
+    result = await runner.process(PipeContext.empty())
+
+    assert result.data == {"processed": 1, "failed": 0}
+    assert work_queue.extend_lease.await_count >= 1
@@ -0,0 +1,60 @@
+import pytest
+from open_ticket_ai import InjectableConfig
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig, PipeResult
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+
+from otai_base.claim_stores import SqliteClaimStore
+from otai_base.pipes.claim_pipes import ClaimTicketsPipe, ReleaseTicketsPipe
+
+TICKETS = [UnifiedTicket(id="1", subject="Printer"), UnifiedTicket(id="2", subject="VPN")]
+
+
+@pytest.fixture
+async def claim_store(tmp_path, logger_factory):
+    config = InjectableConfig(id="claims", params={"path": str(tmp_path / "claims.sqlite3")})
+    store = SqliteClaimStore(config, logger_factory)
+    await store.astart()
+    yield store
+    await store.astop()
+
+
+async def _run(pipe_class, claim_store, logger_factory, tickets: list[UnifiedTicket], owner: str):
+    params = {"tickets": [ticket.model_dump() for ticket in tickets], "owner": owner}
+    config = PipeConfig(id="claim", use=f"base:{pipe_class.__name__}", params=params)
+    pipe = pipe_class(claim_store=claim_store, config=config, logger_factory=logger_factory)
+    return await pipe.process(PipeContext.empty())
+
+
+async def test_tickets_claimed_by_another_owner_are_dropped(claim_store, logger_factory) -> None:
+    await _run(ClaimTicketsPipe, claim_store, logger_factory, TICKETS[:1], "replica-1")
+
+    result = await _run(ClaimTicketsPipe, claim_store, logger_factory, TICKETS, "replica-2")
+
+    assert result.succeeded
+    assert result.data == {"fetched_tickets": TICKETS[1:], "contended_count": 1}
+
+
+async def test_released_tickets_can_be_claimed_by_others(claim_store, logger_factory) -> None:
+    await _run(ClaimTicketsPipe, claim_store, logger_factory, TICKETS, "replica-1")
+    assert (await _run(ClaimTicketsPipe, claim_store, logger_factory, TICKETS, "replica-2")).has_failed()
+
+    released = await _run(ReleaseTicketsPipe, claim_store, logger_factory, TICKETS, "replica-1")
+
+    assert released.data == {"released_count": 2}
+    result = await _run(ClaimTicketsPipe, claim_store, logger_factory, TICKETS, "replica-2")
+    assert result.data["fetched_tickets"] == TICKETS
+
+
+async def test_release_takes_the_tickets_of_the_claim_step(claim_store, logger_factory) -> None:
+    claimed = await _run(ClaimTicketsPipe, claim_store, logger_factory, TICKETS, "replica-1")
+    config = PipeConfig(
+        id="release", use="base:ReleaseTicketsPipe", params={"claim_step": "claim", "owner": "replica-1"}
+    )
+    release = ReleaseTicketsPipe(claim_store=claim_store, config=config, logger_factory=logger_factory)
+
+    nothing_claimed = PipeContext.empty().with_pipe_result("claim", PipeResult.failure("claimed by others"))
+    assert (await release.process(nothing_claimed)).data == {"released_count": 0}
+    released = await release.process(PipeContext.empty().with_pipe_result("claim", claimed))
+
+    assert released.data == {"released_count": len(TICKETS)}
@@ -0,0 +1,45 @@
+import pytest
+from open_ticket_ai import InjectableConfig
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+
+from otai_base.pipes.ledger_pipes import FilterProcessedTicketsPipe, MarkTicketsProcessedPipe
+from otai_base.ticket_ledgers import ProcessedTicketLedgerService
+
+TICKETS = [UnifiedTicket(id="1", subject="Printer"), UnifiedTicket(id="2", subject="VPN")]
+
+
+@pytest.fixture
+def ledger(logger_factory) -> ProcessedTicketLedgerService:
+    return ProcessedTicketLedgerService(InjectableConfig(id="ledger"), logger_factory)
+
+
+def _params(tickets: list[UnifiedTicket]) -> dict:
+    return {"tickets": [ticket.model_dump() for ticket in tickets]}
+
+
+async def _filter(ledger, logger_factory, tickets: list[UnifiedTicket]):
+    config = PipeConfig(id="filter", use="base:FilterProcessedTicketsPipe", params=_params(tickets))
+    pipe = FilterProcessedTicketsPipe(ledger=ledger, config=config, logger_factory=logger_factory)
+    return await pipe.process(PipeContext.empty())
+
+
+async def test_marked_tickets_are_filtered_out(ledger, logger_factory) -> None:
+    config = PipeConfig(id="mark", use="base:MarkTicketsProcessedPipe", params=_params(TICKETS[:1]))
+    await MarkTicketsProcessedPipe(ledger=ledger, config=config, logger_factory=logger_factory).process(
+        PipeContext.empty()
+    )
+
+    result = await _filter(ledger, logger_factory, TICKETS)
+
+    assert result.succeeded
+    assert result.data == {"fetched_tickets": TICKETS[1:], "skipped_count": 1}
+
+
+async def test_fails_when_every_ticket_was_processed(ledger, logger_factory) -> None:
+    await ledger.record(TICKETS)
+
+    result = await _filter(ledger, logger_factory, TICKETS)
+
+    assert result.has_failed()
@@ -47,7 +47,7 @@ async def test_classification_pipe_successful_classification(
 ):
     mock_service = MagicMock(spec=ClassificationService)
     expected_result = ClassificationResult(label="urgent", confidence=CONFIDENCE_URGENT)
-    mock_service.classify.return_value = expected_result
+    mock_service.aclassify.return_value = expected_result
 
     config = classification_pipe_config(
         "test_classification_pipe",
@@ -63,7 +63,7 @@ async def test_classification_pipe_successful_classification(
     assert result.data["label"] == "urgent"
     assert result.data["confidence"] == CONFIDENCE_URGENT
 
-    mock_service.classify.assert_called_once()
+    mock_service.aclassify.assert_awaited_once()
 
 
 async def test_classification_pipe_with_null_api_token(
@@ -71,7 +71,7 @@ async def test_classification_pipe_with_null_api_token(
 ):
     mock_service = MagicMock(spec=ClassificationService)
     expected_result = ClassificationResult(label="normal", confidence=CONFIDENCE_NORMAL)
-    mock_service.classify.return_value = expected_result
+    mock_service.aclassify.return_value = expected_result
 
     config = classification_pipe_config(
         "test_classification_pipe_no_token",
@@ -99,7 +99,7 @@ async def test_classification_pipe_different_inputs(
         label=scenario.expected_label,
         confidence=scenario.expected_confidence,
     )
-    mock_service.classify.return_value = expected_result
+    mock_service.aclassify.return_value = expected_result
 
     config = classification_pipe_config(
         "test_classification_pipe_parametrized",
@@ -114,4 +114,4 @@ async def test_classification_pipe_different_inputs(
     assert result.data["label"] == scenario.expected_label
     assert result.data["confidence"] == scenario.expected_confidence
 
-    mock_service.classify.assert_called_once()
+    mock_service.aclassify.assert_awaited_once()
@@ -111,3 +111,28 @@ async def test_composite_pipe_returns_union_of_results(
     assert result.data == {"key1": "val1", "key2": "val2"}
     assert "step1" in result.message
     assert "step2" in result.message
+
+
+@pytest.mark.parametrize("failure", [PipeResult.failure("step1 failed"), RuntimeError("step1 raised")])
+async def test_finally_steps_run_after_a_failing_step_with_its_result(
+    mock_pipe_factory, logger_factory, simple_step_configs, empty_pipeline_context, failure
+):
+    failing_step = MagicMock()
+    failing_step.process = AsyncMock(side_effect=failure if isinstance(failure, Exception) else None)
+    failing_step.process.return_value = failure
+    finally_step = MagicMock()
+    finally_step.process = AsyncMock(return_value=PipeResult.success(data={"released": True}))
+    mock_pipe_factory.create_pipe.side_effect = [failing_step, finally_step]
+
+    params = {"steps": simple_step_configs[:2], "finally_steps": [simple_step_configs[2]]}
+    config = PipeConfig(id="composite", use="CompositePipe", params=params)
+    composite = CompositePipe(pipe_factory=mock_pipe_factory, config=config, logger_factory=logger_factory)
+
+    if isinstance(failure, Exception):
+        with pytest.raises(RuntimeError):
+            await composite.process(empty_pipeline_context)
+    else:
+        assert (await composite.process(empty_pipeline_context)).data == {"released": True}
+
+    finally_context = finally_step.process.call_args.args[0]
+    assert finally_context.pipe_results.keys() == ({"step1"} if isinstance(failure, PipeResult) else set())
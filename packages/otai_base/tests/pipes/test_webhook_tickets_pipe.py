@@ -0,0 +1,41 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+from packages.otai_base.src.otai_base.pipes.webhook_tickets_pipe import WebhookTicketsPipe
+from packages.otai_base.src.otai_base.webhooks import WebhookIngestionService
+
+MAX_TICKETS = 3
+
+
+@pytest.fixture
+def webhook_source() -> MagicMock:
+    source = MagicMock(spec=WebhookIngestionService)
+    source.receive = AsyncMock(return_value=[])
+    return source
+
+
+def _make_pipe(webhook_source, logger_factory) -> WebhookTicketsPipe:
+    config = PipeConfig(id="webhook_tickets", use="base:WebhookTicketsPipe", params={"max_tickets": MAX_TICKETS})
+    return WebhookTicketsPipe(webhook_source=webhook_source, config=config, logger_factory=logger_factory)
+
+
+@pytest.mark.asyncio
+async def test_returns_received_tickets_as_fetched_tickets(webhook_source, logger_factory) -> None:
+    tickets = [UnifiedTicket(id="1", subject="First")]
+    webhook_source.receive.return_value = tickets
+
+    result = await _make_pipe(webhook_source, logger_factory).process(PipeContext.empty())
+
+    assert result.succeeded
+    assert result.data["fetched_tickets"] == tickets
+    assert webhook_source.receive.await_args.args[0] == MAX_TICKETS
+
+
+@pytest.mark.asyncio
+async def test_fails_when_no_ticket_arrives(webhook_source, logger_factory) -> None:
+    result = await _make_pipe(webhook_source, logger_factory).process(PipeContext.empty())
+
+    assert result.has_failed()
@@ -1,7 +1,10 @@
+from unittest.mock import AsyncMock
+
 import pytest
 from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
 from open_ticket_ai.core.pipes.pipe_models import PipeConfig
 from open_ticket_ai.core.ticket_system_integration.unified_models import TicketSearchCriteria, UnifiedEntity
+from open_ticket_ai.core.workers.worker_shard import WorkerShard, set_current_shard
 from packages.otai_base.src.otai_base.pipes.ticket_system_pipes import FetchTicketsPipe
 
 pytestmark = [pytest.mark.unit]
@@ -67,3 +70,26 @@ async def test_fetch_tickets_no_filter(mocked_ticket_system, logger_factory):
     tickets = await _fetch_tickets(mocked_ticket_system, logger_factory, criteria)
     assert len(tickets) == TOTAL_TICKETS
     assert {t.id for t in tickets} == {"TICKET-1", "TICKET-2", "TICKET-3"}
+
+
+async def test_workers_fetch_disjoint_shards_of_the_tickets(mocked_ticket_system, logger_factory):
+    shards = []
+    for index in range(2):
+        set_current_shard(WorkerShard(index=index, count=2))
+        shards.append(
+            [t.id for t in await _fetch_tickets(mocked_ticket_system, logger_factory, TicketSearchCriteria())]
+        )
+
+    assert sorted(shards[0] + shards[1]) == ["TICKET-1", "TICKET-2", "TICKET-3"]
+
+
+async def test_sharded_workers_search_a_page_per_worker_and_keep_up_to_the_limit(mocked_ticket_system, logger_factory):
+    find_tickets = AsyncMock(wraps=mocked_ticket_system.find_tickets)
+    mocked_ticket_system.find_tickets = find_tickets
+    workers = 3
+    set_current_shard(WorkerShard(index=0, count=workers))
+
+    tickets = await _fetch_tickets(mocked_ticket_system, logger_factory, TicketSearchCriteria(limit=1))
+
+    assert find_tickets.call_args.args[0].limit == workers
+    assert len(tickets) <= 1
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from open_ticket_ai import InjectableConfig
+
+from otai_base.rate_limiting import RateLimitedService
+
+# Timers may fire this much earlier than the waits they are compared with.
+TIMER_SLACK = 0.005
+
+
+class ThrottledError(Exception):
+    def __init__(self, status_code: int, retry_after: str | None = None) -> None:
+        super().__init__(f"HTTP {status_code}")
+        headers = {"Retry-After": retry_after} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=status_code, headers=headers)
+
+
+class FakeBackend:
+    name = "backend"
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.most_running = 0
+        self.started: list[float] = []
+        self.errors: list[Exception] = []
+
+    async def find_tickets(self) -> list[str]:
+        self.started.append(time.monotonic())
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        try:
+            await asyncio.sleep(0.02)
+            if self.errors:
+                raise self.errors.pop(0)
+            return ["1"]
+        finally:
+            self.running -= 1
+
+    def describe(self) -> str:
+        return "fake"
+
+
+@pytest.fixture
+def backend() -> FakeBackend:
+    return FakeBackend()
+
+
+@pytest.fixture
+def make_limited(backend, logger_factory):
+    def _make(**params) -> RateLimitedService:
+        return RateLimitedService(backend, InjectableConfig(id="limited", params=params), logger_factory)
+
+    return _make
+
+
+async def test_calls_start_at_most_at_the_configured_rate(make_limited, backend) -> None:
+    rate, calls = 50, 5
+    limited = make_limited(requests_per_second=rate, burst=1)
+
+    await asyncio.gather(*(limited.find_tickets() for _ in range(calls)))
+
+    assert backend.started[-1] - backend.started[0] >= (calls - 1) / rate - TIMER_SLACK
+
+
+async def test_at_most_max_in_flight_calls_run_at_once(make_limited, backend) -> None:
+    max_in_flight, calls = 2, 6
+    limited = make_limited(max_in_flight=max_in_flight)
+
+    results = await asyncio.gather(*(limited.find_tickets() for _ in range(calls)))
+
+    assert results == [["1"]] * calls
+    assert backend.most_running == max_in_flight
+
+
+async def test_overload_errors_pause_calls_and_lower_the_rate(make_limited, backend) -> None:
+    limited = make_limited(requests_per_second=100, burst=10, backoff=0.05)
+    retry_after = 0.1
+    backend.errors.append(ThrottledError(429, retry_after=str(retry_after)))
+
+    with pytest.raises(ThrottledError):
+        await limited.find_tickets()
+    failed_at = time.monotonic()
+    await limited.find_tickets()
+
+    assert backend.started[-1] - failed_at >= retry_after - TIMER_SLACK
+    assert limited._bucket.rate == pytest.approx(60)
+
+
+async def test_other_errors_do_not_pause_calls(make_limited, backend) -> None:
+    limited = make_limited(backoff=10)
+    backend.errors.append(ThrottledError(404))
+
+    with pytest.raises(ThrottledError):
+        await limited.find_tickets()
+
+    assert await asyncio.wait_for(limited.find_tickets(), timeout=1) == ["1"]
+
+
+def test_other_attributes_are_those_of_the_wrapped_service(make_limited, backend) -> None:
+    limited = make_limited(requests_per_second=1)
+
+    assert limited.name == "backend"
+    assert limited.describe() == "fake"
+    assert limited.wrapped_service is backend
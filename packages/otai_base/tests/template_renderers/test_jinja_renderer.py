@@ -165,3 +165,24 @@ async def test_async_env():
     async_env.globals["some_test_function"] = some_test_function
     template = async_env.from_string("{{ some_test_function() }}")
     assert await template.render_async() == "TEST"
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["plain text", "https://example.com/path?q=1", "{a}", "line\n\nbreaks", "a }} b", "x.y"],
+)
+@pytest.mark.asyncio
+async def test_static_strings_render_unchanged_without_jinja(jinja_renderer: JinjaRenderer, value: str) -> None:
+    assert not jinja_renderer.is_template(value)
+    assert await jinja_renderer._render(value, {}) == value
+    assert await jinja_renderer.render(value, {}) == value
+
+
+@pytest.mark.parametrize("value", ["{{ x }}", "{% if x %}y{% endif %}", "{# c #}", "123", "True", "", "a\n", "a\r\nb"])
+def test_strings_jinja_changes_are_templates(jinja_renderer: JinjaRenderer, value: str) -> None:
+    assert jinja_renderer.is_template(value)
+
+
+def test_needs_rendering_looks_into_nested_values(jinja_renderer: JinjaRenderer) -> None:
+    assert jinja_renderer.needs_rendering({"a": ["static", {"b": "{{ x }}"}]})
+    assert not jinja_renderer.needs_rendering({"a": ["static", 1, None]})
@@ -4,6 +4,7 @@ from open_ticket_ai import Plugin
 from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
 
 from otai_base.base_plugin import BasePlugin
+from otai_base.manifest import MANIFEST
 
 MIN_REGISTERED_COMPONENTS = 2
 
@@ -35,3 +36,6 @@ class TestBasePlugin:
 
         registered_names = [call[0][0] for call in mock_registry.register.call_args_list]
         assert any(name.startswith("base:") for name in registered_names)
+
+    def test_manifest_matches_registered_injectables(self, mock_app_config):
+        assert BasePlugin(mock_app_config).build_manifest() == MANIFEST
@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import pytest
+from open_ticket_ai import InjectableConfig
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedEntity, UnifiedTicket
+
+from otai_base.ticket_ledgers import ProcessedTicketLedgerService
+
+PRINTER = UnifiedTicket(id="1", subject="Printer", body="It is on fire.")
+VPN = UnifiedTicket(id="2", subject="VPN", body="Cannot connect.")
+
+
+@pytest.fixture
+async def make_ledger(logger_factory):
+    ledgers: list[ProcessedTicketLedgerService] = []
+
+    async def _make(**params) -> ProcessedTicketLedgerService:
+        ledger = ProcessedTicketLedgerService(InjectableConfig(id="ledger", params=params), logger_factory)
+        await ledger.astart()
+        ledgers.append(ledger)
+        return ledger
+
+    yield _make
+    for ledger in ledgers:
+        await ledger.astop()
+
+
+async def test_recorded_tickets_are_filtered_until_their_content_changes(make_ledger) -> None:
+    ledger = await make_ledger()
+    await ledger.record([PRINTER])
+
+    moved = PRINTER.model_copy(update={"queue": UnifiedEntity(name="Hardware")})
+    edited = PRINTER.model_copy(update={"body": "It is still on fire."})
+
+    assert await ledger.filter_new([PRINTER, VPN, moved, edited]) == [VPN, edited]
+
+
+async def test_tickets_without_id_are_never_filtered(make_ledger) -> None:
+    ledger = await make_ledger()
+    anonymous = UnifiedTicket(subject="Printer")
+    await ledger.record([anonymous])
+
+    assert await ledger.filter_new([anonymous]) == [anonymous]
+
+
+async def test_new_pipeline_version_processes_tickets_again(make_ledger, tmp_path) -> None:
+    path = str(tmp_path / "ledger.sqlite3")
+    await (await make_ledger(path=path)).record([PRINTER])
+
+    assert await (await make_ledger(path=path)).filter_new([PRINTER]) == []
+    assert await (await make_ledger(path=path, pipeline_version="2")).filter_new([PRINTER]) == [PRINTER]
+
+
+async def test_memory_is_bounded_but_sqlite_remembers(make_ledger, tmp_path) -> None:
+    in_memory = await make_ledger(max_entries=1)
+    backed = await make_ledger(max_entries=1, path=str(tmp_path / "ledger.sqlite3"))
+    for ledger in (in_memory, backed):
+        await ledger.record([PRINTER, VPN])
+
+    assert await in_memory.filter_new([PRINTER, VPN]) == [PRINTER]
+    assert await backed.filter_new([PRINTER, VPN]) == []
+
+
+async def test_entries_older_than_the_retention_are_pruned_on_start(make_ledger, tmp_path, logger_factory) -> None:
+    path = tmp_path / "ledger.sqlite3"
+    await (await make_ledger(path=str(path))).record([PRINTER])
+
+    config = InjectableConfig(id="ledger", params={"path": str(path), "retention": timedelta(days=1)})
+    later = ProcessedTicketLedgerService(config, logger_factory, clock=lambda: 10**10)
+    await later.astart()
+
+    assert await later.filter_new([PRINTER]) == [PRINTER]
+    await later.astop()
@@ -0,0 +1,170 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from open_ticket_ai import InjectableConfig
+from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
+from open_ticket_ai.core.ticket_system_integration.unified_models import (
+    TicketRevision,
+    TicketSearchCriteria,
+    UnifiedEntity,
+    UnifiedNote,
+    UnifiedTicket,
+)
+from packages.otai_base.src.otai_base.ticket_system_services import CachingTicketSystemService
+
+TICKET = UnifiedTicket(id="1", subject="Printer on fire", queue=UnifiedEntity(name="Support"))
+SUPPORT_QUEUE = TicketSearchCriteria(queue=UnifiedEntity(name="Support"))
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def inner() -> MagicMock:
+    mock = MagicMock(spec=TicketSystemService)
+    mock.get_ticket_revision = AsyncMock(return_value=TicketRevision(ticket=TICKET, version='"v1"'))
+    mock.find_tickets = AsyncMock(return_value=[TICKET])
+    mock.update_ticket = AsyncMock(return_value=True)
+    mock.add_note = AsyncMock(return_value=True)
+    mock.create_ticket = AsyncMock(return_value="2")
+    return mock
+
+
+@pytest.fixture
+def make_cache(inner, clock, logger_factory):
+    def _make(**params) -> CachingTicketSystemService:
+        return CachingTicketSystemService(
+            ticket_system=inner,
+            clock=clock,
+            config=InjectableConfig(id="cache", params={"ttl": 10, **params}),
+            logger_factory=logger_factory,
+        )
+
+    return _make
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_serves_repeated_reads_from_cache(make_cache, inner) -> None:
+    cache = make_cache()
+
+    first = await cache.get_ticket("1")
+    second = await cache.get_ticket("1")
+
+    assert first == second == TICKET
+    inner.get_ticket_revision.assert_awaited_once_with("1", None)
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.hit_rate) == (1, 1, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_revalidated_with_known_version(make_cache, inner, clock) -> None:
+    cache = make_cache()
+    await cache.get_ticket("1")
+    clock.now = 11
+    inner.get_ticket_revision.return_value = TicketRevision(version='"v1"', modified=False)
+
+    result = await cache.get_ticket("1")
+
+    assert result == TICKET
+    inner.get_ticket_revision.assert_awaited_with("1", '"v1"')
+    assert cache.stats.revalidations == 1
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_replaced_when_modified(make_cache, inner, clock) -> None:
+    cache = make_cache()
+    await cache.get_ticket("1")
+    clock.now = 11
+    changed = TICKET.model_copy(update={"subject": "Printer extinguished"})
+    inner.get_ticket_revision.return_value = TicketRevision(ticket=changed, version='"v2"')
+
+    result = await cache.get_ticket("1")
+
+    assert result == changed
+    assert cache.stats.misses == inner.get_ticket_revision.await_count
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write", ["update_ticket", "add_note"])
+async def test_writes_invalidate_cached_ticket(make_cache, inner, write) -> None:
+    cache = make_cache()
+    await cache.get_ticket("1")
+
+    if write == "update_ticket":
+        await cache.update_ticket("1", UnifiedTicket(subject="new"))
+    else:
+        await cache.add_note("1", UnifiedNote(subject="s", body="b"))
+    await cache.get_ticket("1")
+
+    assert (inner.get_ticket_revision.await_count, cache.stats.invalidations) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_find_tickets_populates_ticket_cache(make_cache, inner) -> None:
+    cache = make_cache()
+
+    await cache.find_tickets(SUPPORT_QUEUE)
+    result = await cache.get_ticket("1")
+
+    assert result == TICKET
+    inner.get_ticket_revision.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_search_results_are_not_cached_by_default(make_cache, inner) -> None:
+    cache = make_cache()
+    searches = 2
+
+    for _ in range(searches):
+        await cache.find_tickets(SUPPORT_QUEUE)
+
+    assert inner.find_tickets.await_count == searches
+
+
+@pytest.mark.asyncio
+async def test_search_results_cached_until_search_ttl_or_write(make_cache, inner, clock) -> None:
+    cache = make_cache(search_ttl=5)
+
+    await cache.find_tickets(SUPPORT_QUEUE)
+    await cache.find_tickets(SUPPORT_QUEUE)
+    inner.find_tickets.assert_awaited_once()
+
+    inner.find_tickets.reset_mock()
+    await cache.add_note("1", UnifiedNote(body="b"))
+    await cache.find_tickets(SUPPORT_QUEUE)
+    inner.find_tickets.assert_awaited_once()
+
+    inner.find_tickets.reset_mock()
+    clock.now = 6
+    await cache.find_tickets(SUPPORT_QUEUE)
+    inner.find_tickets.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used_ticket(make_cache, inner) -> None:
+    max_size = 2
+    cache = make_cache(max_size=max_size)
+    inner.get_ticket_revision.side_effect = lambda ticket_id, _version: TicketRevision(
+        ticket=UnifiedTicket(id=ticket_id)
+    )
+
+    await cache.get_ticket("1")
+    await cache.get_ticket("2")
+    await cache.get_ticket("1")
+    await cache.get_ticket("3")
+    await cache.get_ticket("1")
+    await cache.get_ticket("2")
+
+    # Every ticket fetched beyond the cache size evicts one.
+    assert cache.stats.evictions == inner.get_ticket_revision.await_count - max_size
+    assert [call.args[0] for call in inner.get_ticket_revision.await_args_list] == ["1", "2", "3", "2"]
@@ -0,0 +1,213 @@
+import asyncio
+import hashlib
+import hmac
+import json
+from datetime import timedelta
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from open_ticket_ai import InjectableConfig
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+from packages.otai_base.src.otai_base.webhooks import WebhookIngestionService
+from pydantic import ValidationError
+
+ZAMMAD_PAYLOAD = {
+    "ticket": {
+        "id": 42,
+        "title": "Printer on fire",
+        "group": {"id": 1, "name": "Users"},
+        "priority": {"id": 2, "name": "2 normal"},
+        "customer": {"id": 5, "email": "jane@example.com"},
+    },
+    "article": {"id": 420, "subject": "Printer on fire", "body": "Flames everywhere", "content_type": "text/plain"},
+}
+OTOBO_PAYLOAD = {
+    "Event": {"Event": "TicketCreate", "TicketID": "7"},
+    "Ticket": {
+        "TicketID": "7",
+        "Title": "VPN broken",
+        "Queue": "Raw",
+        "QueueID": "2",
+        "Priority": "3 normal",
+        "PriorityID": "3",
+        "Article": {"ArticleID": "70", "Subject": "VPN broken", "Body": "Cannot connect"},
+    },
+}
+NO_WAIT = timedelta(seconds=0.05)
+
+
+@pytest.fixture
+async def make_service(logger_factory):
+    services: list[WebhookIngestionService] = []
+
+    async def _make(ticket_system=None, **params) -> WebhookIngestionService:
+        service = WebhookIngestionService(
+            config=InjectableConfig(id="webhooks", params={"host": "127.0.0.1", "port": 0, **params}),
+            logger_factory=logger_factory,
+            ticket_system=ticket_system,
+        )
+        await service.start()
+        services.append(service)
+        return service
+
+    yield _make
+    for service in services:
+        await service.aclose()
+
+
+async def _post(service: WebhookIngestionService, path: str, payload, headers=None) -> httpx.Response:
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{service.port}") as client:
+        return await client.post(path, content=json.dumps(payload).encode(), headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_zammad_webhook_is_converted_and_queued(make_service) -> None:
+    service = await make_service()
+
+    response = await _post(service, "/webhooks/zammad", ZAMMAD_PAYLOAD)
+    tickets = await service.receive(max_tickets=5, wait_timeout=NO_WAIT)
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    assert len(tickets) == 1
+    ticket = tickets[0]
+    assert ticket.id == "42"
+    assert ticket.subject == "Printer on fire"
+    assert ticket.queue is not None and ticket.queue.name == "Users"
+    assert ticket.priority is not None and ticket.priority.name == "2 normal"
+    assert ticket.customer is not None and ticket.customer.name == "jane@example.com"
+    assert ticket.body == "Flames everywhere"
+
+
+@pytest.mark.asyncio
+async def test_otobo_invoker_callback_is_converted_and_queued(make_service) -> None:
+    service = await make_service()
+
+    response = await _post(service, "/webhooks/otobo", OTOBO_PAYLOAD)
+    tickets = await service.receive(max_tickets=5, wait_timeout=NO_WAIT)
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    assert tickets[0].id == "7"
+    assert tickets[0].queue is not None and tickets[0].queue.id == "2"
+    assert tickets[0].body == "Cannot connect"
+
+
+@pytest.mark.asyncio
+async def test_event_only_payload_is_hydrated_from_ticket_system(make_service) -> None:
+    ticket_system = AsyncMock()
+    ticket_system.get_ticket.return_value = UnifiedTicket(id="7", subject="Loaded", body="full body")
+    service = await make_service(ticket_system=ticket_system)
+
+    await _post(service, "/webhooks/otobo", {"Event": {"Event": "TicketCreate", "TicketID": "7"}})
+    tickets = await service.receive(max_tickets=1, wait_timeout=NO_WAIT)
+
+    ticket_system.get_ticket.assert_awaited_once_with("7")
+    assert tickets[0].subject == "Loaded"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("path", "body", "expected_status"),
+    [
+        ("/webhooks/zammad", {"no": "ticket"}, HTTPStatus.BAD_REQUEST),
+        ("/webhooks/otobo", {}, HTTPStatus.BAD_REQUEST),
+        ("/elsewhere", ZAMMAD_PAYLOAD, HTTPStatus.NOT_FOUND),
+    ],
+)
+async def test_invalid_requests_are_rejected(make_service, path, body, expected_status) -> None:
+    service = await make_service()
+
+    response = await _post(service, path, body)
+
+    assert response.status_code == expected_status
+    assert service.queued_count == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_answers_service_unavailable(make_service) -> None:
+    service = await make_service(queue_size=1)
+
+    first = await _post(service, "/webhooks/zammad", ZAMMAD_PAYLOAD)
+    second = await _post(service, "/webhooks/zammad", ZAMMAD_PAYLOAD)
+
+    assert first.status_code == HTTPStatus.ACCEPTED
+    assert second.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert service.rejected_count == 1
+
+
+@pytest.mark.asyncio
+async def test_auth_token_is_required_when_configured(make_service) -> None:
+    service = await make_service(auth_token="s3cret")
+
+    denied = await _post(service, "/webhooks/otobo", OTOBO_PAYLOAD)
+    accepted = await _post(service, "/webhooks/otobo", OTOBO_PAYLOAD, headers={"X-OTAI-Token": "s3cret"})
+
+    assert denied.status_code == HTTPStatus.UNAUTHORIZED
+    assert accepted.status_code == HTTPStatus.ACCEPTED
+
+
+@pytest.mark.asyncio
+async def test_zammad_hmac_signature_is_verified(make_service) -> None:
+    service = await make_service(zammad_hmac_secret="hmac-key")
+    body = json.dumps(ZAMMAD_PAYLOAD).encode()
+    signature = "sha1=" + hmac.new(b"hmac-key", body, hashlib.sha1).hexdigest()
+
+    denied = await _post(service, "/webhooks/zammad", ZAMMAD_PAYLOAD, headers={"X-Hub-Signature": "sha1=bad"})
+    accepted = await _post(service, "/webhooks/zammad", ZAMMAD_PAYLOAD, headers={"X-Hub-Signature": signature})
+
+    assert denied.status_code == HTTPStatus.UNAUTHORIZED
+    assert accepted.status_code == HTTPStatus.ACCEPTED
+
+
+@pytest.mark.asyncio
+async def test_receive_returns_empty_list_after_timeout(make_service) -> None:
+    service = await make_service()
+
+    assert await service.receive(max_tickets=1, wait_timeout=NO_WAIT) == []
+
+
+@pytest.mark.asyncio
+async def test_receive_drains_up_to_max_tickets(make_service) -> None:
+    service = await make_service()
+    for ticket_id in ("1", "2", "3"):
+        service.enqueue(UnifiedTicket(id=ticket_id, subject="s"))
+
+    tickets = await service.receive(max_tickets=2, wait_timeout=NO_WAIT)
+
+    assert [ticket.id for ticket in tickets] == ["1", "2"]
+    assert service.queued_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_hydration_keeps_the_rest_of_the_batch(make_service) -> None:
+    ticket_system = AsyncMock()
+    ticket_system.get_ticket.side_effect = [RuntimeError("backend down"), UnifiedTicket(id="8", subject="Loaded")]
+    service = await make_service(ticket_system=ticket_system)
+
+    for ticket_id in ("7", "8"):
+        await _post(service, "/webhooks/otobo", {"Event": {"Event": "TicketCreate", "TicketID": ticket_id}})
+    tickets = await service.receive(max_tickets=2, wait_timeout=NO_WAIT)
+
+    assert [ticket.id for ticket in tickets] == ["7", "8"]
+    assert tickets[1].subject == "Loaded"
+
+
+@pytest.mark.asyncio
+async def test_negative_content_length_is_rejected(make_service) -> None:
+    service = await make_service()
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+    writer.write(b"POST /webhooks/otobo HTTP/1.1\r\nContent-Length: -5\r\n\r\n")
+    await writer.drain()
+    status_line = await reader.readline()
+    writer.close()
+
+    assert b" 400 " in status_line
+
+
+def test_listening_beyond_loopback_needs_credentials(logger_factory) -> None:
+    with pytest.raises(ValidationError):
+        WebhookIngestionService(
+            config=InjectableConfig(id="webhooks", params={"host": "0.0.0.0"}), logger_factory=logger_factory
+        )
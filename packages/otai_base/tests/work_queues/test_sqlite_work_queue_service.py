@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+import pytest
+from open_ticket_ai import InjectableConfig
+
+from otai_base.work_queues import QueueStats, SqliteWorkQueueService
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+async def make_queue(tmp_path, logger_factory, clock):
+    queues: list[SqliteWorkQueueService] = []
+
+    async def _make(**params) -> SqliteWorkQueueService:
+        config = InjectableConfig(
+            id="work_queue",
+            params={"path": str(tmp_path / "queue.sqlite3"), "visibility_timeout": 60, "retry_delay": 10, **params},
+        )
+        queue = SqliteWorkQueueService(config, logger_factory, clock=clock)
+        await queue.astart()
+        queues.append(queue)
+        return queue
+
+    yield _make
+    for queue in queues:
+        await queue.astop()
+
+
+async def test_leased_items_are_invisible_until_acked(make_queue) -> None:
+    queue = await make_queue()
+    items = [("1", {"id": "1"}), ("2", {"id": "2"}), ("1", {"id": "1"})]
+    assert await queue.enqueue("tickets", items) == len({key for key, _ in items})
+
+    first, second = await queue.lease("tickets", limit=5)
+
+    assert (first.key, first.payload, first.attempts) == ("1", {"id": "1"}, 1)
+    assert second.key == "2"
+    assert await queue.lease("tickets") == []
+    assert await queue.ack(first)
+    assert (await queue.stats("tickets")).leased == 1
+
+
+async def test_expired_lease_is_handed_out_again_and_old_ack_is_refused(make_queue, clock) -> None:
+    queue = await make_queue()
+    await queue.enqueue("tickets", [("1", {})])
+    (stale,) = await queue.lease("tickets")
+
+    clock.now += 61
+    (fresh,) = await queue.lease("tickets")
+
+    assert fresh.attempts == stale.attempts + 1
+    assert not await queue.ack(stale)
+    assert await queue.ack(fresh)
+
+
+async def test_extended_lease_stays_invisible(make_queue, clock) -> None:
+    queue = await make_queue()
+    await queue.enqueue("tickets", [("1", {})])
+    (item,) = await queue.lease("tickets")
+
+    clock.now += 50
+    assert await queue.extend_lease(item)
+    clock.now += 50
+
+    assert await queue.lease("tickets") == []
+
+
+async def test_nack_retries_with_growing_delay_then_dead_letters(make_queue, clock) -> None:
+    queue = await make_queue(max_attempts=3)
+    await queue.enqueue("tickets", [("1", {"id": "1"})])
+
+    (item,) = await queue.lease("tickets")
+    await queue.nack(item, "first")
+    clock.now += 9
+    assert await queue.lease("tickets") == []
+    assert (await queue.stats("tickets")).delayed == 1
+    clock.now += 1
+    (item,) = await queue.lease("tickets")
+    await queue.nack(item, "second")
+    clock.now += 20
+    (item,) = await queue.lease("tickets")
+    await queue.nack(item, "third")
+
+    (dead,) = await queue.dead_letters("tickets")
+    assert (dead.key, dead.attempts, dead.last_error) == ("1", 3, "third")
+    assert await queue.stats("tickets") == QueueStats(ready=0, delayed=0, leased=0, dead=1)
+
+
+async def test_crashing_consumer_moves_item_to_dead_letters_after_max_attempts(make_queue, clock) -> None:
+    queue = await make_queue(max_attempts=1)
+    await queue.enqueue("tickets", [("1", {})])
+    await queue.lease("tickets")
+
+    clock.now += 61
+
+    assert await queue.lease("tickets") == []
+    (dead,) = await queue.dead_letters("tickets")
+    assert dead.last_error == "lease expired"
+
+
+async def test_requeued_dead_letters_get_fresh_attempts(make_queue) -> None:
+    queue = await make_queue(max_attempts=1)
+    await queue.enqueue("tickets", [("1", {})])
+    (item,) = await queue.lease("tickets")
+    await queue.nack(item, "broken")
+
+    assert await queue.requeue_dead_letters("tickets") == 1
+
+    (item,) = await queue.lease("tickets")
+    assert item.attempts == 1
+    assert await queue.dead_letters("tickets") == []
+
+
+async def test_queue_survives_a_restart(make_queue) -> None:
+    queue = await make_queue()
+    await queue.enqueue("tickets", [("1", {"subject": "Printer"})])
+    await queue.astop()
+
+    reopened = await make_queue()
+
+    (item,) = await reopened.lease("tickets", visibility_timeout=timedelta(seconds=1))
+    assert item.payload == {"subject": "Printer"}
@@ -1,6 +1,6 @@
 import inspect
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import lru_cache
 from typing import Any, ClassVar
 
@@ -41,6 +41,10 @@ class HFClassificationServiceParams(StrictBaseModel):
         default=None,
         description="Optional HuggingFace API token for accessing private models or increased rate limits.",
     )
+    preload_models: list[str] = Field(
+        default_factory=list,
+        description="Models loaded before worker processes are forked, so the workers share their weights.",
+    )
 
 
 class HFClassificationService(Injectable[HFClassificationServiceParams]):
@@ -60,6 +64,11 @@ class HFClassificationService(Injectable[HFClassificationServiceParams]):
     def _log_init(self) -> None:
         self._logger.info("HFClassificationService initialized")
 
+    def preload(self) -> None:
+        for model_name in self._params.preload_models:
+            self._logger.info(f"Preloading model {model_name}")
+            self._get_pipeline(model_name, self._params.api_token)
+
     def classify(self, classification_request: ClassificationRequest) -> ClassificationResult:
         classification_request = classification_request.model_copy(
             update={"api_token": classification_request.api_token or self._params.api_token}
@@ -82,5 +91,26 @@ class HFClassificationService(Injectable[HFClassificationServiceParams]):
 
         return result
 
+    def classify_batch(self, requests: Sequence[ClassificationRequest]) -> list[ClassificationResult]:
+        """Classify the texts of each model in one pipeline call, which pads and batches them."""
+        groups: dict[tuple[str, str | None], list[int]] = {}
+        for index, request in enumerate(requests):
+            groups.setdefault((request.model_name, request.api_token or self._params.api_token), []).append(index)
+
+        results: list[ClassificationResult | None] = [None] * len(requests)
+        for (model_name, api_token), indices in groups.items():
+            self._logger.info(f"Batch classification of {len(indices)} texts started for model {model_name}")
+            classify: Pipeline = self._get_pipeline(model_name, api_token)
+            classifications: Any = classify(
+                [requests[index].text for index in indices], truncation=True, batch_size=len(indices)
+            )
+            if not isinstance(classifications, list) or len(classifications) != len(indices):
+                raise TypeError("HuggingFace pipeline returned no result per text")
+            for index, classification in zip(indices, classifications, strict=True):
+                # Pipelines configured with top_k return a list of labels per text, best first.
+                best = classification[0] if isinstance(classification, list) else classification
+                results[index] = ClassificationResult(label=best["label"], confidence=best["score"])
+        return [result for result in results if result is not None]
+
     async def aclassify(self, req: ClassificationRequest) -> ClassificationResult:
         return self.classify(req)
@@ -0,0 +1,7 @@
+from open_ticket_ai import PluginManifest
+
+MANIFEST = PluginManifest(
+    injectables={
+        "HFClassificationService": "otai_hf_local.hf_classification_service:HFClassificationService",
+    }
+)
@@ -123,3 +123,40 @@ def test_classify_raises_error_when_non_list_result(logger_factory):
 
     with pytest.raises(TypeError, match="HuggingFace pipeline returned a non-list result"):
         service.classify(request)
+
+
+def test_classify_batch_runs_one_pipeline_call_per_model_and_keeps_order(logger_factory):
+    config = InjectableConfig(id="test-hf-service")
+    pipelines = {
+        "queue-model": MagicMock(return_value=[{"label": "sales", "score": 0.9}, {"label": "it", "score": 0.8}]),
+        "priority-model": MagicMock(return_value=[{"label": "high", "score": 0.7}]),
+    }
+    mock_get_pipeline = MagicMock(side_effect=lambda model, _token: pipelines[model])
+    service = HFClassificationService(config, logger_factory, get_pipeline=mock_get_pipeline)
+
+    results = service.classify_batch(
+        [
+            ClassificationRequest(text="first", model_name="queue-model"),
+            ClassificationRequest(text="second", model_name="priority-model"),
+            ClassificationRequest(text="third", model_name="queue-model"),
+        ]
+    )
+
+    assert [result.label for result in results] == ["sales", "high", "it"]
+    pipelines["queue-model"].assert_called_once_with(["first", "third"], truncation=True, batch_size=2)
+    pipelines["priority-model"].assert_called_once_with(["second"], truncation=True, batch_size=1)
+
+
+def test_preload_loads_the_configured_models(logger_factory):
+    config = InjectableConfig(
+        id="test-hf-service", params={"api_token": "configured-token", "preload_models": ["queue-model", "prio-model"]}
+    )
+    mock_get_pipeline = MagicMock()
+    service = HFClassificationService(config, logger_factory, get_pipeline=mock_get_pipeline)
+
+    service.preload()
+
+    assert [call.args for call in mock_get_pipeline.call_args_list] == [
+        ("queue-model", "configured-token"),
+        ("prio-model", "configured-token"),
+    ]
@@ -5,6 +5,7 @@ from open_ticket_ai import AppConfig
 from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
 
 from otai_hf_local.hf_local_plugin import HFLocalPlugin
+from otai_hf_local.manifest import MANIFEST
 
 
 def test_plugin_registration_with_valid_config():
@@ -17,3 +18,7 @@ def test_plugin_registration_with_valid_config():
     assert mock_registry.register.called
     assert mock_registry.register.call_count >= 1
 
+
+
+def test_manifest_matches_registered_injectables():
+    assert HFLocalPlugin(AppConfig()).build_manifest() == MANIFEST
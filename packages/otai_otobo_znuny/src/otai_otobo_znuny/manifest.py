@@ -0,0 +1,7 @@
+from open_ticket_ai import PluginManifest
+
+MANIFEST = PluginManifest(
+    injectables={
+        "OTOBOZnunyTicketSystemService": "otai_otobo_znuny.oto_znuny_ts_service:OTOBOZnunyTicketSystemService",
+    }
+)
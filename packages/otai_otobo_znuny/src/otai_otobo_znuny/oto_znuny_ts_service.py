@@ -17,6 +17,7 @@ from otai_otobo_znuny.models import (
     otobo_ticket_to_unified_ticket,
     unified_entity_to_id_name,
 )
+from otai_otobo_znuny.otobo_znuny_session import OTOBOZnunySession, OTOBOZnunySessionPool
 
 
 class OTOBOZnunyTicketSystemService(TicketSystemService):
@@ -30,16 +31,36 @@ class OTOBOZnunyTicketSystemService(TicketSystemService):
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
-        self._client: OTOBOZnunyClient | None = client
         self._logger.debug("🎫 OTOBOZnunyTicketSystemService initializing")
-        self._initialize()
+        self._session_key: str | None = None
+        if client is not None:
+            self._session = self._create_session(client)
+        else:
+            self._session_key = OTOBOZnunySessionPool.session_key(
+                self._params.base_url, self._params.webservice_name, self._params.username, self._params.password
+            )
+            self._session = OTOBOZnunySessionPool.acquire(self._session_key, self._create_session)
 
     @property
     def client(self) -> OTOBOZnunyClient:
-        if self._client is None:
+        client = self._session.client
+        if client is None:
             self._logger.error("❌ Client not initialized")
-            raise RuntimeError("Client not initialized. Call initialize() first.")
-        return self._client
+            raise RuntimeError("Client not initialized. Call connect() first.")
+        return client
+
+    async def connect(self) -> OTOBOZnunyClient:
+        return await self._session.connect()
+
+    async def astop(self) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._session_key is None:
+            await self._session.aclose()
+            return
+        await OTOBOZnunySessionPool.release(self._session_key)
+        self._session_key = None
 
     async def find_tickets(
         self,
@@ -56,12 +77,12 @@ class OTOBOZnunyTicketSystemService(TicketSystemService):
             queues=[unified_entity_to_id_name(search_criteria.queue)] if search_criteria.queue else None,
             limit=search_criteria.limit,
         )
-        self._logger.debug(f"OTOBO search object: {search.model_dump()}")
-        tickets: list[Ticket] = await self.client.search_and_get(search)
+        self._logger.debug("OTOBO search object: %s", search)
+        tickets: list[Ticket] = await self._session.call(lambda client: client.search_and_get(search))
         self._logger.debug(f"📥 OTOBO search returned {len(tickets)} ticket(s)")
 
         if tickets:
-            self._logger.debug(f"Ticket IDs: {[t.id for t in tickets]}")
+            self._logger.debug(lambda: f"Ticket IDs: {[t.id for t in tickets]}")
 
         return [otobo_ticket_to_unified_ticket(ticket) for ticket in tickets]
 
@@ -85,7 +106,7 @@ class OTOBOZnunyTicketSystemService(TicketSystemService):
         self._logger.info(f"🎫 Fetching ticket by ID: {ticket_id}")
 
         try:
-            ticket = await self.client.get_ticket(int(ticket_id))
+            ticket = await self._session.call(lambda client: client.get_ticket(int(ticket_id)))
             self._logger.info(f"✅ Retrieved ticket {ticket_id}")
             return otobo_ticket_to_unified_ticket(ticket) if ticket else None
         except Exception as e:
@@ -109,7 +130,7 @@ class OTOBOZnunyTicketSystemService(TicketSystemService):
                 body=unified_ticket.body or "",
             ),
         )
-        created_ticket: Ticket = await self.client.create_ticket(payload)
+        created_ticket: Ticket = await self._session.call(lambda client: client.create_ticket(payload))
         return otobo_ticket_to_unified_ticket(created_ticket)
 
     async def update_ticket(
@@ -120,7 +141,7 @@ class OTOBOZnunyTicketSystemService(TicketSystemService):
     ) -> bool:
         resolved_updates = self._resolve_unified_ticket(updates, update_kwargs)
         self._logger.info(f"📝 Updating ticket {ticket_id} in OTOBO/Znuny")
-        self._logger.debug(f"Updates: {resolved_updates.model_dump(exclude_none=True)}")
+        self._logger.debug(lambda: f"Updates: {resolved_updates.model_dump(exclude_none=True)}")
 
         article = None
         if resolved_updates.notes and len(resolved_updates.notes) > 0:
@@ -144,10 +165,10 @@ class OTOBOZnunyTicketSystemService(TicketSystemService):
             article=article,
         )
 
-        self._logger.debug(f"OTOBO ticket update object: {ticket.model_dump(exclude_none=True)}")
+        self._logger.debug(lambda: f"OTOBO ticket update object: {ticket.model_dump(exclude_none=True)}")
 
         try:
-            await self.client.update_ticket(ticket)
+            await self._session.call(lambda client: client.update_ticket(ticket))
         except Exception as e:
             self._logger.error(f"❌ Failed to update ticket {ticket_id}: {e}", exc_info=True)
             raise
@@ -206,21 +227,14 @@ class OTOBOZnunyTicketSystemService(TicketSystemService):
             return UnifiedNote.model_validate(note_kwargs)
         raise ValueError("Note details must be provided either as a UnifiedNote or keyword arguments.")
 
-    def _recreate_client(self) -> OTOBOZnunyClient:
-        self._logger.debug("🔄 Recreating OTOBO client")
-        self._logger.debug(f"Base URL: {self._params.to_client_config().base_url}")
+    def _create_client(self) -> OTOBOZnunyClient:
+        self._logger.debug(f"Base URL: {self._params.base_url}")
+        return OTOBOZnunyClient(config=self._params.to_client_config())
 
-        self._client = OTOBOZnunyClient(config=self._params.to_client_config())
-
-        auth_info = self._params.get_basic_auth().model_dump(with_secrets=True)
-        self._logger.debug(f"Authentication: user={auth_info.get('username', 'N/A')}")
-
-        self._client.login(self._params.get_basic_auth())
-        self._logger.debug("✅ OTOBO client recreated and logged in")
-
-        return self._client
-
-    def _initialize(self) -> None:
-        self._logger.debug("⚙️  Initializing OTOBO/Znuny ticket system service")
-        self._recreate_client()
-        self._logger.debug("✅ OTOBO/Znuny ticket system service initialized")
+    def _create_session(self, client: OTOBOZnunyClient | None = None) -> OTOBOZnunySession:
+        return OTOBOZnunySession(
+            client_factory=self._create_client,
+            auth_factory=self._params.get_basic_auth,
+            logger=self._logger,
+            client=client,
+        )
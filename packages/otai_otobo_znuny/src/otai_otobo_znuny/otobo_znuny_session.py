@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import ClassVar
+
+import httpx
+from open_ticket_ai import AppLogger
+from otobo_znuny.clients.otobo_client import OTOBOZnunyClient
+from otobo_znuny.domain_models.basic_auth_model import BasicAuth
+from otobo_znuny.util.otobo_errors import OTOBOError
+
+_AUTH_ERROR_CODE_MARKERS = ("AuthFail", "SessionInvalid")
+_AUTH_ERROR_STATUS_CODES = (httpx.codes.UNAUTHORIZED, httpx.codes.FORBIDDEN)
+
+type ClientFactory = Callable[[], OTOBOZnunyClient]
+type AuthFactory = Callable[[], BasicAuth]
+
+
+def is_auth_error(error: BaseException) -> bool:
+    if isinstance(error, OTOBOError):
+        return any(marker in error.code for marker in _AUTH_ERROR_CODE_MARKERS)
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _AUTH_ERROR_STATUS_CODES
+    return False
+
+
+class OTOBOZnunySession:
+    """Lazily authenticated OTOBO/Znuny client shared by all calls of a service.
+
+    The client is only created and logged in on the first request. When a request fails
+    with an authentication error, exactly one caller re-authenticates while concurrent
+    callers wait on the same lock and then retry with the refreshed session.
+    """
+
+    def __init__(
+        self,
+        client_factory: ClientFactory,
+        auth_factory: AuthFactory,
+        logger: AppLogger,
+        client: OTOBOZnunyClient | None = None,
+    ) -> None:
+        self._client_factory = client_factory
+        self._auth_factory = auth_factory
+        self._logger = logger
+        self._client: OTOBOZnunyClient | None = client
+        self._owns_client = client is None
+        self._authenticated = False
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def client(self) -> OTOBOZnunyClient | None:
+        return self._client
+
+    @property
+    def is_connected(self) -> bool:
+        return self._client is not None and self._authenticated
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    async def connect(self) -> OTOBOZnunyClient:
+        if not self.is_connected:
+            async with self._lock:
+                if not self.is_connected:
+                    self._login()
+        return self._require_client()
+
+    async def reauthenticate(self, failed_generation: int) -> None:
+        async with self._lock:
+            if failed_generation != self._generation and self.is_connected:
+                self._logger.debug("Session was already re-authenticated by a concurrent request")
+                return
+            self._logger.info("🔑 Re-authenticating OTOBO/Znuny session")
+            if self._client is not None:
+                self._client.logout()
+            self._authenticated = False
+            self._login()
+
+    async def call[T](self, operation: Callable[[OTOBOZnunyClient], Awaitable[T]]) -> T:
+        client = await self.connect()
+        generation = self._generation
+        try:
+            return await operation(client)
+        except (OTOBOError, httpx.HTTPStatusError) as e:
+            if not is_auth_error(e):
+                raise
+            self._logger.warning(f"⚠️  OTOBO/Znuny authentication failed ({e}); retrying with a new session")
+        await self.reauthenticate(generation)
+        return await operation(await self.connect())
+
+    async def aclose(self) -> None:
+        async with self._lock:
+            if self._client is not None:
+                self._client.logout()
+                if self._owns_client:
+                    self._logger.debug("Closing OTOBO/Znuny client")
+                    await self._client.aclose()
+            self._client = None
+            self._authenticated = False
+
+    def _login(self) -> None:
+        if self._client is None:
+            self._logger.debug("🔄 Creating OTOBO/Znuny client")
+            self._client = self._client_factory()
+            self._owns_client = True
+        self._client.login(self._auth_factory())
+        self._authenticated = True
+        self._generation += 1
+        self._logger.debug(f"✅ OTOBO/Znuny session established (generation {self._generation})")
+
+    def _require_client(self) -> OTOBOZnunyClient:
+        if self._client is None:
+            raise RuntimeError("OTOBO/Znuny session has been closed.")
+        return self._client
+
+
+class OTOBOZnunySessionPool:
+    """Process-wide sessions keyed by endpoint and credentials.
+
+    Services are rebuilt by the pipe factory whenever the pipe context changes; sharing the
+    session keeps the HTTP connection pool and login state across those rebuilds.
+    """
+
+    _sessions: ClassVar[dict[str, OTOBOZnunySession]] = {}
+    _references: ClassVar[dict[str, int]] = {}
+
+    @classmethod
+    def acquire(cls, key: str, create_session: Callable[[], OTOBOZnunySession]) -> OTOBOZnunySession:
+        session = cls._sessions.get(key)
+        if session is None:
+            session = create_session()
+            cls._sessions[key] = session
+        cls._references[key] = cls._references.get(key, 0) + 1
+        return session
+
+    @classmethod
+    async def release(cls, key: str) -> None:
+        remaining = cls._references.get(key, 0) - 1
+        if remaining > 0:
+            cls._references[key] = remaining
+            return
+        cls._references.pop(key, None)
+        session = cls._sessions.pop(key, None)
+        if session is not None:
+            await session.aclose()
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        sessions = list(cls._sessions.values())
+        cls._sessions.clear()
+        cls._references.clear()
+        for session in sessions:
+            await session.aclose()
+
+    @staticmethod
+    def session_key(base_url: str, webservice_name: str, username: str, password: str) -> str:
+        password_digest = hashlib.sha256(password.encode()).hexdigest()
+        return f"{base_url.rstrip('/')}|{webservice_name}|{username}|{password_digest}"
@@ -42,17 +42,12 @@ def logger_factory():
 
 @pytest.fixture
 def service(mock_client, service_params, logger_factory):
-    service_instance = OTOBOZnunyTicketSystemService.__new__(OTOBOZnunyTicketSystemService)
     service_config = InjectableConfig(
         id="test_service",
         use="packages.otai_otobo_znuny.src.otai_otobo_znuny.oto_znuny_ts_service.OTOBOZnunyTicketSystemService",
         params=service_params.model_dump(),
     )
-    service_instance._config = service_config
-    service_instance._logger_factory = logger_factory
-    service_instance._logger = logger_factory.create(service_config.id)
-    service_instance._client = mock_client
-    return service_instance
+    return OTOBOZnunyTicketSystemService(client=mock_client, config=service_config, logger_factory=logger_factory)
 
 
 @pytest.fixture
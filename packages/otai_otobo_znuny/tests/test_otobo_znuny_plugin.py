@@ -0,0 +1,7 @@
+from open_ticket_ai import AppConfig
+from packages.otai_otobo_znuny.src.otai_otobo_znuny.manifest import MANIFEST
+from packages.otai_otobo_znuny.src.otai_otobo_znuny.otobo_znuny_plugin import OTOBOZnunyPlugin
+
+
+def test_manifest_matches_registered_injectables() -> None:
+    assert OTOBOZnunyPlugin(AppConfig()).build_manifest() == MANIFEST
@@ -0,0 +1,144 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from otobo_znuny.clients.otobo_client import OTOBOZnunyClient
+from otobo_znuny.util.otobo_errors import OTOBOError
+from packages.otai_otobo_znuny.src.otai_otobo_znuny.otobo_znuny_session import (
+    OTOBOZnunySession,
+    OTOBOZnunySessionPool,
+    is_auth_error,
+)
+
+
+@pytest.fixture
+def session_client():
+    mock = MagicMock(spec=OTOBOZnunyClient)
+    mock.aclose = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def client_factory(session_client):
+    return MagicMock(return_value=session_client)
+
+
+@pytest.fixture
+def session(client_factory, service_params, logger_factory):
+    return OTOBOZnunySession(
+        client_factory=client_factory,
+        auth_factory=service_params.get_basic_auth,
+        logger=logger_factory.create("session"),
+    )
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (OTOBOError("TicketSearch.AuthFail", "Authorization failing!"), True),
+        (OTOBOError("SessionGet.SessionInvalid", "SessionID is invalid"), True),
+        (OTOBOError("500", "Internal Server Error"), False),
+        (ValueError("boom"), False),
+    ],
+)
+def test_is_auth_error(error, expected) -> None:
+    assert is_auth_error(error) is expected
+
+
+def test_session_does_not_connect_on_construction(session, client_factory) -> None:
+    assert session.is_connected is False
+    client_factory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_connect_creates_client_and_logs_in_once(session, client_factory, session_client) -> None:
+    first = await session.connect()
+    second = await session.connect()
+
+    assert first is second is session_client
+    client_factory.assert_called_once()
+    session_client.login.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_call_reauthenticates_on_auth_error(session, session_client) -> None:
+    operation = AsyncMock(side_effect=[OTOBOError("TicketGet.AuthFail", "expired"), "ticket"])
+
+    result = await session.call(operation)
+
+    assert result == "ticket"
+    assert operation.await_count == 2
+    assert session_client.login.call_count == 2
+    session_client.logout.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_call_propagates_non_auth_errors(session, session_client) -> None:
+    operation = AsyncMock(side_effect=OTOBOError("500", "Internal Server Error"))
+
+    with pytest.raises(OTOBOError):
+        await session.call(operation)
+
+    session_client.login.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_auth_failures_login_only_once(session, session_client) -> None:
+    await session.connect()
+    expired_generation = session.generation
+
+    async def operation(_client):
+        if session.generation == expired_generation:
+            await asyncio.sleep(0)
+            raise OTOBOError("TicketSearch.AuthFail", "expired")
+        return "ok"
+
+    results = await asyncio.gather(*(session.call(operation) for _ in range(10)))
+
+    assert results == ["ok"] * 10
+    assert session_client.login.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_owned_client(session, session_client) -> None:
+    await session.connect()
+
+    await session.aclose()
+
+    session_client.aclose.assert_awaited_once()
+    assert session.client is None
+    assert session.is_connected is False
+
+
+@pytest.mark.asyncio
+async def test_aclose_keeps_injected_client_open(service_params, logger_factory, session_client) -> None:
+    session = OTOBOZnunySession(
+        client_factory=MagicMock(),
+        auth_factory=service_params.get_basic_auth,
+        logger=logger_factory.create("session"),
+        client=session_client,
+    )
+    await session.connect()
+
+    await session.aclose()
+
+    session_client.aclose.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_session_pool_shares_sessions_until_last_release(session) -> None:
+    create_session = MagicMock(return_value=session)
+    key = OTOBOZnunySessionPool.session_key("http://otobo/", "ws", "user", "secret")
+
+    first = OTOBOZnunySessionPool.acquire(key, create_session)
+    second = OTOBOZnunySessionPool.acquire(key, create_session)
+    await session.connect()
+    await OTOBOZnunySessionPool.release(key)
+
+    assert first is second
+    create_session.assert_called_once()
+    assert session.is_connected is True
+
+    await OTOBOZnunySessionPool.release(key)
+
+    assert session.is_connected is False
@@ -227,3 +227,28 @@ def test_converter_to_unified_ticket(sample_otobo_ticket) -> None:
 
     assert unified.subject == sample_otobo_ticket.title
     assert unified.id == str(sample_otobo_ticket.id)
+
+
+def test_service_construction_does_not_log_in(service, mock_client) -> None:
+    mock_client.login.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_first_request_logs_in_lazily(service, mock_client, sample_otobo_ticket) -> None:
+    mock_client.get_ticket.return_value = sample_otobo_ticket
+
+    await service.get_ticket("123")
+    await service.get_ticket("123")
+
+    mock_client.login.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_retries_after_auth_failure(service, mock_client, sample_otobo_ticket) -> None:
+    mock_client.get_ticket.side_effect = [OTOBOError("TicketGet.AuthFail", "Session expired"), sample_otobo_ticket]
+
+    result = await service.get_ticket("123")
+
+    assert result is not None
+    assert result.id == "123"
+    assert mock_client.login.call_count == 2
@@ -0,0 +1,169 @@
+"""Compare Zammad search response decoding before and after validating raw bytes.
+
+Run from the repository root:
+
+    python packages/otai_zammad/benchmarks/bench_response_decoding.py --tickets 50 --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedEntity, UnifiedNote, UnifiedTicket
+
+from otai_zammad.models import (
+    ZAMMAD_SEARCH_ADAPTER,
+    ZammadArticle,
+    ZammadTicket,
+    zammad_ticket_to_unified_ticket,
+)
+
+# Shape of a ticket returned by GET /api/v1/tickets/search?expand=true on Zammad 6.x,
+# including the fields the adapter ignores.
+RECORDED_TICKET: dict[str, Any] = {
+    "id": 1,
+    "group_id": 1,
+    "priority_id": 2,
+    "state_id": 1,
+    "organization_id": None,
+    "number": "31001",
+    "title": "Cannot connect to VPN from home office",
+    "owner_id": 1,
+    "customer_id": 3,
+    "note": None,
+    "first_response_at": None,
+    "first_response_escalation_at": None,
+    "close_at": None,
+    "update_escalation_at": None,
+    "last_contact_at": "2025-01-10T08:12:44.101Z",
+    "last_contact_agent_at": None,
+    "last_contact_customer_at": "2025-01-10T08:12:44.101Z",
+    "create_article_type_id": 1,
+    "create_article_sender_id": 2,
+    "article_count": 2,
+    "escalation_at": None,
+    "pending_time": None,
+    "type": None,
+    "time_unit": None,
+    "preferences": {"channel_id": 1},
+    "updated_by_id": 3,
+    "created_by_id": 3,
+    "created_at": "2025-01-10T08:12:44.062Z",
+    "updated_at": "2025-01-10T08:12:44.158Z",
+    "article_ids": [11, 12],
+    "ticket_time_accounting_ids": [],
+    "group": "Users",
+    "priority": "2 normal",
+    "state": "new",
+    "owner": "-",
+    "customer": "jane.doe@example.com",
+    "created_by": "jane.doe@example.com",
+    "updated_by": "jane.doe@example.com",
+    "articles": [
+        {
+            "id": 11,
+            "ticket_id": 1,
+            "type_id": 1,
+            "sender_id": 2,
+            "from": "Jane Doe <jane.doe@example.com>",
+            "to": "support@example.com",
+            "subject": "Cannot connect to VPN from home office",
+            "body": "Since this morning the VPN client times out after the login prompt. " * 8,
+            "content_type": "text/plain",
+            "internal": False,
+            "type": "email",
+            "sender": "Customer",
+            "created_at": "2025-01-10T08:12:44.101Z",
+            "updated_at": "2025-01-10T08:12:44.101Z",
+        },
+        {
+            "id": 12,
+            "ticket_id": 1,
+            "type_id": 10,
+            "sender_id": 1,
+            "subject": "",
+            "body": "Asked the customer for the client log file.",
+            "content_type": "text/plain",
+            "internal": True,
+            "type": "note",
+            "sender": "Agent",
+            "created_at": "2025-01-10T08:30:02.000Z",
+            "updated_at": "2025-01-10T08:30:02.000Z",
+        },
+    ],
+}
+
+
+def build_search_response(ticket_count: int) -> bytes:
+    return json.dumps([{**RECORDED_TICKET, "id": i, "number": str(31000 + i)} for i in range(ticket_count)]).encode()
+
+
+def decode_via_dicts(content: bytes) -> list[UnifiedTicket]:
+    """The previous path: json.loads, per-item validation, a model_copy and validated unified models."""
+    unified = []
+    for raw in json.loads(content):
+        ticket = ZammadTicket.model_validate(raw)
+        ticket = ticket.model_copy(update={"articles": [ZammadArticle.model_validate(a) for a in raw["articles"]]})
+        notes = [
+            UnifiedNote(id=str(article.id), subject=article.subject or "", body=article.body or "")
+            for article in ticket.articles or []
+        ]
+        unified.append(
+            UnifiedTicket(
+                id=str(ticket.id),
+                subject=ticket.title or "",
+                queue=UnifiedEntity(id=ticket.group, name=ticket.group) if ticket.group else None,
+                priority=UnifiedEntity(id=ticket.priority, name=ticket.priority) if ticket.priority else None,
+                notes=notes,
+                body=notes[0].body if notes else "",
+            )
+        )
+    return unified
+
+
+def decode_via_type_adapter(content: bytes) -> list[UnifiedTicket]:
+    result = ZAMMAD_SEARCH_ADAPTER.validate_json(content)
+    entries = result if isinstance(result, list) else result.entries()
+    return [zammad_ticket_to_unified_ticket(entry) for entry in entries if isinstance(entry, ZammadTicket)]
+
+
+def measure(decode: Callable[[bytes], list[UnifiedTicket]], content: bytes, repeat: int) -> list[float]:
+    decode(content)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(content)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickets", type=int, default=50, help="Tickets per search response.")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed decodes per variant.")
+    args = parser.parse_args()
+
+    content = build_search_response(args.tickets)
+    assert [t.model_dump() for t in decode_via_dicts(content)] == [
+        t.model_dump() for t in decode_via_type_adapter(content)
+    ], "both decoders must produce the same tickets"
+
+    print(f"{args.tickets} tickets, {len(content) / 1024:.0f} KiB per response, {args.repeat} runs")
+    medians = {}
+    variants = (("dicts + model_validate", decode_via_dicts), ("TypeAdapter.validate_json", decode_via_type_adapter))
+    for name, decode in variants:
+        timings = measure(decode, content, args.repeat)
+        medians[name] = statistics.median(timings)
+        per_ticket_us = medians[name] / args.tickets * 1e6
+        print(f"  {name:<28} median {medians[name] * 1e3:7.3f} ms  ({per_ticket_us:6.1f} µs/ticket)")
+    before, after = medians.values()
+    print(f"  speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
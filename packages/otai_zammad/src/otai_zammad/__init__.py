@@ -1,4 +1,5 @@
+from .zammad_client_pool import PoolStats, ZammadClientPool
 from .zammad_plugin import ZammadPlugin
 from .zammad_ticket_system_service import ZammadTicketsystemService
 
-__all__ = ["ZammadPlugin", "ZammadTicketsystemService"]
+__all__ = ["PoolStats", "ZammadClientPool", "ZammadPlugin", "ZammadTicketsystemService"]
@@ -0,0 +1,7 @@
+from open_ticket_ai import PluginManifest
+
+MANIFEST = PluginManifest(
+    injectables={
+        "ZammadTicketsystemService": "otai_zammad.zammad_ticket_system_service:ZammadTicketsystemService",
+    }
+)
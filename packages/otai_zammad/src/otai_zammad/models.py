@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from typing import Any
-
-from pydantic import AnyHttpUrl, ConfigDict, Field, SecretStr
+from typing import Annotated
 
+import httpx
 from open_ticket_ai import StrictBaseModel
 from open_ticket_ai.core.ticket_system_integration.unified_models import (
     UnifiedEntity,
     UnifiedNote,
     UnifiedTicket,
 )
+from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, SecretStr, TypeAdapter
+
+_DEFAULT_TIMEOUT_SECONDS = 5.0
 
 
 class ZammadTSServiceParams(StrictBaseModel):
@@ -18,7 +20,30 @@ class ZammadTSServiceParams(StrictBaseModel):
     timeout: float | None = Field(
         default=None,
         gt=0,
-        description="Optional request timeout (in seconds) applied to HTTP requests.",
+        description="Optional request timeout (in seconds) applied to HTTP requests; defaults to 5 seconds.",
+    )
+    connect_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Seconds allowed for opening a connection; falls back to 'timeout' when unset.",
+    )
+    read_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Seconds allowed between two received chunks of a response; falls back to 'timeout' when unset.",
+    )
+    max_connections: int = Field(
+        default=20, gt=0, description="Maximum number of concurrent connections to the Zammad instance."
+    )
+    max_keepalive_connections: int = Field(
+        default=10, ge=0, description="Maximum number of idle connections kept open for reuse."
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, ge=0, description="Seconds an idle connection is kept open before it is closed."
+    )
+    http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with the Zammad instance. Requires the 'http2' extra (h2 package).",
     )
     verify: bool | str = Field(
         default=True,
@@ -28,6 +53,21 @@ class ZammadTSServiceParams(StrictBaseModel):
     def auth_header(self) -> str:
         return f"Token token={self.access_token.get_secret_value()}"
 
+    def http_timeout(self) -> httpx.Timeout:
+        default = self.timeout if self.timeout is not None else _DEFAULT_TIMEOUT_SECONDS
+        return httpx.Timeout(
+            default,
+            connect=self.connect_timeout if self.connect_timeout is not None else default,
+            read=self.read_timeout if self.read_timeout is not None else default,
+        )
+
+    def http_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
 
 class ZammadArticle(StrictBaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -51,6 +91,39 @@ class ZammadTicket(StrictBaseModel):
     articles: list[ZammadArticle] | None = None
 
 
+# Tried in order: smart-mode unions would validate every ticket against each member.
+type ZammadTicketEntry = Annotated[ZammadTicket | int, Field(union_mode="left_to_right")]
+
+
+class ZammadTicketSearchPage(BaseModel):
+    """Envelope returned by ticket searches that are not expanded; entries may be ticket ids."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    tickets: list[ZammadTicketEntry] | None = None
+    results: list[ZammadTicketEntry] | None = None
+    objects: list[ZammadTicketEntry] | None = None
+
+    def entries(self) -> list[ZammadTicket | int]:
+        return self.tickets or self.results or self.objects or []
+
+
+class ZammadArticlePage(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    articles: list[ZammadArticle] = Field(default_factory=list)
+
+
+# Built once at import time so responses are validated straight from the raw bytes.
+ZAMMAD_TICKET_ADAPTER: TypeAdapter[ZammadTicket] = TypeAdapter(ZammadTicket)
+ZAMMAD_SEARCH_ADAPTER: TypeAdapter[list[ZammadTicket | int] | ZammadTicketSearchPage] = TypeAdapter(
+    Annotated[list[ZammadTicketEntry] | ZammadTicketSearchPage, Field(union_mode="left_to_right")]
+)
+ZAMMAD_ARTICLES_ADAPTER: TypeAdapter[list[ZammadArticle] | ZammadArticlePage] = TypeAdapter(
+    Annotated[list[ZammadArticle] | ZammadArticlePage, Field(union_mode="left_to_right")]
+)
+
+
 class ZammadArticleCreate(StrictBaseModel):
     ticket_id: int | None = None
     subject: str = ""
@@ -99,8 +172,13 @@ def zammad_article_to_unified_note(article: ZammadArticle) -> UnifiedNote:
     )
 
 
-def zammad_ticket_to_unified_ticket(ticket: ZammadTicket) -> UnifiedTicket:
-    notes = [zammad_article_to_unified_note(article) for article in ticket.articles or []]
+def zammad_ticket_to_unified_ticket(
+    ticket: ZammadTicket, articles: list[ZammadArticle] | None = None
+) -> UnifiedTicket:
+    """Convert a ticket, taking ``articles`` instead of ``ticket.articles`` when they were fetched separately."""
+    if articles is None:
+        articles = ticket.articles or []
+    notes = [zammad_article_to_unified_note(article) for article in articles]
     body = notes[0].body if notes else ""
     return UnifiedTicket(
         id=str(ticket.id),
@@ -138,11 +216,3 @@ def unified_ticket_to_zammad_update(ticket: UnifiedTicket) -> ZammadTicketUpdate
         priority=_value_from_unified_entity(ticket.priority),
     )
 
-
-def merge_ticket_with_articles(ticket: ZammadTicket, articles: list[ZammadArticle] | None) -> ZammadTicket:
-    payload: dict[str, Any] = {}
-    if articles is not None:
-        payload["articles"] = articles
-    if not payload:
-        return ticket
-    return ticket.model_copy(update=payload)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+import httpx
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    active_connections: int = 0
+    idle_connections: int = 0
+    requests: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.requests if self.requests else 0.0
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """HTTP transport that records how long requests wait for a pooled connection.
+
+    The wait ends with the first connection event httpcore reports for the request, which is
+    either opening a new connection or sending headers over a reused one.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._requests = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        waited: list[float] = []
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if not waited:
+                waited.append(time.perf_counter() - started)
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            self._record_wait(waited[0] if waited else time.perf_counter() - started)
+
+    def stats(self) -> PoolStats:
+        connections = self._pool.connections
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return PoolStats(
+            active_connections=len(connections) - idle,
+            idle_connections=idle,
+            requests=self._requests,
+            total_wait_seconds=self._total_wait,
+            max_wait_seconds=self._max_wait,
+        )
+
+    def _record_wait(self, wait: float) -> None:
+        self._requests += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+
+
+class ZammadClientPool:
+    """Process-wide ``httpx.AsyncClient`` instances keyed by base URL and credentials.
+
+    All services talking to the same Zammad with the same token share one connection pool, so
+    keep-alive connections survive service rebuilds. The first service creating a client
+    decides its limits and timeouts; the client is closed when the last service releases it.
+    """
+
+    _clients: ClassVar[dict[str, httpx.AsyncClient]] = {}
+    _references: ClassVar[dict[str, int]] = {}
+
+    @classmethod
+    def acquire(cls, key: str, create_client: Callable[[], httpx.AsyncClient]) -> httpx.AsyncClient:
+        client = cls._clients.get(key)
+        if client is None or client.is_closed:
+            client = create_client()
+            cls._clients[key] = client
+        cls._references[key] = cls._references.get(key, 0) + 1
+        return client
+
+    @classmethod
+    async def release(cls, key: str) -> None:
+        remaining = cls._references.get(key, 0) - 1
+        if remaining > 0:
+            cls._references[key] = remaining
+            return
+        cls._references.pop(key, None)
+        client = cls._clients.pop(key, None)
+        if client is not None:
+            await client.aclose()
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        cls._references.clear()
+        for client in clients:
+            await client.aclose()
+
+    @classmethod
+    def stats(cls, key: str) -> PoolStats:
+        client = cls._clients.get(key)
+        if client is None:
+            return PoolStats()
+        return client_stats(client)
+
+    @staticmethod
+    def client_key(base_url: str, access_token: str) -> str:
+        token_digest = hashlib.sha256(access_token.encode()).hexdigest()
+        return f"{base_url.rstrip('/')}|{token_digest}"
+
+
+def client_stats(client: httpx.AsyncClient) -> PoolStats:
+    transport = client._transport  # noqa: SLF001 - httpx offers no public accessor for the default transport
+    if isinstance(transport, InstrumentedTransport):
+        return transport.stats()
+    return PoolStats()
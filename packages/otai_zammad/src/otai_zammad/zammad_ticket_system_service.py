@@ -1,26 +1,29 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
 from typing import Any, ClassVar
 
 import httpx
 from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
 from open_ticket_ai.core.ticket_system_integration.unified_models import (
+    TicketRevision,
     TicketSearchCriteria,
     UnifiedNote,
     UnifiedTicket,
 )
 
 from otai_zammad.models import (
+    ZAMMAD_ARTICLES_ADAPTER,
+    ZAMMAD_SEARCH_ADAPTER,
+    ZAMMAD_TICKET_ADAPTER,
     ZammadArticle,
     ZammadTicket,
     ZammadTSServiceParams,
-    merge_ticket_with_articles,
     unified_note_to_zammad_article,
     unified_ticket_to_zammad_create,
     unified_ticket_to_zammad_update,
     zammad_ticket_to_unified_ticket,
 )
+from otai_zammad.zammad_client_pool import InstrumentedTransport, PoolStats, ZammadClientPool, client_stats
 
 
 class ZammadTicketsystemService(TicketSystemService):
@@ -39,42 +42,56 @@ class ZammadTicketsystemService(TicketSystemService):
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
-        self._owns_client = client is None
-        self._client: httpx.AsyncClient | None = client or self._create_client()
+        self._injected_client = client
+        self._pool_key: str | None = None
+        self._client: httpx.AsyncClient | None = client
         self._logger.debug(f"ZammadTicketsystemService initialized with base_url={self._params.base_url}")
 
     @property
     def client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._logger.debug("Creating new AsyncClient for Zammad requests")
-            self._client = self._create_client()
-            self._owns_client = True
+            self._pool_key = ZammadClientPool.client_key(
+                str(self._params.base_url), self._params.access_token.get_secret_value()
+            )
+            self._client = ZammadClientPool.acquire(self._pool_key, self._create_client)
         return self._client
 
+    @property
+    def pool_stats(self) -> PoolStats:
+        if self._client is None:
+            return PoolStats()
+        return client_stats(self._client)
+
     def _create_client(self) -> httpx.AsyncClient:
         headers = {
             "Authorization": self._params.auth_header(),
             "Accept": "application/json",
         }
-        client_kwargs: dict[str, Any] = {
-            "base_url": str(self._params.base_url),
-            "headers": headers,
-            "verify": self._params.verify,
-        }
-        if self._params.timeout is not None:
-            client_kwargs["timeout"] = self._params.timeout
-        loggable_kwargs = {k: v for k, v in client_kwargs.items() if k != "headers"}
-        self._logger.debug(f"Creating AsyncClient with kwargs: {loggable_kwargs}")
-        return httpx.AsyncClient(**client_kwargs)
+        limits = self._params.http_limits()
+        transport = InstrumentedTransport(verify=self._params.verify, http2=self._params.http2, limits=limits)
+        self._logger.debug(
+            f"Creating shared AsyncClient for {self._params.base_url} "
+            f"(http2={self._params.http2}, limits={limits}, timeout={self._params.http_timeout()})"
+        )
+        return httpx.AsyncClient(
+            base_url=str(self._params.base_url),
+            headers=headers,
+            timeout=self._params.http_timeout(),
+            transport=transport,
+        )
+
+    async def astop(self) -> None:
+        await self.aclose()
 
     async def aclose(self) -> None:
-        if self._client is not None and self._owns_client:
-            self._logger.debug("Closing AsyncClient for Zammad")
-            await self._client.aclose()
-        self._client = None
+        if self._pool_key is not None:
+            self._logger.debug("Releasing shared AsyncClient for Zammad")
+            await ZammadClientPool.release(self._pool_key)
+            self._pool_key = None
+        self._client = self._injected_client
 
     async def find_tickets(self, criteria: TicketSearchCriteria) -> list[UnifiedTicket]:
-        self._logger.debug(f"Searching Zammad tickets with criteria={criteria.model_dump()}")
+        self._logger.debug("Searching Zammad tickets with criteria=%s", criteria)
         params: dict[str, Any] = {
             "limit": criteria.limit,
             "offset": criteria.offset,
@@ -88,10 +105,10 @@ class ZammadTicketsystemService(TicketSystemService):
 
         response = await self.client.get(self.API_TICKETS_SEARCH, params=params)
         response.raise_for_status()
-        payload = response.json()
-        raw_tickets = self._extract_ticket_entries(payload)
+        result = ZAMMAD_SEARCH_ADAPTER.validate_json(response.content)
+        entries = result if isinstance(result, list) else result.entries()
 
-        unified = await self._process_raw_tickets_to_unified(raw_tickets)
+        unified = await self._entries_to_unified(entries)
         self._logger.debug(f"Zammad search returned {len(unified)} ticket(s)")
         return unified
 
@@ -101,29 +118,39 @@ class ZammadTicketsystemService(TicketSystemService):
         if ticket:
             self._logger.debug(f"Found first ticket with id={ticket.id}")
         else:
-            self._logger.debug(f"No tickets found for criteria={criteria.model_dump()}")
+            self._logger.debug("No tickets found for criteria=%s", criteria)
         return ticket
 
-    async def _process_raw_tickets_to_unified(self, raw_tickets: list[Any]) -> list[UnifiedTicket]:
+    async def _entries_to_unified(self, entries: list[ZammadTicket | int]) -> list[UnifiedTicket]:
         unified: list[UnifiedTicket] = []
-        for raw in raw_tickets:
-            ticket = await self._coerce_to_ticket(raw)
+        for entry in entries:
+            ticket = entry if isinstance(entry, ZammadTicket) else await self._get_ticket(entry)
             if ticket is None:
                 continue
-            if not ticket.articles:
-                articles = await self._fetch_articles(ticket.id)
-                ticket = merge_ticket_with_articles(ticket, articles)
-            unified.append(zammad_ticket_to_unified_ticket(ticket))
+            unified.append(await self._to_unified(ticket))
         return unified
 
-
     async def get_ticket(self, ticket_id: str) -> UnifiedTicket | None:
         self._logger.info(f"Fetching Zammad ticket id={ticket_id}")
         ticket = await self._get_ticket(int(ticket_id))
         if ticket is None:
             self._logger.warning(f"Ticket id={ticket_id} not found")
             return None
-        return zammad_ticket_to_unified_ticket(ticket)
+        return await self._to_unified(ticket)
+
+    async def get_ticket_revision(self, ticket_id: str, known_version: str | None = None) -> TicketRevision:
+        headers = {"If-None-Match": known_version} if known_version else None
+        response = await self.client.get(
+            self.API_TICKET_BY_ID.format(ticket_id=ticket_id), params={"expand": "articles"}, headers=headers
+        )
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            self._logger.debug(f"Ticket id={ticket_id} not modified since version {known_version}")
+            return TicketRevision(version=known_version, modified=False)
+        if response.status_code == httpx.codes.NOT_FOUND:
+            return TicketRevision()
+        response.raise_for_status()
+        ticket = await self._to_unified(ZAMMAD_TICKET_ADAPTER.validate_json(response.content))
+        return TicketRevision(ticket=ticket, version=response.headers.get("ETag"))
 
     async def create_ticket(self, ticket: UnifiedTicket) -> str:
         payload = unified_ticket_to_zammad_create(ticket)
@@ -163,57 +190,24 @@ class ZammadTicketsystemService(TicketSystemService):
         self._logger.info(f"Added note to Zammad ticket id={ticket_id}")
         return True
 
-    async def _coerce_to_ticket(self, payload: Any) -> ZammadTicket | None:
-        if isinstance(payload, dict):
-            return await self._hydrate_ticket(payload)
-        if isinstance(payload, int):
-            return await self._get_ticket(payload)
-        if isinstance(payload, str) and payload.isdigit():
-            return await self._get_ticket(int(payload))
-        self._logger.warning(f"Skipping unsupported ticket payload: {payload}")
-        return None
-
-    async def _hydrate_ticket(self, payload: dict[str, Any]) -> ZammadTicket:
-        ticket = ZammadTicket.model_validate(payload)
-        if not ticket.articles and ticket.article_ids:
-            articles = await self._fetch_articles(ticket.id)
-            ticket = merge_ticket_with_articles(ticket, articles)
-        return ticket
-
     async def _get_ticket(self, ticket_id: int) -> ZammadTicket | None:
         url = self.API_TICKET_BY_ID.format(ticket_id=ticket_id)
-        response = await self.client.get(
-            url, params={"expand": "articles"}
-        )
+        response = await self.client.get(url, params={"expand": "articles"})
         if response.status_code == httpx.codes.NOT_FOUND:
             return None
         response.raise_for_status()
-        ticket = ZammadTicket.model_validate(response.json())
-        if not ticket.articles:
-            articles = await self._fetch_articles(ticket.id)
-            ticket = merge_ticket_with_articles(ticket, articles)
-        return ticket
+        return ZAMMAD_TICKET_ADAPTER.validate_json(response.content)
+
+    async def _to_unified(self, ticket: ZammadTicket) -> UnifiedTicket:
+        if ticket.articles:
+            return zammad_ticket_to_unified_ticket(ticket)
+        return zammad_ticket_to_unified_ticket(ticket, await self._fetch_articles(ticket.id))
 
     async def _fetch_articles(self, ticket_id: int) -> list[ZammadArticle]:
         response = await self.client.get(self.API_TICKET_ARTICLES_LIST.format(ticket_id=ticket_id))
         response.raise_for_status()
-        data = response.json()
-        if isinstance(data, dict):
-            articles_data: Iterable[Any] = data.get("articles", [])
-        else:
-            articles_data = data
-        return [ZammadArticle.model_validate(item) for item in articles_data if isinstance(item, dict)]
-
-    @staticmethod
-    def _extract_ticket_entries(payload: Any) -> list[Any]:
-        if isinstance(payload, list):
-            return payload
-        if isinstance(payload, dict):
-            for key in ("tickets", "results", "objects"):
-                items = payload.get(key)
-                if isinstance(items, list):
-                    return items
-        return []
+        result = ZAMMAD_ARTICLES_ADAPTER.validate_json(response.content)
+        return result if isinstance(result, list) else result.articles
 
     @staticmethod
     def _extract_ticket_id(payload: Any) -> str:
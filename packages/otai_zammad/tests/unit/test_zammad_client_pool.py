@@ -0,0 +1,86 @@
+from http import HTTPStatus
+
+import pytest
+from open_ticket_ai.core.http.local_http_server import HttpRequest, HttpResponse, LocalHttpServer
+from open_ticket_ai.core.injectables.injectable_models import InjectableConfig
+from open_ticket_ai.core.logging.logging_models import LoggingConfig
+from open_ticket_ai.core.logging.stdlib_logging_adapter import StdlibLoggerFactory
+from open_ticket_ai.core.ticket_system_integration.unified_models import TicketSearchCriteria
+
+from otai_zammad.zammad_client_pool import ZammadClientPool
+from otai_zammad.zammad_ticket_system_service import ZammadTicketsystemService
+
+LOGGER_FACTORY = StdlibLoggerFactory(LoggingConfig(level="DEBUG"))
+
+
+def _make_service(base_url: str = "http://zammad.test/", access_token: str = "token", **params):
+    return ZammadTicketsystemService(
+        config=InjectableConfig(id="zammad", params={"base_url": base_url, "access_token": access_token, **params}),
+        logger_factory=LOGGER_FACTORY,
+    )
+
+
+@pytest.fixture(autouse=True)
+async def _close_pool():
+    yield
+    await ZammadClientPool.aclose_all()
+
+
+@pytest.mark.asyncio
+async def test_services_with_same_credentials_share_one_client() -> None:
+    first = _make_service()
+    second = _make_service()
+    other_token = _make_service(access_token="other")
+
+    assert first.client is second.client
+    assert other_token.client is not first.client
+
+
+@pytest.mark.asyncio
+async def test_client_is_closed_when_last_service_releases_it() -> None:
+    first = _make_service()
+    second = _make_service()
+    client = first.client
+    assert second.client is client
+
+    await first.aclose()
+    assert client.is_closed is False
+
+    await second.aclose()
+    assert client.is_closed is True
+
+
+def test_client_uses_configured_limits_and_split_timeouts() -> None:
+    service = _make_service(timeout=10, connect_timeout=2, read_timeout=30)
+
+    timeout = service.client.timeout
+
+    assert (timeout.connect, timeout.read, timeout.write) == (2, 30, 10)
+
+
+def test_client_key_does_not_contain_the_token() -> None:
+    key = ZammadClientPool.client_key("http://zammad.test/", "secret-token")
+
+    assert "secret-token" not in key
+    assert key == ZammadClientPool.client_key("http://zammad.test", "secret-token")
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_count_requests() -> None:
+    async def handler(_request: HttpRequest) -> HttpResponse:
+        return HttpResponse.json(HTTPStatus.OK, [])
+
+    server = LocalHttpServer(handler, logger=LOGGER_FACTORY.create("server"))
+    await server.start()
+    try:
+        service = _make_service(base_url=server.url)
+        searches = 3
+        for _ in range(searches):
+            await service.find_tickets(TicketSearchCriteria())
+        stats = service.pool_stats
+    finally:
+        await server.aclose()
+
+    assert stats.requests == searches
+    assert stats.max_wait_seconds >= stats.mean_wait_seconds >= 0
+    assert stats.active_connections + stats.idle_connections <= 1
@@ -0,0 +1,8 @@
+from open_ticket_ai import AppConfig
+
+from otai_zammad.manifest import MANIFEST
+from otai_zammad.zammad_plugin import ZammadPlugin
+
+
+def test_manifest_matches_registered_injectables() -> None:
+    assert ZammadPlugin(AppConfig()).build_manifest() == MANIFEST
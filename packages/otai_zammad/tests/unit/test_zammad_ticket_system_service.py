@@ -0,0 +1,108 @@
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+from open_ticket_ai.core.injectables.injectable_models import InjectableConfig
+from open_ticket_ai.core.logging.logging_models import LoggingConfig
+from open_ticket_ai.core.logging.stdlib_logging_adapter import StdlibLoggerFactory
+from open_ticket_ai.core.ticket_system_integration.unified_models import TicketSearchCriteria
+
+from otai_zammad.zammad_ticket_system_service import ZammadTicketsystemService
+
+BASE_URL = "http://zammad.test/"
+TICKET_PAYLOAD = {
+    "id": 7,
+    "title": "VPN broken",
+    "group": "Users",
+    "priority": "2 normal",
+    "articles": [{"id": 70, "subject": "VPN broken", "body": "Cannot connect"}],
+}
+
+type Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def make_service() -> Callable[[Handler], Any]:
+    def _make(handler: Handler) -> ZammadTicketsystemService:
+        client = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+        return ZammadTicketsystemService(
+            client=client,
+            config=InjectableConfig(id="zammad", params={"base_url": BASE_URL, "access_token": "token"}),
+            logger_factory=StdlibLoggerFactory(LoggingConfig(level="DEBUG")),
+        )
+
+    return _make
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_revision_returns_ticket_and_etag(make_service) -> None:
+    service = make_service(lambda _request: httpx.Response(200, json=TICKET_PAYLOAD, headers={"ETag": '"abc"'}))
+
+    revision = await service.get_ticket_revision("7")
+
+    assert revision.modified is True
+    assert revision.version == '"abc"'
+    assert revision.ticket is not None
+    assert revision.ticket.subject == "VPN broken"
+    assert revision.ticket.body == "Cannot connect"
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_revision_sends_if_none_match_and_handles_not_modified(make_service) -> None:
+    seen_headers: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("If-None-Match"))
+        return httpx.Response(304)
+
+    service = make_service(handler)
+
+    revision = await service.get_ticket_revision("7", known_version='"abc"')
+
+    assert seen_headers == ['"abc"']
+    assert revision.modified is False
+    assert revision.ticket is None
+    assert revision.version == '"abc"'
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_revision_not_found(make_service) -> None:
+    service = make_service(lambda _request: httpx.Response(404))
+
+    revision = await service.get_ticket_revision("404")
+
+    assert revision.ticket is None
+    assert revision.modified is True
+
+
+@pytest.mark.asyncio
+async def test_find_tickets_decodes_expanded_search_results(make_service) -> None:
+    service = make_service(lambda _request: httpx.Response(200, json=[TICKET_PAYLOAD]))
+
+    tickets = await service.find_tickets(TicketSearchCriteria(limit=5))
+
+    assert len(tickets) == 1
+    assert tickets[0].id == "7"
+    assert tickets[0].queue is not None and tickets[0].queue.name == "Users"
+    assert tickets[0].notes is not None and tickets[0].notes[0].body == "Cannot connect"
+    assert tickets[0].body == "Cannot connect"
+
+
+@pytest.mark.asyncio
+async def test_find_tickets_loads_tickets_and_articles_listed_by_id(make_service) -> None:
+    ticket_without_articles = {key: value for key, value in TICKET_PAYLOAD.items() if key != "articles"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/tickets/search":
+            return httpx.Response(200, json={"tickets": [7], "tickets_count": 1})
+        if request.url.path == "/api/v1/tickets/7":
+            return httpx.Response(200, json=ticket_without_articles)
+        return httpx.Response(200, json=TICKET_PAYLOAD["articles"])
+
+    service = make_service(handler)
+
+    tickets = await service.find_tickets(TicketSearchCriteria())
+
+    assert [ticket.id for ticket in tickets] == ["7"]
+    assert tickets[0].body == "Cannot connect"
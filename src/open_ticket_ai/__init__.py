@@ -23,6 +23,7 @@ from open_ticket_ai.core.logging.logging_models import LoggingConfig
 from open_ticket_ai.core.pipes.pipe import Pipe
 from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
 from open_ticket_ai.core.plugins.plugin import Plugin
+from open_ticket_ai.core.plugins.plugin_manifest import PluginManifest
 from open_ticket_ai.core.template_rendering.template_renderer import (
     NoRender,
     NoRenderField,
@@ -31,6 +32,7 @@ from open_ticket_ai.core.template_rendering.template_renderer import (
 )
 from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
 from open_ticket_ai.core.ticket_system_integration.unified_models import (
+    TicketRevision,
     TicketSearchCriteria,
     UnifiedEntity,
     UnifiedNote,
@@ -58,10 +60,12 @@ __all__ = [
     "Pipe",
     "PipeFactory",
     "Plugin",
+    "PluginManifest",
     "RegistryError",
     "StrictBaseModel",
     "TemplateRenderError",
     "TemplateRenderer",
+    "TicketRevision",
     "TicketSearchCriteria",
     "TicketSystemService",
     "UnifiedEntity",
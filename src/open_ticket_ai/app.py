@@ -1,11 +1,42 @@
+import asyncio
+import contextlib
+import signal
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
 from injector import inject
 
+from open_ticket_ai.core.config.config_diff import ConfigDiff, diff_configs
 from open_ticket_ai.core.config.config_models import OpenTicketAIConfig
+from open_ticket_ai.core.config.config_watcher import ConfigWatcher
+from open_ticket_ai.core.injectables.lifecycle import StopResult, stop_injectables
 from open_ticket_ai.core.logging.logging_iface import LoggerFactory
+from open_ticket_ai.core.metrics.metrics_exporter import MetricsExporter
 from open_ticket_ai.core.pipes.pipe import Pipe
 from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
 from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
-from open_ticket_ai.core.plugins.plugin_loader import PluginLoader
+from open_ticket_ai.core.pipes.pipe_models import PipeResult
+from open_ticket_ai.core.profiling.cycle_profiler import PROFILER
+from open_ticket_ai.core.tracing.span_exporters import create_span_exporter
+from open_ticket_ai.core.tracing.tracer import TRACER
+
+
+@dataclass(frozen=True, slots=True)
+class DrainSummary:
+    drained: bool
+    seconds: float
+    stopped: tuple[StopResult, ...] = ()
+
+    @property
+    def failed(self) -> tuple[StopResult, ...]:
+        return tuple(result for result in self.stopped if not result.succeeded)
+
+    def describe(self) -> str:
+        cycle = "running cycle drained" if self.drained else "running cycle cancelled after the drain timeout"
+        failed = f", failed: {', '.join(result.name for result in self.failed)}" if self.failed else ""
+        return f"{cycle}; stopped {len(self.stopped)} services and pipes in {self.seconds:.2f}s{failed}"
 
 
 class OpenTicketAIApp:
@@ -15,23 +46,174 @@ class OpenTicketAIApp:
         config: OpenTicketAIConfig,
         pipe_factory: PipeFactory,
         logger_factory: LoggerFactory,
-        plugin_loader: PluginLoader,
     ):
         self._logger = logger_factory.create(self.__class__.__name__)
         self._config = config
         self._orchestrator: Pipe | None = None
-        self._plugin_loader = plugin_loader
+        self._orchestrator_task: asyncio.Task[PipeResult] | None = None
         self._pipe_factory = pipe_factory
+        self._reload_lock = asyncio.Lock()
+        self._shutdown_requested = asyncio.Event()
+        self._metrics_exporter = MetricsExporter(config.infrastructure.metrics, self._logger)
 
-    async def run(self) -> None:
+    def request_shutdown(self) -> None:
+        """Stop scheduling new cycles; ``run`` drains the running one and stops all services."""
+        if not self._shutdown_requested.is_set():
+            self._logger.info("🛑 Shutdown requested, draining...")
+        self._shutdown_requested.set()
+
+    async def run(self) -> DrainSummary:
         self._logger.info("🚀 Starting Open Ticket AI orchestration...")
         self._logger.info(f"📦 Loaded {len(self._config.services)} services")
         self._logger.info(f"🔧 Orchestrator has {len(self._config.orchestrator.params['steps'])} runners\n")
-        self._orchestrator = await self._pipe_factory.create_pipe(self._config.orchestrator, PipeContext.empty())
-        self._plugin_loader.load_plugins()
+        reload_config = self._config.infrastructure.config_reload
+        watch_task = (
+            asyncio.create_task(self._watch_config(ConfigWatcher(self._logger, reload_config.poll_interval)))
+            if reload_config.enabled
+            else None
+        )
+        tracing = self._config.infrastructure.tracing
+        if tracing.enabled:
+            TRACER.configure(create_span_exporter(tracing), tracing.sample_rate)
+        PROFILER.configure(self._config.infrastructure.profiling, self._logger)
+        handled_signals = self._install_signal_handlers()
         try:
-            await self._orchestrator.process(PipeContext.empty())
+            await self._metrics_exporter.start()
+            await PROFILER.astart()
+            await self._start_orchestrator()
+            await self._wait_for_orchestrator()
         except KeyboardInterrupt:
             self._logger.info("\n⚠️  Shutdown requested...")
+        finally:
+            if watch_task is not None:
+                watch_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await watch_task
+            summary = await self._shutdown()
+            await self._metrics_exporter.aclose()
+            await PROFILER.aclose()
+            TRACER.shutdown()
+            loop = asyncio.get_running_loop()
+            for handled_signal in handled_signals:
+                loop.remove_signal_handler(handled_signal)
 
         self._logger.info("✅ Orchestration complete")
+        return summary
+
+    async def reload(self, new_config: OpenTicketAIConfig) -> ConfigDiff:
+        """Apply ``new_config`` to the running app, rebuilding only what changed.
+
+        The running orchestrator finishes its current cycle on the old configuration first; a cycle
+        still running after ``infrastructure.shutdown.drain_timeout`` is cancelled.
+        Services and pipes that did not change, and nothing they depend on did, are reused.
+        """
+        diff = diff_configs(self._config, new_config)
+        if diff.restart_required:
+            self._logger.warning(f"⚠️  Changes to {', '.join(diff.restart_required)} only apply after a restart")
+        if not diff.needs_reload:
+            return diff
+        self._pipe_factory.validate_config(new_config)
+
+        async with self._reload_lock:
+            was_running = self._orchestrator_task is not None and not self._orchestrator_task.done()
+            drain_timeout = self._config.infrastructure.shutdown.drain_timeout
+            if not await self._stop_orchestrator(drain_timeout):
+                self._logger.warning(
+                    f"⚠️  Running cycle did not finish within {drain_timeout}; cancelled it to apply the configuration"
+                )
+            old_config = self._config
+            stale = self._pipe_factory.apply_config(new_config, diff)
+            self._config = new_config
+            try:
+                if was_running:
+                    await self._start_orchestrator()
+            except Exception:
+                self._logger.exception("❌ Changed orchestrator could not be built; restoring previous configuration")
+                stale += self._pipe_factory.apply_config(old_config, diff)
+                self._config = old_config
+                await self._start_orchestrator()
+                raise
+            finally:
+                await stop_injectables(stale, self._logger, self._config.infrastructure.shutdown.stop_timeout)
+
+        self._logger.info(
+            f"🔄 Configuration reloaded; rebuilt services {sorted(diff.changed_services)} "
+            f"and pipes {list(diff.changed_pipes)}"
+        )
+        return diff
+
+    async def _watch_config(self, watcher: ConfigWatcher) -> None:
+        async for app_config in watcher.changes():
+            try:
+                await self.reload(app_config.open_ticket_ai)
+            except Exception:
+                self._logger.exception("❌ Failed to apply the changed configuration")
+
+    async def _start_orchestrator(self) -> None:
+        self._orchestrator = await self._pipe_factory.create_pipe(self._config.orchestrator, PipeContext.empty())
+        self._orchestrator_task = asyncio.create_task(self._orchestrator.process(PipeContext.empty()))
+
+    async def _stop_orchestrator(self, timeout: timedelta | None = None) -> bool:
+        """Let the orchestrator finish its running cycle; return ``False`` if it had to be cancelled."""
+        task = self._orchestrator_task
+        if task is None or task.done():
+            return True
+        request_stop = getattr(self._orchestrator, "request_stop", None)
+        if not callable(request_stop):
+            task.cancel()
+            await asyncio.wait([task])
+            return False
+        request_stop()
+        done, _ = await asyncio.wait([task], timeout=timeout.total_seconds() if timeout else None)
+        if done:
+            return True
+        task.cancel()
+        await asyncio.wait([task])
+        return False
+
+    async def _wait_for_orchestrator(self) -> None:
+        shutdown_requested = asyncio.ensure_future(self._shutdown_requested.wait())
+        try:
+            while self._orchestrator_task is not None:
+                task = self._orchestrator_task
+                await asyncio.wait([task, shutdown_requested], return_when=asyncio.FIRST_COMPLETED)
+                if shutdown_requested.done():
+                    return
+                async with self._reload_lock:
+                    if task is self._orchestrator_task:
+                        task.result()
+                        return
+        finally:
+            shutdown_requested.cancel()
+
+    async def _shutdown(self) -> DrainSummary:
+        settings = self._config.infrastructure.shutdown
+        started = time.perf_counter()
+        async with self._reload_lock:
+            drained = await self._stop_orchestrator(settings.drain_timeout)
+            self._orchestrator_task = None
+            stopped = await self._pipe_factory.aclose(settings.stop_timeout)
+        summary = DrainSummary(drained=drained, seconds=time.perf_counter() - started, stopped=tuple(stopped))
+        log = self._logger.info if drained and not summary.failed else self._logger.warning
+        log(f"🛑 Shutdown complete: {summary.describe()}")
+        return summary
+
+    def _install_signal_handlers(self) -> list[signal.Signals]:
+        loop = asyncio.get_running_loop()
+        handlers: dict[signal.Signals, Callable[[], object]] = {
+            signal.SIGTERM: self.request_shutdown,
+            signal.SIGINT: self.request_shutdown,
+        }
+        profile_signal = getattr(signal, "SIGUSR1", None)
+        if PROFILER.enabled and profile_signal is not None:
+            handlers[profile_signal] = PROFILER.request
+        handled: list[signal.Signals] = []
+        for handled_signal, handler in handlers.items():
+            try:
+                loop.add_signal_handler(handled_signal, handler)
+            except (NotImplementedError, RuntimeError, ValueError) as e:
+                # Not supported on Windows event loops or outside the main thread.
+                self._logger.debug(f"Not handling {handled_signal.name}: {e}")
+                continue
+            handled.append(handled_signal)
+        return handled
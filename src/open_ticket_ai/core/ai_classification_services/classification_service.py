@@ -1,15 +1,46 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 
 from open_ticket_ai import Injectable
 from open_ticket_ai.core.ai_classification_services.classification_models import (
     ClassificationRequest,
     ClassificationResult,
 )
+from open_ticket_ai.core.metrics.instrumentation import instrument_methods
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+
+_CALLS = METRICS.counter(
+    "otai_classification_calls_total", "Classification calls by outcome.", ("service", "operation", "outcome")
+)
+_DURATION = METRICS.histogram(
+    "otai_classification_duration_seconds", "Duration of classification calls.", ("service", "operation")
+)
+_CONFIDENCE = METRICS.histogram(
+    "otai_classification_confidence",
+    "Confidence of the returned label.",
+    ("service",),
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99, 1.0),
+)
+
+
+def _observe_confidence(service: Any, _operation: str, result: ClassificationResult) -> None:
+    _CONFIDENCE.labels(service.injectable_id).observe(result.confidence)
 
 
 class ClassificationService(Injectable, ABC):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        instrument_methods(
+            cls, ("classify", "aclassify"), _CALLS, _DURATION, _observe_confidence, span_prefix="classification"
+        )
+
     @abstractmethod
     def classify(self, req: ClassificationRequest) -> ClassificationResult: ...
 
     @abstractmethod
     async def aclassify(self, req: ClassificationRequest) -> ClassificationResult: ...
+
+    def classify_batch(self, requests: Sequence[ClassificationRequest]) -> list[ClassificationResult]:
+        """Classify several texts in one call; models that run faster on batches override this."""
+        return [self.classify(req) for req in requests]
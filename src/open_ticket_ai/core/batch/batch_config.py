@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Any
+
+from open_ticket_ai.core.ai_classification_services.classification_service import ClassificationService
+from open_ticket_ai.core.batch.recording_ticket_system import RecordingTicketSystemService
+from open_ticket_ai.core.config.config_diff import pipe_tree
+from open_ticket_ai.core.config.config_models import OpenTicketAIConfig
+from open_ticket_ai.core.config.errors import WrongConfigError
+from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
+from open_ticket_ai.core.injectables.injectable import Injectable
+from open_ticket_ai.core.injectables.injectable_models import InjectableConfigBase
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig, iter_pipe_configs
+from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
+
+RECORDING_TICKET_SYSTEM = "batch:RecordingTicketSystemService"
+BATCHING_CLASSIFIER = "base:BatchingClassificationService"
+BATCH_COMPONENTS: dict[str, type[Injectable]] = {RECORDING_TICKET_SYSTEM: RecordingTicketSystemService}
+
+_FETCH_PIPE_SUFFIX = ":FetchTicketsPipe"
+
+
+def find_batch_pipe(config: OpenTicketAIConfig, pipe_id: str | None = None) -> PipeConfig:
+    """The composite pipe with ``pipe_id``, or by default the ``run`` pipe of the first orchestrator runner."""
+    if pipe_id is None:
+        steps = config.orchestrator.params.get("steps") or []
+        runs = [step["params"]["run"] for step in steps if "run" in (step.get("params") or {})]
+        if not runs:
+            raise WrongConfigError("The orchestrator has no runner with a 'run' pipe; choose the batch pipe by id.")
+        pipe = PipeConfig.model_validate(runs[0])
+    else:
+        pipe = next((pipe for pipe in pipe_tree(config) if pipe.id == pipe_id), None)
+        if pipe is None:
+            raise WrongConfigError(f"No pipe with id '{pipe_id}' in the orchestrator.")
+    if not isinstance(pipe.params.get("steps"), list):
+        raise WrongConfigError(f"Pipe '{pipe.id}' has no steps; batch runs need a composite pipe.")
+    return pipe
+
+
+def batch_steps(pipe: PipeConfig) -> list[PipeConfig]:
+    return [PipeConfig.model_validate(step) for step in pipe.params["steps"]]
+
+
+def find_ticket_step(pipe: PipeConfig, step_id: str | None = None) -> PipeConfig:
+    """The step whose result the batch tickets replace: ``step_id``, or the first ``FetchTicketsPipe``."""
+    for step in batch_steps(pipe):
+        if step.id == step_id or (step_id is None and step.use.endswith(_FETCH_PIPE_SUFFIX)):
+            return step
+    wanted = f"step '{step_id}'" if step_id else "step fetching tickets"
+    raise WrongConfigError(f"Pipe '{pipe.id}' has no {wanted} to feed the batch tickets into.")
+
+
+def prepare_batch_config(
+    config: OpenTicketAIConfig,
+    pipe: PipeConfig,
+    component_registry: ComponentRegistry,
+    *,
+    apply_writes: bool,
+    inference_batch_size: int,
+) -> tuple[OpenTicketAIConfig, PipeConfig]:
+    """Wrap the services the batch pipe uses and point everything that injects them at the wrappers.
+
+    What is wrapped is decided by the type of the configured component, whatever name it is injected
+    under. Every ticket system the pipe uses, directly or through other services, that does not
+    itself wrap another one is wrapped by a ``RecordingTicketSystemService``, which only forwards
+    writes with ``apply_writes``. Services injecting it, such as caches or rate limiters, and the
+    pipes are pointed at the wrapper, so no write reaches a backend around it. With an
+    ``inference_batch_size`` above one, the classification services injected into pipes are wrapped
+    by a ``BatchingClassificationService`` so concurrent tickets are classified together.
+    """
+    services = dict(config.services)
+    raw: dict[str, Any] = pipe.model_dump()
+    used = _used_services(config, [nested.get("injects") or {} for nested in iter_pipe_configs(raw)])
+
+    def component(service_id: str) -> type[Injectable] | None:
+        service = config.services.get(service_id)
+        return None if service is None else component_registry.get_injectable(by_identifier=service.use)
+
+    def is_ticket_system(service_id: str) -> bool:
+        service_class = component(service_id)
+        return service_class is not None and issubclass(service_class, TicketSystemService)
+
+    backends = [
+        service_id
+        for service_id in used
+        if is_ticket_system(service_id)
+        and not any(is_ticket_system(inner) for inner in config.services[service_id].injects.values())
+    ]
+    recorded = {service_id: f"{service_id}_batch_writes" for service_id in backends}
+    batched: dict[str, str] = {}
+
+    def wrap(service_id: str) -> str:
+        if service_id in recorded:
+            return recorded[service_id]
+        service_class = component(service_id)
+        if inference_batch_size > 1 and service_class is not None and issubclass(service_class, ClassificationService):
+            batched[service_id] = f"{service_id}_batched"
+            return batched[service_id]
+        return service_id
+
+    for service_id in used:
+        injects = config.services[service_id].injects
+        if any(inner in recorded for inner in injects.values()):
+            services[service_id] = services[service_id].model_copy(
+                update={"injects": {name: recorded.get(inner, inner) for name, inner in injects.items()}}
+            )
+
+    for nested in iter_pipe_configs(raw):
+        if nested.get("injects"):
+            nested["injects"] = {param_name: wrap(service_id) for param_name, service_id in nested["injects"].items()}
+
+    for service_id, wrapper_id in recorded.items():
+        services[wrapper_id] = InjectableConfigBase(
+            use=RECORDING_TICKET_SYSTEM, params={"apply_writes": apply_writes}, injects={"ticket_system": service_id}
+        )
+    for service_id, wrapper_id in batched.items():
+        services[wrapper_id] = InjectableConfigBase(
+            use=BATCHING_CLASSIFIER,
+            params={"max_batch_size": inference_batch_size},
+            injects={"classification_service": service_id},
+        )
+    return config.model_copy(update={"services": services}), PipeConfig.model_validate(raw)
+
+
+def _used_services(config: OpenTicketAIConfig, injects: list[dict[str, str]]) -> list[str]:
+    """The configured services in ``injects`` and, transitively, the services they inject."""
+    used: list[str] = []
+    pending = [service_id for injected in injects for service_id in injected.values()]
+    while pending:
+        service_id = pending.pop(0)
+        if service_id in used or service_id not in config.services:
+            continue
+        used.append(service_id)
+        pending.extend(config.services[service_id].injects.values())
+    return used
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import typing
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Literal
+
+from injector import Injector
+from pydantic import Field
+
+from open_ticket_ai.core.base_model import StrictBaseModel
+from open_ticket_ai.core.batch.batch_config import (
+    BATCH_COMPONENTS,
+    find_batch_pipe,
+    find_ticket_step,
+    prepare_batch_config,
+)
+from open_ticket_ai.core.batch.batch_runner import BatchRunner, BatchSummary, ProgressCallback, write_parquet
+from open_ticket_ai.core.batch.ticket_sources import TicketSource, TicketSystemTicketSource, ticket_source_for_file
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.errors import WrongConfigError
+from open_ticket_ai.core.dependency_injection.container import AppModule
+from open_ticket_ai.core.injectables.injectable import Injectable
+from open_ticket_ai.core.logging.logging_iface import LoggerFactory
+from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig
+from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
+from open_ticket_ai.core.ticket_system_integration.unified_models import TicketSearchCriteria
+
+_PARQUET_SUFFIX = ".parquet"
+
+
+class BatchJobSettings(StrictBaseModel):
+    output: Path = Field(description="JSON lines result file; with a .parquet suffix it is converted at the end.")
+    input: Path | None = Field(
+        default=None, description="JSON lines or CSV export to read. By default the fetch step's search is paged."
+    )
+    pipe_id: str | None = Field(
+        default=None, description="Composite pipe to run; by default the first orchestrator runner's run pipe."
+    )
+    ticket_step_id: str | None = Field(
+        default=None, description="Step whose fetched tickets are replaced; by default the first FetchTicketsPipe."
+    )
+    concurrency: int = Field(default=16, gt=0, description="Tickets processed at the same time.")
+    inference_batch_size: int = Field(
+        default=16, gt=0, description="Most classifications batched together; 1 classifies each ticket on its own."
+    )
+    apply_writes: bool = Field(default=False, description="Perform the pipeline's writes instead of recording them.")
+    resume: bool = Field(default=False, description="Continue from the checkpoint of an interrupted run.")
+    page_size: int = Field(default=100, gt=0, description="Tickets per search when paging the ticket system.")
+    checkpoint_every: int = Field(default=100, gt=0, description="Write the checkpoint every N tickets.")
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] | None = Field(
+        default=None, description="Overrides the configured log level."
+    )
+
+    @property
+    def results_path(self) -> Path:
+        if self.output.suffix == _PARQUET_SUFFIX:
+            return self.output.with_suffix(".jsonl")
+        return self.output
+
+
+async def run_batch_job(
+    app_config: AppConfig,
+    settings: BatchJobSettings,
+    on_progress: ProgressCallback | None = None,
+    extra_components: Mapping[str, type[Injectable]] | None = None,
+) -> BatchSummary:
+    """Set up the app for a batch run of ``app_config``'s pipeline and run it to the end of the source.
+
+    ``extra_components`` are registered like in ``AppModule``, e.g. stand-ins used by tests.
+    """
+    config = app_config.open_ticket_ai
+    if settings.log_level is not None:
+        logging_config = config.infrastructure.logging.model_copy(update={"level": settings.log_level})
+        config = config.model_copy(
+            update={"infrastructure": config.infrastructure.model_copy(update={"logging": logging_config})}
+        )
+    pipe = find_batch_pipe(config, settings.pipe_id)
+    ticket_step = find_ticket_step(pipe, settings.ticket_step_id)
+    app_module = AppModule(
+        app_config.model_copy(update={"open_ticket_ai": config}),
+        extra_components={**BATCH_COMPONENTS, **(extra_components or {})},
+    )
+    config, pipe = prepare_batch_config(
+        config,
+        pipe,
+        app_module.component_registry,
+        apply_writes=settings.apply_writes,
+        inference_batch_size=settings.inference_batch_size,
+    )
+    # The wrappers are chosen by the component types of the module's registry, so the module is
+    # built first and handed the prepared config before the container binds it.
+    app_module.app_config = app_module.app_config.model_copy(update={"open_ticket_ai": config})
+    injector = Injector([app_module])
+    pipe_factory = injector.get(PipeFactory)
+    logger_factory = injector.get(LoggerFactory)
+    try:
+        runner = BatchRunner(
+            pipe_factory,
+            pipe,
+            ticket_step.id,
+            await _ticket_source(settings, ticket_step, pipe_factory),
+            settings.results_path,
+            logger_factory.create("BatchRunner"),
+            concurrency=settings.concurrency,
+            checkpoint_every=settings.checkpoint_every,
+            on_progress=on_progress,
+        )
+        summary = await runner.run(resume=settings.resume)
+    finally:
+        await pipe_factory.aclose()
+        logger_factory.shutdown()
+    if settings.output != settings.results_path:
+        write_parquet(settings.results_path, settings.output)
+    return summary
+
+
+async def _ticket_source(
+    settings: BatchJobSettings, ticket_step: PipeConfig, pipe_factory: PipeFactory
+) -> TicketSource:
+    if settings.input is not None:
+        return ticket_source_for_file(settings.input)
+    service_id = ticket_step.injects.get("ticket_system")
+    criteria = ticket_step.params.get("ticket_search_criteria")
+    if service_id is None or criteria is None:
+        raise WrongConfigError(f"Step '{ticket_step.id}' does not search a ticket system; pass an input file.")
+    ticket_system = typing.cast(TicketSystemService, await pipe_factory.get_service(service_id))
+    return TicketSystemTicketSource(ticket_system, TicketSearchCriteria.model_validate(criteria), settings.page_size)
@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic import Field
+
+from open_ticket_ai.core.base_model import StrictBaseModel
+from open_ticket_ai.core.batch.batch_config import batch_steps
+from open_ticket_ai.core.batch.recording_ticket_system import recording_writes
+from open_ticket_ai.core.batch.ticket_sources import TicketSource
+from open_ticket_ai.core.logging.logging_iface import AppLogger
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig, PipeResult
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedTicket
+
+_TICKETS = METRICS.counter("otai_batch_tickets_total", "Tickets processed by batch runs by outcome.", ("outcome",))
+# Rows per Parquet row group when converting the results.
+_PARQUET_CHUNK = 10_000
+# Bytes read at a time when looking for the end of the last complete result line.
+_TAIL_CHUNK = 64 * 1024
+
+
+class CheckpointMismatchError(Exception):
+    """Raised when resuming from a checkpoint written for another source or pipe."""
+
+
+class BatchCheckpoint(StrictBaseModel):
+    source: str = Field(description="Description of the ticket source the run reads.")
+    pipe_id: str = Field(description="Id of the composite pipe the tickets run through.")
+    offset: int = Field(description="Every ticket before this offset has its result in the output.")
+    processed: int = Field(default=0, description="Tickets processed over all runs, including failed ones.")
+    failed: int = Field(default=0, description="Tickets whose pipeline failed over all runs.")
+    updated_at: datetime
+
+    @classmethod
+    def load(cls, path: Path) -> BatchCheckpoint | None:
+        return cls.model_validate_json(path.read_text()) if path.exists() else None
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(self.model_dump_json(indent=2))
+        tmp_path.replace(path)
+
+
+@dataclass(frozen=True, slots=True)
+class BatchProgress:
+    processed: int
+    failed: int
+    resumed: int
+    offset: int
+    total: int | None
+    elapsed_seconds: float
+
+    @property
+    def tickets_per_second(self) -> float:
+        return self.processed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class BatchSummary(StrictBaseModel):
+    pipe_id: str
+    start_offset: int
+    end_offset: int
+    processed: int
+    failed: int
+    resumed: int = Field(description="Tickets skipped because an interrupted run already wrote their result.")
+    seconds: float
+    tickets_per_second: float
+
+
+type ProgressCallback = Callable[[BatchProgress], None]
+
+
+class _BatchRun:
+    """Progress of one run; ``offset`` only advances over tickets finished without a gap."""
+
+    def __init__(self, start: int, finished: set[int], total: int | None, previous: BatchCheckpoint | None) -> None:
+        self.offset = start
+        self.finished = finished
+        self.total = total
+        self.previous = previous
+        self.processed = self.failed = self.resumed = 0
+        self._done: set[int] = set()
+        self._started = time.perf_counter()
+
+    @property
+    def completed(self) -> int:
+        return self.processed + self.resumed
+
+    def complete(self, offset: int, *, failed: bool = False, resumed: bool = False) -> None:
+        if resumed:
+            self.resumed += 1
+        else:
+            self.processed += 1
+            self.failed += failed
+        self._done.add(offset)
+        while self.offset in self._done:
+            self._done.remove(self.offset)
+            self.offset += 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def progress(self) -> BatchProgress:
+        return BatchProgress(
+            processed=self.processed,
+            failed=self.failed,
+            resumed=self.resumed,
+            offset=self.offset,
+            total=self.total,
+            elapsed_seconds=self.elapsed(),
+        )
+
+
+class JsonLinesResultWriter:
+    """Appends one JSON result per line; values JSON cannot represent are written as strings."""
+
+    def __init__(self, path: Path, *, append: bool) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if append and path.exists():
+            _drop_incomplete_last_line(path)
+        self._file: IO[str] = path.open("a" if append else "w", encoding="utf-8")
+
+    @staticmethod
+    def written_offsets(path: Path, since: int) -> set[int]:
+        """Offsets from ``since`` on that already have a result in ``path``."""
+        if not path.exists():
+            return set()
+        offsets: set[int] = set()
+        with path.open(encoding="utf-8") as lines:
+            for line in lines:
+                try:
+                    offset = json.loads(line).get("offset")
+                except json.JSONDecodeError:
+                    # The last line of an interrupted run may be incomplete.
+                    continue
+                if isinstance(offset, int) and offset >= since:
+                    offsets.add(offset)
+        return offsets
+
+    def write(self, record: dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+
+    def sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _drop_incomplete_last_line(path: Path) -> None:
+    # An interrupted run may have written half a line, which the next result must not extend.
+    with path.open("rb+") as file:
+        size = file.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        file.seek(size - 1)
+        if file.read(1) == b"\n":
+            return
+        end = size
+        while end > 0:
+            start = max(0, end - _TAIL_CHUNK)
+            file.seek(start)
+            newline = file.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                file.truncate(start + newline + 1)
+                return
+            end = start
+        file.truncate(0)
+
+
+class BatchRunner:
+    """Runs tickets from a source through the steps of a composite pipe, many tickets at a time.
+
+    The step that fetches tickets in the configured pipeline is not run; each ticket is passed as
+    its only fetched ticket instead. Every ticket's step results and the writes it caused go to a
+    JSON lines file. The checkpoint holds the offset below which every result has been written, so
+    an interrupted run resumes there and skips the tickets it finished beyond it.
+    """
+
+    def __init__(
+        self,
+        pipe_factory: PipeFactory,
+        pipe: PipeConfig,
+        ticket_step_id: str,
+        source: TicketSource,
+        output: Path,
+        logger: AppLogger,
+        *,
+        checkpoint: Path | None = None,
+        concurrency: int = 16,
+        checkpoint_every: int = 100,
+        on_progress: ProgressCallback | None = None,
+    ) -> None:
+        self._pipe_factory = pipe_factory
+        self._pipe = pipe
+        self._ticket_step_id = ticket_step_id
+        self._steps = [step for step in batch_steps(pipe) if step.id != ticket_step_id]
+        self._source = source
+        self._output = output
+        self._logger = logger
+        self._checkpoint_path = checkpoint or output.with_name(f"{output.name}.checkpoint.json")
+        self._concurrency = concurrency
+        self._checkpoint_every = checkpoint_every
+        self._on_progress = on_progress
+
+    async def run(self, *, resume: bool = False) -> BatchSummary:
+        checkpoint = BatchCheckpoint.load(self._checkpoint_path) if resume else None
+        if checkpoint is not None and (checkpoint.source, checkpoint.pipe_id) != (
+            self._source.description,
+            self._pipe.id,
+        ):
+            raise CheckpointMismatchError(
+                f"Checkpoint {self._checkpoint_path} belongs to pipe '{checkpoint.pipe_id}' reading "
+                f"{checkpoint.source}, not to pipe '{self._pipe.id}' reading {self._source.description}."
+            )
+        start = checkpoint.offset if checkpoint else 0
+        run = _BatchRun(
+            start=start,
+            finished=JsonLinesResultWriter.written_offsets(self._output, start) if checkpoint else set(),
+            total=self._source.count(),
+            previous=checkpoint,
+        )
+        if start:
+            self._logger.info(f"Resuming batch run at offset {start}")
+        writer = JsonLinesResultWriter(self._output, append=checkpoint is not None)
+        tickets: asyncio.Queue[tuple[int, UnifiedTicket] | None] = asyncio.Queue(maxsize=self._concurrency * 2)
+        try:
+            async with asyncio.TaskGroup() as tasks:
+                tasks.create_task(self._read(tickets, start))
+                for _ in range(self._concurrency):
+                    tasks.create_task(self._work(tickets, writer, run))
+        finally:
+            writer.sync()
+            writer.close()
+            self._save_checkpoint(run)
+        return BatchSummary(
+            pipe_id=self._pipe.id,
+            start_offset=start,
+            end_offset=run.offset,
+            processed=run.processed,
+            failed=run.failed,
+            resumed=run.resumed,
+            seconds=run.elapsed(),
+            tickets_per_second=run.progress().tickets_per_second,
+        )
+
+    async def _read(self, tickets: asyncio.Queue[tuple[int, UnifiedTicket] | None], start: int) -> None:
+        async for item in self._source.tickets(start):
+            await tickets.put(item)
+        # Only once the source is exhausted: when it fails or a worker does, the task group cancels
+        # the workers and nobody is left to make room in the queue for the sentinels.
+        for _ in range(self._concurrency):
+            await tickets.put(None)
+
+    async def _work(
+        self, tickets: asyncio.Queue[tuple[int, UnifiedTicket] | None], writer: JsonLinesResultWriter, run: _BatchRun
+    ) -> None:
+        while (item := await tickets.get()) is not None:
+            offset, ticket = item
+            if offset in run.finished:
+                run.complete(offset, resumed=True)
+            else:
+                record = await self._process(offset, ticket)
+                writer.write(record)
+                run.complete(offset, failed=not record["succeeded"])
+                _TICKETS.labels("succeeded" if record["succeeded"] else "failed").inc()
+            if run.completed % self._checkpoint_every == 0:
+                writer.sync()
+                self._save_checkpoint(run)
+            if self._on_progress is not None:
+                self._on_progress(run.progress())
+
+    async def _process(self, offset: int, ticket: UnifiedTicket) -> dict[str, Any]:
+        fetched = PipeResult.success(data={"fetched_tickets": [ticket.model_dump()]})
+        context = PipeContext(
+            pipe_results={self._ticket_step_id: fetched.model_dump()}, parent_params=self._pipe.params
+        )
+        results: dict[str, Any] = {}
+        started = time.perf_counter()
+        succeeded, message = True, ""
+        with recording_writes() as writes:
+            try:
+                for step in self._steps:
+                    # Every ticket has its own context, so its pipes are not worth caching.
+                    pipe = await self._pipe_factory.create_pipe(step, context, cache=False)
+                    try:
+                        result = await pipe.process(context)
+                    finally:
+                        await pipe.astop()
+                    context = context.with_pipe_result(step.id, result)
+                    results[step.id] = context.pipe_results[step.id]
+                    if result.has_failed():
+                        succeeded, message = False, f"Step '{step.id}' failed: {result.message}"
+                        break
+            except Exception as exc:
+                self._logger.exception(f"Ticket at offset {offset} failed")
+                succeeded, message = False, f"{type(exc).__name__}: {exc}"
+        return {
+            "offset": offset,
+            "ticket_id": ticket.id,
+            "succeeded": succeeded,
+            "message": message,
+            "seconds": time.perf_counter() - started,
+            "results": results,
+            "writes": writes,
+        }
+
+    def _save_checkpoint(self, run: _BatchRun) -> None:
+        previous = run.previous
+        BatchCheckpoint(
+            source=self._source.description,
+            pipe_id=self._pipe.id,
+            offset=run.offset,
+            processed=(previous.processed if previous else 0) + run.processed,
+            failed=(previous.failed if previous else 0) + run.failed,
+            updated_at=datetime.now(UTC),
+        ).save(self._checkpoint_path)
+
+
+def write_parquet(results: Path, destination: Path) -> int:
+    """Convert a JSON lines result file to Parquet and return the number of rows.
+
+    Step results and writes vary between pipelines, so they are stored as JSON strings. Needs the
+    ``pyarrow`` package installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError("Parquet output needs the pyarrow package") from e
+    schema = pa.schema(
+        [
+            ("offset", pa.int64()),
+            ("ticket_id", pa.string()),
+            ("succeeded", pa.bool_()),
+            ("message", pa.string()),
+            ("seconds", pa.float64()),
+            ("results", pa.string()),
+            ("writes", pa.string()),
+        ]
+    )
+    rows: list[dict[str, Any]] = []
+    count = 0
+    with results.open(encoding="utf-8") as lines, pq.ParquetWriter(destination, schema) as parquet:
+        for line in lines:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            record["results"] = json.dumps(record["results"], ensure_ascii=False)
+            record["writes"] = json.dumps(record["writes"], ensure_ascii=False)
+            rows.append(record)
+            if len(rows) == _PARQUET_CHUNK:
+                parquet.write_table(pa.Table.from_pylist(rows, schema=schema))
+                count += len(rows)
+                rows = []
+        if rows:
+            parquet.write_table(pa.Table.from_pylist(rows, schema=schema))
+            count += len(rows)
+    return count
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, ClassVar
+
+from pydantic import Field
+
+from open_ticket_ai.core.base_model import StrictBaseModel
+from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
+from open_ticket_ai.core.ticket_system_integration.unified_models import (
+    TicketRevision,
+    TicketSearchCriteria,
+    UnifiedNote,
+    UnifiedTicket,
+)
+
+# Writes of the ticket currently processed; every batch worker task has its own list.
+_recorded_writes: ContextVar[list[dict[str, Any]] | None] = ContextVar("recorded_writes", default=None)
+
+
+@contextmanager
+def recording_writes() -> Iterator[list[dict[str, Any]]]:
+    """Collect the writes recording ticket systems receive within the block, e.g. for one ticket."""
+    writes: list[dict[str, Any]] = []
+    token = _recorded_writes.set(writes)
+    try:
+        yield writes
+    finally:
+        _recorded_writes.reset(token)
+
+
+class RecordingTicketSystemServiceParams(StrictBaseModel):
+    apply_writes: bool = Field(
+        default=False,
+        description="Forward writes to the wrapped ticket system. Otherwise they are only recorded (dry run).",
+    )
+
+
+class RecordingTicketSystemService(TicketSystemService):
+    """Records the writes of a batch run and only forwards them when ``apply_writes`` is set.
+
+    Reads always go to the wrapped ticket system. Skipped writes report success, so the pipeline
+    continues as it would against the real system.
+    """
+
+    ParamsModel: ClassVar[type[RecordingTicketSystemServiceParams]] = RecordingTicketSystemServiceParams
+
+    def __init__(self, ticket_system: TicketSystemService, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._ticket_system = ticket_system
+
+    async def create_ticket(self, ticket: UnifiedTicket | None = None, **kwargs: Any) -> UnifiedTicket:
+        self._record("create_ticket", None, ticket)
+        if self._params.apply_writes:
+            return await self._ticket_system.create_ticket(ticket, **kwargs)
+        return ticket or UnifiedTicket()
+
+    async def update_ticket(self, ticket_id: str, updates: UnifiedTicket | None = None, **kwargs: Any) -> bool:
+        self._record("update_ticket", ticket_id, updates)
+        if self._params.apply_writes:
+            return await self._ticket_system.update_ticket(ticket_id, updates, **kwargs)
+        return True
+
+    async def add_note(self, ticket_id: str, note: UnifiedNote | None = None, **kwargs: Any) -> bool:
+        self._record("add_note", ticket_id, note)
+        if self._params.apply_writes:
+            return await self._ticket_system.add_note(ticket_id, note, **kwargs)
+        return True
+
+    async def find_tickets(self, criteria: TicketSearchCriteria | None = None, **kwargs: Any) -> list[UnifiedTicket]:
+        return await self._ticket_system.find_tickets(criteria, **kwargs)
+
+    async def find_first_ticket(
+        self, criteria: TicketSearchCriteria | None = None, **kwargs: Any
+    ) -> UnifiedTicket | None:
+        return await self._ticket_system.find_first_ticket(criteria, **kwargs)
+
+    async def get_ticket(self, ticket_id: str) -> UnifiedTicket | None:
+        return await self._ticket_system.get_ticket(ticket_id)
+
+    async def get_ticket_revision(self, ticket_id: str, known_version: str | None = None) -> TicketRevision:
+        return await self._ticket_system.get_ticket_revision(ticket_id, known_version)
+
+    def _record(self, operation: str, ticket_id: str | None, payload: UnifiedTicket | UnifiedNote | None) -> None:
+        writes = _recorded_writes.get()
+        if writes is not None:
+            writes.append(
+                {
+                    "operation": operation,
+                    "ticket_id": ticket_id,
+                    "payload": payload.model_dump(exclude_none=True) if payload is not None else None,
+                    "applied": self._params.apply_writes,
+                }
+            )
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import csv
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
+from open_ticket_ai.core.ticket_system_integration.unified_models import TicketSearchCriteria, UnifiedTicket
+
+# CSV columns holding the name or id of a ticket's queue, priority and customer.
+_ENTITY_COLUMNS = ("queue", "priority", "customer")
+
+
+class TicketSource(ABC):
+    """Tickets of a batch run in a stable order, numbered by offset so that a run can resume."""
+
+    @property
+    @abstractmethod
+    def description(self) -> str:
+        """Identifies the source in checkpoints, so a run is not resumed from a different one."""
+
+    @abstractmethod
+    def tickets(self, start: int = 0) -> AsyncIterator[tuple[int, UnifiedTicket]]:
+        """Yield ``(offset, ticket)`` from ``start`` on, with consecutive offsets."""
+
+    def count(self) -> int | None:
+        """Number of tickets in the source, if it is known up front."""
+        return None
+
+
+class JsonLinesTicketSource(TicketSource):
+    """One ``UnifiedTicket`` JSON object per line; blank lines are ignored."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    @property
+    def description(self) -> str:
+        return f"jsonl:{self._path.resolve()}"
+
+    async def tickets(self, start: int = 0) -> AsyncIterator[tuple[int, UnifiedTicket]]:
+        with self._path.open(encoding="utf-8") as lines:
+            offset = 0
+            for line in lines:
+                if not line.strip():
+                    continue
+                if offset >= start:
+                    yield offset, UnifiedTicket.model_validate_json(line)
+                offset += 1
+
+    def count(self) -> int:
+        with self._path.open(encoding="utf-8") as lines:
+            return sum(1 for line in lines if line.strip())
+
+
+class CsvTicketSource(TicketSource):
+    """A CSV export with a header row.
+
+    ``id``, ``subject`` and ``body`` map to the ticket fields. ``queue``, ``priority`` and
+    ``customer`` hold entity names and ``queue_id``, ``priority_id`` and ``customer_id`` their ids.
+    Other columns and empty cells are ignored.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    @property
+    def description(self) -> str:
+        return f"csv:{self._path.resolve()}"
+
+    async def tickets(self, start: int = 0) -> AsyncIterator[tuple[int, UnifiedTicket]]:
+        with self._path.open(encoding="utf-8", newline="") as rows:
+            for offset, row in enumerate(csv.DictReader(rows)):
+                if offset >= start:
+                    yield offset, UnifiedTicket.model_validate(_ticket_fields(row))
+
+    def count(self) -> int:
+        with self._path.open(encoding="utf-8", newline="") as rows:
+            return sum(1 for _ in csv.DictReader(rows))
+
+
+class TicketSystemTicketSource(TicketSource):
+    """Pages through a ticket system search with ``offset`` and ``limit``.
+
+    The search must return tickets in a stable order. Runs that move tickets out of the searched
+    queue shift the later pages, so apply such writes only after the batch has finished.
+    """
+
+    def __init__(
+        self, ticket_system: TicketSystemService, criteria: TicketSearchCriteria, page_size: int = 100
+    ) -> None:
+        self._ticket_system = ticket_system
+        self._criteria = criteria
+        self._page_size = page_size
+
+    @property
+    def description(self) -> str:
+        queue = self._criteria.queue
+        return f"ticket-system:{self._ticket_system.injectable_id}:{queue.model_dump_json() if queue else '*'}"
+
+    async def tickets(self, start: int = 0) -> AsyncIterator[tuple[int, UnifiedTicket]]:
+        offset = start
+        while True:
+            criteria = self._criteria.model_copy(update={"offset": offset, "limit": self._page_size})
+            page = await self._ticket_system.find_tickets(criteria)
+            for ticket in page:
+                yield offset, ticket
+                offset += 1
+            if len(page) < self._page_size:
+                return
+
+
+def ticket_source_for_file(path: Path) -> TicketSource:
+    """The source reading ``path``, chosen by its suffix: ``.csv`` or JSON lines."""
+    if path.suffix.lower() == ".csv":
+        return CsvTicketSource(path)
+    return JsonLinesTicketSource(path)
+
+
+def _ticket_fields(row: dict[str, Any]) -> dict[str, Any]:
+    fields: dict[str, Any] = {
+        name: value for name in ("id", "subject", "body") if (value := row.get(name) or "").strip()
+    }
+    for entity in _ENTITY_COLUMNS:
+        name, entity_id = (row.get(entity) or "").strip(), (row.get(f"{entity}_id") or "").strip()
+        if name or entity_id:
+            fields[entity] = {"name": name or None, "id": entity_id or None}
+    return fields
@@ -0,0 +1,55 @@
+import os
+import socket
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Any
+
+from open_ticket_ai.core.injectables.injectable import Injectable
+from open_ticket_ai.core.metrics.instrumentation import instrument_methods
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+
+_CALLS = METRICS.counter(
+    "otai_claim_store_calls_total", "Claim store calls by outcome.", ("service", "operation", "outcome")
+)
+_DURATION = METRICS.histogram(
+    "otai_claim_store_call_duration_seconds", "Duration of claim store calls.", ("service", "operation")
+)
+_KEYS = METRICS.counter(
+    "otai_claim_store_keys_total",
+    "Keys granted by claim calls and given up by release calls.",
+    ("service", "operation"),
+)
+
+
+def _count_keys(service: Any, operation: str, result: Any) -> None:
+    _KEYS.labels(service.injectable_id, operation).inc(len(result) if operation == "claim" else result)
+
+
+def claim_owner() -> str:
+    """Identifies the calling process across hosts and forked workers by hostname and process id."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class ClaimStore(Injectable, ABC):
+    """Grants time-limited exclusive claims on keys, like ticket ids, to one owner at a time.
+
+    A claim lasts until its owner releases it or its ``ttl`` runs out, so the keys of a process
+    that died can be claimed by others after at most one ``ttl``. Claiming a key again as its
+    current owner renews the claim. Implementations on storage shared between hosts, such as a
+    database, let several instances of the application divide the same tickets between them.
+
+    Calls to ``claim`` and ``release`` are counted and timed automatically for every store.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls, ("claim", "release"), _CALLS, _DURATION, _count_keys, span_prefix="claim_store")
+
+    @abstractmethod
+    async def claim(self, keys: Sequence[str], owner: str, ttl: timedelta) -> list[str]:
+        """Claim the keys that are free, expired or held by ``owner``; returns the keys ``owner`` now holds."""
+
+    @abstractmethod
+    async def release(self, keys: Sequence[str], owner: str) -> int:
+        """Give up the claims ``owner`` holds on ``keys``; returns how many were released."""
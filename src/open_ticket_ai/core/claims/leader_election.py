@@ -0,0 +1,82 @@
+import asyncio
+import contextlib
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from open_ticket_ai.core.claims.claim_store import ClaimStore, claim_owner
+from open_ticket_ai.core.logging.logging_iface import AppLogger
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+
+type Clock = Callable[[], float]
+
+_LEADER = METRICS.gauge("otai_leader", "1 while this process holds the leadership of an election.", ("election",))
+
+
+class LeaderElection:
+    """Elects one leader among the processes sharing a ``ClaimStore`` by claiming a single key.
+
+    ``maintain`` keeps claiming the key in the background: the leader renews its lease every
+    third of ``ttl``, the others try to take it over every tenth. Leases last nine tenths of
+    ``ttl``, so when the leader dies another process leads within one ``ttl``, and at once when
+    the leader resigns. A leader that cannot renew stops reporting ``is_leader`` when its lease
+    runs out, before anyone else can claim it.
+    """
+
+    def __init__(
+        self,
+        store: ClaimStore,
+        name: str,
+        ttl: timedelta,
+        logger: AppLogger,
+        owner: str | None = None,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        self._store = store
+        self._name = name
+        self._key = f"leader:{name}"
+        self._owner = owner
+        self._lease = ttl * 0.9
+        self._renew_interval = ttl.total_seconds() / 3
+        self._retry_interval = ttl.total_seconds() / 10
+        self._logger = logger
+        self._clock = clock
+        self._expires_at: float | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._expires_at is not None and self._clock() < self._expires_at
+
+    async def maintain(self) -> None:
+        """Claim or renew the leadership until cancelled, then resign."""
+        try:
+            while True:
+                await self.attempt()
+                await asyncio.sleep(self._renew_interval if self.is_leader else self._retry_interval)
+        finally:
+            await self.resign()
+
+    async def attempt(self) -> bool:
+        """Claim the leadership, or renew it when held; returns whether this process leads."""
+        was_leader = self.is_leader
+        started = self._clock()
+        try:
+            claimed = await self._store.claim([self._key], self._owner or claim_owner(), self._lease)
+        except Exception:
+            self._logger.exception(f"Leader election '{self._name}' could not reach its claim store")
+        else:
+            self._expires_at = started + self._lease.total_seconds() if claimed else None
+        if self.is_leader != was_leader:
+            self._logger.info("👑 %s leadership of '%s'", "Took" if self.is_leader else "Lost", self._name)
+        _LEADER.labels(self._name).set(int(self.is_leader))
+        return self.is_leader
+
+    async def resign(self) -> None:
+        """Release the leadership so another process can take over without waiting for the lease to expire."""
+        if self._expires_at is None:
+            return
+        self._expires_at = None
+        _LEADER.labels(self._name).set(0)
+        with contextlib.suppress(Exception):
+            await self._store.release([self._key], self._owner or claim_owner())
+        self._logger.info("👑 Resigned leadership of '%s'", self._name)
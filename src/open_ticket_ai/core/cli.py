@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from injector import Injector
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+from rich.table import Table
+
+from open_ticket_ai.core.batch.batch_job import BatchJobSettings, run_batch_job
+from open_ticket_ai.core.batch.batch_runner import BatchProgress, BatchSummary
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.config_snapshot import (
+    ConfigSnapshot,
+    compile_config_snapshot,
+    load_app_config,
+    write_config_snapshot,
+)
+from open_ticket_ai.core.dependency_injection.container import AppModule
+from open_ticket_ai.core.profiling.import_time import measure_import_times, total_by_top_level_package
+from open_ticket_ai.core.profiling.startup_profiler import StartupProfile, StartupProfiler
+from open_ticket_ai.core.template_rendering.template_renderer import TemplateRenderer
+from open_ticket_ai.core.workers.worker_supervisor import WorkerSupervisor
+from open_ticket_ai.main import run_app_config
+
+app = typer.Typer(add_completion=False, help="Open Ticket AI command line interface.")
+console = Console()
+
+_PROFILE_CHILD_ARGS = ["-m", "open_ticket_ai.core.cli", "profile-startup", "--no-import-times"]
+
+
+@app.command()
+def run(
+    snapshot: Annotated[
+        Path | None,
+        typer.Option(help="Start from this compiled config snapshot when it matches the current config files."),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            min=1, help="Fork N worker processes after loading models; defaults to infrastructure.workers.count."
+        ),
+    ] = None,
+) -> None:
+    """Start the orchestrator with the config.yml of the working directory."""
+    app_config, compiled_pipes = load_app_config(snapshot)
+    if (workers or app_config.open_ticket_ai.infrastructure.workers.count) > 1:
+        WorkerSupervisor(app_config, functools.partial(run_app_config, compiled_pipes=compiled_pipes), workers).run()
+        return
+    asyncio.run(run_app_config(app_config, compiled_pipes))
+
+
+@app.command("compile-config")
+def compile_config(
+    output: Annotated[Path, typer.Option("--output", "-o", help="Where to write the snapshot.")] = Path(
+        "config.snapshot.pickle"
+    ),
+) -> None:
+    """Validate config.yml with its env and dotenv overrides and write a snapshot `run --snapshot` starts from."""
+    app_module = AppModule(AppConfig())
+    template_renderer = Injector([app_module]).get(TemplateRenderer)
+    snapshot = compile_config_snapshot(app_module.app_config, template_renderer)
+    write_config_snapshot(snapshot, output)
+    _print_snapshot(snapshot)
+    console.print(f"Config snapshot written to {output}")
+
+
+@app.command("run-batch")
+def run_batch(
+    output: Annotated[
+        Path, typer.Option("--output", "-o", help="JSON lines result file; a .parquet suffix converts it at the end.")
+    ] = Path("batch-results.jsonl"),
+    input_path: Annotated[
+        Path | None,
+        typer.Option("--input", "-i", help="JSON lines or CSV export to read instead of paging the ticket system."),
+    ] = None,
+    pipe: Annotated[
+        str | None, typer.Option(help="Composite pipe to run; defaults to the first orchestrator runner's pipe.")
+    ] = None,
+    ticket_step: Annotated[
+        str | None, typer.Option(help="Step whose fetched tickets are replaced; defaults to the FetchTicketsPipe.")
+    ] = None,
+    concurrency: Annotated[int, typer.Option(help="Tickets processed at the same time.")] = 16,
+    inference_batch_size: Annotated[
+        int, typer.Option(help="Most classifications run as one batch; 1 disables batching.")
+    ] = 16,
+    apply_writes: Annotated[
+        bool, typer.Option("--apply-writes/--dry-run", help="Perform the pipeline's writes or only record them.")
+    ] = False,
+    resume: Annotated[
+        bool, typer.Option("--resume", help="Continue from the checkpoint of an interrupted run.")
+    ] = False,
+    page_size: Annotated[int, typer.Option(help="Tickets per search when paging the ticket system.")] = 100,
+    checkpoint_every: Annotated[int, typer.Option(help="Write the checkpoint every N tickets.")] = 100,
+    log_level: Annotated[str | None, typer.Option(help="Override the configured log level, e.g. WARNING.")] = None,
+) -> None:
+    """Run every ticket of an export or a ticket system search through a pipeline of config.yml."""
+    settings = BatchJobSettings.model_validate(
+        {
+            "output": output,
+            "input": input_path,
+            "pipe_id": pipe,
+            "ticket_step_id": ticket_step,
+            "concurrency": concurrency,
+            "inference_batch_size": inference_batch_size,
+            "apply_writes": apply_writes,
+            "resume": resume,
+            "page_size": page_size,
+            "checkpoint_every": checkpoint_every,
+            "log_level": log_level,
+        }
+    )
+    with Progress(
+        TextColumn("[bold]Tickets"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        TextColumn("{task.fields[detail]}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("batch", total=None, detail="")
+
+        def report(state: BatchProgress) -> None:
+            progress.update(
+                task,
+                total=state.total,
+                completed=state.processed + state.resumed,
+                detail=f"{state.tickets_per_second:.1f}/s, {state.failed} failed, checkpoint {state.offset}",
+            )
+
+        summary = asyncio.run(run_batch_job(AppConfig(), settings, on_progress=report))
+    _print_batch_summary(summary)
+    console.print(f"Results written to {settings.output}")
+
+
+@app.command("profile-startup")
+def profile_startup(
+    json_path: Annotated[
+        Path | None, typer.Option("--json", help="Write the profile as JSON to this file, or '-' for stdout.")
+    ] = None,
+    import_times: Annotated[
+        bool,
+        typer.Option(
+            "--import-times/--no-import-times", help="Also measure import costs in a fresh interpreter (-X importtime)."
+        ),
+    ] = True,
+    top: Annotated[int, typer.Option(help="Number of most expensive imports to report.")] = 25,
+    connect: Annotated[
+        bool, typer.Option("--connect", help="Also connect or log in to services that support it.")
+    ] = False,
+) -> None:
+    """Time each startup phase: settings, container, plugin imports, services and first pipe builds."""
+    profile = asyncio.run(StartupProfiler(connect_services=connect).profile())
+    if import_times:
+        timings = measure_import_times(_PROFILE_CHILD_ARGS)
+        profile = profile.model_copy(
+            update={
+                "imports": sorted(timings, key=lambda timing: timing.cumulative_seconds, reverse=True)[:top],
+                "import_totals_by_package": dict(list(total_by_top_level_package(timings).items())[:top]),
+            }
+        )
+
+    if json_path is not None and str(json_path) == "-":
+        typer.echo(profile.model_dump_json(indent=2))
+        return
+    _print_profile(profile)
+    if json_path is not None:
+        json_path.write_text(profile.model_dump_json(indent=2))
+        console.print(f"Profile written to {json_path}")
+
+
+def _print_profile(profile: StartupProfile) -> None:
+    phases = Table(title="Startup phases")
+    phases.add_column("Phase")
+    phases.add_column("Name")
+    phases.add_column("ms", justify="right")
+    phases.add_column("Detail")
+    for phase in profile.phases:
+        detail = f"[red]{phase.error}[/red]" if phase.error else phase.detail
+        phases.add_row(phase.kind, phase.name, f"{phase.seconds * 1000:.1f}", detail)
+    console.print(phases)
+
+    summary = ", ".join(f"{kind} {seconds * 1000:.0f} ms" for kind, seconds in profile.seconds_by_kind().items())
+    console.print(f"Total {profile.total_seconds * 1000:.0f} ms ({summary})")
+    if profile.peak_rss_bytes is not None:
+        console.print(f"Peak RSS {profile.peak_rss_bytes / 1024 / 1024:.0f} MiB")
+
+    if profile.import_totals_by_package:
+        packages = Table(title="Import time by top-level package")
+        packages.add_column("Package")
+        packages.add_column("ms", justify="right")
+        for package, seconds in profile.import_totals_by_package.items():
+            packages.add_row(package, f"{seconds * 1000:.1f}")
+        console.print(packages)
+
+    if profile.imports:
+        imports = Table(title="Most expensive imports (cumulative)")
+        imports.add_column("Module")
+        imports.add_column("cumulative ms", justify="right")
+        imports.add_column("self ms", justify="right")
+        for timing in profile.imports:
+            cumulative_ms, self_ms = timing.cumulative_seconds * 1000, timing.self_seconds * 1000
+            imports.add_row(timing.module, f"{cumulative_ms:.1f}", f"{self_ms:.1f}")
+        console.print(imports)
+
+
+def _print_batch_summary(summary: BatchSummary) -> None:
+    table = Table(title=f"Batch run of {summary.pipe_id}")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("Offsets", f"{summary.start_offset} to {summary.end_offset}")
+    table.add_row("Processed", str(summary.processed))
+    table.add_row("Failed", str(summary.failed))
+    table.add_row("Already done", str(summary.resumed))
+    table.add_row("Seconds", f"{summary.seconds:.1f}")
+    table.add_row("Tickets/s", f"{summary.tickets_per_second:.2f}")
+    console.print(table)
+
+
+def _print_snapshot(snapshot: ConfigSnapshot) -> None:
+    pipes = Table(title="Validated pipes")
+    pipes.add_column("Pipe")
+    pipes.add_column("Use")
+    pipes.add_column("Templated params")
+    for pipe in snapshot.pipes:
+        pipes.add_row(pipe.config.id, pipe.config.use, ", ".join(sorted(pipe.templated_params)) or "-")
+    console.print(pipes)
+    for source in snapshot.sources:
+        console.print(f"Source {source.path}" + ("" if source.sha256 is not None else " (missing)"))
+
+
+def main() -> None:
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+
+from open_ticket_ai.core.config.config_models import OpenTicketAIConfig
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig, iter_pipe_configs
+
+RESTART_REQUIRED_SECTIONS = ("api_version", "plugins", "infrastructure")
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigDiff:
+    """What changed between two configurations, as far as a running app can apply it.
+
+    ``changed_services`` holds added, removed and modified service ids together with every
+    service that injects one of them, since those must be rebuilt as well.
+    """
+
+    changed_services: frozenset[str] = frozenset()
+    changed_pipes: tuple[str, ...] = ()
+    orchestrator_changed: bool = False
+    restart_required: tuple[str, ...] = ()
+
+    @property
+    def needs_reload(self) -> bool:
+        return bool(self.changed_services or self.changed_pipes or self.orchestrator_changed)
+
+
+def pipe_tree(config: OpenTicketAIConfig) -> list[PipeConfig]:
+    """Return the orchestrator and every pipe nested in it, depth-first."""
+    return [PipeConfig.model_validate(raw) for raw in iter_pipe_configs(config.orchestrator.model_dump())]
+
+
+def diff_configs(old: OpenTicketAIConfig, new: OpenTicketAIConfig) -> ConfigDiff:
+    changed_services = {
+        service_id
+        for service_id in old.services.keys() | new.services.keys()
+        if old.services.get(service_id) != new.services.get(service_id)
+    }
+    changed_services |= _dependents(new, changed_services)
+
+    old_pipes, new_pipes = Counter(_pipe_keys(old)), Counter(_pipe_keys(new))
+    changed_pipes = {pipe_id for pipe_id, _ in (old_pipes - new_pipes) + (new_pipes - old_pipes)}
+    changed_pipes |= {pipe.id for pipe in pipe_tree(new) if not changed_services.isdisjoint(pipe.injects.values())}
+
+    return ConfigDiff(
+        changed_services=frozenset(changed_services),
+        changed_pipes=tuple(sorted(changed_pipes)),
+        orchestrator_changed=_pipe_key(old.orchestrator) != _pipe_key(new.orchestrator),
+        restart_required=tuple(
+            section for section in RESTART_REQUIRED_SECTIONS if getattr(old, section) != getattr(new, section)
+        ),
+    )
+
+
+def _dependents(config: OpenTicketAIConfig, service_ids: set[str]) -> set[str]:
+    dependents: set[str] = set()
+    affected = set(service_ids)
+    while True:
+        found = {
+            service_id
+            for service_id, service in config.services.items()
+            if service_id not in affected and not affected.isdisjoint(service.injects.values())
+        }
+        if not found:
+            return dependents
+        dependents |= found
+        affected |= found
+
+
+def _pipe_keys(config: OpenTicketAIConfig) -> list[tuple[str, PipeConfig]]:
+    return [_pipe_key(pipe) for pipe in pipe_tree(config)]
+
+
+def _pipe_key(pipe: PipeConfig) -> tuple[str, PipeConfig]:
+    # PipeConfig equality ignores the id, so it is compared separately.
+    return pipe.id, pipe
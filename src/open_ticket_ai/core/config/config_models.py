@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from datetime import timedelta
+from typing import Literal
+
 from packaging.specifiers import SpecifierSet
 from pydantic import BaseModel, Field, field_validator
 
@@ -9,11 +12,180 @@ from open_ticket_ai.core.logging.logging_models import LoggingConfig
 from open_ticket_ai.core.pipes.pipe_models import PipeConfig
 
 
+class ConfigReloadConfig(BaseModel):
+    enabled: bool = Field(
+        default=True,
+        description="Watch the config sources and apply changed services and pipes without restarting.",
+    )
+    poll_interval: timedelta = Field(
+        default=timedelta(seconds=2),
+        description="How often the config file and .env are checked for changes.",
+    )
+
+
+class ShutdownConfig(BaseModel):
+    drain_timeout: timedelta = Field(
+        default=timedelta(seconds=25),
+        description="How long a running orchestrator cycle may take to finish after SIGTERM before it is cancelled.",
+    )
+    stop_timeout: timedelta = Field(
+        default=timedelta(seconds=5),
+        description="How long each service and pipe may take to stop before shutdown moves on.",
+    )
+
+
+class MetricsConfig(BaseModel):
+    http_enabled: bool = Field(
+        default=False,
+        description="Serve pipe, ticket system and classification metrics on GET /metrics in the Prometheus format.",
+    )
+    host: str = Field(
+        default="127.0.0.1",
+        description="Interface the metrics endpoint listens on.",
+    )
+    port: int = Field(
+        default=9464,
+        ge=0,
+        le=65535,
+        description="Port of the metrics endpoint; 0 picks a free port.",
+    )
+    file_path: str | None = Field(
+        default=None,
+        description="Also write the metrics to this file periodically and on shutdown.",
+    )
+    file_interval: timedelta = Field(
+        default=timedelta(seconds=15),
+        description="How often the metrics file is rewritten.",
+    )
+
+
+class TracingConfig(BaseModel):
+    enabled: bool = Field(
+        default=False,
+        description="Record spans for orchestrator cycles, pipes, template rendering and service calls.",
+    )
+    sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Share of orchestrator cycles and other traces that are recorded.",
+    )
+    exporter: Literal["jsonl", "opentelemetry"] = Field(
+        default="jsonl",
+        description="Write spans to a JSON lines file or hand them to the OpenTelemetry tracer provider.",
+    )
+    file_path: str = Field(
+        default="traces.jsonl",
+        description="File the jsonl exporter appends spans to.",
+    )
+
+
+class ProfilingConfig(BaseModel):
+    enabled: bool = Field(
+        default=False,
+        description="Allow capturing profiles of live orchestrator cycles on request.",
+    )
+    format: Literal["speedscope", "collapsed", "pstats"] = Field(
+        default="speedscope",
+        description="speedscope and collapsed stacks sample the loop thread and attribute time to pipe ids; "
+        "pstats traces every call with cProfile.",
+    )
+    cycles: int = Field(
+        default=5,
+        gt=0,
+        description="Cycles captured per request unless the request says otherwise.",
+    )
+    max_duration: timedelta = Field(
+        default=timedelta(seconds=60),
+        description="A capture ends after the first cycle finishing past this time, even if cycles are left.",
+    )
+    sample_interval: timedelta = Field(
+        default=timedelta(milliseconds=5),
+        description="Time between stack samples of the sampling formats.",
+    )
+    output_dir: str = Field(
+        default="profiles",
+        description="Directory the captured profiles are written to.",
+    )
+    trigger_file: str | None = Field(
+        default=None,
+        description="Start a capture when this file appears; it may contain the number of cycles and is deleted.",
+    )
+    http_enabled: bool = Field(
+        default=False,
+        description="Start captures with POST /profile?cycles=N&seconds=T on a local HTTP endpoint.",
+    )
+    host: str = Field(
+        default="127.0.0.1",
+        description="Interface the profiling endpoint listens on.",
+    )
+    port: int = Field(
+        default=9465,
+        ge=0,
+        le=65535,
+        description="Port of the profiling endpoint; 0 picks a free port.",
+    )
+
+
+class WorkersConfig(BaseModel):
+    count: int = Field(
+        default=1,
+        ge=1,
+        description="Worker processes forked by a supervisor, each running the orchestrator on its shard of tickets; "
+        "1 runs the orchestrator in the main process.",
+    )
+    preload: bool = Field(
+        default=True,
+        description="Call the preload hook of every service before forking, so loaded models are shared "
+        "copy-on-write by the workers.",
+    )
+    restart_delay: timedelta = Field(
+        default=timedelta(seconds=1),
+        description="Wait before restarting a crashed worker; doubles while it keeps crashing right after start.",
+    )
+    max_restart_delay: timedelta = Field(
+        default=timedelta(seconds=60),
+        description="Upper bound of the restart delay.",
+    )
+
+
 class InfrastructureConfig(BaseModel):
     logging: LoggingConfig = Field(
         default_factory=LoggingConfig,
         description="Configuration for application logging including level, format, and output destination.",
     )
+    config_reload: ConfigReloadConfig = Field(
+        default_factory=ConfigReloadConfig,
+        description="Hot reload of services and the orchestrator when the configuration changes.",
+    )
+    shutdown: ShutdownConfig = Field(
+        default_factory=ShutdownConfig,
+        description="Draining and service shutdown behaviour on SIGTERM and SIGINT.",
+    )
+    metrics: MetricsConfig = Field(
+        default_factory=MetricsConfig,
+        description="Where the built-in metrics are exposed.",
+    )
+    tracing: TracingConfig = Field(
+        default_factory=TracingConfig,
+        description="Span recording for finding where the time of a cycle goes.",
+    )
+    profiling: ProfilingConfig = Field(
+        default_factory=ProfilingConfig,
+        description="On-demand profiles of live orchestrator cycles, started by SIGUSR1, a file or HTTP.",
+    )
+    workers: WorkersConfig = Field(
+        default_factory=WorkersConfig,
+        description="Multi-process mode that spreads tickets over several worker processes.",
+    )
+    max_cached_pipes: int = Field(
+        default=256,
+        ge=1,
+        description=(
+            "How many pipes built for the results of earlier steps stay cached; the least recently used are "
+            "stopped beyond that."
+        ),
+    )
 
 
 class PluginConfig(BaseModel):
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pydantic
+from pydantic import AliasChoices
+
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.config_diff import pipe_tree
+from open_ticket_ai.core.config.errors import StaleConfigSnapshotError
+from open_ticket_ai.core.pipes.pipe_models import CompiledPipe, without_run_on
+from open_ticket_ai.core.template_rendering.template_renderer import TemplateRenderer
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 3
+
+
+@dataclass(frozen=True, slots=True)
+class SourceStamp:
+    path: str
+    mtime_ns: int | None
+    size: int | None
+
+    @classmethod
+    def of(cls, path: Path) -> SourceStamp:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return cls(path=str(path.absolute()), mtime_ns=None, size=None)
+        return cls(path=str(path.absolute()), mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+
+@dataclass(frozen=True, slots=True)
+class SourceDigest:
+    path: str
+    sha256: str | None
+
+    @classmethod
+    def of(cls, path: Path) -> SourceDigest:
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return cls(path=str(path.absolute()), sha256=None)
+        return cls(path=str(path.absolute()), sha256=hashlib.sha256(content).hexdigest())
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """Validated ``AppConfig`` together with everything needed to tell whether it is still current.
+
+    ``pipes`` is the orchestrator's pipe tree, depth-first, with the params of each pipe that hold
+    templates, so pipes built from it skip checking the others for templates.
+    The snapshot is only valid for the settings schema, config file contents and environment it was
+    compiled from; ``stale_reason`` compares all three against the running process.
+    """
+
+    schema_hash: str
+    sources: tuple[SourceDigest, ...]
+    env_digest: str
+    app_config: AppConfig
+    pipes: tuple[CompiledPipe, ...] = ()
+
+    def stale_reason(self, environ: Mapping[str, str] = os.environ) -> str | None:
+        return _stale_reason(self.schema_hash, self.sources, self.env_digest, environ)
+
+
+@functools.cache
+def config_schema_hash() -> str:
+    schema = json.dumps(AppConfig.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(f"{SNAPSHOT_FORMAT_VERSION}|{pydantic.VERSION}|{schema}".encode()).hexdigest()
+
+
+def config_sources() -> tuple[SourceStamp, ...]:
+    paths = [*_as_paths(AppConfig.model_config.get("yaml_file")), *_as_paths(AppConfig.model_config.get("env_file"))]
+    return tuple(SourceStamp.of(path) for path in paths)
+
+
+def config_source_digests() -> tuple[SourceDigest, ...]:
+    return tuple(SourceDigest.of(Path(stamp.path)) for stamp in config_sources())
+
+
+def config_env_digest(environ: Mapping[str, str] = os.environ) -> str:
+    """Hash the environment variables the settings sources read for ``AppConfig.open_ticket_ai``."""
+    alias = AppConfig.model_fields["open_ticket_ai"].validation_alias
+    names = alias.choices if isinstance(alias, AliasChoices) else ["open_ticket_ai"]
+    delimiter = AppConfig.model_config.get("env_nested_delimiter") or "__"
+    prefixes = tuple(str(name).lower() for name in names)
+    relevant = sorted(
+        (key.lower(), value)
+        for key, value in environ.items()
+        if key.lower() in prefixes or key.lower().startswith(tuple(prefix + delimiter for prefix in prefixes))
+    )
+    return hashlib.sha256(json.dumps(relevant).encode()).hexdigest()
+
+
+def compile_config_snapshot(app_config: AppConfig, template_renderer: TemplateRenderer) -> ConfigSnapshot:
+    pipes = []
+    for pipe_config in pipe_tree(app_config.open_ticket_ai):
+        # Stored the way PipeFactory looks pipes up, since orchestrators read run_on themselves.
+        pipe_config = without_run_on(pipe_config)
+        templated = frozenset(
+            name for name, value in pipe_config.params.items() if template_renderer.needs_rendering(value)
+        )
+        pipes.append(CompiledPipe(config=pipe_config, templated_params=templated))
+    return ConfigSnapshot(
+        schema_hash=config_schema_hash(),
+        sources=config_source_digests(),
+        env_digest=config_env_digest(),
+        app_config=app_config,
+        pipes=tuple(pipes),
+    )
+
+
+def write_config_snapshot(snapshot: ConfigSnapshot, path: Path) -> None:
+    header = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "schema_hash": snapshot.schema_hash,
+        "sources": [[source.path, source.sha256] for source in snapshot.sources],
+        "env_digest": snapshot.env_digest,
+    }
+    payload = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(json.dumps(header).encode() + b"\n" + payload)
+    tmp_path.replace(path)
+
+
+def load_config_snapshot(path: Path, environ: Mapping[str, str] = os.environ) -> ConfigSnapshot:
+    """Load a snapshot written by ``write_config_snapshot`` and make sure it is still current.
+
+    Snapshots are pickles and must only be loaded from trusted locations. The JSON header is
+    checked against the current schema, config files and environment before the payload is
+    unpickled, so stale snapshots are never materialized.
+    """
+    try:
+        raw_header, _, payload = path.read_bytes().partition(b"\n")
+        header = json.loads(raw_header)
+        sources = tuple(SourceDigest(path=source_path, sha256=sha256) for source_path, sha256 in header["sources"])
+        schema_hash, env_digest = header["schema_hash"], header["env_digest"]
+    except FileNotFoundError as e:
+        raise StaleConfigSnapshotError(path, "no snapshot found") from e
+    except (UnicodeDecodeError, ValueError, TypeError, KeyError) as e:
+        raise StaleConfigSnapshotError(path, "unreadable snapshot") from e
+
+    if header.get("format") != SNAPSHOT_FORMAT_VERSION:
+        raise StaleConfigSnapshotError(path, "settings schema changed")
+    reason = _stale_reason(schema_hash, sources, env_digest, environ)
+    if reason is not None:
+        raise StaleConfigSnapshotError(path, reason)
+    try:
+        snapshot: ConfigSnapshot = pickle.loads(payload)  # noqa: S301 - written by compile-config
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError) as e:
+        raise StaleConfigSnapshotError(path, "unreadable snapshot") from e
+    return snapshot
+
+
+def load_app_config(snapshot_path: Path | None = None) -> tuple[AppConfig, tuple[CompiledPipe, ...]]:
+    """Return the snapshotted ``AppConfig`` and pipes when current, otherwise read the settings sources.
+
+    Only an explicitly given snapshot is used; without one the configuration is always read from
+    its sources, and no pipes are precompiled.
+    """
+    if snapshot_path is None:
+        return AppConfig(), ()
+    try:
+        snapshot = load_config_snapshot(snapshot_path)
+    except StaleConfigSnapshotError as e:
+        logger.warning(f"{e}; loading configuration from its sources")
+        return AppConfig(), ()
+    return snapshot.app_config, snapshot.pipes
+
+
+def _stale_reason(
+    schema_hash: str, sources: tuple[SourceDigest, ...], env_digest: str, environ: Mapping[str, str]
+) -> str | None:
+    if schema_hash != config_schema_hash():
+        return "settings schema changed"
+    current_sources = config_source_digests()
+    if current_sources != sources:
+        changed = [current.path for current in current_sources if current not in sources]
+        return f"{', '.join(changed) or 'configuration sources'} changed"
+    if env_digest != config_env_digest(environ):
+        return "configuration environment variables changed"
+    return None
+
+
+def _as_paths(value: Any) -> list[Path]:
+    if value is None:
+        return []
+    if isinstance(value, str | os.PathLike):
+        return [Path(value)]
+    if isinstance(value, Iterable):
+        return [Path(item) for item in value]
+    return []
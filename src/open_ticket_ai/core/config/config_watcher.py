@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from datetime import timedelta
+
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.config_snapshot import SourceStamp, config_sources
+from open_ticket_ai.core.logging.logging_iface import AppLogger
+
+
+class ConfigWatcher:
+    """Polls the config sources and yields every changed configuration that validates.
+
+    A configuration that fails to load or validate is logged and skipped; the watcher keeps
+    polling, so fixing the file is picked up on the next change.
+    """
+
+    def __init__(
+        self,
+        logger: AppLogger,
+        poll_interval: timedelta,
+        load_config: Callable[[], AppConfig] = AppConfig,
+        sources: Callable[[], tuple[SourceStamp, ...]] = config_sources,
+    ) -> None:
+        self._logger = logger
+        self._poll_interval = poll_interval
+        self._load_config = load_config
+        self._sources = sources
+
+    async def changes(self) -> AsyncIterator[AppConfig]:
+        last_seen = self._sources()
+        while True:
+            await asyncio.sleep(self._poll_interval.total_seconds())
+            current = self._sources()
+            if current == last_seen:
+                continue
+            last_seen = current
+            try:
+                app_config = self._load_config()
+            except Exception:
+                self._logger.exception("❌ Changed configuration is invalid; keeping the running configuration")
+                continue
+            yield app_config
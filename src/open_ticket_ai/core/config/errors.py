@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from open_ticket_ai.core.injectables.injectable import Injectable
@@ -11,6 +12,14 @@ class WrongConfigError(Exception):
     """Raised when the configuration provided is incorrect or invalid."""
 
 
+class StaleConfigSnapshotError(WrongConfigError):
+    """Raised when a compiled config snapshot is missing or no longer matches its sources."""
+
+    def __init__(self, snapshot_path: Path, reason: str):
+        super().__init__(f"Config snapshot '{snapshot_path}' cannot be used: {reason}")
+        self.reason = reason
+
+
 class RegistryError(Exception):
     """Raised when there is an error related to the component registry."""
 
@@ -29,6 +38,14 @@ class NoServiceConfigurationFoundError(WrongConfigError):
         )
 
 
+class CircularInjectionError(WrongConfigError):
+    """Raised when services inject each other, directly or through others."""
+
+    def __init__(self, service_ids: list[str]):
+        super().__init__(f"Services inject each other in a cycle: {' -> '.join(service_ids)}")
+        self.service_ids = service_ids
+
+
 class InjectableNotFoundError(RegistryError):
     def __init__(self, injectable_id: str, component_registry: ComponentRegistry):
         super().__init__(
@@ -36,6 +53,15 @@ class InjectableNotFoundError(RegistryError):
         )
 
 
+class InjectableImportError(RegistryError):
+    """Raised when a lazily registered injectable cannot be imported."""
+
+    def __init__(self, injectable_id: str, import_path: str, component_registry: ComponentRegistry):
+        super().__init__(
+            component_registry, f"Injectable with id '{injectable_id}' could not be imported from '{import_path}'. "
+        )
+
+
 class MissingConfigurationForRequiredServiceError(WrongConfigError):
     """Raised when a required service configuration is missing."""
 
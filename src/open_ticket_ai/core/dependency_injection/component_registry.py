@@ -1,7 +1,9 @@
+import importlib
 import logging
 from collections.abc import Iterable
+from typing import cast
 
-from open_ticket_ai.core.config.errors import InjectableNotFoundError, RegistryError
+from open_ticket_ai.core.config.errors import InjectableImportError, InjectableNotFoundError, RegistryError
 from open_ticket_ai.core.injectables.injectable import Injectable
 from open_ticket_ai.core.pipes.pipe import Pipe
 
@@ -10,25 +12,53 @@ logger = logging.getLogger(__name__)
 
 
 class ComponentRegistry:
+    """Maps registry identifiers to injectable classes.
+
+    Classes are additionally indexed by every ``Injectable`` base class in their MRO, so lookups by
+    identifier and by type do not scan the whole registry. After :meth:`freeze` no further components
+    can be registered; lazily registered components are still imported on first lookup.
+    """
+
     def __init__(self) -> None:
         self._injectables: dict[str, type[Injectable]] = {}
+        self._lazy_injectables: dict[str, str] = {}
+        self._ids_by_type: dict[type[Injectable], dict[str, None]] = {}
+        self._frozen = False
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self) -> None:
+        self._frozen = True
 
     def register(self, registry_identifier: str, register_class: type[Injectable]) -> None:
-        if not issubclass(register_class, Injectable):
-            raise RegistryError(self, "Registered class must be a subclass of Injectable")
-        self._injectables[registry_identifier] = register_class
+        self._ensure_not_frozen(registry_identifier)
+        self._add(registry_identifier, register_class)
+
+    def register_lazy(self, registry_identifier: str, import_path: str) -> None:
+        """Register an injectable by its ``module:ClassName`` path; it is imported on first lookup."""
+        self._ensure_not_frozen(registry_identifier)
+        self._remove(registry_identifier)
+        self._lazy_injectables[registry_identifier] = import_path
+
+    def is_loaded(self, registry_identifier: str) -> bool:
+        return registry_identifier in self._injectables
 
     def find[T: Injectable](self, *, by_type: type[T]) -> dict[str, type[T]]:
-        return {registry_id: cls for registry_id, cls in self._injectables.items() if issubclass(cls, by_type)}
+        for registry_identifier in list(self._lazy_injectables):
+            self._resolve(registry_identifier)
+        registry_ids = self._ids_by_type.get(by_type, {})
+        return {registry_id: cast(type[T], self._injectables[registry_id]) for registry_id in registry_ids}
 
     def find_one[T: Injectable](self, *, by_identifier: str, by_type: type[T]) -> type[T]:
-        injectable = self.find(by_type=by_type).get(by_identifier)
-        if injectable is None:
+        injectable = self._resolve(by_identifier)
+        if injectable is None or by_identifier not in self._ids_by_type.get(by_type, {}):
             raise InjectableNotFoundError(
                 by_identifier,
                 self,
             )
-        return injectable
+        return cast(type[T], injectable)
 
     def get_pipe(self, *, by_identifier: str) -> type[Pipe]:
         return self.find_one(by_identifier=by_identifier, by_type=Pipe)
@@ -37,4 +67,41 @@ class ComponentRegistry:
         return self.find_one(by_identifier=by_identifier, by_type=Injectable)
 
     def get_available_injectables(self) -> Iterable[str]:
-        return self._injectables.keys()
+        return [*self._injectables, *self._lazy_injectables]
+
+    def _ensure_not_frozen(self, registry_identifier: str) -> None:
+        if self._frozen:
+            raise RegistryError(self, f"Cannot register '{registry_identifier}': the registry is frozen")
+
+    def _add(self, registry_identifier: str, register_class: type[Injectable]) -> None:
+        if not isinstance(register_class, type) or not issubclass(register_class, Injectable):
+            raise RegistryError(self, "Registered class must be a subclass of Injectable")
+        self._remove(registry_identifier)
+        self._injectables[registry_identifier] = register_class
+        for base in register_class.__mro__:
+            if isinstance(base, type) and issubclass(base, Injectable):
+                self._ids_by_type.setdefault(base, {})[registry_identifier] = None
+
+    def _remove(self, registry_identifier: str) -> None:
+        self._lazy_injectables.pop(registry_identifier, None)
+        previous = self._injectables.pop(registry_identifier, None)
+        if previous is None:
+            return
+        for base in previous.__mro__:
+            self._ids_by_type.get(base, {}).pop(registry_identifier, None)
+
+    def _resolve(self, registry_identifier: str) -> type[Injectable] | None:
+        injectable = self._injectables.get(registry_identifier)
+        if injectable is not None:
+            return injectable
+        import_path = self._lazy_injectables.get(registry_identifier)
+        if import_path is None:
+            return None
+        module_name, _, class_name = import_path.partition(":")
+        logger.debug(f"Importing {import_path} for {registry_identifier}")
+        try:
+            injectable = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            raise InjectableImportError(registry_identifier, import_path, self) from e
+        self._add(registry_identifier, injectable)
+        return injectable
@@ -1,4 +1,5 @@
 import typing
+from collections.abc import Mapping
 
 from injector import Binder, Module, provider, singleton
 
@@ -12,6 +13,7 @@ from open_ticket_ai.core.config.errors import (
 )
 from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
 from open_ticket_ai.core.dependency_injection.service_registry_util import find_all_configured_services_of_type
+from open_ticket_ai.core.injectables.injectable import Injectable
 from open_ticket_ai.core.logging.logging_iface import LoggerFactory
 from open_ticket_ai.core.logging.stdlib_logging_adapter import create_logger_factory
 from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
@@ -20,7 +22,12 @@ from open_ticket_ai.core.template_rendering.template_renderer import TemplateRen
 
 
 class AppModule(Module):
-    def __init__(self, app_config: AppConfig | None = None) -> None:
+    def __init__(
+        self,
+        app_config: AppConfig | None = None,
+        extra_components: Mapping[str, type[Injectable]] | None = None,
+    ) -> None:
+        """``extra_components`` are registered after the plugins, e.g. stand-ins used by tests and benchmarks."""
         self.app_config = app_config or AppConfig()
         self.logger_factory = create_logger_factory(self.app_config.open_ticket_ai.infrastructure.logging)
         self.component_registry = ComponentRegistry()
@@ -30,6 +37,9 @@ class AppModule(Module):
             app_config=self.app_config,
         )
         self.plugin_loader.load_plugins()
+        for registry_identifier, component in (extra_components or {}).items():
+            self.component_registry.register(registry_identifier, component)
+        self.component_registry.freeze()
 
     def configure(self, binder: Binder) -> None:
         binder.bind(AppConfig, to=self.app_config, scope=singleton)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+from open_ticket_ai.core.logging.logging_iface import AppLogger
+
+_HEADER_TERMINATOR = b"\r\n\r\n"
+_MAX_HEADER_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class HttpRequest:
+    method: str
+    path: str
+    query: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def header(self, name: str) -> str | None:
+        return self.headers.get(name.lower())
+
+
+@dataclass(frozen=True, slots=True)
+class HttpResponse:
+    status: int
+    body: bytes = b""
+    content_type: str = "application/json"
+
+    @classmethod
+    def json(cls, status: int, payload: Any) -> HttpResponse:
+        return cls(status=status, body=json.dumps(payload, default=str).encode())
+
+    @classmethod
+    def text(cls, status: int, text: str, content_type: str = "text/plain; charset=utf-8") -> HttpResponse:
+        return cls(status=status, body=text.encode(), content_type=content_type)
+
+
+type RequestHandler = Callable[[HttpRequest], Awaitable[HttpResponse]]
+
+
+class _BadRequest(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class LocalHttpServer:
+    """Minimal asyncio HTTP/1.1 server for small local endpoints (webhooks, metrics).
+
+    Every request is answered and the connection closed afterwards; request bodies need a
+    ``Content-Length`` header and are limited to ``max_body_bytes``.
+    """
+
+    def __init__(
+        self,
+        handler: RequestHandler,
+        logger: AppLogger,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_body_bytes: int = 1024 * 1024,
+        read_timeout: float = 10.0,
+    ) -> None:
+        self._handler = handler
+        self._logger = logger
+        self._host = host
+        self._port = port
+        self._max_body_bytes = max_body_bytes
+        self._read_timeout = read_timeout
+        self._server: asyncio.Server | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    @property
+    def port(self) -> int:
+        if self._server is None or not self._server.sockets:
+            return self._port
+        return int(self._server.sockets[0].getsockname()[1])
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self.port}"
+
+    async def start(self) -> None:
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(
+            self._handle_connection, host=self._host, port=self._port, limit=_MAX_HEADER_BYTES
+        )
+        self._logger.info(f"🌐 Listening on {self.url}")
+
+    async def aclose(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        self._logger.info("🌐 HTTP listener stopped")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                request = await asyncio.wait_for(self._read_request(reader), timeout=self._read_timeout)
+            except _BadRequest as e:
+                response = HttpResponse.json(e.status, {"error": str(e)})
+            except (TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                return
+            else:
+                response = await self._dispatch(request)
+            await self._write_response(writer, response)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _dispatch(self, request: HttpRequest) -> HttpResponse:
+        try:
+            return await self._handler(request)
+        except Exception:
+            self._logger.exception(f"Unhandled error while serving {request.method} {request.path}")
+            return HttpResponse.json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal server error"})
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> HttpRequest:
+        head = await reader.readuntil(_HEADER_TERMINATOR)
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _version = request_line.split(" ", 2)
+        except ValueError as e:
+            raise _BadRequest(HTTPStatus.BAD_REQUEST, "malformed request line") from e
+
+        headers: dict[str, str] = {}
+        for line in header_lines:
+            if not line:
+                continue
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise _BadRequest(HTTPStatus.LENGTH_REQUIRED, "chunked request bodies are not supported")
+        try:
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError as e:
+            raise _BadRequest(HTTPStatus.BAD_REQUEST, "invalid Content-Length") from e
+        if content_length < 0:
+            raise _BadRequest(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+        if content_length > self._max_body_bytes:
+            raise _BadRequest(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body too large")
+        body = await reader.readexactly(content_length) if content_length else b""
+
+        url = urlsplit(target)
+        return HttpRequest(
+            method=method.upper(),
+            path=url.path or "/",
+            query=dict(parse_qsl(url.query)),
+            headers=headers,
+            body=body,
+        )
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, response: HttpResponse) -> None:
+        status = HTTPStatus(response.status)
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {response.content_type}\r\n"
+            f"Content-Length: {len(response.body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + response.body)
+        with contextlib.suppress(ConnectionError):
+            await writer.drain()
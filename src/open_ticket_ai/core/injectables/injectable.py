@@ -18,8 +18,25 @@ class Injectable[ParamsT: BaseModel = StrictBaseModel]:
         self._params: ParamsT = typing.cast(ParamsT, self.ParamsModel.model_validate(config.params))
         self._log_init()
 
+    @property
+    def injectable_id(self) -> str:
+        return self._config.id
+
+    def preload(self) -> None:
+        """Load what forked worker processes can share, like model weights, into process-wide caches.
+
+        Called before forking on an instance that is never started and is stopped right after,
+        so it must not use the event loop.
+        """
+
+    async def astart(self) -> None:
+        """Acquire resources that need the running event loop; called once after construction."""
+
+    async def astop(self) -> None:
+        """Release connections, sessions and listeners; called once on shutdown or when replaced on reload."""
+
     def _log_init(self) -> None:
-        self._logger.info(f"Initializing with config: {self._config.model_dump()}")
+        self._logger.info("Initializing with config: %s", self._config)
 
     @classmethod
     def get_registry_name(cls) -> str:
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from open_ticket_ai.core.injectables.injectable import Injectable
+from open_ticket_ai.core.logging.logging_iface import AppLogger
+
+
+@dataclass(frozen=True, slots=True)
+class StopResult:
+    name: str
+    seconds: float
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+async def stop_injectables(
+    injectables: Iterable[Injectable], logger: AppLogger, timeout: timedelta | None = None
+) -> list[StopResult]:
+    """Call ``astop`` on each injectable in the given order.
+
+    A failing or hanging ``astop`` is recorded and logged but does not keep the remaining
+    injectables from being stopped.
+    """
+    results = []
+    for injectable in injectables:
+        name = f"{injectable.__class__.__name__}.{injectable.injectable_id}"
+        error: str | None = None
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(injectable.astop(), timeout=timeout.total_seconds() if timeout else None)
+        except TimeoutError:
+            error = f"did not stop within {timeout}"
+            logger.warning(f"⚠️  {name} {error}")
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.exception(f"❌ Failed to stop {name}")
+        results.append(StopResult(name=name, seconds=time.perf_counter() - started, error=error))
+    return results
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Iterator, Mapping
+from typing import Any
+
+from pydantic import BaseModel
+
+REDACTED = "***"
+
+
+def truncate(text: str, max_length: int) -> str:
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}... ({len(text) - max_length} more characters)"
+
+
+def render_bounded(value: Any, max_length: int, redacted_keys: Collection[str], *, as_repr: bool = True) -> str:
+    """Render ``value`` like ``repr`` with secrets redacted, stopping after ``max_length`` characters.
+
+    Models, mappings, lists and tuples are walked lazily, so only the part that is shown is ever
+    rendered, however large the value is.
+    """
+    if not as_repr and not isinstance(value, BaseModel | Mapping | list | tuple):
+        return truncate(str(value), max_length)
+    pieces: list[str] = []
+    length = 0
+    for piece in _render_pieces(value, max_length, redacted_keys):
+        pieces.append(piece)
+        length += len(piece)
+        if length > max_length:
+            return f"{''.join(pieces)[:max_length]}... (truncated)"
+    return "".join(pieces)
+
+
+def _render_pieces(value: Any, max_length: int, redacted_keys: Collection[str]) -> Iterator[str]:
+    if isinstance(value, BaseModel):
+        value = {**{name: getattr(value, name) for name in type(value).model_fields}, **(value.model_extra or {})}
+    if isinstance(value, Mapping):
+        yield "{"
+        for index, (key, item) in enumerate(value.items()):
+            yield f"{', ' if index else ''}{_short_repr(key, max_length)}: "
+            if _is_redacted(key, redacted_keys):
+                yield repr(REDACTED)
+            else:
+                yield from _render_pieces(item, max_length, redacted_keys)
+        yield "}"
+    elif isinstance(value, list | tuple):
+        yield "[" if isinstance(value, list) else "("
+        for index, item in enumerate(value):
+            if index:
+                yield ", "
+            yield from _render_pieces(item, max_length, redacted_keys)
+        yield "]" if isinstance(value, list) else ("," if len(value) == 1 else "") + ")"
+    else:
+        yield _short_repr(value, max_length)
+
+
+def _short_repr(value: Any, max_length: int) -> str:
+    if isinstance(value, str | bytes) and len(value) > max_length:
+        return repr(value[: max_length + 1])
+    return repr(value)
+
+
+class LogPayload:
+    """Log argument that is only redacted and rendered, up to ``max_length``, when the record is formatted."""
+
+    __slots__ = ("max_length", "redacted_keys", "value")
+
+    def __init__(self, value: Any, max_length: int, redacted_keys: Collection[str]) -> None:
+        self.value = value
+        self.max_length = max_length
+        self.redacted_keys = redacted_keys
+
+    def __str__(self) -> str:
+        return render_bounded(self.value, self.max_length, self.redacted_keys, as_repr=False)
+
+    def __repr__(self) -> str:
+        return render_bounded(self.value, self.max_length, self.redacted_keys)
+
+
+def _is_redacted(key: Any, redacted_keys: Collection[str]) -> bool:
+    lowered = str(key).lower()
+    return any(redacted_key in lowered for redacted_key in redacted_keys)
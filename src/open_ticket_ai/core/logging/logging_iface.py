@@ -1,26 +1,40 @@
 from __future__ import annotations
 
 import abc
+from collections.abc import Callable
 from typing import Any
 
-from open_ticket_ai.core.logging.logging_models import LoggingFormatConfig
+from open_ticket_ai.core.logging.logging_models import LoggingFormatConfig, LogLevel
+
+type LogMessage = str | Callable[[], str]
 
 
 class AppLogger(abc.ABC):
+    """Logger handed to services and pipes.
+
+    Messages are only built when ``level`` is enabled: pass ``%``-style ``args`` or a callable
+    returning the message instead of an f-string for anything expensive. Args are logged
+    size-bounded and with secrets redacted.
+    """
+
+    def is_enabled_for(self, level: LogLevel) -> bool:  # noqa: ARG002
+        """Whether messages of ``level`` are logged; loggers without level checks log everything."""
+        return True
+
     @abc.abstractmethod
-    def debug(self, message: str, **kwargs: Any) -> None: ...
+    def debug(self, message: LogMessage, *args: Any, **kwargs: Any) -> None: ...
 
     @abc.abstractmethod
-    def info(self, message: str, **kwargs: Any) -> None: ...
+    def info(self, message: LogMessage, *args: Any, **kwargs: Any) -> None: ...
 
     @abc.abstractmethod
-    def warning(self, message: str, **kwargs: Any) -> None: ...
+    def warning(self, message: LogMessage, *args: Any, **kwargs: Any) -> None: ...
 
     @abc.abstractmethod
-    def error(self, message: str, **kwargs: Any) -> None: ...
+    def error(self, message: LogMessage, *args: Any, **kwargs: Any) -> None: ...
 
     @abc.abstractmethod
-    def exception(self, message: str, **kwargs: Any) -> None: ...
+    def exception(self, message: LogMessage, *args: Any, **kwargs: Any) -> None: ...
 
 
 class LoggerFactory(abc.ABC):
@@ -34,3 +48,6 @@ class LoggerFactory(abc.ABC):
         **kwargs: Any,
     ) -> AppLogger:
         pass
+
+    def shutdown(self) -> None:  # noqa: B027 - optional hook, most factories write synchronously
+        """Flush records that are still buffered; loggers should not be used afterwards."""
@@ -37,3 +37,21 @@ class LoggingConfig(StrictBaseModel):
         default_factory=LoggingFormatConfig,
         description="Message and date formats",
     )
+    max_payload_length: int = Field(
+        default=2_000,
+        gt=0,
+        description="Maximum characters of a single logged value such as params, configs and pipe results",
+    )
+    redacted_keys: list[str] = Field(
+        default_factory=lambda: ["password", "secret", "token", "api_key", "authorization"],
+        description="Values of keys containing one of these words are logged as ***",
+    )
+    use_queue: bool = Field(
+        default=False,
+        description="Format and write records on a background thread instead of the event loop thread",
+    )
+    queue_size: int = Field(
+        default=10_000,
+        gt=0,
+        description="Records waiting for the background thread; further records are dropped and counted",
+    )
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+import threading
+from collections.abc import Collection
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
-from open_ticket_ai.core.logging.logging_iface import AppLogger, LoggerFactory
-from open_ticket_ai.core.logging.logging_models import LoggingConfig, LoggingFormatConfig
+from open_ticket_ai.core.logging.log_payload import LogPayload
+from open_ticket_ai.core.logging.logging_iface import AppLogger, LoggerFactory, LogMessage
+from open_ticket_ai.core.logging.logging_models import LoggingConfig, LoggingFormatConfig, LogLevel
 
 PIPE_FMT_DEFAULT = "%(asctime)s - %(levelname)s - %(name)s: %(pipe_name)s - %(message)s"
 
@@ -26,24 +33,90 @@ def build_formatter(logging_format_config: LoggingFormatConfig) -> logging.Forma
     return logging.Formatter(fmt=logging_format_config.message_format, datefmt=logging_format_config.date_format)
 
 
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """``QueueHandler`` that never blocks the calling thread.
+
+    The message is built before the record is queued, like the stdlib ``QueueHandler`` does,
+    because logged payloads may refer to dicts and models the event loop keeps changing; payloads
+    are bounded, so this stays cheap. The listener thread only applies the handlers' formats.
+    When the queue is full the record is dropped and counted in ``dropped``.
+    """
+
+    def __init__(self, record_queue: queue.Queue[Any]) -> None:
+        super().__init__(record_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Kept as text, which the listener's formatters append like a traceback of their own.
+            record.exc_text = record.exc_text or _TRACEBACK_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+class _FlushingQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Wait for room instead of failing when the queue is full, so stop() always flushes.
+        self.queue.put(self._sentinel)
+
+
+_PLAIN_ARG_TYPES = (int, float, bool, type(None))
+
+
 class StdlibLogger(AppLogger):
-    def __init__(self, inner: logging.Logger | logging.LoggerAdapter | None = None):
+    def __init__(
+        self,
+        inner: logging.Logger | logging.LoggerAdapter | None = None,
+        max_payload_length: int | None = None,
+        redacted_keys: Collection[str] = (),
+    ):
         self._logger = inner or logging.getLogger()
+        self._max_payload_length = max_payload_length or LoggingConfig().max_payload_length
+        self._redacted_keys = tuple(key.lower() for key in redacted_keys)
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        return self._logger.isEnabledFor(level_no(level))
 
-    def debug(self, message: str, **kwargs: Any) -> None:
-        self._logger.debug(message, **kwargs)
+    def debug(self, message: LogMessage, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.DEBUG, message, args, kwargs)
 
-    def info(self, message: str, **kwargs: Any) -> None:
-        self._logger.info(message, **kwargs)
+    def info(self, message: LogMessage, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.INFO, message, args, kwargs)
 
-    def warning(self, message: str, **kwargs: Any) -> None:
-        self._logger.warning(message, **kwargs)
+    def warning(self, message: LogMessage, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.WARNING, message, args, kwargs)
 
-    def error(self, message: str, **kwargs: Any) -> None:
-        self._logger.error(message, **kwargs)
+    def error(self, message: LogMessage, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.ERROR, message, args, kwargs)
 
-    def exception(self, message: str, **kwargs: Any) -> None:
-        self._logger.exception(message, **kwargs)
+    def exception(self, message: LogMessage, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("exc_info", True)
+        self._log(logging.ERROR, message, args, kwargs)
+
+    def _log(self, level: int, message: LogMessage, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+        if callable(message):
+            message = message()
+        payloads = tuple(
+            arg if isinstance(arg, _PLAIN_ARG_TYPES) else LogPayload(arg, self._max_payload_length, self._redacted_keys)
+            for arg in args
+        )
+        self._logger.log(level, message, *payloads, **kwargs)
 
 
 class _PipeNameDefaultFilter(logging.Filter):
@@ -54,8 +127,34 @@ class _PipeNameDefaultFilter(logging.Filter):
 
 
 class StdlibLoggerFactory(LoggerFactory):
-    def __init__(self, cfg: LoggingConfig | None = None):
+    def __init__(self, cfg: LoggingConfig | None = None, queue_handler: BoundedQueueHandler | None = None):
         self._cfg = cfg or LoggingConfig()
+        self._queue_handler = queue_handler
+
+    @property
+    def dropped_records(self) -> int:
+        return self._queue_handler.dropped if self._queue_handler else 0
+
+    def shutdown(self) -> None:
+        """Write all queued records and stop the listener thread, reporting dropped records."""
+        listener = self._queue_handler.listener if self._queue_handler else None
+        if listener is None:
+            return
+        listener.stop()
+        self._queue_handler.listener = None
+        if self.dropped_records:
+            record = logging.LogRecord(
+                __name__,
+                logging.WARNING,
+                __file__,
+                0,
+                f"Dropped {self.dropped_records} log records because the log queue was full",
+                None,
+                None,
+            )
+            for handler in listener.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
 
     def create(
         self,
@@ -81,26 +180,41 @@ class StdlibLoggerFactory(LoggerFactory):
                 fh.setFormatter(build_formatter(format_config))
                 logger.addHandler(fh)
             adapter = logging.LoggerAdapter(logger, extras or {})
-            return StdlibLogger(adapter)
-        return StdlibLogger(logger)
+            return StdlibLogger(adapter, self._cfg.max_payload_length, self._cfg.redacted_keys)
+        return StdlibLogger(logger, self._cfg.max_payload_length, self._cfg.redacted_keys)
 
 
 def create_logger_factory(logging_config: LoggingConfig) -> LoggerFactory:
     root_logger = logging.getLogger()
     root_logger.setLevel(level_no(logging_config.level))
+    for previous in root_logger.handlers:
+        if isinstance(previous, BoundedQueueHandler) and previous.listener is not None:
+            previous.listener.stop()
     root_logger.handlers.clear()
 
     formatter = build_formatter(logging_config.format)
+    handlers: list[logging.Handler] = []
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level_no(logging_config.level))
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     if logging_config.log_to_file and logging_config.log_file_path:
         file_handler = logging.FileHandler(logging_config.log_file_path)
         file_handler.setLevel(level_no(logging_config.level))
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
-
-    return StdlibLoggerFactory(logging_config)
+        handlers.append(file_handler)
+
+    if not logging_config.use_queue:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        return StdlibLoggerFactory(logging_config)
+
+    queue_handler = BoundedQueueHandler(queue.Queue(maxsize=logging_config.queue_size))
+    queue_handler.listener = _FlushingQueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    queue_handler.listener.start()
+    root_logger.addHandler(queue_handler)
+    factory = StdlibLoggerFactory(logging_config, queue_handler)
+    atexit.register(factory.shutdown)
+    return factory
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from collections.abc import Callable, Iterable, Sized
+from contextvars import ContextVar
+from typing import Any
+
+from open_ticket_ai.core.metrics.metrics_registry import Counter, Histogram
+from open_ticket_ai.core.tracing.tracer import TRACER, NonRecordingSpan, Span
+
+type ResultObserver = Callable[[Any, str, Any], None]
+
+# Instances with an instrumented call in progress, so that e.g. ``aclassify`` delegating to
+# ``classify`` is recorded once.
+_active: ContextVar[frozenset[int]] = ContextVar("instrumented_calls_active", default=frozenset())
+
+
+def instrument_methods(
+    cls: type,
+    method_names: Iterable[str],
+    calls: Counter,
+    duration: Histogram,
+    observe_result: ResultObserver | None = None,
+    span_prefix: str = "service",
+) -> None:
+    """Wrap the methods ``cls`` defines itself so every call is counted, timed and traced.
+
+    ``calls`` is labelled ``(service, operation, outcome)`` and ``duration`` ``(service,
+    operation)``, where ``service`` is the injectable id. A call fails when it raises or returns
+    ``False``. ``observe_result`` receives ``(instance, operation, result)`` of successful calls.
+    Each call opens a ``<span_prefix>.<operation>`` span carrying the ``ticket_id`` argument, if
+    the method has one, and the size of returned collections.
+    Calls an instrumented method makes to another one on the same instance are not recorded.
+    """
+    for name in method_names:
+        method = cls.__dict__.get(name)
+        if method is None or getattr(method, "__wrapped_for_metrics__", False):
+            continue
+        call = _InstrumentedCall(method, name, calls, duration, observe_result, f"{span_prefix}.{name}")
+        setattr(cls, name, call.wrap())
+
+
+class _InstrumentedCall:
+    def __init__(
+        self,
+        method: Callable[..., Any],
+        operation: str,
+        calls: Counter,
+        duration: Histogram,
+        observe_result: ResultObserver | None,
+        span_name: str,
+    ) -> None:
+        self.method = method
+        self.operation = operation
+        self.calls = calls
+        self.duration = duration
+        self.observe_result = observe_result
+        self.span_name = span_name
+        parameters = list(inspect.signature(method).parameters)
+        # Position in ``args``, which excludes ``self``.
+        self.ticket_id_index = parameters.index("ticket_id") - 1 if "ticket_id" in parameters else None
+
+    def wrap(self) -> Callable[..., Any]:
+        method = self.method
+
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(instance: Any, *args: Any, **kwargs: Any) -> Any:
+                active = _active.get()
+                if id(instance) in active:
+                    return await method(instance, *args, **kwargs)
+                token = _active.set(active | {id(instance)})
+                started = time.perf_counter()
+                try:
+                    with TRACER.span(self.span_name) as span:
+                        self._describe_call(span, instance, args, kwargs)
+                        result = await method(instance, *args, **kwargs)
+                        self._describe_result(span, result)
+                except BaseException:
+                    self._record(instance, started, None, failed=True)
+                    raise
+                finally:
+                    _active.reset(token)
+                self._record(instance, started, result, failed=False)
+                return result
+
+            async_wrapper.__wrapped_for_metrics__ = True  # type: ignore[attr-defined]
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(instance: Any, *args: Any, **kwargs: Any) -> Any:
+            active = _active.get()
+            if id(instance) in active:
+                return method(instance, *args, **kwargs)
+            token = _active.set(active | {id(instance)})
+            started = time.perf_counter()
+            try:
+                with TRACER.span(self.span_name) as span:
+                    self._describe_call(span, instance, args, kwargs)
+                    result = method(instance, *args, **kwargs)
+                    self._describe_result(span, result)
+            except BaseException:
+                self._record(instance, started, None, failed=True)
+                raise
+            finally:
+                _active.reset(token)
+            self._record(instance, started, result, failed=False)
+            return result
+
+        wrapper.__wrapped_for_metrics__ = True  # type: ignore[attr-defined]
+        return wrapper
+
+    def _record(self, instance: Any, started: float, result: Any, failed: bool) -> None:
+        service = _service_id(instance)
+        self.duration.labels(service, self.operation).observe(time.perf_counter() - started)
+        self.calls.labels(service, self.operation, "failed" if failed or result is False else "succeeded").inc()
+        if self.observe_result is not None and not failed:
+            self.observe_result(instance, self.operation, result)
+
+    def _describe_call(
+        self, span: Span | NonRecordingSpan, instance: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> None:
+        if not span.is_recording:
+            return
+        span.set_attribute("service", _service_id(instance))
+        ticket_id = kwargs.get("ticket_id")
+        if ticket_id is None and self.ticket_id_index is not None and len(args) > self.ticket_id_index:
+            ticket_id = args[self.ticket_id_index]
+        if ticket_id is not None:
+            span.set_attribute("ticket_id", str(ticket_id))
+
+    @staticmethod
+    def _describe_result(span: Span | NonRecordingSpan, result: Any) -> None:
+        if span.is_recording and isinstance(result, Sized) and not isinstance(result, str):
+            span.set_attribute("result_count", len(result))
+
+
+def _service_id(instance: Any) -> str:
+    return getattr(instance, "injectable_id", type(instance).__name__)
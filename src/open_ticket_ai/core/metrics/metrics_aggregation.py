@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from open_ticket_ai.core.metrics.metrics_registry import format_value
+
+# Kinds whose samples only grow, so the last values of an exited process stay part of the totals.
+_CUMULATIVE_KINDS = frozenset({"counter", "histogram"})
+
+
+@dataclass(slots=True)
+class _Family:
+    documentation: str = ""
+    kind: str = "untyped"
+    # Sample name with its rendered labels, e.g. 'otai_runs_total{pipe="fetch"}', to the value.
+    samples: dict[str, float] = field(default_factory=dict)
+
+    def add(self, other: _Family) -> None:
+        for sample, value in other.samples.items():
+            self.samples[sample] = self.samples.get(sample, 0.0) + value
+
+
+class MetricsAggregator:
+    """Sums the metrics of several processes into one exposition in the Prometheus text format.
+
+    ``sources`` returns the current metrics of each process, as rendered by ``MetricsRegistry``.
+    Samples with the same name and labels are added up, so a counter reports the total of all
+    processes and a gauge such as in-flight requests their sum. ``retire`` keeps the counters and
+    histograms of a process that exited, so totals do not drop when a worker is restarted.
+    """
+
+    def __init__(self, sources: Callable[[], Iterable[str]]) -> None:
+        self._sources = sources
+        self._retired: dict[str, _Family] = {}
+
+    def retire(self, text: str) -> None:
+        """Keep the cumulative samples of an exited process in every later ``render``."""
+        for name, family in _parse_metrics(text).items():
+            if family.kind in _CUMULATIVE_KINDS:
+                _merge_family(self._retired, name, family)
+
+    def render(self) -> str:
+        """Sum the retired samples and the current metrics of every source."""
+        families: dict[str, _Family] = {}
+        for name, family in self._retired.items():
+            _merge_family(families, name, family)
+        for text in self._sources():
+            for name, family in _parse_metrics(text).items():
+                _merge_family(families, name, family)
+        lines: list[str] = []
+        for name in sorted(families):
+            family = families[name]
+            lines.append(f"# HELP {name} {family.documentation}")
+            lines.append(f"# TYPE {name} {family.kind}")
+            lines.extend(f"{sample} {format_value(value)}" for sample, value in family.samples.items())
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _parse_metrics(text: str) -> dict[str, _Family]:
+    """Read metrics as rendered by ``MetricsRegistry.render``; samples belong to the family declared before them."""
+    families: dict[str, _Family] = {}
+    current: _Family | None = None
+    for line in text.splitlines():
+        if line.startswith("# HELP "):
+            name, _, documentation = line.removeprefix("# HELP ").partition(" ")
+            current = families.setdefault(name, _Family())
+            current.documentation = documentation
+        elif line.startswith("# TYPE "):
+            name, _, kind = line.removeprefix("# TYPE ").partition(" ")
+            current = families.setdefault(name, _Family())
+            current.kind = kind
+        elif line and not line.startswith("#") and current is not None:
+            sample, _, value = line.rpartition(" ")
+            try:
+                current.samples[sample] = float(value)
+            except ValueError:
+                continue
+    return families
+
+
+def _merge_family(families: dict[str, _Family], name: str, family: _Family) -> None:
+    merged = families.get(name)
+    if merged is None:
+        families[name] = merged = _Family(family.documentation, family.kind)
+    merged.add(family)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from http import HTTPStatus
+from pathlib import Path
+from typing import Protocol
+
+from open_ticket_ai.core.config.config_models import MetricsConfig
+from open_ticket_ai.core.http.local_http_server import HttpRequest, HttpResponse, LocalHttpServer
+from open_ticket_ai.core.logging.logging_iface import AppLogger
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsSource(Protocol):
+    def render(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        ...
+
+
+class MetricsExporter:
+    """Serves the registry on ``GET /metrics`` and/or writes it to a file, as configured."""
+
+    def __init__(self, config: MetricsConfig, logger: AppLogger, registry: MetricsSource = METRICS) -> None:
+        self._config = config
+        self._logger = logger
+        self._registry = registry
+        self._server: LocalHttpServer | None = None
+        self._dump_task: asyncio.Task[None] | None = None
+
+    @property
+    def url(self) -> str | None:
+        return f"{self._server.url}/metrics" if self._server else None
+
+    async def start(self) -> None:
+        if self._config.http_enabled:
+            self._server = LocalHttpServer(self._handle, self._logger, host=self._config.host, port=self._config.port)
+            await self._server.start()
+        if self._config.file_path:
+            self._dump_task = asyncio.create_task(self._dump_periodically(Path(self._config.file_path)))
+
+    async def aclose(self) -> None:
+        if self._server is not None:
+            await self._server.aclose()
+            self._server = None
+        if self._dump_task is not None:
+            self._dump_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._dump_task
+            self._dump_task = None
+        if self._config.file_path:
+            self.write_file(Path(self._config.file_path))
+
+    def write_file(self, path: Path) -> None:
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(self._registry.render())
+        tmp_path.replace(path)
+
+    async def _dump_periodically(self, path: Path) -> None:
+        while True:
+            await asyncio.sleep(self._config.file_interval.total_seconds())
+            try:
+                self.write_file(path)
+            except OSError:
+                self._logger.exception("❌ Failed to write metrics to %s", path)
+
+    async def _handle(self, request: HttpRequest) -> HttpResponse:
+        if request.path != "/metrics":
+            return HttpResponse.json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+        if request.method != "GET":
+            return HttpResponse.json(HTTPStatus.METHOD_NOT_ALLOWED, {"error": "method not allowed"})
+        return HttpResponse.text(HTTPStatus.OK, self._registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
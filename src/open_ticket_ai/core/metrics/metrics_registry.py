@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Sequence
+from typing import Protocol
+
+DEFAULT_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+type LabelValues = tuple[str, ...]
+
+
+class _Series(Protocol):
+    def reset(self) -> None: ...
+
+
+class _Metric[ChildT: _Series](ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children: dict[LabelValues, ChildT] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *label_values: str) -> ChildT:
+        """Return the series for ``label_values``; keep the result to skip the lookup on hot paths."""
+        child = self._children.get(label_values)
+        if child is not None:
+            return child
+        if len(label_values) != len(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {label_values}")
+        with self._lock:
+            return self._children.setdefault(label_values, self._new_child())
+
+    @abstractmethod
+    def _new_child(self) -> ChildT:
+        pass
+
+    def reset(self) -> None:
+        for _, child in self._series():
+            child.reset()
+
+    def _series(self) -> list[tuple[LabelValues, ChildT]]:
+        with self._lock:
+            return list(self._children.items())
+
+    @abstractmethod
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        pass
+
+
+class CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self.value = 0.0
+
+
+class Counter(_Metric[CounterChild]):
+    """Monotonic counter; by convention its name ends in ``_total``."""
+
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for label_values, child in self._series():
+            yield self.name, dict(zip(self.label_names, label_values, strict=True)), child.value
+
+
+class GaugeChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def reset(self) -> None:
+        self.set(0.0)
+
+
+class Gauge(_Metric[GaugeChild]):
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for label_values, child in self._series():
+            yield self.name, dict(zip(self.label_names, label_values, strict=True)), child.value
+
+
+class HistogramChild:
+    __slots__ = ("_lock", "bucket_counts", "buckets", "count", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def reset(self) -> None:
+        with self._lock:
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+            self.count = 0
+            self.sum = 0.0
+
+
+class Histogram(_Metric[HistogramChild]):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(bucket for bucket in buckets if bucket != math.inf))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for label_values, child in self._series():
+            labels = dict(zip(self.label_names, label_values, strict=True))
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), child.bucket_counts, strict=True):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket", {**labels, "le": format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, child.sum
+            yield f"{self.name}_count", labels, child.count
+
+
+class MetricsRegistry:
+    """Process-wide collection of metrics, rendered in the Prometheus text format.
+
+    Asking twice for a metric with the same name returns the existing one, so modules can declare
+    their metrics at import time without coordinating.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, label_names, lambda: Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, label_names, lambda: Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> Histogram:
+        return self._register(
+            Histogram, name, label_names, lambda: Histogram(name, documentation, label_names, buckets)
+        )
+
+    def reset(self) -> None:
+        """Zero every series, e.g. in a forked worker so it does not report the values of its parent again.
+
+        Series are kept rather than dropped, since modules hold on to the series they update.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation, quote=False)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(
+                f"{sample_name}{_format_labels(labels)} {format_value(value)}"
+                for sample_name, labels, value in metric.samples()
+            )
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _register[MetricT: _Metric](
+        self, metric_type: type[MetricT], name: str, label_names: Sequence[str], create: Callable[[], MetricT]
+    ) -> MetricT:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = create()
+        if not isinstance(metric, metric_type) or metric.label_names != tuple(label_names):
+            raise ValueError(f"Metric {name} is already registered as {metric.kind} with labels {metric.label_names}")
+        return metric
+
+
+METRICS = MetricsRegistry()
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape(text: str, *, quote: bool = True) -> str:
+    escaped = text.replace("\\", "\\\\").replace("\n", "\\n")
+    return escaped.replace('"', '\\"') if quote else escaped
@@ -1,3 +1,4 @@
+import time
 from abc import ABC
 from typing import Any, final
 
@@ -6,22 +7,44 @@ from pydantic import BaseModel
 from open_ticket_ai.core.base_model import StrictBaseModel
 from open_ticket_ai.core.injectables.injectable import Injectable
 from open_ticket_ai.core.logging.logging_iface import LoggerFactory
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
 from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
 from open_ticket_ai.core.pipes.pipe_models import PipeConfig, PipeResult
+from open_ticket_ai.core.tracing.tracer import TRACER
+
+_PIPE_DURATION = METRICS.histogram("otai_pipe_duration_seconds", "Time spent in Pipe.process.", ("pipe",))
+_PIPE_RUNS = METRICS.counter("otai_pipe_runs_total", "Pipe runs by outcome.", ("pipe", "outcome"))
 
 
 class Pipe[ParamsT: BaseModel = StrictBaseModel](Injectable[ParamsT], ABC):
     def __init__(self, config: PipeConfig, logger_factory: LoggerFactory, *args: Any, **kwargs: Any) -> None:
         super().__init__(config, logger_factory, *args, **kwargs)
         self._logger = logger_factory.create(name=f"{self.__class__.__name__}.{self._config.id}")
-        self._config: PipeConfig = PipeConfig.model_validate(config.model_dump())
+        self._config: PipeConfig = (
+            config if isinstance(config, PipeConfig) else PipeConfig.model_validate(config.model_dump())
+        )
 
     @final
     async def process(self, context: PipeContext) -> PipeResult:
-        self._logger.info(f"Processing {self._config.id} with {self._params}")
-        result: PipeResult = await self._process(context)
-        self._logger.info(f"Processed {self._config.id} with result: {result}")
+        self._logger.debug("Processing %s with %s", self._config.id, self._params)
+        started = time.perf_counter()
+        outcome = "failed"
+        try:
+            with TRACER.span("pipe.process", pipe_id=self._config.id, pipe_type=type(self).__name__) as span:
+                result: PipeResult = await self._process(context)
+                outcome = _outcome(result)
+                span.set_attribute("outcome", outcome)
+        finally:
+            _PIPE_DURATION.labels(self._config.id).observe(time.perf_counter() - started)
+            _PIPE_RUNS.labels(self._config.id, outcome).inc()
+        self._logger.debug("Processed %s with result: %s", self._config.id, result)
         return result
 
     async def _process(self, *_: Any, **__: Any) -> PipeResult:
         return PipeResult.skipped()
+
+
+def _outcome(result: PipeResult) -> str:
+    if result.was_skipped:
+        return "skipped"
+    return "succeeded" if result.succeeded else "failed"
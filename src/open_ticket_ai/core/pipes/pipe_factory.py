@@ -1,23 +1,35 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import timedelta
 from typing import Any
 
-from async_lru import alru_cache
 from injector import inject, singleton
 from pydantic import BaseModel
 
+from open_ticket_ai.core.config.config_diff import ConfigDiff, pipe_tree
 from open_ticket_ai.core.config.config_models import OpenTicketAIConfig
-from open_ticket_ai.core.config.errors import NoServiceConfigurationFoundError
+from open_ticket_ai.core.config.errors import CircularInjectionError, NoServiceConfigurationFoundError
 from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
 from open_ticket_ai.core.injectables.injectable import Injectable
 from open_ticket_ai.core.injectables.injectable_models import InjectableConfig
+from open_ticket_ai.core.injectables.lifecycle import StopResult, stop_injectables
 from open_ticket_ai.core.logging.logging_iface import LoggerFactory
 from open_ticket_ai.core.pipes.pipe import Pipe
 from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
-from open_ticket_ai.core.pipes.pipe_models import PipeConfig
+from open_ticket_ai.core.pipes.pipe_models import CompiledPipe, PipeConfig, without_run_on
 from open_ticket_ai.core.template_rendering.template_renderer import TemplateRenderer
 
 
 @singleton
 class PipeFactory:
+    """Builds, caches and stops the configured services and pipes.
+
+    Pipes are cached per config and context. Pipes built for a context that holds results of
+    earlier steps depend on ticket data, so at most ``infrastructure.max_cached_pipes`` of them
+    are kept; the least recently used are stopped and dropped beyond that.
+    """
+
     @inject
     def __init__(
         self,
@@ -31,14 +43,90 @@ class PipeFactory:
         self._logger = logger_factory.create(self.__class__.__name__)
         self._service_configs: list[InjectableConfig] = otai_config.get_services_list()
         self._component_registry = component_registry
+        self._services: dict[str, Injectable] = {}
+        self._service_locks: dict[str, asyncio.Lock] = {}
+        self._max_cached_pipes = otai_config.infrastructure.max_cached_pipes
+        self._pipes: OrderedDict[tuple[PipeConfig, PipeContext], Pipe] = OrderedDict()
+        self._templated_params: dict[PipeConfig, frozenset[str]] = {}
+
+    def use_compiled_pipes(self, pipes: Iterable[CompiledPipe]) -> None:
+        """Render only the params found to hold templates when building these pipes, e.g. from a config snapshot.
+
+        Pipes not among them, like those of a config loaded on reload, have all their params rendered.
+        """
+        self._templated_params.update((without_run_on(pipe.config), pipe.templated_params) for pipe in pipes)
+
+    async def create_pipe(self, pipe_config: PipeConfig, pipe_context: PipeContext, *, cache: bool = True) -> Pipe:
+        """Return the pipe for ``pipe_config`` in ``pipe_context``, building it on first use.
+
+        With ``cache=False`` a new pipe is built and not kept; the caller stops it after use.
+        """
+        key = (without_run_on(pipe_config), pipe_context)
+        pipe = self._pipes.get(key) if cache else None
+        if pipe is not None:
+            self._pipes.move_to_end(key)
+            return pipe
+        pipe = await self._create_pipe(pipe_config, pipe_context)
+        await pipe.astart()
+        if cache:
+            self._pipes[key] = pipe
+            await self._evict_pipes()
+        return pipe
+
+    async def _evict_pipes(self) -> None:
+        # Pipes for contexts without step results, like the orchestrator and its steps, are bounded
+        # by the config and are never evicted, so running composites keep their pipes.
+        evictable = [key for key in self._pipes if key[1].pipe_results]
+        excess = evictable[: max(len(evictable) - self._max_cached_pipes, 0)]
+        if excess:
+            await stop_injectables([self._pipes.pop(key) for key in excess], self._logger)
+
+    def validate_config(self, otai_config: OpenTicketAIConfig) -> None:
+        """Raise if a service or pipe of ``otai_config`` uses a component that is not registered."""
+        for config in [*otai_config.get_services_list(), *pipe_tree(otai_config)]:
+            self._component_registry.get_injectable(by_identifier=config.use)
+
+    def apply_config(self, otai_config: OpenTicketAIConfig, diff: ConfigDiff) -> list[Injectable]:
+        """Switch to ``otai_config`` and drop what ``diff`` reports as changed.
 
-    @alru_cache()
-    async def create_pipe(self, pipe_config: PipeConfig, pipe_context: PipeContext) -> Pipe:
+        Unchanged services and pipes stay cached. The dropped pipes and services are returned in
+        stop order so the caller can stop them once nothing uses them anymore.
+        """
+        self._service_configs = otai_config.get_services_list()
+        current_pipes = {without_run_on(config) for config in pipe_tree(otai_config)}
+        kept_pipes: OrderedDict[tuple[PipeConfig, PipeContext], Pipe] = OrderedDict()
+        stale: list[Injectable] = []
+        for (config, context), pipe in self._pipes.items():
+            if config in current_pipes and diff.changed_services.isdisjoint(config.injects.values()):
+                kept_pipes[config, context] = pipe
+            else:
+                stale.append(pipe)
+        self._pipes = kept_pipes
+        stale.reverse()
+        stale_ids = [service_id for service_id in reversed(self._services) if service_id in diff.changed_services]
+        stale.extend(self._services.pop(service_id) for service_id in stale_ids)
+        return stale
+
+    async def aclose(self, stop_timeout: timedelta | None = None) -> list[StopResult]:
+        """Stop every pipe and service built so far, in reverse order of creation.
+
+        Services are created after the services they inject, so they are stopped before them.
+        """
+        injectables: list[Injectable] = [*reversed(self._pipes.values()), *reversed(self._services.values())]
+        self._pipes = OrderedDict()
+        self._services = {}
+        return await stop_injectables(injectables, self._logger, stop_timeout)
+
+    async def _create_pipe(self, pipe_config: PipeConfig, pipe_context: PipeContext) -> Pipe:
         injected_services = await self._resolve_service_injects(pipe_config.injects)
         pipe_class: type[Pipe] = self._component_registry.get_pipe(by_identifier=pipe_config.use)
 
+        templated = self._templated_params.get(without_run_on(pipe_config)) if self._templated_params else None
         rendered_params: BaseModel = await self._template_renderer.render_to_model(
-            to_model=pipe_class.ParamsModel, from_raw_dict=pipe_config.params, with_scope=pipe_context.model_dump()
+            to_model=pipe_class.ParamsModel,
+            from_raw_dict=pipe_config.params,
+            with_scope=pipe_context.model_dump(),
+            templated_fields=templated,
         )
 
         rendered_config = pipe_config.model_copy(update={"params": rendered_params.model_dump()})
@@ -51,16 +139,64 @@ class PipeFactory:
             **injected_services,
         )
 
-    async def _resolve_service_injects(self, injects: dict[str, str]) -> dict[str, Any]:
-        return {param_name: await self._get_service_by_id(service_id) for param_name, service_id in injects.items()}
+    async def preload_services(self) -> list[str]:
+        """Build each configured service without starting it, call its ``preload`` hook and stop it.
+
+        Services that inject others are skipped, since building them would start what they
+        inject; the services they wrap are configured on their own and preloaded as well.
+        The instances are stopped afterwards, so that connections or shared sessions they
+        acquired on construction are released before worker processes are forked.
+        Returns the ids of the preloaded services.
+        """
+        built: list[Injectable] = []
+        try:
+            for config in self._service_configs:
+                if config.injects:
+                    continue
+                service = await self._create_service(config.id)
+                built.append(service)
+                service.preload()
+        finally:
+            await stop_injectables(reversed(built), self._logger)
+        return [service.injectable_id for service in built]
 
-    async def _get_service_by_id(self, service_id: str) -> Injectable:
+    async def get_service(self, service_id: str) -> Injectable:
+        """Return the configured service with ``service_id``, building it on first use."""
+        return await self._get_service_by_id(service_id)
+
+    async def _resolve_service_injects(
+        self, injects: dict[str, str], resolving: tuple[str, ...] = ()
+    ) -> dict[str, Any]:
+        return {
+            param_name: await self._get_service_by_id(service_id, resolving)
+            for param_name, service_id in injects.items()
+        }
+
+    async def _get_service_by_id(self, service_id: str, resolving: tuple[str, ...] = ()) -> Injectable:
+        service = self._services.get(service_id)
+        if service is not None:
+            return service
+        # Checked before taking the lock, which the services waiting in a cycle already hold.
+        if service_id in resolving:
+            raise CircularInjectionError([*resolving, service_id])
+        # Concurrent first uses wait for one build instead of each starting an instance of their own.
+        async with self._service_locks.setdefault(service_id, asyncio.Lock()):
+            service = self._services.get(service_id)
+            if service is None:
+                service = await self._create_service(service_id, resolving)
+                await service.astart()
+                self._services[service_id] = service
+        return service
+
+    async def _create_service(self, service_id: str, resolving: tuple[str, ...] = ()) -> Injectable:
+        """Build the service; ``resolving`` holds the ids of the services waiting for it to be injected."""
         config: InjectableConfig | None = next(
             (service_config for service_config in self._service_configs if service_config.id == service_id), None
         )
         if config is None:
             raise NoServiceConfigurationFoundError(service_id, self._service_configs)
 
+        injected_services = await self._resolve_service_injects(config.injects, (*resolving, service_id))
         injectable_class: type[Injectable] = self._component_registry.get_injectable(by_identifier=config.use)
         rendered_params: BaseModel = await self._template_renderer.render_to_model(
             to_model=injectable_class.ParamsModel, from_raw_dict=config.params, with_scope={}
@@ -70,4 +206,5 @@ class PipeFactory:
         return injectable_class(
             config=rendered_config,
             logger_factory=self._logger_factory,
+            **injected_services,
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from functools import reduce
 from typing import Any, Self
 
@@ -15,6 +16,14 @@ class PipeConfig(InjectableConfig):
     model_config = ConfigDict(populate_by_name=True, frozen=True, extra="forbid")
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledPipe:
+    """A pipe of the configured tree together with the names of its params that hold templates."""
+
+    config: PipeConfig
+    templated_params: frozenset[str] = frozenset()
+
+
 class PipeResult(StrictBaseModel):
     succeeded: bool = Field(
         default=True, description="Indicates whether the pipe execution completed successfully without errors."
@@ -67,3 +76,26 @@ class PipeResult(StrictBaseModel):
     @classmethod
     def success(cls, message: str = "", data: dict[str, Any] | None = None) -> PipeResult:
         return PipeResult.model_validate({"message": message, "data": data or {}})
+
+
+def iter_pipe_configs(raw: Any) -> Iterator[dict[str, Any]]:
+    """Yield every nested pipe configuration (a mapping with ``id`` and ``use``) depth-first."""
+    if isinstance(raw, dict):
+        if "use" in raw and "id" in raw:
+            yield raw
+        for value in raw.values():
+            yield from iter_pipe_configs(value)
+    elif isinstance(raw, list):
+        for item in raw:
+            yield from iter_pipe_configs(item)
+
+
+RUN_ON_PARAM = "run_on"
+
+
+def without_run_on(config: PipeConfig) -> PipeConfig:
+    """Drop the ``run_on`` step option, which orchestrators read and the step's own params model may not accept."""
+    if RUN_ON_PARAM not in config.params:
+        return config
+    params = {key: value for key, value in config.params.items() if key != RUN_ON_PARAM}
+    return config.model_copy(update={"params": params})
@@ -8,6 +8,13 @@ from injector import inject
 from open_ticket_ai.core.config.app_config import AppConfig
 from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
 from open_ticket_ai.core.injectables.injectable import Injectable
+from open_ticket_ai.core.plugins.plugin_manifest import PluginManifest
+
+
+def get_component_name_prefix(module_name: str, app_config: type[AppConfig] | AppConfig) -> str:
+    """Registry prefix of the plugin distributed in the top-level package of ``module_name``."""
+    plugin_name = module_name.split(".")[0].replace("_", "-")
+    return plugin_name.replace(app_config.PLUGIN_NAME_PREFIX, "")
 
 
 class Plugin(ABC):
@@ -39,7 +46,7 @@ class Plugin(ABC):
     @property
     def _component_name_prefix(self) -> str:
         """Get component name prefix for this plugin."""
-        return self._plugin_name.replace(self._app_config.PLUGIN_NAME_PREFIX, "")
+        return get_component_name_prefix(self._plugin_name, self._app_config)
 
     def get_registry_name(self, injectable: type[Injectable]) -> str:
         """Get the name used to register this plugin's components."""
@@ -49,6 +56,16 @@ class Plugin(ABC):
             + injectable.get_registry_name()
         )
 
+    @final
+    def build_manifest(self) -> PluginManifest:
+        """Describe this plugin's injectables as import paths, e.g. to write or check its ``manifest.py``."""
+        return PluginManifest(
+            injectables={
+                injectable.get_registry_name(): f"{injectable.__module__}:{injectable.__qualname__}"
+                for injectable in self._get_all_injectables()
+            }
+        )
+
     @abstractmethod
     def _get_all_injectables(self) -> list[type[Injectable]]:
         pass
@@ -6,7 +6,8 @@ from injector import inject
 from open_ticket_ai.core.config.app_config import AppConfig
 from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
 from open_ticket_ai.core.logging.logging_iface import LoggerFactory
-from open_ticket_ai.core.plugins.plugin import GetEntryPointsFn, Plugin
+from open_ticket_ai.core.plugins.plugin import GetEntryPointsFn, Plugin, get_component_name_prefix
+from open_ticket_ai.core.plugins.plugin_manifest import PluginManifest
 
 
 class PluginLoadError(Exception):
@@ -20,6 +21,13 @@ default_entry_point_function: GetEntryPointsFn = typing.cast(GetEntryPointsFn, e
 
 
 class PluginLoader:
+    """Fills the component registry from installed plugins.
+
+    Plugins that publish a :class:`PluginManifest` are registered lazily from it, so their modules (and
+    heavy dependencies) are only imported when one of their injectables is used. Plugins without a
+    manifest are imported and loaded right away.
+    """
+
     @inject
     def __init__(
         self,
@@ -32,6 +40,7 @@ class PluginLoader:
         self._logger = logger_factory.create(self.__class__.__name__)
         self._app_config = app_config
         self._entry_points_fn = entry_points_fn
+        self._loaded = False
 
     def _load_plugin(self, entry_point: EntryPoint) -> None:
         self._logger.info(f"Loading plugin {entry_point}")
@@ -48,6 +57,31 @@ class PluginLoader:
 
         self._logger.info(f"Loaded plugin: {entry_point.name}")
 
+    def _register_manifest(self, entry_point: EntryPoint, manifest_entry_point: EntryPoint) -> None:
+        try:
+            manifest = manifest_entry_point.load()
+        except ImportError as e:
+            self._logger.error(f"Error loading manifest of plugin {entry_point.name}: {e}")
+            raise PluginLoadError(entry_point.name) from e
+        if not isinstance(manifest, PluginManifest):
+            raise PluginLoadError(entry_point.name)
+
+        prefix = get_component_name_prefix(entry_point.module, self._app_config)
+        for name, import_path in manifest.injectables.items():
+            self._registry.register_lazy(prefix + self._app_config.REGISTRY_IDENTIFIER_SEPERATOR + name, import_path)
+
+        self._logger.info(f"Registered {len(manifest.injectables)} injectable(s) of plugin {entry_point.name} lazily")
+
     def load_plugins(self) -> None:
+        if self._loaded:
+            return
+        manifests = {
+            ep.name: ep for ep in self._entry_points_fn(group=self._app_config.PLUGIN_MANIFEST_ENTRY_POINT_GROUP)
+        }
         for ep in self._entry_points_fn(group=self._app_config.PLUGIN_ENTRY_POINT_GROUP):
-            self._load_plugin(ep)
+            manifest_entry_point = manifests.get(ep.name)
+            if manifest_entry_point is None:
+                self._load_plugin(ep)
+            else:
+                self._register_manifest(ep, manifest_entry_point)
+        self._loaded = True
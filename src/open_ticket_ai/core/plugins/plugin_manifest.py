@@ -0,0 +1,17 @@
+from pydantic import Field
+
+from open_ticket_ai.core.base_model import StrictBaseModel
+
+
+class PluginManifest(StrictBaseModel):
+    """Import-free description of a plugin's injectables.
+
+    Published under the ``open_ticket_ai.plugin_manifests`` entry point group with the same name as the
+    plugin entry point. Registry names are filled from it without importing the plugin; an injectable's
+    module is only imported once its registry name is resolved.
+    """
+
+    injectables: dict[str, str] = Field(
+        default_factory=dict,
+        description="Maps the injectable registry name (without plugin prefix) to its 'module:ClassName' import path.",
+    )
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import cProfile
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Literal
+
+from open_ticket_ai.core.config.config_models import ProfilingConfig
+from open_ticket_ai.core.http.local_http_server import HttpRequest, HttpResponse, LocalHttpServer
+from open_ticket_ai.core.logging.logging_iface import AppLogger
+from open_ticket_ai.core.pipes.pipe import Pipe
+
+type ProfileFormat = Literal["speedscope", "collapsed", "pstats"]
+type Stack = tuple[str, ...]
+
+_PIPE_PROCESS_CODE: CodeType = Pipe.process.__code__
+_EXTENSIONS: dict[str, str] = {"speedscope": ".speedscope.json", "collapsed": ".collapsed.txt", "pstats": ".pstats"}
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileRequest:
+    cycles: int
+    max_duration: timedelta
+    format: ProfileFormat
+
+
+class StackSampler:
+    """Samples the stack of one thread from a background thread while it is resumed.
+
+    Frames of ``Pipe.process`` are labelled ``pipe:<id>`` so that time is attributed to the
+    configured pipe rather than to the pipe class.
+    """
+
+    def __init__(self, thread_id: int, interval: timedelta) -> None:
+        self.interval = interval.total_seconds()
+        self.samples: Counter[Stack] = Counter()
+        self._thread_id = thread_id
+        self._resumed = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="otai-stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def resume(self) -> None:
+        self._resumed.set()
+
+    def pause(self) -> None:
+        self._resumed.clear()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._resumed.set()
+        self._thread.join()
+
+    def pipe_seconds(self) -> dict[str, float]:
+        """Sampled time per pipe id, counting each sample for the innermost pipe on its stack."""
+        seconds: Counter[str] = Counter()
+        for stack, count in self.samples.items():
+            pipe = next((frame for frame in reversed(stack) if frame.startswith("pipe:")), None)
+            if pipe is not None:
+                seconds[pipe.removeprefix("pipe:").split(" ", 1)[0]] += count * self.interval
+        return dict(seconds.most_common())
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._resumed.wait()
+            if self._stopped.wait(self.interval):
+                return
+            if not self._resumed.is_set():
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self.samples[_stack(frame)] += 1
+
+
+def _stack(frame: FrameType | None) -> Stack:
+    labels: list[str] = []
+    while frame is not None:
+        labels.append(_label(frame))
+        frame = frame.f_back
+    return tuple(reversed(labels))
+
+
+def _label(frame: FrameType) -> str:
+    code = frame.f_code
+    if code is _PIPE_PROCESS_CODE:
+        pipe = frame.f_locals.get("self")
+        if pipe is not None:
+            return f"pipe:{pipe.injectable_id} ({type(pipe).__name__})"
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class _Capture:
+    def __init__(self, request: ProfileRequest, sample_interval: timedelta) -> None:
+        self.request = request
+        self.started = time.perf_counter()
+        self.cycles = 0
+        self.profile: cProfile.Profile | None = None
+        self.sampler: StackSampler | None = None
+        if request.format == "pstats":
+            self.profile = cProfile.Profile()
+        else:
+            self.sampler = StackSampler(threading.get_ident(), sample_interval)
+            self.sampler.start()
+
+    @property
+    def done(self) -> bool:
+        elapsed = time.perf_counter() - self.started
+        return self.cycles >= self.request.cycles or elapsed >= self.request.max_duration.total_seconds()
+
+    def resume(self) -> None:
+        if self.profile is not None:
+            self.profile.enable()
+        if self.sampler is not None:
+            self.sampler.resume()
+
+    def pause(self) -> None:
+        if self.profile is not None:
+            self.profile.disable()
+        if self.sampler is not None:
+            self.sampler.pause()
+
+    def write(self, path: Path) -> dict[str, float]:
+        if self.sampler is None:
+            if self.profile is not None:
+                self.profile.dump_stats(path)
+            return {}
+        self.sampler.stop()
+        if self.request.format == "collapsed":
+            path.write_text("".join(f"{';'.join(stack)} {count}\n" for stack, count in self.sampler.samples.items()))
+        else:
+            path.write_text(json.dumps(_speedscope(self.sampler, path.name)))
+        return self.sampler.pipe_seconds()
+
+
+def _speedscope(sampler: StackSampler, name: str) -> dict[str, Any]:
+    frame_index: dict[str, int] = {}
+    samples: list[list[int]] = []
+    weights: list[float] = []
+    for stack, count in sampler.samples.items():
+        samples.append([frame_index.setdefault(frame, len(frame_index)) for frame in stack])
+        weights.append(count * sampler.interval)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": [{"name": frame} for frame in frame_index]},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+        "name": name,
+        "activeProfileIndex": 0,
+        "exporter": "open_ticket_ai",
+    }
+
+
+class CycleProfiler:
+    """Profiles the next orchestrator cycles when asked to, without restarting the process.
+
+    The orchestrator reports each cycle through ``cycle_started``/``cycle_finished``; only time
+    inside cycles is captured. Captures are requested with ``request``, which the app wires to
+    SIGUSR1, ``trigger_file`` and ``POST /profile``.
+    """
+
+    def __init__(self) -> None:
+        self._config = ProfilingConfig()
+        self._logger: AppLogger | None = None
+        self._pending: ProfileRequest | None = None
+        self._capture: _Capture | None = None
+        self._server: LocalHttpServer | None = None
+        self.last_profile: Path | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled
+
+    @property
+    def url(self) -> str | None:
+        return f"{self._server.url}/profile" if self._server else None
+
+    def configure(self, config: ProfilingConfig, logger: AppLogger) -> None:
+        self._config = config
+        self._logger = logger
+
+    def request(
+        self,
+        cycles: int | None = None,
+        max_duration: timedelta | None = None,
+        profile_format: ProfileFormat | None = None,
+    ) -> ProfileRequest:
+        """Capture the next ``cycles`` cycles; a request made during a capture replaces any pending one."""
+        self._pending = ProfileRequest(
+            cycles=cycles or self._config.cycles,
+            max_duration=max_duration or self._config.max_duration,
+            format=profile_format or self._config.format,
+        )
+        self._log_info(f"🔬 Profiling requested for the next {self._pending.cycles} cycles")
+        return self._pending
+
+    def cycle_started(self) -> None:
+        if not self._config.enabled:
+            return
+        if self._pending is None and self._capture is None and self._config.trigger_file:
+            self._check_trigger_file(Path(self._config.trigger_file))
+        if self._capture is None and self._pending is not None:
+            self._capture = _Capture(self._pending, self._config.sample_interval)
+            self._pending = None
+        if self._capture is not None:
+            self._capture.resume()
+
+    def cycle_finished(self) -> Path | None:
+        """Pause the running capture and return the written profile once it is complete."""
+        capture = self._capture
+        if capture is None:
+            return None
+        capture.pause()
+        capture.cycles += 1
+        return self._finish(capture) if capture.done else None
+
+    async def astart(self) -> None:
+        if self._config.enabled and self._config.http_enabled and self._logger is not None:
+            self._server = LocalHttpServer(self._handle, self._logger, host=self._config.host, port=self._config.port)
+            await self._server.start()
+
+    async def aclose(self) -> None:
+        if self._server is not None:
+            await self._server.aclose()
+            self._server = None
+        if self._capture is not None:
+            self._finish(self._capture)
+        self._pending = None
+
+    def _finish(self, capture: _Capture) -> Path:
+        self._capture = None
+        output_dir = Path(self._config.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")  # noqa: DTZ005 - local time reads best in file names
+        path = output_dir / f"cycles-{stamp}{_EXTENSIONS[capture.request.format]}"
+        pipe_seconds = capture.write(path)
+        self.last_profile = path
+        message = f"🔬 Profile of {capture.cycles} cycles written to {path}"
+        if pipe_seconds:
+            by_pipe = ", ".join(f"{pipe_id} {seconds:.2f}s" for pipe_id, seconds in list(pipe_seconds.items())[:10])
+            message = f"{message}; time by pipe: {by_pipe}"
+        self._log_info(message)
+        return path
+
+    def _check_trigger_file(self, trigger_file: Path) -> None:
+        try:
+            content = trigger_file.read_text().strip()
+        except FileNotFoundError:
+            return
+        trigger_file.unlink(missing_ok=True)
+        self.request(cycles=int(content) if content.isdigit() else None)
+
+    async def _handle(self, request: HttpRequest) -> HttpResponse:
+        if request.path != "/profile":
+            return HttpResponse.json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+        if request.method == "GET":
+            return HttpResponse.json(
+                HTTPStatus.OK,
+                {
+                    "capturing": self._capture is not None,
+                    "pending": self._pending is not None,
+                    "last_profile": str(self.last_profile) if self.last_profile else None,
+                },
+            )
+        if request.method != "POST":
+            return HttpResponse.json(HTTPStatus.METHOD_NOT_ALLOWED, {"error": "method not allowed"})
+        profile_format = request.query.get("format")
+        try:
+            cycles = int(request.query["cycles"]) if "cycles" in request.query else None
+            seconds = float(request.query["seconds"]) if "seconds" in request.query else None
+        except ValueError:
+            return HttpResponse.json(HTTPStatus.BAD_REQUEST, {"error": "cycles and seconds must be numbers"})
+        if profile_format not in (None, *_EXTENSIONS):
+            return HttpResponse.json(HTTPStatus.BAD_REQUEST, {"error": f"format must be one of {list(_EXTENSIONS)}"})
+        if (cycles is not None and cycles <= 0) or (seconds is not None and seconds <= 0):
+            return HttpResponse.json(HTTPStatus.BAD_REQUEST, {"error": "cycles and seconds must be positive"})
+        pending = self.request(
+            cycles=cycles,
+            max_duration=timedelta(seconds=seconds) if seconds else None,
+            profile_format=profile_format,  # type: ignore[arg-type]
+        )
+        return HttpResponse.json(
+            HTTPStatus.ACCEPTED,
+            {
+                "cycles": pending.cycles,
+                "max_duration_seconds": pending.max_duration.total_seconds(),
+                "format": pending.format,
+            },
+        )
+
+    def _log_info(self, message: str) -> None:
+        if self._logger is not None:
+            self._logger.info(message)
+
+
+PROFILER = CycleProfiler()
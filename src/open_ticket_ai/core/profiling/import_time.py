@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+
+from pydantic import Field
+
+from open_ticket_ai.core.base_model import StrictBaseModel
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+_MICROSECONDS = 1_000_000
+
+
+class ImportTiming(StrictBaseModel):
+    module: str = Field(description="Dotted name of the imported module.")
+    self_seconds: float = Field(description="Time spent executing the module itself.")
+    cumulative_seconds: float = Field(description="Time spent importing the module including its own imports.")
+    depth: int = Field(default=0, description="Nesting level of the import; 0 for modules imported directly.")
+
+
+def parse_import_times(lines: Iterable[str]) -> list[ImportTiming]:
+    """Parse the stderr output of ``python -X importtime``."""
+    timings: list[ImportTiming] = []
+    for line in lines:
+        match = _IMPORT_TIME_LINE.match(line.rstrip("\n"))
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_seconds=int(self_us) / _MICROSECONDS,
+                cumulative_seconds=int(cumulative_us) / _MICROSECONDS,
+                depth=max(len(indent) - 1, 0) // 2,
+            )
+        )
+    return timings
+
+
+def total_by_top_level_package(timings: Iterable[ImportTiming]) -> dict[str, float]:
+    """Sum the self time of all imported modules per top-level package, most expensive first."""
+    totals: defaultdict[str, float] = defaultdict(float)
+    for timing in timings:
+        totals[timing.module.split(".", 1)[0]] += timing.self_seconds
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def measure_import_times(python_args: Sequence[str], timeout: float = 600.0) -> list[ImportTiming]:
+    """Run ``python -X importtime <python_args>`` in a fresh interpreter and return its import timings."""
+    completed = subprocess.run(  # noqa: S603 - runs the current interpreter with arguments chosen by the caller
+        [sys.executable, "-X", "importtime", *python_args],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=False,
+    )
+    return parse_import_times(completed.stderr.splitlines())
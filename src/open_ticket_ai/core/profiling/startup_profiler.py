@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import resource
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Literal
+
+from injector import Injector
+from pydantic import Field
+
+from open_ticket_ai.core.base_model import StrictBaseModel
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
+from open_ticket_ai.core.dependency_injection.container import AppModule
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig, iter_pipe_configs
+from open_ticket_ai.core.profiling.import_time import ImportTiming
+
+type PhaseKind = Literal["settings", "container", "plugin_import", "service", "service_connect", "pipe", "teardown"]
+type Clock = Callable[[], float]
+
+
+class PhaseTiming(StrictBaseModel):
+    kind: PhaseKind = Field(description="Startup phase this timing belongs to.")
+    name: str = Field(description="What was timed, e.g. a plugin prefix, service id or pipe id.")
+    seconds: float = Field(description="Wall clock duration of the phase.")
+    detail: str = Field(default="", description="Additional context such as the resolved component names.")
+    error: str | None = Field(default=None, description="Error raised during the phase, if any.")
+
+
+class StartupProfile(StrictBaseModel):
+    phases: list[PhaseTiming] = Field(default_factory=list, description="Per-phase timings in execution order.")
+    total_seconds: float = Field(default=0.0, description="Duration of all profiled phases together.")
+    peak_rss_bytes: int | None = Field(default=None, description="Peak resident set size of the profiling process.")
+    imports: list[ImportTiming] = Field(
+        default_factory=list, description="Most expensive imports of a fresh interpreter by cumulative time."
+    )
+    import_totals_by_package: dict[str, float] = Field(
+        default_factory=dict, description="Self import time summed per top-level package."
+    )
+
+    def seconds_by_kind(self) -> dict[str, float]:
+        totals: dict[str, float] = {}
+        for phase in self.phases:
+            totals[phase.kind] = totals.get(phase.kind, 0.0) + phase.seconds
+        return totals
+
+
+def peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StartupProfiler:
+    """Runs the startup sequence of ``open_ticket_ai.main`` step by step and times each phase.
+
+    Components used by the configuration are resolved per plugin before the container is built, so plugin
+    import cost is reported separately from service construction and pipe builds. Errors in a single
+    service or pipe are recorded on its phase and do not stop the profile. Everything built is stopped
+    again at the end, which is timed as the teardown phase.
+    """
+
+    def __init__(
+        self,
+        app_config_factory: Callable[[], AppConfig] = AppConfig,
+        connect_services: bool = False,
+        clock: Clock = time.perf_counter,
+    ) -> None:
+        self._app_config_factory = app_config_factory
+        self._connect_services = connect_services
+        self._clock = clock
+        self._phases: list[PhaseTiming] = []
+
+    async def profile(self) -> StartupProfile:
+        self._phases = []
+        with self._phase("settings", "AppConfig"):
+            app_config = self._app_config_factory()
+        with self._phase("container", "AppModule"):
+            app_module = AppModule(app_config)
+
+        otai_config = app_config.open_ticket_ai
+        services = otai_config.get_services_list()
+        pipe_configs = list(iter_pipe_configs(otai_config.orchestrator.model_dump()))
+
+        # Before the container: building the PipeFactory resolves the TemplateRenderer, which imports
+        # every configured service while looking for it.
+        used = [service.use for service in services] + [pipe["use"] for pipe in pipe_configs]
+        self._import_plugins(app_module.component_registry, list(dict.fromkeys(used)), app_config)
+
+        with self._phase("container", "PipeFactory"):
+            pipe_factory = Injector([app_module]).get(PipeFactory)
+
+        try:
+            for service in services:
+                instance = None
+                with self._phase("service", service.id, detail=service.use):
+                    instance = await pipe_factory.get_service(service.id)
+                connect = getattr(instance, "connect", None) if self._connect_services else None
+                if callable(connect):
+                    with self._phase("service_connect", service.id, detail=service.use):
+                        await connect()
+
+            for raw_pipe in pipe_configs:
+                with self._phase("pipe", str(raw_pipe["id"] or raw_pipe["use"]), detail=str(raw_pipe["use"])):
+                    await pipe_factory.create_pipe(PipeConfig.model_validate(raw_pipe), PipeContext.empty())
+        finally:
+            with self._phase("teardown", "PipeFactory"):
+                await pipe_factory.aclose(otai_config.infrastructure.shutdown.stop_timeout)
+
+        return StartupProfile(
+            phases=self._phases,
+            total_seconds=sum(phase.seconds for phase in self._phases),
+            peak_rss_bytes=peak_rss_bytes(),
+        )
+
+    def _import_plugins(self, registry: ComponentRegistry, identifiers: list[str], app_config: AppConfig) -> None:
+        by_plugin: dict[str, list[str]] = {}
+        for identifier in identifiers:
+            prefix = identifier.split(app_config.REGISTRY_IDENTIFIER_SEPERATOR, 1)[0]
+            by_plugin.setdefault(prefix, []).append(identifier)
+        for prefix, plugin_identifiers in by_plugin.items():
+            with self._phase("plugin_import", prefix, detail=", ".join(plugin_identifiers)):
+                for identifier in plugin_identifiers:
+                    registry.get_injectable(by_identifier=identifier)
+
+    @contextmanager
+    def _phase(self, kind: PhaseKind, name: str, detail: str = "") -> Iterator[None]:
+        error: str | None = None
+        started = self._clock()
+        try:
+            yield
+        except Exception as e:
+            if kind in ("settings", "container"):
+                raise
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            self._phases.append(
+                PhaseTiming(kind=kind, name=name, seconds=self._clock() - started, detail=detail, error=error)
+            )
@@ -6,6 +6,7 @@ from pydantic.fields import Field, FieldInfo
 
 from open_ticket_ai.core.base_model import StrictBaseModel
 from open_ticket_ai.core.injectables.injectable import Injectable
+from open_ticket_ai.core.tracing.tracer import TRACER
 
 RENDER_FIELD_KEY = "render"
 
@@ -40,9 +41,22 @@ class TemplateRenderer[ParamsT: BaseModel = StrictBaseModel](Injectable[ParamsT]
             return bool(value)
         return True
 
+    def is_template(self, value: str) -> bool:  # noqa: ARG002 - renderers without a cheap check render everything
+        """Whether rendering ``value`` can produce anything but ``value`` itself; static strings are not rendered."""
+        return True
+
+    def needs_rendering(self, obj: Any) -> bool:
+        if isinstance(obj, str):
+            return self.is_template(obj)
+        if isinstance(obj, list):
+            return any(self.needs_rendering(i) for i in obj)
+        if isinstance(obj, dict):
+            return any(self.needs_rendering(v) for v in obj.values())
+        return False
+
     async def render(self, obj: Any, scope: dict[str, Any]) -> Any:
         if isinstance(obj, str):
-            return await self._render(obj, scope)
+            return await self._render(obj, scope) if self.is_template(obj) else obj
         if isinstance(obj, list):
             return [await self.render(i, scope) for i in obj]
         if isinstance(obj, dict):
@@ -50,19 +64,31 @@ class TemplateRenderer[ParamsT: BaseModel = StrictBaseModel](Injectable[ParamsT]
         return obj
 
     async def render_to_model[T](
-        self, to_model: type[BaseModel], from_raw_dict: dict[str, Any], with_scope: dict[str, Any]
+        self,
+        to_model: type[BaseModel],
+        from_raw_dict: dict[str, Any],
+        with_scope: dict[str, Any],
+        templated_fields: frozenset[str] | None = None,
     ) -> T:
+        """Render the renderable fields of ``from_raw_dict`` and validate the result as ``to_model``.
+
+        ``templated_fields``, when known up front, names the fields that hold templates; the
+        others are validated as given without being checked for templates.
+        """
         self._logger.debug(f"Rendering to model {to_model.__name__} with scope keys: {list(with_scope.keys())}")
-        out = dict(from_raw_dict)
-        for name, field in to_model.model_fields.items():
-            self._logger.debug(f"Checking field {name} should render: {self._should_render_field(field)}")
-            if name in out and self._should_render_field(field):
-                self._logger.debug(f"Rendering field {name}")
-                out[name] = await self.render(out[name], with_scope)
-        try:
-            return cast(T, to_model.model_validate(out))
-        except ValidationError as e:
-            raise TemplateRenderError("Failed to render template to model") from e
+        with TRACER.span("template.render", model=to_model.__name__):
+            out = dict(from_raw_dict)
+            for name, field in to_model.model_fields.items():
+                if templated_fields is not None and name not in templated_fields:
+                    continue
+                self._logger.debug(f"Checking field {name} should render: {self._should_render_field(field)}")
+                if name in out and self._should_render_field(field):
+                    self._logger.debug(f"Rendering field {name}")
+                    out[name] = await self.render(out[name], with_scope)
+            try:
+                return cast(T, to_model.model_validate(out))
+            except ValidationError as e:
+                raise TemplateRenderError("Failed to render template to model") from e
 
     @abstractmethod
     async def _render(self, template_str: str, scope: dict[str, Any]) -> Any:
@@ -1,12 +1,47 @@
+import hashlib
 from typing import Any
 
 from open_ticket_ai.core.injectables.injectable import Injectable
+from open_ticket_ai.core.metrics.instrumentation import instrument_methods
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
 from open_ticket_ai.core.ticket_system_integration.unified_models import (
+    TicketRevision,
     TicketSearchCriteria,
     UnifiedNote,
     UnifiedTicket,
 )
 
+_CALLS = METRICS.counter(
+    "otai_ticket_system_calls_total", "Ticket system calls by outcome.", ("service", "operation", "outcome")
+)
+_DURATION = METRICS.histogram(
+    "otai_ticket_system_call_duration_seconds", "Duration of ticket system calls.", ("service", "operation")
+)
+_TICKETS_FETCHED = METRICS.counter(
+    "otai_tickets_fetched_total", "Tickets returned by ticket system searches and lookups.", ("service",)
+)
+_OPERATIONS = (
+    "create_ticket",
+    "update_ticket",
+    "find_tickets",
+    "find_first_ticket",
+    "get_ticket",
+    "get_ticket_revision",
+    "add_note",
+)
+
+
+def _count_fetched_tickets(service: Any, operation: str, result: Any) -> None:
+    if operation == "find_tickets":
+        fetched = len(result)
+    elif operation == "get_ticket_revision":
+        fetched = int(result.ticket is not None)
+    elif operation in ("find_first_ticket", "get_ticket"):
+        fetched = int(result is not None)
+    else:
+        return
+    _TICKETS_FETCHED.labels(service.injectable_id).inc(fetched)
+
 
 class TicketSystemService(Injectable):
     """Base contract for ticket system integrations.
@@ -21,8 +56,14 @@ class TicketSystemService(Injectable):
 
     Adapters are responsible for translating between their native models and the
     unified representations exposed here.
+
+    Calls to the methods below are counted and timed automatically for every adapter.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls, _OPERATIONS, _CALLS, _DURATION, _count_fetched_tickets, span_prefix="ticket_system")
+
     async def create_ticket(
         self,
         ticket: UnifiedTicket | None = None,
@@ -58,6 +99,25 @@ class TicketSystemService(Injectable):
     ) -> UnifiedTicket | None:  # pragma: no cover - interface contract
         raise NotImplementedError("Ticket system adapters must implement 'get_ticket'.")
 
+    async def get_ticket_revision(
+        self,
+        ticket_id: str,
+        known_version: str | None = None,
+    ) -> TicketRevision:
+        """Fetch a ticket unless ``known_version`` is still current.
+
+        Adapters whose backend supports conditional requests override this to avoid
+        transferring unchanged tickets. The default fetches the full ticket and uses a hash of
+        its content as version, so callers still learn when it did not change.
+        """
+        ticket = await self.get_ticket(ticket_id)
+        if ticket is None:
+            return TicketRevision()
+        version = hashlib.sha256(ticket.model_dump_json().encode()).hexdigest()[:32]
+        if version == known_version:
+            return TicketRevision(version=version, modified=False)
+        return TicketRevision(ticket=ticket, version=version)
+
     async def add_note(
         self,
         ticket_id: str,
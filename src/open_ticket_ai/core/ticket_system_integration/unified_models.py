@@ -80,3 +80,16 @@ class TicketSearchCriteria(StrictBaseModel):
     offset: int = Field(
         default=0, description="Number of tickets to skip before returning results for pagination and page navigation."
     )
+
+
+class TicketRevision(StrictBaseModel):
+    ticket: UnifiedTicket | None = Field(
+        default=None, description="Ticket as returned by the ticket system, or None if unchanged or not found."
+    )
+    version: str | None = Field(
+        default=None,
+        description="Opaque version marker (e.g. an HTTP ETag) that can be sent back to skip unchanged tickets.",
+    )
+    modified: bool = Field(
+        default=True, description="False when the ticket system confirmed that the known version is still current."
+    )
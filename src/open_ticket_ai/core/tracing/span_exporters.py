@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import abc
+import json
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from open_ticket_ai.core.config.config_models import TracingConfig
+from open_ticket_ai.core.tracing.tracer import Span
+
+
+class SpanExporter(abc.ABC):
+    @abc.abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Receive all spans of one finished trace, children before their parents."""
+
+    def shutdown(self) -> None:  # noqa: B027 - optional hook, exporters without buffers need nothing
+        """Flush and release resources; no spans are exported afterwards."""
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Appends one JSON object per span to ``path``."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._file = path.open("a", encoding="utf-8")
+
+    def export(self, spans: Sequence[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self._lock:
+            self._file.write(lines)
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+    """Replays finished traces into an OpenTelemetry tracer provider.
+
+    Uses the global tracer provider unless one is passed, so OTLP or any other OpenTelemetry
+    exporter is configured the usual OpenTelemetry way. Needs ``opentelemetry-sdk`` installed.
+    """
+
+    def __init__(self, tracer_provider: Any = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "The OpenTelemetry span exporter needs the opentelemetry-sdk package"
+            ) from e
+        self._trace = trace
+        self._provider = tracer_provider or trace.get_tracer_provider()
+        self._tracer = self._provider.get_tracer("open_ticket_ai")
+
+    def export(self, spans: Sequence[Span]) -> None:
+        started: dict[str, Any] = {}
+        for span in sorted(spans, key=lambda s: s.start_time_ns):
+            parent = started.get(span.parent_id) if span.parent_id else None
+            context = self._trace.set_span_in_context(parent) if parent is not None else None
+            started[span.span_id] = self._tracer.start_span(
+                span.name, context=context, attributes=_otel_attributes(span.attributes), start_time=span.start_time_ns
+            )
+        for span in spans:
+            otel_span = started[span.span_id]
+            if span.status == "error":
+                otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+            otel_span.end(end_time=span.end_time_ns)
+
+    def shutdown(self) -> None:
+        shutdown = getattr(self._provider, "shutdown", None)
+        if callable(shutdown):
+            shutdown()
+
+
+def create_span_exporter(config: TracingConfig) -> SpanExporter:
+    if config.exporter == "opentelemetry":
+        return OpenTelemetrySpanExporter()
+    return JsonLinesSpanExporter(Path(config.file_path))
+
+
+def _otel_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
+    # OpenTelemetry only accepts primitive attribute values.
+    return {
+        key: value if isinstance(value, str | bool | int | float) else str(value) for key, value in attributes.items()
+    }
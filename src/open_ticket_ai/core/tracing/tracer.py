@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import random
+import secrets
+import time
+from collections.abc import Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from open_ticket_ai.core.tracing.span_exporters import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+# Finished spans of a trace whose root stays open, like a long running runner, are exported in
+# chunks of this size instead of being held until the root ends.
+MAX_BUFFERED_SPANS = 1000
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time_ns: int
+    end_time_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: Literal["ok", "error"] = "ok"
+    error: str | None = None
+
+    @property
+    def is_recording(self) -> bool:
+        return True
+
+    @property
+    def duration_seconds(self) -> float | None:
+        return None if self.end_time_ns is None else (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration_seconds": self.duration_seconds,
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class NonRecordingSpan:
+    """Stand-in for spans of unsampled traces and of a disabled tracer; attributes are discarded."""
+
+    __slots__ = ()
+
+    @property
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+NON_RECORDING_SPAN = NonRecordingSpan()
+
+
+class _Trace:
+    __slots__ = ("open_spans", "spans")
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self.open_spans = 0
+
+
+_UNSAMPLED = object()
+_current: ContextVar[tuple[_Trace, Span] | object | None] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Records nested spans and hands every finished trace to the configured exporter.
+
+    The sampling decision is made once per trace, at its root span: spans of a trace that is not
+    sampled, and all spans while no exporter is configured, cost a context variable lookup.
+    """
+
+    def __init__(self) -> None:
+        self._exporter: SpanExporter | None = None
+        self._sample_rate = 1.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._exporter is not None
+
+    def configure(self, exporter: SpanExporter | None, sample_rate: float = 1.0) -> None:
+        self._exporter = exporter
+        self._sample_rate = sample_rate
+
+    def create_task[T](self, coro: Coroutine[Any, Any, T], *, name: str | None = None) -> asyncio.Task[T]:
+        """Run ``coro`` as a task outside the current trace, e.g. a heartbeat of a long running span.
+
+        Tasks inherit the context of their creator, so without this every span of a background
+        loop would be added to the trace of the span that started it.
+        """
+        context = contextvars.copy_context()
+        context.run(_current.set, None)
+        return asyncio.create_task(coro, name=name, context=context)
+
+    def shutdown(self) -> None:
+        exporter, self._exporter = self._exporter, None
+        if exporter is not None:
+            exporter.shutdown()
+
+    @contextmanager
+    def span(self, name: str, *, new_trace: bool = False, **attributes: Any) -> Iterator[Span | NonRecordingSpan]:
+        """Open a span as child of the current one; ``new_trace`` starts a separate trace instead.
+
+        An exception leaving the span marks it as failed and is re-raised.
+        """
+        if self._exporter is None:
+            yield NON_RECORDING_SPAN
+            return
+        current = None if new_trace else _current.get()
+        if current is _UNSAMPLED or (current is None and random.random() >= self._sample_rate):  # noqa: S311
+            token = _current.set(_UNSAMPLED)
+            try:
+                yield NON_RECORDING_SPAN
+            finally:
+                _current.reset(token)
+            return
+
+        if isinstance(current, tuple):
+            trace, parent = current
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        else:
+            trace, trace_id, parent_id = _Trace(), secrets.token_hex(16), None
+        span = Span(name, trace_id, secrets.token_hex(8), parent_id, time.time_ns(), attributes=attributes)
+        trace.open_spans += 1
+        token = _current.set((trace, span))
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current.reset(token)
+            span.end_time_ns = time.time_ns()
+            trace.spans.append(span)
+            trace.open_spans -= 1
+            if trace.open_spans == 0 or len(trace.spans) >= MAX_BUFFERED_SPANS:
+                spans, trace.spans = trace.spans, []
+                self._export(spans)
+
+    def _export(self, spans: list[Span]) -> None:
+        if self._exporter is None:
+            return
+        try:
+            self._exporter.export(spans)
+        except Exception:
+            # Tracing must never break the traced code.
+            logger.exception("Failed to export %d spans", len(spans))
+
+
+TRACER = Tracer()
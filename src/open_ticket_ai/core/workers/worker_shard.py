@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import zlib
+from contextvars import ContextVar
+
+from pydantic import Field
+
+from open_ticket_ai.core.base_model import StrictBaseModel
+
+
+class WorkerShard(StrictBaseModel):
+    """The part of the tickets a worker process is responsible for, chosen by a stable hash of a key."""
+
+    index: int = Field(default=0, ge=0, description="Number of this worker, from 0.")
+    count: int = Field(default=1, ge=1, description="Number of workers sharing the tickets.")
+
+    def owns(self, key: str | None) -> bool:
+        """Whether this worker handles ``key``; keys missing a value belong to the first worker."""
+        if self.count == 1:
+            return True
+        if key is None:
+            return self.index == 0
+        # crc32 rather than hash(), which is salted per interpreter unless PYTHONHASHSEED is set.
+        return zlib.crc32(key.encode()) % self.count == self.index
+
+
+# Set by the supervisor in each forked worker before its event loop starts, so every task sees it.
+_current_shard: ContextVar[WorkerShard | None] = ContextVar("otai_worker_shard", default=None)
+_ALL_TICKETS = WorkerShard()
+
+
+def current_shard() -> WorkerShard:
+    """The shard of this process; all tickets unless it was started as one of several workers."""
+    return _current_shard.get() or _ALL_TICKETS
+
+
+def set_current_shard(shard: WorkerShard) -> None:
+    _current_shard.set(shard)
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from injector import Injector
+
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.dependency_injection.container import AppModule
+from open_ticket_ai.core.logging.logging_iface import AppLogger, LoggerFactory
+from open_ticket_ai.core.metrics.metrics_aggregation import MetricsAggregator
+from open_ticket_ai.core.metrics.metrics_exporter import PROMETHEUS_CONTENT_TYPE, MetricsExporter
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
+from open_ticket_ai.core.workers.worker_shard import WorkerShard, set_current_shard
+
+type WorkerMain = Callable[[AppConfig], Awaitable[None]]
+
+# Workers dump their metrics at least this often, so the sums served by the supervisor stay fresh.
+_WORKER_METRICS_INTERVAL = timedelta(seconds=5)
+# Added to the drain and stop timeouts before workers that ignore SIGTERM are killed.
+_KILL_GRACE = timedelta(seconds=5)
+_POLL_SECONDS = 0.2
+
+_RESTARTS = METRICS.counter(
+    "otai_worker_restarts_total", "Worker processes restarted after they exited unexpectedly.", ("worker",)
+)
+_RUNNING = METRICS.gauge("otai_workers_running", "Worker processes currently running.")
+
+
+@dataclass(slots=True)
+class _Worker:
+    shard: WorkerShard
+    pid: int | None = None
+    started_at: float = 0.0
+    restart_at: float | None = None
+    quick_crashes: int = 0
+
+
+class WorkerSupervisor:
+    """Runs the orchestrator in several forked worker processes and restarts workers that crash.
+
+    The supervisor builds the app once and calls the ``preload`` hook of each service, so models
+    loaded there are shared copy-on-write by the workers forked afterwards. Every worker runs
+    the whole orchestrator with its own ``WorkerShard``; ``FetchTicketsPipe`` only keeps the
+    fetched tickets of the worker's shard, while work queue runners need no sharding because
+    leases are exclusive.
+
+    Workers write their metrics to files that the supervisor sums up and exposes as configured
+    in ``infrastructure.metrics``. Worker HTTP endpoints for metrics and profiling are turned off
+    since they would all bind the same port; receive webhooks in a single process and hand the
+    tickets over through a work queue.
+    """
+
+    def __init__(self, app_config: AppConfig, worker_main: WorkerMain, count: int | None = None) -> None:
+        infrastructure = app_config.open_ticket_ai.infrastructure
+        # The supervisor logs without a listener thread, which would not survive the forks.
+        logging_config = infrastructure.logging.model_copy(update={"use_queue": False})
+        self._app_config = _with_infrastructure(app_config, logging=logging_config)
+        self._worker_logging = infrastructure.logging
+        self._settings = infrastructure.workers
+        self._count = count or self._settings.count
+        self._worker_main = worker_main
+        self._workers = [_Worker(WorkerShard(index=index, count=self._count)) for index in range(self._count)]
+        self._run_dir = Path(tempfile.mkdtemp(prefix="otai-workers-"))
+        self._metrics = MetricsAggregator(self._current_metrics)
+        self._server: HTTPServer | None = None
+        self._shutdown_requested = False
+        self._logger: AppLogger | None = None
+
+    @property
+    def metrics(self) -> MetricsAggregator:
+        return self._metrics
+
+    def run(self) -> None:
+        """Start the workers and supervise them until SIGTERM or SIGINT, or until all exited on their own."""
+        injector = Injector([AppModule(self._app_config)])
+        logger_factory = injector.get(LoggerFactory)
+        self._logger = logger = logger_factory.create(self.__class__.__name__)
+        metrics_config = self._app_config.open_ticket_ai.infrastructure.metrics
+        exporter = MetricsExporter(metrics_config, logger, self._metrics)
+        handled = {sig: signal.signal(sig, self._request_shutdown) for sig in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            if self._settings.preload:
+                self._preload(injector.get(PipeFactory))
+            if metrics_config.http_enabled:
+                self._server = _metrics_server(metrics_config.host, metrics_config.port, self._metrics)
+                logger.info(f"📈 Serving the metrics of all workers on port {self._server.server_port}")
+            for worker in self._workers:
+                if not self._shutdown_requested:
+                    self._start(worker)
+            self._supervise(exporter)
+        finally:
+            self._stop_workers()
+            for sig, previous in handled.items():
+                signal.signal(sig, previous)
+            if self._server is not None:
+                self._server.server_close()
+                self._server = None
+            if metrics_config.file_path:
+                exporter.write_file(Path(metrics_config.file_path))
+            shutil.rmtree(self._run_dir, ignore_errors=True)
+            logger.info("✅ All workers stopped")
+            logger_factory.shutdown()
+
+    def _preload(self, pipe_factory: PipeFactory) -> None:
+        started = time.perf_counter()
+        preloaded = asyncio.run(pipe_factory.preload_services())
+        self._log().info(f"📦 Preloaded services {preloaded} in {time.perf_counter() - started:.1f}s before forking")
+
+    def _supervise(self, exporter: MetricsExporter) -> None:
+        metrics_config = self._app_config.open_ticket_ai.infrastructure.metrics
+        next_dump = time.monotonic() + metrics_config.file_interval.total_seconds()
+        while not self._shutdown_requested and any(
+            worker.pid is not None or worker.restart_at is not None for worker in self._workers
+        ):
+            self._wait()
+            self._reap()
+            now = time.monotonic()
+            for worker in self._workers:
+                if worker.restart_at is not None and worker.restart_at <= now and not self._shutdown_requested:
+                    _RESTARTS.labels(str(worker.shard.index)).inc()
+                    self._start(worker)
+            if metrics_config.file_path and now >= next_dump:
+                next_dump = now + metrics_config.file_interval.total_seconds()
+                try:
+                    exporter.write_file(Path(metrics_config.file_path))
+                except OSError:
+                    self._log().exception("❌ Failed to write metrics to %s", metrics_config.file_path)
+
+    def _wait(self) -> None:
+        if self._server is None:
+            time.sleep(_POLL_SECONDS)
+            return
+        self._server.timeout = _POLL_SECONDS
+        self._server.handle_request()
+
+    def _start(self, worker: _Worker) -> None:
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker(worker.shard)
+        worker.pid, worker.started_at, worker.restart_at = pid, time.monotonic(), None
+        _RUNNING.labels().set(sum(w.pid is not None for w in self._workers))
+        self._log().info(f"👷 Started worker {worker.shard.index} of {self._count} (pid {pid})")
+
+    def _run_worker(self, shard: WorkerShard) -> None:
+        """Body of a forked worker; never returns."""
+        logger = self._log()
+        exit_code = 0
+        try:
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, signal.SIG_DFL)
+            if self._server is not None:
+                self._server.socket.close()
+            set_current_shard(shard)
+            METRICS.reset()
+            _share_cores(shard.count)
+            asyncio.run(self._worker_main(self._worker_config(shard)))
+        except Exception:
+            logger.exception(f"❌ Worker {shard.index} crashed")
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)
+
+    def _worker_config(self, shard: WorkerShard) -> AppConfig:
+        infrastructure = self._app_config.open_ticket_ai.infrastructure
+        metrics = infrastructure.metrics.model_copy(
+            update={
+                "http_enabled": False,
+                "file_path": str(self._metrics_file(shard.index)),
+                "file_interval": min(infrastructure.metrics.file_interval, _WORKER_METRICS_INTERVAL),
+            }
+        )
+        profiling = infrastructure.profiling.model_copy(update={"http_enabled": False})
+        return _with_infrastructure(
+            self._app_config,
+            metrics=metrics,
+            profiling=profiling,
+            logging=self._worker_logging,
+            workers=self._settings.model_copy(update={"count": 1}),
+        )
+
+    def _reap(self) -> None:
+        for worker in self._workers:
+            if worker.pid is None:
+                continue
+            try:
+                pid, status = os.waitpid(worker.pid, os.WNOHANG)
+            except ChildProcessError:
+                pid, status = worker.pid, 0
+            if pid == 0:
+                continue
+            self._on_exit(worker, os.waitstatus_to_exitcode(status))
+
+    def _on_exit(self, worker: _Worker, exit_code: int) -> None:
+        pid, worker.pid = worker.pid, None
+        _RUNNING.labels().set(sum(w.pid is not None for w in self._workers))
+        metrics_file = self._metrics_file(worker.shard.index)
+        with contextlib.suppress(FileNotFoundError):
+            self._metrics.retire(metrics_file.read_text())
+            metrics_file.unlink()
+        if exit_code == 0 or self._shutdown_requested:
+            self._log().info(f"Worker {worker.shard.index} (pid {pid}) exited with {exit_code}")
+            return
+        now = time.monotonic()
+        if now - worker.started_at >= self._settings.max_restart_delay.total_seconds():
+            worker.quick_crashes = 0
+        delay = min(
+            self._settings.restart_delay.total_seconds() * 2**worker.quick_crashes,
+            self._settings.max_restart_delay.total_seconds(),
+        )
+        worker.quick_crashes += 1
+        worker.restart_at = now + delay
+        self._log().warning(
+            f"⚠️  Worker {worker.shard.index} (pid {pid}) exited with {exit_code}; restarting in {delay:.1f}s"
+        )
+
+    def _stop_workers(self) -> None:
+        self._shutdown_requested = True
+        for worker in self._workers:
+            worker.restart_at = None
+            if worker.pid is not None:
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(worker.pid, signal.SIGTERM)
+        shutdown = self._app_config.open_ticket_ai.infrastructure.shutdown
+        deadline = time.monotonic() + (shutdown.drain_timeout + shutdown.stop_timeout + _KILL_GRACE).total_seconds()
+        while any(worker.pid is not None for worker in self._workers) and time.monotonic() < deadline:
+            time.sleep(_POLL_SECONDS)
+            self._reap()
+        for worker in self._workers:
+            if worker.pid is not None:
+                self._log().warning(f"Killing worker {worker.shard.index} (pid {worker.pid}) after the drain timeout")
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(worker.pid, signal.SIGKILL)
+                with contextlib.suppress(ChildProcessError):
+                    os.waitpid(worker.pid, 0)
+                self._on_exit(worker, -signal.SIGKILL)
+
+    def _request_shutdown(self, signum: int, _frame: FrameType | None) -> None:
+        if not self._shutdown_requested:
+            self._log().info(f"🛑 {signal.Signals(signum).name} received, stopping workers...")
+        self._shutdown_requested = True
+
+    def _current_metrics(self) -> list[str]:
+        texts = [METRICS.render()]
+        for worker in self._workers:
+            with contextlib.suppress(FileNotFoundError):
+                texts.append(self._metrics_file(worker.shard.index).read_text())
+        return texts
+
+    def _metrics_file(self, index: int) -> Path:
+        return self._run_dir / f"worker-{index}.prom"
+
+    def _log(self) -> AppLogger:
+        if self._logger is None:
+            raise RuntimeError("The supervisor is not running.")
+        return self._logger
+
+
+def _with_infrastructure(app_config: AppConfig, **updates: Any) -> AppConfig:
+    config = app_config.open_ticket_ai
+    infrastructure = config.infrastructure.model_copy(update=updates)
+    return app_config.model_copy(
+        update={"open_ticket_ai": config.model_copy(update={"infrastructure": infrastructure})}
+    )
+
+
+def _share_cores(workers: int) -> None:
+    # Torch sizes its thread pool for all cores; with several workers that oversubscribes the CPU.
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // workers))
+
+
+def _metrics_server(host: str, port: int, metrics: MetricsAggregator) -> HTTPServer:
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            body = metrics.render().encode()
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_: Any) -> None:
+            pass
+
+    return HTTPServer((host, port), MetricsHandler)
@@ -1,15 +1,31 @@
 import asyncio
+from collections.abc import Iterable
+from pathlib import Path
 
 from injector import Injector
 
 from open_ticket_ai.app import OpenTicketAIApp
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.config_snapshot import load_app_config
 from open_ticket_ai.core.dependency_injection.container import AppModule
+from open_ticket_ai.core.logging.logging_iface import LoggerFactory
+from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
+from open_ticket_ai.core.pipes.pipe_models import CompiledPipe
 
 
-async def run() -> None:
-    container = Injector([AppModule()])
+async def run(snapshot_path: Path | None = None) -> None:
+    app_config, compiled_pipes = load_app_config(snapshot_path)
+    await run_app_config(app_config, compiled_pipes)
+
+
+async def run_app_config(app_config: AppConfig, compiled_pipes: Iterable[CompiledPipe] = ()) -> None:
+    container = Injector([AppModule(app_config)])
+    container.get(PipeFactory).use_compiled_pipes(compiled_pipes)
     app = container.get(OpenTicketAIApp)
-    await app.run()
+    try:
+        await app.run()
+    finally:
+        container.get(LoggerFactory).shutdown()
 
 
 if __name__ == "__main__":
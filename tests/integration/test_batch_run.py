@@ -0,0 +1,200 @@
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from benchmarks.e2e_benchmark import BenchmarkSettings, load_benchmark_config, with_stand_ins
+from benchmarks.stand_ins import FAKE_TICKET_SYSTEM, STAND_INS
+from open_ticket_ai.core.batch.batch_config import (
+    BATCH_COMPONENTS,
+    BATCHING_CLASSIFIER,
+    RECORDING_TICKET_SYSTEM,
+    find_batch_pipe,
+    find_ticket_step,
+    prepare_batch_config,
+)
+from open_ticket_ai.core.batch.batch_job import BatchJobSettings, run_batch_job
+from open_ticket_ai.core.batch.batch_runner import BatchCheckpoint, CheckpointMismatchError
+from open_ticket_ai.core.batch.ticket_sources import JsonLinesTicketSource
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.config_models import OpenTicketAIConfig
+from open_ticket_ai.core.dependency_injection.container import AppModule
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig
+from open_ticket_ai.core.ticket_system_integration.unified_models import UnifiedEntity, UnifiedTicket
+
+DEPLOYMENT_CONFIG = Path(__file__).parents[2] / "deployment" / "config.yml"
+TICKETS = 5
+
+STAND_IN_SETTINGS = BenchmarkSettings(
+    tickets=TICKETS, latency=timedelta(0), jitter=timedelta(0), inference_time=timedelta(0), body_size=50
+)
+
+
+@pytest.fixture
+def app_config() -> AppConfig:
+    config = with_stand_ins(load_benchmark_config(DEPLOYMENT_CONFIG), STAND_IN_SETTINGS)
+    return AppConfig(open_ticket_ai=config)
+
+
+@pytest.fixture
+def export(tmp_path: Path) -> Path:
+    path = tmp_path / "export.jsonl"
+    tickets = [
+        UnifiedTicket(id=str(number), subject=f"Printer {number}", body="It is broken.", queue=UnifiedEntity(name="In"))
+        for number in range(TICKETS)
+    ]
+    path.write_text("".join(ticket.model_dump_json() + "\n" for ticket in tickets))
+    return path
+
+
+def _records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_batch_config_wraps_the_injected_services_of_the_batch_pipe(app_config: AppConfig) -> None:
+    config = app_config.open_ticket_ai
+    pipe = find_batch_pipe(config)
+
+    registry = AppModule(app_config, extra_components={**BATCH_COMPONENTS, **STAND_INS}).component_registry
+
+    prepared, prepared_pipe = prepare_batch_config(config, pipe, registry, apply_writes=False, inference_batch_size=8)
+
+    assert find_ticket_step(pipe).id == "ticket_fetcher"
+    assert prepared.services["otobo_znuny_batch_writes"].use == RECORDING_TICKET_SYSTEM
+    assert prepared.services["otobo_znuny_batch_writes"].injects == {"ticket_system": "otobo_znuny"}
+    assert prepared.services["hf_local_batched"].use == BATCHING_CLASSIFIER
+    assert prepared.services["hf_local_batched"].params == {"max_batch_size": 8}
+    injects = {step["id"]: step.get("injects") for step in prepared_pipe.params["steps"]}
+    assert injects["queue_update_ticket"] == {"ticket_system": "otobo_znuny_batch_writes"}
+    assert injects["priority_classify"] == {"classification_service": "hf_local_batched"}
+
+
+def test_batch_config_wraps_ticket_systems_by_type_whatever_they_are_injected_as(app_config: AppConfig) -> None:
+    registry = AppModule(app_config, extra_components={**BATCH_COMPONENTS, **STAND_INS}).component_registry
+    config = OpenTicketAIConfig.model_validate(
+        {
+            "services": {
+                "helpdesk": {"use": FAKE_TICKET_SYSTEM},
+                "limited": {"use": "base:RateLimitedService", "injects": {"service": "helpdesk"}},
+            }
+        }
+    )
+    pipe = PipeConfig.model_validate(
+        {
+            "id": "batch",
+            "use": "base:CompositePipe",
+            "params": {
+                "steps": [
+                    {"id": "direct", "use": "base:AddNotePipe", "injects": {"backend": "helpdesk"}},
+                    {"id": "proxied", "use": "base:AddNotePipe", "injects": {"ticket_system": "limited"}},
+                ]
+            },
+        }
+    )
+
+    prepared, prepared_pipe = prepare_batch_config(config, pipe, registry, apply_writes=False, inference_batch_size=1)
+
+    assert prepared.services["helpdesk_batch_writes"].injects == {"ticket_system": "helpdesk"}
+    assert prepared.services["limited"].injects == {"service": "helpdesk_batch_writes"}
+    injects = {step["id"]: step["injects"] for step in prepared_pipe.params["steps"]}
+    assert injects == {"direct": {"backend": "helpdesk_batch_writes"}, "proxied": {"ticket_system": "limited"}}
+
+
+async def test_dry_run_writes_step_results_and_recorded_writes_per_ticket(
+    app_config: AppConfig, export: Path, tmp_path: Path
+) -> None:
+    output = tmp_path / "results.jsonl"
+    progress = []
+
+    summary = await run_batch_job(
+        app_config,
+        BatchJobSettings(output=output, input=export, concurrency=3, log_level="WARNING"),
+        on_progress=progress.append,
+        extra_components=STAND_INS,
+    )
+
+    assert (summary.processed, summary.failed, summary.end_offset) == (TICKETS, 0, TICKETS)
+    records = sorted(_records(output), key=lambda record: record["offset"])
+    assert [record["ticket_id"] for record in records] == [str(number) for number in range(TICKETS)]
+    assert all(record["succeeded"] for record in records)
+    assert "ticket_fetcher" not in records[0]["results"]
+    assert records[0]["results"]["queue_classify"]["data"]["label"]
+    assert [write["operation"] for write in records[0]["writes"]] == [
+        "update_ticket",
+        "add_note",
+        "update_ticket",
+        "add_note",
+    ]
+    assert not any(write["applied"] for record in records for write in record["writes"])
+    assert progress[-1].processed == TICKETS
+    assert BatchCheckpoint.load(tmp_path / "results.jsonl.checkpoint.json").offset == TICKETS
+
+
+async def test_a_failing_worker_ends_the_run_while_the_reader_waits_on_a_full_queue(
+    app_config: AppConfig, export: Path, tmp_path: Path
+) -> None:
+    def on_progress(_progress: object) -> None:
+        raise RuntimeError("progress display crashed")
+
+    with pytest.raises(ExceptionGroup) as raised:
+        await run_batch_job(
+            app_config,
+            BatchJobSettings(output=tmp_path / "results.jsonl", input=export, concurrency=1, log_level="WARNING"),
+            on_progress=on_progress,
+            extra_components=STAND_INS,
+        )
+
+    assert raised.group_contains(RuntimeError, match="progress display crashed")
+
+
+async def test_resume_skips_tickets_already_in_the_output(app_config: AppConfig, export: Path, tmp_path: Path) -> None:
+    output = tmp_path / "results.jsonl"
+    source = JsonLinesTicketSource(export)
+    BatchCheckpoint(
+        source=source.description, pipe_id="ticket-routing", offset=2, processed=3, updated_at=datetime.now(UTC)
+    ).save(tmp_path / "results.jsonl.checkpoint.json")
+    output.write_text(
+        "".join(json.dumps({"offset": offset, "succeeded": True}) + "\n" for offset in (0, 1, 3)) + '{"offset": 4'
+    )
+
+    summary = await run_batch_job(
+        app_config,
+        BatchJobSettings(output=output, input=export, resume=True, log_level="WARNING"),
+        extra_components=STAND_INS,
+    )
+
+    assert (summary.start_offset, summary.processed, summary.resumed, summary.end_offset) == (2, 2, 1, TICKETS)
+    offsets = [json.loads(line)["offset"] for line in output.read_text().splitlines() if line.endswith("}")]
+    assert sorted(offsets) == [0, 1, 2, 3, 4]
+    assert BatchCheckpoint.load(tmp_path / "results.jsonl.checkpoint.json").processed == 3 + 2
+
+
+async def test_resume_refuses_a_checkpoint_of_another_source(
+    app_config: AppConfig, export: Path, tmp_path: Path
+) -> None:
+    BatchCheckpoint(source="csv:elsewhere", pipe_id="ticket-routing", offset=2, updated_at=datetime.now(UTC)).save(
+        tmp_path / "results.jsonl.checkpoint.json"
+    )
+
+    with pytest.raises(CheckpointMismatchError):
+        await run_batch_job(
+            app_config,
+            BatchJobSettings(output=tmp_path / "results.jsonl", input=export, resume=True, log_level="WARNING"),
+            extra_components=STAND_INS,
+        )
+
+
+async def test_without_input_the_fetch_step_search_is_paged(app_config: AppConfig, tmp_path: Path) -> None:
+    output = tmp_path / "results.jsonl"
+
+    summary = await run_batch_job(
+        app_config,
+        BatchJobSettings(output=output, page_size=2, apply_writes=True, log_level="WARNING"),
+        extra_components=STAND_INS,
+    )
+
+    assert summary.processed == TICKETS
+    records = _records(output)
+    assert len({record["ticket_id"] for record in records}) == TICKETS
+    assert all(write["applied"] for record in records for write in record["writes"])
@@ -0,0 +1,95 @@
+from datetime import timedelta
+from pathlib import Path
+
+from benchmarks.e2e_benchmark import (
+    BenchmarkSettings,
+    EndToEndBenchmark,
+    compare_results,
+    load_benchmark_config,
+    with_stand_ins,
+)
+from benchmarks.micro_benchmark import MicroBenchmark, exponent_regressions, scaling_exponent
+from benchmarks.scaling_plot import render_scaling_svg
+from benchmarks.stand_ins import FAKE_TICKET_SYSTEM, STUB_CLASSIFIER
+from open_ticket_ai.core.injectables.injectable_models import InjectableConfigBase
+
+DEPLOYMENT_CONFIG = Path(__file__).parents[2] / "deployment" / "config.yml"
+TICKETS = 5
+
+FAST = BenchmarkSettings(
+    tickets=TICKETS, latency=timedelta(0), jitter=timedelta(0), inference_time=timedelta(0), body_size=50
+)
+
+
+def test_stand_ins_replace_injected_ticket_system_and_classifier() -> None:
+    config = with_stand_ins(load_benchmark_config(DEPLOYMENT_CONFIG), FAST)
+
+    assert config.services["otobo_znuny"].use == FAKE_TICKET_SYSTEM
+    assert config.services["otobo_znuny"].params["queues"] == ["OpenTicketAI::Incoming"]
+    assert config.services["hf_local"].use == STUB_CLASSIFIER
+    assert config.services["jinja_default"].use == "base:JinjaRenderer"
+    assert config.infrastructure.logging.level == "WARNING"
+
+
+def test_stand_ins_keep_services_wrapping_a_ticket_system() -> None:
+    config = load_benchmark_config(DEPLOYMENT_CONFIG)
+    cache = InjectableConfigBase(use="base:CachingTicketSystemService", injects={"ticket_system": "otobo_znuny"})
+    config = config.model_copy(update={"services": {**config.services, "cache": cache}})
+
+    replaced = with_stand_ins(config, FAST)
+
+    assert replaced.services["cache"].use == "base:CachingTicketSystemService"
+    assert replaced.services["otobo_znuny"].use == FAKE_TICKET_SYSTEM
+
+
+async def test_benchmark_processes_every_ticket_of_the_deployment_config() -> None:
+    result = await EndToEndBenchmark(DEPLOYMENT_CONFIG, FAST).run()
+
+    assert result.name == "deployment-config"
+    assert result.tickets_processed == TICKETS
+    assert result.cycles == TICKETS + 1
+    assert result.tickets_per_second > 0
+    assert 0 < result.latency_seconds.p50 <= result.latency_seconds.p95 <= result.latency_seconds.p99
+    assert result.peak_rss_bytes > 0
+
+
+async def test_compare_flags_only_metrics_worse_than_the_tolerance() -> None:
+    baseline = await EndToEndBenchmark(DEPLOYMENT_CONFIG, FAST).run()
+    slower = baseline.model_copy(
+        update={"tickets_per_second": baseline.tickets_per_second * 0.5, "cpu_seconds": baseline.cpu_seconds * 1.05}
+    )
+
+    comparisons = {comparison.metric: comparison for comparison in compare_results(baseline, slower, tolerance=0.1)}
+
+    assert comparisons["tickets_per_second"].regressed
+    assert comparisons["tickets_per_second"].change == -0.5
+    assert not comparisons["cpu_seconds"].regressed
+    assert not comparisons["latency_seconds.p99"].regressed
+
+
+def test_scaling_exponent_tells_linear_from_quadratic_cost() -> None:
+    sizes = [5, 10, 50, 100, 200]
+
+    assert round(scaling_exponent([(size, 3.0 + 0 * size) for size in sizes]), 6) == 0
+    assert round(scaling_exponent([(size, 2e-6 * size) for size in sizes]), 6) == 1
+    assert round(scaling_exponent([(size, 2e-6 * size**2) for size in sizes]), 6) == 2
+
+
+async def test_micro_benchmark_sweeps_both_dimensions_and_plots_them() -> None:
+    benchmark = MicroBenchmark(steps=(5, 10), tickets=(1, 10), min_time=0.0, repeats=1)
+
+    result = await benchmark.run(only=("PipeResult.union", "PipeFactory.create_pipe"))
+
+    assert result.operations() == ["PipeFactory.create_pipe", "PipeResult.union"]
+    assert [(point.steps, point.tickets) for point in result.series("PipeResult.union", "steps")] == [(5, 10), (10, 10)]
+    assert [point.size for point in result.series("PipeResult.union", "tickets")] == [1, 10]
+    assert all(point.seconds_per_call > 0 and point.allocated_bytes > 0 for point in result.points)
+    assert set(result.exponents["PipeResult.union"]) == {"steps", "tickets"}
+    svg = render_scaling_svg(result)
+    assert svg.startswith("<svg")
+    assert svg.endswith("</svg>")
+    # One curve per operation in each of the four panels.
+    assert svg.count("<polyline") == 8
+
+    slower = result.model_copy(update={"exponents": {"PipeResult.union": {"steps": 2.0, "tickets": 0.0}}})
+    assert exponent_regressions(result, slower)[0].startswith("PipeResult.union by steps")
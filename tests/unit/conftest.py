@@ -233,6 +233,7 @@ def mock_injector() -> MagicMock:
 def mock_otai_config() -> MagicMock:
     mock = MagicMock(spec=OpenTicketAIConfig)
     mock.get_services_list.return_value = []
+    mock.infrastructure = InfrastructureConfig()
     return mock
 
 
@@ -0,0 +1,56 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from open_ticket_ai.core.batch.ticket_sources import (
+    CsvTicketSource,
+    JsonLinesTicketSource,
+    TicketSystemTicketSource,
+    ticket_source_for_file,
+)
+from open_ticket_ai.core.ticket_system_integration.ticket_system_service import TicketSystemService
+from open_ticket_ai.core.ticket_system_integration.unified_models import (
+    TicketSearchCriteria,
+    UnifiedEntity,
+    UnifiedTicket,
+)
+
+
+async def test_csv_source_maps_columns_and_starts_at_the_offset(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text(
+        'id,subject,body,queue,priority_id,ignored\n1,Printer,"Broken, again",Support,,x\n2,VPN,No access,,3,y\n'
+    )
+    source = ticket_source_for_file(path)
+
+    tickets = [item async for item in source.tickets(start=1)]
+
+    assert isinstance(source, CsvTicketSource)
+    assert source.count() == 2
+    assert tickets == [(1, UnifiedTicket(id="2", subject="VPN", body="No access", priority=UnifiedEntity(id="3")))]
+    first, _ = [ticket async for _, ticket in source.tickets()]
+    assert first.body == "Broken, again"
+    assert first.queue == UnifiedEntity(name="Support")
+
+
+async def test_json_lines_source_numbers_non_blank_lines(tmp_path):
+    path = tmp_path / "export.jsonl"
+    path.write_text('{"id": "a"}\n\n{"id": "b"}\n{"id": "c"}\n')
+    source = JsonLinesTicketSource(path)
+
+    tickets = [(offset, ticket.id) async for offset, ticket in source.tickets(start=1)]
+
+    assert tickets == [(1, "b"), (2, "c")]
+    assert source.count() == 3
+
+
+async def test_ticket_system_source_pages_from_the_start_offset():
+    ticket_system = MagicMock(spec=TicketSystemService)
+    ticket_system.injectable_id = "otobo"
+    pages = {3: [UnifiedTicket(id="3"), UnifiedTicket(id="4")], 5: [UnifiedTicket(id="5")]}
+    ticket_system.find_tickets = AsyncMock(side_effect=lambda criteria: pages[criteria.offset])
+    criteria = TicketSearchCriteria(queue=UnifiedEntity(name="Incoming"))
+    source = TicketSystemTicketSource(ticket_system, criteria, page_size=2)
+
+    tickets = [(offset, ticket.id) async for offset, ticket in source.tickets(start=3)]
+
+    assert tickets == [(3, "3"), (4, "4"), (5, "5")]
+    assert [call.args[0].limit for call in ticket_system.find_tickets.await_args_list] == [2, 2]
@@ -0,0 +1,94 @@
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from open_ticket_ai.core.claims.claim_store import ClaimStore
+from open_ticket_ai.core.claims.leader_election import LeaderElection
+from open_ticket_ai.core.injectables.injectable_models import InjectableConfig
+
+TTL = timedelta(seconds=30)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class InMemoryClaimStore(ClaimStore):
+    def __init__(self, *args: Any, clock: FakeClock, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._clock = clock
+        self.claims: dict[str, tuple[str, float]] = {}
+
+    async def claim(self, keys: Sequence[str], owner: str, ttl: timedelta) -> list[str]:
+        now = self._clock()
+        claimed = []
+        for key in keys:
+            holder, expires_at = self.claims.get(key, (owner, now))
+            if holder == owner or expires_at <= now:
+                self.claims[key] = (owner, now + ttl.total_seconds())
+                claimed.append(key)
+        return claimed
+
+    async def release(self, keys: Sequence[str], owner: str) -> int:
+        released = [key for key in keys if self.claims.get(key, ("",))[0] == owner]
+        for key in released:
+            del self.claims[key]
+        return len(released)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def make_election(logger_factory, clock):
+    store = InMemoryClaimStore(InjectableConfig(id="claims"), logger_factory, clock=clock)
+
+    def _make(owner: str) -> LeaderElection:
+        return LeaderElection(store, "reports", TTL, logger_factory.create("election"), owner=owner, clock=clock)
+
+    return _make
+
+
+async def test_only_one_process_leads(make_election) -> None:
+    first, second = make_election("replica-1"), make_election("replica-2")
+
+    assert await first.attempt()
+    assert not await second.attempt()
+    assert await first.attempt()
+
+
+async def test_leadership_moves_within_one_ttl_when_the_leader_dies(make_election, clock) -> None:
+    leader, follower = make_election("replica-1"), make_election("replica-2")
+    await leader.attempt()
+    clock.now += TTL.total_seconds() / 3
+    await leader.attempt()
+
+    # The follower retries every tenth of the ttl; the leader renews no more from here.
+    takeover = None
+    for _ in range(10):
+        clock.now += TTL.total_seconds() / 10
+        if await follower.attempt():
+            takeover = clock.now
+            break
+
+    assert takeover is not None
+    assert takeover - (1000.0 + TTL.total_seconds() / 3) <= TTL.total_seconds()
+    assert not leader.is_leader
+
+
+async def test_resigning_hands_over_at_once(make_election) -> None:
+    leader, follower = make_election("replica-1"), make_election("replica-2")
+    await leader.attempt()
+
+    await leader.resign()
+
+    assert not leader.is_leader
+    assert await follower.attempt()
@@ -0,0 +1,75 @@
+from open_ticket_ai.core.config.config_diff import diff_configs
+from open_ticket_ai.core.config.config_models import OpenTicketAIConfig
+
+
+def _config(services: dict | None = None, steps: list | None = None, **extra: object) -> OpenTicketAIConfig:
+    return OpenTicketAIConfig.model_validate(
+        {
+            "services": services or {},
+            "orchestrator": {
+                "id": "orchestrator",
+                "use": "base:SimpleSequentialOrchestrator",
+                "params": {"steps": steps or []},
+            },
+            **extra,
+        }
+    )
+
+
+def _step(step_id: str, value: str, injects: dict[str, str] | None = None) -> dict:
+    return {"id": step_id, "use": "base:ExpressionPipe", "params": {"expression": value}, "injects": injects or {}}
+
+
+SERVICES = {
+    "tickets": {"use": "zammad:ZammadTicketsystemService", "params": {"base_url": "http://a"}},
+    "cache": {"use": "base:CachingTicketSystemService", "injects": {"ticket_system": "tickets"}},
+    "renderer": {"use": "base:JinjaRenderer"},
+}
+
+
+def test_identical_configs_need_no_reload():
+    diff = diff_configs(_config(SERVICES, [_step("a", "1")]), _config(SERVICES, [_step("a", "1")]))
+
+    assert not diff.needs_reload
+    assert diff.restart_required == ()
+
+
+def test_changed_service_includes_services_and_pipes_injecting_it():
+    changed = {**SERVICES, "tickets": {**SERVICES["tickets"], "params": {"base_url": "http://b"}}}
+    steps = [_step("uses_cache", "1", {"tickets": "cache"}), _step("plain", "2")]
+
+    diff = diff_configs(_config(SERVICES, steps), _config(changed, steps))
+
+    assert diff.changed_services == {"tickets", "cache"}
+    assert diff.changed_pipes == ("uses_cache",)
+    assert not diff.orchestrator_changed
+
+
+def test_changed_step_marks_step_and_orchestrator():
+    diff = diff_configs(
+        _config(steps=[_step("a", "1"), _step("b", "2")]), _config(steps=[_step("a", "1"), _step("b", "3")])
+    )
+
+    assert diff.changed_pipes == ("b", "orchestrator")
+    assert diff.orchestrator_changed
+    assert diff.changed_services == frozenset()
+
+
+def test_added_and_removed_services_and_renamed_steps_are_changes():
+    old = _config({"renderer": SERVICES["renderer"]}, [_step("a", "1")])
+    new = _config({"tickets": SERVICES["tickets"]}, [_step("renamed", "1")])
+
+    diff = diff_configs(old, new)
+
+    assert diff.changed_services == {"renderer", "tickets"}
+    assert set(diff.changed_pipes) == {"a", "renamed", "orchestrator"}
+
+
+def test_plugins_and_infrastructure_require_restart():
+    old = _config()
+    new = _config(plugins=[{"name": "otai-zammad"}], infrastructure={"logging": {"level": "DEBUG"}})
+
+    diff = diff_configs(old, new)
+
+    assert diff.restart_required == ("plugins", "infrastructure")
+    assert not diff.needs_reload
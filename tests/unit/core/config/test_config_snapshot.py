@@ -0,0 +1,147 @@
+import json
+import os
+
+import pytest
+import yaml
+from injector import Injector
+
+from open_ticket_ai.core.config import config_snapshot
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.config_snapshot import (
+    compile_config_snapshot,
+    load_app_config,
+    load_config_snapshot,
+    write_config_snapshot,
+)
+from open_ticket_ai.core.config.errors import StaleConfigSnapshotError
+from open_ticket_ai.core.dependency_injection.container import AppModule
+from open_ticket_ai.core.template_rendering.template_renderer import TemplateRenderer
+
+CONFIG = {
+    "open_ticket_ai": {
+        "services": {"jinja_default": {"use": "base:JinjaRenderer"}},
+        "orchestrator": {
+            "id": "orchestrator",
+            "use": "base:SimpleSequentialOrchestrator",
+            "params": {
+                "steps": [
+                    {
+                        "id": "runner",
+                        "use": "base:SimpleSequentialRunner",
+                        "params": {
+                            "on": {"id": "trigger", "use": "base:IntervalTrigger", "params": {"interval": "PT1S"}},
+                            "run": {
+                                "id": "expr",
+                                "use": "base:ExpressionPipe",
+                                "params": {"expression": "{{ get_env('X') }}", "label": "static"},
+                            },
+                        },
+                    }
+                ]
+            },
+        },
+    }
+}
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    (tmp_path / "config.yml").write_text(yaml.safe_dump(CONFIG))
+    monkeypatch.chdir(tmp_path)
+    for key in list(os.environ):
+        if key.lower().startswith(("otai", "cfg", "open_ticket_ai")):
+            monkeypatch.delenv(key)
+    return tmp_path
+
+
+def _compile(path):
+    app_module = AppModule(AppConfig())
+    snapshot = compile_config_snapshot(app_module.app_config, Injector([app_module]).get(TemplateRenderer))
+    write_config_snapshot(snapshot, path)
+    return snapshot
+
+
+def test_snapshot_round_trips_config_and_pipe_tree(config_dir):
+    snapshot_path = config_dir / "config.snapshot.pickle"
+    compiled = _compile(snapshot_path)
+
+    loaded = load_config_snapshot(snapshot_path)
+
+    assert loaded.app_config == compiled.app_config
+    assert load_app_config(snapshot_path) == (compiled.app_config, compiled.pipes)
+    assert [pipe.config.id for pipe in loaded.pipes] == ["orchestrator", "runner", "trigger", "expr"]
+    templated = {pipe.config.id: pipe.templated_params for pipe in loaded.pipes}
+    assert templated["expr"] == frozenset({"expression"})
+    assert templated["trigger"] == frozenset()
+    assert templated["runner"] == frozenset({"run"})
+
+
+def test_touched_but_unchanged_config_file_keeps_snapshot_current(config_dir):
+    snapshot_path = config_dir / "config.snapshot.pickle"
+    _compile(snapshot_path)
+    stat = (config_dir / "config.yml").stat()
+    os.utime(config_dir / "config.yml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert load_config_snapshot(snapshot_path).app_config == AppConfig()
+
+
+def test_changed_config_file_makes_snapshot_stale(config_dir):
+    snapshot_path = config_dir / "config.snapshot.pickle"
+    _compile(snapshot_path)
+    changed = {**CONFIG, "open_ticket_ai": {**CONFIG["open_ticket_ai"], "api_version": ">=2.0.0"}}
+    (config_dir / "config.yml").write_text(yaml.safe_dump(changed))
+
+    with pytest.raises(StaleConfigSnapshotError, match=r"config\.yml changed"):
+        load_config_snapshot(snapshot_path)
+    app_config, compiled_pipes = load_app_config(snapshot_path)
+    assert str(app_config.open_ticket_ai.api_version) == ">=2.0.0"
+    assert compiled_pipes == ()
+
+
+def test_config_environment_variables_make_snapshot_stale(config_dir, monkeypatch):
+    snapshot_path = config_dir / "config.snapshot.pickle"
+    _compile(snapshot_path)
+    monkeypatch.setenv("UNRELATED_SETTING", "1")
+    load_config_snapshot(snapshot_path)
+
+    monkeypatch.setenv("OTAI__API_VERSION", ">=3.0.0")
+
+    with pytest.raises(StaleConfigSnapshotError, match="environment"):
+        load_config_snapshot(snapshot_path)
+
+
+def test_stale_snapshots_are_detected_before_the_payload_is_unpickled(config_dir, monkeypatch):
+    snapshot_path = config_dir / "config.snapshot.pickle"
+    _compile(snapshot_path)
+    raw_header, _, _payload = snapshot_path.read_bytes().partition(b"\n")
+    header = json.loads(raw_header)
+
+    snapshot_path.write_bytes(json.dumps({**header, "env_digest": "old"}).encode() + b"\nnot a pickle")
+    with pytest.raises(StaleConfigSnapshotError, match="environment"):
+        load_config_snapshot(snapshot_path)
+
+    snapshot_path.write_bytes(json.dumps({**header, "schema_hash": "old"}).encode() + b"\nnot a pickle")
+    with pytest.raises(StaleConfigSnapshotError, match="schema"):
+        load_config_snapshot(snapshot_path)
+
+    snapshot_path.write_bytes(raw_header + b"\nnot a pickle")
+    monkeypatch.setattr(config_snapshot, "config_schema_hash", lambda: "new")
+    with pytest.raises(StaleConfigSnapshotError, match="schema"):
+        load_config_snapshot(snapshot_path)
+
+
+def test_unreadable_snapshot_falls_back_to_sources(config_dir):
+    snapshot_path = config_dir / "config.snapshot.pickle"
+    snapshot_path.write_bytes(b"not a pickle")
+
+    with pytest.raises(StaleConfigSnapshotError, match="unreadable"):
+        load_config_snapshot(snapshot_path)
+    assert load_app_config(snapshot_path) == (AppConfig(), ())
+    assert load_app_config(config_dir / "missing.pickle") == (AppConfig(), ())
+
+
+def test_snapshot_is_only_used_when_given_explicitly(config_dir, monkeypatch):
+    _compile(config_dir / "config.snapshot.pickle")
+    monkeypatch.setattr(config_snapshot, "load_config_snapshot", lambda *_args: pytest.fail("snapshot loaded"))
+
+    assert load_app_config() == (AppConfig(), ())
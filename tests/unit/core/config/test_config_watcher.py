@@ -0,0 +1,38 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.config_snapshot import SourceStamp
+from open_ticket_ai.core.config.config_watcher import ConfigWatcher
+
+
+@pytest.mark.asyncio
+async def test_yields_valid_configs_only_when_sources_change():
+    stamps = iter([1, 1, 2, 3, 3, 4])
+    loaded = [AppConfig(), ValueError("invalid yaml"), AppConfig()]
+
+    def load_config() -> AppConfig:
+        result = loaded.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    logger = MagicMock()
+    watcher = ConfigWatcher(
+        logger,
+        timedelta(0),
+        load_config=load_config,
+        sources=lambda: (SourceStamp(path="config.yml", mtime_ns=next(stamps), size=1),),
+    )
+
+    changes = watcher.changes()
+    first = await asyncio.wait_for(anext(changes), timeout=1)
+    second = await asyncio.wait_for(anext(changes), timeout=1)
+
+    assert isinstance(first, AppConfig)
+    assert isinstance(second, AppConfig)
+    assert loaded == []
+    logger.exception.assert_called_once()
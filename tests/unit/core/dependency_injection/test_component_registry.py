@@ -1,7 +1,8 @@
 import pytest
 
-from open_ticket_ai.core.config.errors import InjectableNotFoundError, RegistryError
+from open_ticket_ai.core.config.errors import InjectableImportError, InjectableNotFoundError, RegistryError
 from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
+from open_ticket_ai.core.injectables.injectable import Injectable
 from tests.unit.conftest import SimpleInjectable, SimplePipe
 
 
@@ -90,3 +91,90 @@ class TestGetAvailableInjectables:
         result = registry.get_available_injectables()
 
         assert list(result) == []
+
+
+class TestRegisterLazy:
+    def test_lazy_injectable_is_listed_before_import(self):
+        registry = ComponentRegistry()
+        registry.register_lazy("lazy_pipe", "tests.unit.conftest:SimplePipe")
+
+        assert list(registry.get_available_injectables()) == ["lazy_pipe"]
+        assert registry.is_loaded("lazy_pipe") is False
+
+    def test_lazy_injectable_is_imported_on_first_lookup(self):
+        registry = ComponentRegistry()
+        registry.register_lazy("lazy_pipe", "tests.unit.conftest:SimplePipe")
+
+        result = registry.get_pipe(by_identifier="lazy_pipe")
+
+        assert result == SimplePipe
+        assert registry.is_loaded("lazy_pipe") is True
+
+    def test_lookup_only_imports_the_requested_injectable(self):
+        registry = ComponentRegistry()
+        registry.register_lazy("lazy_pipe", "tests.unit.conftest:SimplePipe")
+        registry.register_lazy("broken", "not_an_installed_module:Missing")
+
+        registry.get_pipe(by_identifier="lazy_pipe")
+
+        assert registry.is_loaded("broken") is False
+
+    def test_unimportable_lazy_injectable_raises_error(self):
+        registry = ComponentRegistry()
+        registry.register_lazy("broken", "not_an_installed_module:Missing")
+
+        with pytest.raises(InjectableImportError, match="could not be imported"):
+            registry.get_injectable(by_identifier="broken")
+
+    def test_lazy_injectable_of_wrong_type_is_not_found(self):
+        registry = ComponentRegistry()
+        registry.register_lazy("service", "tests.unit.conftest:SimpleInjectable")
+
+        with pytest.raises(InjectableNotFoundError):
+            registry.get_pipe(by_identifier="service")
+
+    def test_find_by_type_imports_lazy_injectables(self):
+        registry = ComponentRegistry()
+        registry.register_lazy("lazy_pipe", "tests.unit.conftest:SimplePipe")
+
+        assert registry.find(by_type=SimplePipe) == {"lazy_pipe": SimplePipe}
+
+
+class TestTypeIndex:
+    def test_reregistering_an_identifier_updates_the_type_index(self):
+        registry = ComponentRegistry()
+        registry.register("component", SimplePipe)
+        registry.register("component", SimpleInjectable)
+
+        assert registry.find(by_type=SimplePipe) == {}
+        with pytest.raises(InjectableNotFoundError):
+            registry.get_pipe(by_identifier="component")
+
+    def test_find_by_base_type_includes_subclasses(self):
+        registry = ComponentRegistry()
+        registry.register("pipe1", SimplePipe)
+        registry.register("service1", SimpleInjectable)
+
+        assert set(registry.find(by_type=Injectable)) == {"pipe1", "service1"}
+
+
+class TestFreeze:
+    def test_frozen_registry_rejects_registration(self):
+        registry = ComponentRegistry()
+        registry.register("pipe1", SimplePipe)
+        registry.freeze()
+
+        with pytest.raises(RegistryError, match="frozen"):
+            registry.register("pipe2", SimplePipe)
+        with pytest.raises(RegistryError, match="frozen"):
+            registry.register_lazy("pipe3", "tests.unit.conftest:SimplePipe")
+
+        assert registry.is_frozen is True
+        assert registry.get_pipe(by_identifier="pipe1") == SimplePipe
+
+    def test_frozen_registry_still_imports_lazy_injectables(self):
+        registry = ComponentRegistry()
+        registry.register_lazy("lazy_pipe", "tests.unit.conftest:SimplePipe")
+        registry.freeze()
+
+        assert registry.get_pipe(by_identifier="lazy_pipe") == SimplePipe
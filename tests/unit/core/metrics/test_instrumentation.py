@@ -0,0 +1,106 @@
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+from open_ticket_ai.core.metrics.instrumentation import instrument_methods
+from open_ticket_ai.core.metrics.metrics_registry import MetricsRegistry
+from open_ticket_ai.core.tracing.span_exporters import SpanExporter
+from open_ticket_ai.core.tracing.tracer import TRACER, Span
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def service_class() -> type:
+    # A new class per test, since instrumenting wraps the methods in place.
+    class _Service:
+        injectable_id = "classifier"
+
+        def classify(self, text: str) -> str:
+            if not text:
+                raise ValueError("empty text")
+            return text.upper()
+
+        async def aclassify(self, text: str) -> str:
+            return self.classify(text)
+
+        def update(self, *, ok: bool) -> bool:
+            return ok
+
+        async def find(self, ticket_id: str, limit: int = 2) -> list[str]:
+            return [ticket_id] * limit
+
+    return _Service
+
+
+@pytest.fixture
+def observed(registry: MetricsRegistry, service_class: type) -> list[tuple[str, Any]]:
+    results: list[tuple[str, Any]] = []
+    instrument_methods(
+        service_class,
+        ("classify", "aclassify", "update", "find"),
+        registry.counter("calls_total", "Calls.", ("service", "operation", "outcome")),
+        registry.histogram("duration_seconds", "Duration.", ("service", "operation")),
+        lambda _service, operation, result: results.append((operation, result)),
+    )
+    return results
+
+
+def _calls(registry: MetricsRegistry) -> dict[tuple[str, ...], float]:
+    calls = registry.counter("calls_total", "Calls.", ("service", "operation", "outcome"))
+    return {labels: child.value for labels, child in calls._series()}
+
+
+async def test_calls_are_counted_by_outcome(
+    registry: MetricsRegistry, service_class: type, observed: list[tuple[str, Any]]
+) -> None:
+    service = service_class()
+
+    service.classify("a")
+    with pytest.raises(ValueError, match="empty text"):
+        service.classify("")
+    service.update(ok=False)
+
+    assert _calls(registry) == {
+        ("classifier", "classify", "succeeded"): 1,
+        ("classifier", "classify", "failed"): 1,
+        ("classifier", "update", "failed"): 1,
+    }
+    assert observed == [("classify", "A"), ("update", False)]
+
+
+async def test_nested_calls_on_the_same_instance_are_recorded_once(
+    registry: MetricsRegistry, service_class: type, observed: list[tuple[str, Any]]
+) -> None:
+    assert await service_class().aclassify("a") == "A"
+
+    assert _calls(registry) == {("classifier", "aclassify", "succeeded"): 1}
+    assert observed == [("aclassify", "A")]
+
+
+class _CollectingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self.spans.extend(spans)
+
+
+async def test_calls_open_spans_with_ticket_id_and_result_count(
+    service_class: type, observed: list[tuple[str, Any]]
+) -> None:
+    exporter = _CollectingExporter()
+    TRACER.configure(exporter)
+    try:
+        await service_class().find("42", limit=3)
+    finally:
+        TRACER.shutdown()
+
+    [span] = exporter.spans
+    assert span.name == "service.find"
+    assert span.attributes == {"service": "classifier", "ticket_id": "42", "result_count": 3}
+    assert observed == [("find", ["42", "42", "42"])]
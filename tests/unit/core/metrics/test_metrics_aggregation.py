@@ -0,0 +1,37 @@
+from open_ticket_ai.core.metrics.metrics_aggregation import MetricsAggregator
+from open_ticket_ai.core.metrics.metrics_registry import MetricsRegistry
+
+
+def _worker_metrics(runs: int, in_flight: int, durations: list[float]) -> str:
+    registry = MetricsRegistry()
+    registry.counter("otai_runs_total", "Runs.", ("pipe",)).labels("fetch").inc(runs)
+    registry.gauge("otai_in_flight", "In flight.").labels().set(in_flight)
+    duration = registry.histogram("otai_duration_seconds", "Duration.", buckets=(1.0,)).labels()
+    for value in durations:
+        duration.observe(value)
+    return registry.render()
+
+
+def test_samples_of_all_sources_are_summed() -> None:
+    texts = [_worker_metrics(2, 1, [0.5]), _worker_metrics(3, 4, [0.5, 2.0])]
+
+    lines = MetricsAggregator(lambda: texts).render().splitlines()
+
+    assert 'otai_runs_total{pipe="fetch"} 5' in lines
+    assert "otai_in_flight 5" in lines
+    assert 'otai_duration_seconds_bucket{le="1"} 2' in lines
+    assert 'otai_duration_seconds_bucket{le="+Inf"} 3' in lines
+    assert "otai_duration_seconds_sum 3" in lines
+    assert "# TYPE otai_runs_total counter" in lines
+
+
+def test_retired_processes_keep_their_counters_but_not_their_gauges() -> None:
+    live = [_worker_metrics(1, 1, [])]
+    aggregator = MetricsAggregator(lambda: live)
+
+    aggregator.retire(_worker_metrics(10, 7, [0.5]))
+    lines = aggregator.render().splitlines()
+
+    assert 'otai_runs_total{pipe="fetch"} 11' in lines
+    assert "otai_in_flight 1" in lines
+    assert "otai_duration_seconds_count 1" in lines
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import httpx
+
+from open_ticket_ai.core.config.config_models import MetricsConfig
+from open_ticket_ai.core.logging.logging_iface import LoggerFactory
+from open_ticket_ai.core.metrics.metrics_exporter import PROMETHEUS_CONTENT_TYPE, MetricsExporter
+from open_ticket_ai.core.metrics.metrics_registry import MetricsRegistry
+
+
+def _registry() -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.counter("otai_runs_total", "Runs.").labels().inc()
+    return registry
+
+
+async def test_metrics_endpoint_serves_the_registry(logger_factory: LoggerFactory) -> None:
+    exporter = MetricsExporter(MetricsConfig(http_enabled=True, port=0), logger_factory.create("metrics"), _registry())
+    await exporter.start()
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(exporter.url)
+            not_found = await client.get(exporter.url.removesuffix("/metrics") + "/other")
+    finally:
+        await exporter.aclose()
+
+    assert response.status_code == httpx.codes.OK
+    assert response.headers["content-type"] == PROMETHEUS_CONTENT_TYPE
+    assert "otai_runs_total 1" in response.text
+    assert not_found.status_code == httpx.codes.NOT_FOUND
+
+
+async def test_metrics_file_is_written_on_close(tmp_path: Path, logger_factory: LoggerFactory) -> None:
+    metrics_file = tmp_path / "metrics.prom"
+    exporter = MetricsExporter(
+        MetricsConfig(file_path=str(metrics_file)), logger_factory.create("metrics"), _registry()
+    )
+    await exporter.start()
+    await exporter.aclose()
+
+    assert "otai_runs_total 1" in metrics_file.read_text()
+    assert exporter.url is None
@@ -0,0 +1,89 @@
+import pytest
+
+from open_ticket_ai.core.metrics.metrics_registry import MetricsRegistry
+
+
+def test_render_outputs_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    runs = registry.counter("otai_runs_total", "Runs by outcome.", ("pipe", "outcome"))
+    queued = registry.gauge("otai_queued", "Queued tickets.")
+    runs.labels("fetch", "succeeded").inc()
+    runs.labels("fetch", "succeeded").inc(2)
+    runs.labels('say "hi"', "failed").inc()
+    queued.labels().set(4)
+
+    assert registry.render() == (
+        "# HELP otai_queued Queued tickets.\n"
+        "# TYPE otai_queued gauge\n"
+        "otai_queued 4\n"
+        "# HELP otai_runs_total Runs by outcome.\n"
+        "# TYPE otai_runs_total counter\n"
+        'otai_runs_total{pipe="fetch",outcome="succeeded"} 3\n'
+        'otai_runs_total{pipe="say \\"hi\\"",outcome="failed"} 1\n'
+    )
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count() -> None:
+    registry = MetricsRegistry()
+    duration = registry.histogram("otai_duration_seconds", "Duration.", ("pipe",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        duration.labels("fetch").observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert lines[2:] == [
+        'otai_duration_seconds_bucket{pipe="fetch",le="0.1"} 2',
+        'otai_duration_seconds_bucket{pipe="fetch",le="1"} 3',
+        'otai_duration_seconds_bucket{pipe="fetch",le="+Inf"} 4',
+        'otai_duration_seconds_sum{pipe="fetch"} 3.65',
+        'otai_duration_seconds_count{pipe="fetch"} 4',
+    ]
+
+
+def test_registering_the_same_metric_twice_returns_it() -> None:
+    registry = MetricsRegistry()
+
+    assert registry.counter("otai_total", "Help.", ("pipe",)) is registry.counter("otai_total", "Help.", ("pipe",))
+
+
+@pytest.mark.parametrize(
+    "register",
+    [
+        lambda registry: registry.gauge("otai_total", "Help.", ("pipe",)),
+        lambda registry: registry.counter("otai_total", "Help.", ("service",)),
+    ],
+)
+def test_conflicting_registration_raises(register) -> None:
+    registry = MetricsRegistry()
+    registry.counter("otai_total", "Help.", ("pipe",))
+
+    with pytest.raises(ValueError, match="already registered"):
+        register(registry)
+
+
+def test_wrong_number_of_label_values_raises() -> None:
+    counter = MetricsRegistry().counter("otai_total", "Help.", ("pipe", "outcome"))
+
+    with pytest.raises(ValueError, match="expects labels"):
+        counter.labels("fetch")
+
+
+def test_counter_cannot_decrease() -> None:
+    counter = MetricsRegistry().counter("otai_total", "Help.")
+
+    with pytest.raises(ValueError, match="only increase"):
+        counter.labels().inc(-1)
+
+
+def test_reset_zeroes_series_that_modules_still_hold() -> None:
+    registry = MetricsRegistry()
+    runs = registry.counter("otai_runs_total", "Runs.").labels()
+    duration = registry.histogram("otai_duration_seconds", "Duration.", buckets=(1.0,)).labels()
+    runs.inc(3)
+    duration.observe(0.5)
+
+    registry.reset()
+    runs.inc()
+
+    assert "otai_runs_total 1" in registry.render()
+    assert "otai_duration_seconds_count 0" in registry.render()
@@ -4,6 +4,7 @@ import pytest
 from pydantic import BaseModel
 
 from open_ticket_ai.core.logging.logging_iface import LoggerFactory
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
 from open_ticket_ai.core.pipes.pipe import Pipe
 from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
 from open_ticket_ai.core.pipes.pipe_models import PipeConfig, PipeResult
@@ -100,3 +101,17 @@ class TestPipeProcess:
         assert not result.was_skipped
         assert result.message == "processed"
         assert result.data == {"result": "test_value"}
+
+    async def test_process_records_duration_and_outcome_metrics(
+        self, test_pipe: ConcretePipeForTesting, empty_pipeline_context: PipeContext
+    ):
+        runs = METRICS.counter("otai_pipe_runs_total", "Pipe runs by outcome.", ("pipe", "outcome"))
+        duration = METRICS.histogram("otai_pipe_duration_seconds", "Time spent in Pipe.process.", ("pipe",))
+        runs_before = runs.labels("test_pipe", "succeeded").value
+        observed_before = duration.labels("test_pipe").count
+
+        await test_pipe.process(empty_pipeline_context)
+
+        assert runs.labels("test_pipe", "succeeded").value == runs_before + 1
+        assert duration.labels("test_pipe").count == observed_before + 1
+        assert 'otai_pipe_runs_total{pipe="test_pipe",outcome="succeeded"}' in METRICS.render()
@@ -0,0 +1,208 @@
+import asyncio
+from datetime import timedelta
+from typing import Any, ClassVar
+
+import pytest
+from pydantic import BaseModel
+
+from open_ticket_ai.core.config.config_diff import ConfigDiff
+from open_ticket_ai.core.config.config_models import OpenTicketAIConfig
+from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
+from open_ticket_ai.core.injectables.injectable import Injectable
+from open_ticket_ai.core.pipes.pipe import Pipe
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
+from open_ticket_ai.core.pipes.pipe_models import CompiledPipe, PipeConfig, PipeResult
+
+
+class _Params(BaseModel):
+    hang: bool = False
+    fail: bool = False
+    slow_start: bool = False
+
+
+class _RecordingService(Injectable[_Params]):
+    ParamsModel: ClassVar[type[BaseModel]] = _Params
+    events: ClassVar[list[str]] = []
+
+    async def astart(self) -> None:
+        if self._params.slow_start:
+            await asyncio.sleep(0.01)
+        self.events.append(f"start {self.injectable_id}")
+
+    def preload(self) -> None:
+        self.events.append(f"preload {self.injectable_id}")
+
+    async def astop(self) -> None:
+        if self._params.hang:
+            await asyncio.sleep(10)
+        if self._params.fail:
+            raise RuntimeError("boom")
+        self.events.append(f"stop {self.injectable_id}")
+
+
+class _RecordingPipe(Pipe[_Params]):
+    ParamsModel: ClassVar[type[BaseModel]] = _Params
+
+    def __init__(self, *args: Any, pipe_factory: PipeFactory, **kwargs: Any) -> None:  # noqa: ARG002
+        super().__init__(*args, **kwargs)
+
+    async def astop(self) -> None:
+        _RecordingService.events.append(f"stop {self.injectable_id}")
+
+
+class _Renderer:
+    templated_fields: ClassVar[list[frozenset[str] | None]] = []
+
+    async def render_to_model(
+        self, to_model: type[BaseModel], from_raw_dict: dict, templated_fields: frozenset[str] | None = None, **_: Any
+    ) -> BaseModel:
+        self.templated_fields.append(templated_fields)
+        return to_model.model_validate(from_raw_dict)
+
+
+@pytest.fixture
+def factory(logger_factory):
+    def _build(services: dict, **config: Any) -> PipeFactory:
+        _RecordingService.events = []
+        _Renderer.templated_fields = []
+        registry = ComponentRegistry()
+        registry.register("test:Service", _RecordingService)
+        registry.register("test:Pipe", _RecordingPipe)
+        otai_config = OpenTicketAIConfig.model_validate({"services": services, **config})
+        return PipeFactory(_Renderer(), logger_factory, otai_config, registry)
+
+    return _build
+
+
+@pytest.mark.asyncio
+async def test_services_start_once_and_stop_in_reverse_dependency_order(factory):
+    pipe_factory = factory(
+        {
+            "database": {"use": "test:Service"},
+            "tickets": {"use": "test:Service", "injects": {"database": "database"}},
+            "cache": {"use": "test:Service", "injects": {"tickets": "tickets"}},
+        }
+    )
+
+    await pipe_factory.get_service("cache")
+    await pipe_factory.get_service("tickets")
+    results = await pipe_factory.aclose()
+
+    assert _RecordingService.events == [
+        "start database",
+        "start tickets",
+        "start cache",
+        "stop cache",
+        "stop tickets",
+        "stop database",
+    ]
+    assert all(result.succeeded for result in results)
+
+
+@pytest.mark.asyncio
+async def test_failing_and_hanging_services_do_not_block_shutdown(factory):
+    pipe_factory = factory(
+        {
+            "first": {"use": "test:Service"},
+            "hanging": {"use": "test:Service", "params": {"hang": True}},
+            "failing": {"use": "test:Service", "params": {"fail": True}},
+        }
+    )
+    for service_id in ("first", "hanging", "failing"):
+        await pipe_factory.get_service(service_id)
+
+    results = await pipe_factory.aclose(stop_timeout=timedelta(milliseconds=20))
+
+    assert [result.name for result in results] == [
+        "_RecordingService.failing",
+        "_RecordingService.hanging",
+        "_RecordingService.first",
+    ]
+    assert "RuntimeError: boom" in results[0].error
+    assert "did not stop" in results[1].error
+    assert results[2].succeeded
+    assert _RecordingService.events[-1] == "stop first"
+
+
+def _after(step_id: str, ticket_id: int) -> PipeContext:
+    return PipeContext.empty().with_pipe_result(step_id, PipeResult.success(data={"ticket_id": ticket_id}))
+
+
+@pytest.mark.asyncio
+async def test_pipes_for_step_results_are_evicted_least_recently_used_first(factory):
+    pipe_factory = factory({}, infrastructure={"max_cached_pipes": 2})
+    step = PipeConfig(id="step", use="test:Pipe")
+
+    static = await pipe_factory.create_pipe(step, PipeContext.empty())
+    first = await pipe_factory.create_pipe(step, _after("fetch", 1))
+    await pipe_factory.create_pipe(step, _after("fetch", 2))
+    assert await pipe_factory.create_pipe(step, _after("fetch", 1)) is first
+    await pipe_factory.create_pipe(step, _after("fetch", 3))
+
+    assert _RecordingService.events == ["stop step"]
+    assert await pipe_factory.create_pipe(step, _after("fetch", 1)) is first
+    assert await pipe_factory.create_pipe(step, PipeContext.empty()) is static
+    assert len(pipe_factory._pipes) == 3
+
+
+@pytest.mark.asyncio
+async def test_apply_config_keeps_steps_cached_without_their_run_on_option(factory):
+    step = {"id": "step", "use": "test:Pipe", "params": {"run_on": "leader"}}
+    pipe_factory = factory({}, orchestrator={"id": "orchestrator", "use": "test:Pipe", "params": {"steps": [step]}})
+    pipe = await pipe_factory.create_pipe(PipeConfig(id="step", use="test:Pipe"), PipeContext.empty())
+
+    stale = pipe_factory.apply_config(
+        OpenTicketAIConfig.model_validate(
+            {"orchestrator": {"id": "orchestrator", "use": "test:Pipe", "params": {"steps": [step]}}}
+        ),
+        ConfigDiff(),
+    )
+
+    assert stale == []
+    assert await pipe_factory.create_pipe(PipeConfig(id="step", use="test:Pipe"), PipeContext.empty()) is pipe
+
+
+@pytest.mark.asyncio
+async def test_compiled_pipes_render_only_their_templated_params(factory):
+    pipe_factory = factory({})
+    step = PipeConfig(id="step", use="test:Pipe", params={"run_on": "leader", "hang": False, "fail": False})
+    pipe_factory.use_compiled_pipes([CompiledPipe(config=step, templated_params=frozenset({"hang"}))])
+
+    await pipe_factory.create_pipe(step, PipeContext.empty())
+    await pipe_factory.create_pipe(PipeConfig(id="other", use="test:Pipe"), PipeContext.empty())
+
+    assert _Renderer.templated_fields == [frozenset({"hang"}), None]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_uses_share_one_started_service(factory):
+    pipe_factory = factory(
+        {
+            "model": {"use": "test:Service", "params": {"slow_start": True}},
+            "classifier": {"use": "test:Service", "injects": {"model": "model"}},
+        }
+    )
+    users = 8
+
+    services = await asyncio.gather(*(pipe_factory.get_service("classifier") for _ in range(users)))
+
+    assert len({id(service) for service in services}) == 1
+    assert _RecordingService.events == ["start model", "start classifier"]
+
+
+@pytest.mark.asyncio
+async def test_preloaded_services_are_stopped_without_being_started(factory):
+    pipe_factory = factory(
+        {
+            "model": {"use": "test:Service"},
+            "tokenizer": {"use": "test:Service"},
+            "classifier": {"use": "test:Service", "injects": {"model": "model"}},
+        }
+    )
+
+    preloaded = await pipe_factory.preload_services()
+
+    assert preloaded == ["model", "tokenizer"]
+    assert _RecordingService.events == ["preload model", "preload tokenizer", "stop tokenizer", "stop model"]
+    assert await pipe_factory.aclose() == []
@@ -2,8 +2,27 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from open_ticket_ai.core.dependency_injection.component_registry import ComponentRegistry
 from open_ticket_ai.core.plugins.plugin import Plugin
 from open_ticket_ai.core.plugins.plugin_loader import PluginLoader, PluginLoadError
+from open_ticket_ai.core.plugins.plugin_manifest import PluginManifest
+
+
+def _plugin_entry_points(app_config, plugins, manifests=()):
+    def entry_points_fn(group):
+        if group == app_config.PLUGIN_MANIFEST_ENTRY_POINT_GROUP:
+            return list(manifests)
+        return list(plugins)
+
+    return MagicMock(side_effect=entry_points_fn)
+
+
+def _entry_point(name, module, loaded):
+    entry_point = MagicMock()
+    entry_point.name = name
+    entry_point.module = module
+    entry_point.load.return_value = loaded
+    return entry_point
 
 
 class TestLoadPlugins:
@@ -15,7 +34,7 @@ class TestLoadPlugins:
         mock_entry_point.name = "test-plugin"
         mock_entry_point.load.return_value = lambda _: mock_plugin
 
-        mock_entry_points_fn = MagicMock(return_value=[mock_entry_point])
+        mock_entry_points_fn = _plugin_entry_points(mock_app_config, [mock_entry_point])
 
         loader = PluginLoader(
             registry=mock_component_registry,
@@ -36,7 +55,7 @@ class TestLoadPlugins:
         mock_entry_point.name = "invalid-plugin"
         mock_entry_point.load.return_value = lambda _: NotAPlugin()
 
-        mock_entry_points_fn = MagicMock(return_value=[mock_entry_point])
+        mock_entry_points_fn = _plugin_entry_points(mock_app_config, [mock_entry_point])
 
         loader = PluginLoader(
             registry=mock_component_registry,
@@ -47,3 +66,53 @@ class TestLoadPlugins:
 
         with pytest.raises(PluginLoadError):
             loader.load_plugins()
+
+
+class TestManifestPlugins:
+    def test_registers_manifest_injectables_without_importing_plugin(self, logger_factory, mock_app_config):
+        mock_app_config.PLUGIN_NAME_PREFIX = "otai-"
+        mock_app_config.REGISTRY_IDENTIFIER_SEPERATOR = ":"
+        registry = ComponentRegistry()
+        plugin_entry_point = _entry_point("heavy", "otai_heavy.plugin", MagicMock())
+        manifest = PluginManifest(injectables={"SimplePipe": "tests.unit.conftest:SimplePipe"})
+        manifest_entry_point = _entry_point("heavy", "otai_heavy.manifest", manifest)
+
+        loader = PluginLoader(
+            registry=registry,
+            logger_factory=logger_factory,
+            app_config=mock_app_config,
+            entry_points_fn=_plugin_entry_points(mock_app_config, [plugin_entry_point], [manifest_entry_point]),
+        )
+        loader.load_plugins()
+
+        plugin_entry_point.load.assert_not_called()
+        assert list(registry.get_available_injectables()) == ["heavy:SimplePipe"]
+        assert registry.is_loaded("heavy:SimplePipe") is False
+
+    def test_invalid_manifest_raises_plugin_load_error(self, logger_factory, mock_app_config):
+        plugin_entry_point = _entry_point("broken", "otai_broken.plugin", MagicMock())
+        manifest_entry_point = _entry_point("broken", "otai_broken.manifest", {"not": "a manifest"})
+
+        loader = PluginLoader(
+            registry=ComponentRegistry(),
+            logger_factory=logger_factory,
+            app_config=mock_app_config,
+            entry_points_fn=_plugin_entry_points(mock_app_config, [plugin_entry_point], [manifest_entry_point]),
+        )
+
+        with pytest.raises(PluginLoadError):
+            loader.load_plugins()
+
+    def test_load_plugins_runs_only_once(self, mock_component_registry, logger_factory, mock_app_config):
+        entry_points_fn = _plugin_entry_points(mock_app_config, [])
+        loader = PluginLoader(
+            registry=mock_component_registry,
+            logger_factory=logger_factory,
+            app_config=mock_app_config,
+            entry_points_fn=entry_points_fn,
+        )
+
+        loader.load_plugins()
+        loader.load_plugins()
+
+        assert entry_points_fn.call_count == 2
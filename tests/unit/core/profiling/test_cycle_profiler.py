@@ -0,0 +1,137 @@
+import json
+import pstats
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+
+import httpx
+import pytest
+
+from open_ticket_ai.core.config.config_models import ProfilingConfig
+from open_ticket_ai.core.logging.logging_iface import LoggerFactory
+from open_ticket_ai.core.pipes.pipe import Pipe
+from open_ticket_ai.core.pipes.pipe_context_model import PipeContext
+from open_ticket_ai.core.pipes.pipe_models import PipeConfig, PipeResult
+from open_ticket_ai.core.profiling.cycle_profiler import CycleProfiler
+
+
+class _BusyPipe(Pipe):
+    async def _process(self, *_: object, **__: object) -> PipeResult:
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+        return PipeResult.success()
+
+
+@pytest.fixture
+def make_profiler(tmp_path: Path, logger_factory: LoggerFactory) -> Callable[..., CycleProfiler]:
+    def _make(**settings: object) -> CycleProfiler:
+        profiler = CycleProfiler()
+        config = ProfilingConfig(enabled=True, output_dir=str(tmp_path / "profiles"), **settings)
+        profiler.configure(config, logger_factory.create("profiler"))
+        return profiler
+
+    return _make
+
+
+async def _run_cycles(profiler: CycleProfiler, pipe: Pipe, cycles: int) -> list[Path | None]:
+    written = []
+    for _ in range(cycles):
+        profiler.cycle_started()
+        await pipe.process(PipeContext.empty())
+        written.append(profiler.cycle_finished())
+    return written
+
+
+@pytest.fixture
+def busy_pipe(logger_factory: LoggerFactory) -> _BusyPipe:
+    return _BusyPipe(PipeConfig(id="busy_step", use="tests.BusyPipe"), logger_factory)
+
+
+async def test_nothing_is_captured_without_a_request(make_profiler, busy_pipe: _BusyPipe) -> None:
+    profiler = make_profiler()
+
+    assert await _run_cycles(profiler, busy_pipe, 2) == [None, None]
+    assert profiler.last_profile is None
+
+
+async def test_collapsed_profile_attributes_samples_to_pipe_ids(make_profiler, busy_pipe: _BusyPipe) -> None:
+    profiler = make_profiler(format="collapsed", sample_interval=timedelta(milliseconds=1))
+    profiler.request(cycles=2)
+
+    first, second, third = await _run_cycles(profiler, busy_pipe, 3)
+
+    assert first is None
+    assert third is None
+    assert second is not None
+    assert second.name.endswith(".collapsed.txt")
+    lines = second.read_text().splitlines()
+    assert any("pipe:busy_step (_BusyPipe);" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+async def test_speedscope_profile_is_a_sampled_profile(make_profiler, busy_pipe: _BusyPipe) -> None:
+    profiler = make_profiler(sample_interval=timedelta(milliseconds=1))
+    profiler.request(cycles=1)
+
+    [written] = await _run_cycles(profiler, busy_pipe, 1)
+
+    profile = json.loads(written.read_text())
+    frame_names = [frame["name"] for frame in profile["shared"]["frames"]]
+    assert profile["profiles"][0]["type"] == "sampled"
+    assert "pipe:busy_step (_BusyPipe)" in frame_names
+    assert len(profile["profiles"][0]["samples"]) == len(profile["profiles"][0]["weights"])
+
+
+async def test_pstats_profile_contains_the_pipe(make_profiler, busy_pipe: _BusyPipe) -> None:
+    profiler = make_profiler(format="pstats")
+    profiler.request(cycles=1)
+
+    [written] = await _run_cycles(profiler, busy_pipe, 1)
+
+    functions = {name for _, _, name in pstats.Stats(str(written)).stats}
+    assert "_process" in functions
+
+
+async def test_trigger_file_starts_a_capture_and_is_removed(
+    make_profiler, busy_pipe: _BusyPipe, tmp_path: Path
+) -> None:
+    trigger_file = tmp_path / "profile-now"
+    trigger_file.write_text("2")
+    profiler = make_profiler(trigger_file=str(trigger_file), format="collapsed")
+
+    written = await _run_cycles(profiler, busy_pipe, 2)
+
+    assert not trigger_file.exists()
+    assert written[0] is None
+    assert written[1] == profiler.last_profile
+
+
+async def test_http_endpoint_requests_a_capture(make_profiler) -> None:
+    profiler = make_profiler(http_enabled=True, port=0)
+    await profiler.astart()
+    try:
+        async with httpx.AsyncClient() as client:
+            accepted = await client.post(profiler.url, params={"cycles": 3, "format": "pstats"})
+            status = await client.get(profiler.url)
+            invalid = await client.post(profiler.url, params={"cycles": "many"})
+    finally:
+        await profiler.aclose()
+
+    assert accepted.status_code == httpx.codes.ACCEPTED
+    assert accepted.json()["cycles"] == 3
+    assert accepted.json()["format"] == "pstats"
+    assert status.json()["pending"] is True
+    assert invalid.status_code == httpx.codes.BAD_REQUEST
+
+
+async def test_close_writes_an_unfinished_capture(make_profiler, busy_pipe: _BusyPipe) -> None:
+    profiler = make_profiler(format="collapsed")
+    profiler.request(cycles=10)
+    await _run_cycles(profiler, busy_pipe, 1)
+
+    await profiler.aclose()
+
+    assert profiler.last_profile is not None
+    assert profiler.last_profile.exists()
@@ -0,0 +1,29 @@
+import pytest
+
+from open_ticket_ai.core.profiling.import_time import parse_import_times, total_by_top_level_package
+
+IMPORT_TIME_STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _json
+import time:      1500 |       1620 | json
+import time:       300 |        300 |     pydantic.version
+import time:      2000 |       2300 |   pydantic.main
+import time:      4000 |       6300 | pydantic
+some unrelated warning
+"""
+
+
+def test_parse_import_times_reads_timings_and_depth():
+    timings = parse_import_times(IMPORT_TIME_STDERR.splitlines())
+
+    assert [timing.module for timing in timings] == ["_json", "json", "pydantic.version", "pydantic.main", "pydantic"]
+    assert timings[1].self_seconds == pytest.approx(0.0015)
+    assert timings[4].cumulative_seconds == pytest.approx(0.0063)
+    assert [timing.depth for timing in timings] == [1, 0, 2, 1, 0]
+
+
+def test_total_by_top_level_package_sums_self_time_most_expensive_first():
+    totals = total_by_top_level_package(parse_import_times(IMPORT_TIME_STDERR.splitlines()))
+
+    assert list(totals) == ["pydantic", "json", "_json"]
+    assert totals["pydantic"] == pytest.approx(0.0063)
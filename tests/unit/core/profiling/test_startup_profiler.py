@@ -0,0 +1,103 @@
+import itertools
+
+import pytest
+import yaml
+
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
+from open_ticket_ai.core.pipes.pipe_models import iter_pipe_configs
+from open_ticket_ai.core.profiling.startup_profiler import StartupProfiler
+
+CONFIG = {
+    "open_ticket_ai": {
+        "services": {
+            "jinja_default": {"use": "base:JinjaRenderer"},
+        },
+        "orchestrator": {
+            "use": "base:SimpleSequentialOrchestrator",
+            "params": {
+                "steps": [
+                    {
+                        "id": "runner",
+                        "use": "base:SimpleSequentialRunner",
+                        "params": {
+                            "on": {"id": "trigger", "use": "base:IntervalTrigger", "params": {"interval": "PT1S"}},
+                            "run": {"id": "expr", "use": "base:ExpressionPipe", "params": {"expression": "ok"}},
+                        },
+                    },
+                    {"id": "missing", "use": "not-installed:Pipe"},
+                ]
+            },
+        },
+    }
+}
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    (tmp_path / "config.yml").write_text(yaml.safe_dump(CONFIG))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_iter_pipe_configs_finds_nested_pipes():
+    pipes = list(iter_pipe_configs(CONFIG["open_ticket_ai"]["orchestrator"]["params"]))
+
+    assert [pipe["id"] for pipe in pipes] == ["runner", "trigger", "expr", "missing"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("config_dir")
+async def test_profile_reports_every_phase_in_order():
+    ticks = itertools.count()
+    profiler = StartupProfiler(app_config_factory=AppConfig, clock=lambda: float(next(ticks)))
+
+    profile = await profiler.profile()
+
+    assert [(phase.kind, phase.name) for phase in profile.phases] == [
+        ("settings", "AppConfig"),
+        ("container", "AppModule"),
+        ("plugin_import", "base"),
+        ("plugin_import", "not-installed"),
+        ("container", "PipeFactory"),
+        ("service", "jinja_default"),
+        ("pipe", "base:SimpleSequentialOrchestrator"),
+        ("pipe", "runner"),
+        ("pipe", "trigger"),
+        ("pipe", "expr"),
+        ("pipe", "missing"),
+        ("teardown", "PipeFactory"),
+    ]
+    assert all(phase.seconds == 1.0 for phase in profile.phases)
+    assert profile.total_seconds == len(profile.phases)
+    assert profile.seconds_by_kind()["pipe"] == 5.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("config_dir")
+async def test_failing_components_are_recorded_without_stopping_the_profile():
+    profile = await StartupProfiler().profile()
+
+    errors = {(phase.kind, phase.name): phase.error for phase in profile.phases if phase.error}
+
+    assert set(errors) == {("plugin_import", "not-installed"), ("pipe", "missing")}
+    assert "InjectableNotFoundError" in errors[("pipe", "missing")]
+    assert profile.peak_rss_bytes is not None and profile.peak_rss_bytes > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("config_dir")
+async def test_services_and_pipes_are_stopped_after_profiling(monkeypatch):
+    stopped = []
+    aclose = PipeFactory.aclose
+
+    async def recording_aclose(pipe_factory, stop_timeout=None):
+        results = await aclose(pipe_factory, stop_timeout)
+        stopped.extend(result.name for result in results)
+        return results
+
+    monkeypatch.setattr(PipeFactory, "aclose", recording_aclose)
+
+    await StartupProfiler().profile()
+
+    assert {"JinjaRenderer.jinja_default", "ExpressionPipe.expr", "IntervalTrigger.trigger"} <= set(stopped)
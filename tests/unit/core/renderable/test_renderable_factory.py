@@ -1,3 +1,4 @@
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -174,3 +175,71 @@ async def test_render_pipe_raises_value_error_for_missing_inject_service(
 
     with pytest.raises(NoServiceConfigurationFoundError, match="nonexistent_service"):
         await factory.create_pipe(config, sample_pipe_context)
+
+
+@pytest.mark.asyncio
+async def test_services_are_created_once_and_receive_their_own_injects(
+    mock_template_renderer: MagicMock,
+    mock_component_registry: MagicMock,
+    logger_factory: MagicMock,
+    mock_otai_config: MagicMock,
+) -> None:
+    from open_ticket_ai.core.injectables.injectable_models import InjectableConfig
+    from tests.unit.conftest import SimpleInjectable
+
+    created: list[dict] = []
+
+    class RecordingInjectable(SimpleInjectable):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            created.append(kwargs)
+
+    mock_otai_config.get_services_list.return_value = [
+        InjectableConfig(id="inner", use="tests:Recording"),
+        InjectableConfig(id="outer", use="tests:Recording", injects={"wrapped": "inner"}),
+    ]
+    mock_component_registry.get_pipe.return_value = SimplePipe
+    mock_component_registry.get_injectable.return_value = RecordingInjectable
+    mock_template_renderer.render_to_model = AsyncMock(return_value=SimpleParams())
+    factory = PipeFactory(
+        component_registry=mock_component_registry,
+        template_renderer=mock_template_renderer,
+        logger_factory=logger_factory,
+        otai_config=mock_otai_config,
+    )
+
+    outer = await factory._get_service_by_id("outer")
+    again = await factory._get_service_by_id("outer")
+    inner = await factory._get_service_by_id("inner")
+
+    assert outer is again
+    assert len(created) == 2
+    assert created[1]["wrapped"] is inner
+
+
+@pytest.mark.asyncio
+async def test_services_injecting_each_other_raise_a_config_error(
+    mock_template_renderer: MagicMock,
+    mock_component_registry: MagicMock,
+    logger_factory: MagicMock,
+    mock_otai_config: MagicMock,
+) -> None:
+    from open_ticket_ai.core.config.errors import CircularInjectionError
+    from open_ticket_ai.core.injectables.injectable_models import InjectableConfig
+    from tests.unit.conftest import SimpleInjectable
+
+    mock_otai_config.get_services_list.return_value = [
+        InjectableConfig(id="first", use="tests:Simple", injects={"other": "second"}),
+        InjectableConfig(id="second", use="tests:Simple", injects={"other": "first"}),
+    ]
+    mock_component_registry.get_injectable.return_value = SimpleInjectable
+    mock_template_renderer.render_to_model = AsyncMock(return_value=SimpleParams())
+    factory = PipeFactory(
+        component_registry=mock_component_registry,
+        template_renderer=mock_template_renderer,
+        logger_factory=logger_factory,
+        otai_config=mock_otai_config,
+    )
+
+    with pytest.raises(CircularInjectionError, match="first -> second -> first"):
+        await factory.get_service("first")
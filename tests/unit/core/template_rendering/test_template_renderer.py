@@ -178,6 +178,20 @@ async def test_render_to_model_all_non_renderable(logger_factory):
     assert result.field_y == "{{y}}"
 
 
+@pytest.mark.asyncio
+async def test_render_to_model_renders_only_the_given_templated_fields(logger_factory):
+    config = InjectableConfig(id="test-renderer")
+    renderer = SimpleTemplateRenderer(config, logger_factory)
+
+    raw_dict = {"field_a": "{{a}}", "field_b": "{{b}}"}
+    scope = {"a": "first", "b": "second"}
+
+    result = await renderer.render_to_model(ModelAllRenderableFields, raw_dict, scope, frozenset({"field_a"}))
+
+    assert result.field_a == "first"
+    assert result.field_b == "{{b}}"
+
+
 @pytest.mark.asyncio
 async def test_render_to_model_mixed_fields(logger_factory):
     config = InjectableConfig(id="test-renderer")
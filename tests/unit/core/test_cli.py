@@ -0,0 +1,60 @@
+import json
+
+from typer.testing import CliRunner
+
+from open_ticket_ai.core.cli import app
+from open_ticket_ai.core.config.config_snapshot import load_config_snapshot
+from open_ticket_ai.core.profiling.startup_profiler import PhaseTiming, StartupProfile
+
+runner = CliRunner()
+
+
+class _FakeProfiler:
+    def __init__(self, connect_services: bool = False) -> None:
+        self.connect_services = connect_services
+
+    async def profile(self) -> StartupProfile:
+        return StartupProfile(
+            phases=[PhaseTiming(kind="settings", name="AppConfig", seconds=0.25)],
+            total_seconds=0.25,
+        )
+
+
+def test_profile_startup_writes_json_to_stdout(monkeypatch):
+    monkeypatch.setattr("open_ticket_ai.core.cli.StartupProfiler", _FakeProfiler)
+
+    result = runner.invoke(app, ["profile-startup", "--no-import-times", "--json", "-"])
+
+    assert result.exit_code == 0
+    profile = json.loads(result.stdout)
+    assert profile["phases"][0]["name"] == "AppConfig"
+    assert profile["total_seconds"] == 0.25
+
+
+def test_profile_startup_prints_table_and_writes_json_file(monkeypatch, tmp_path):
+    monkeypatch.setattr("open_ticket_ai.core.cli.StartupProfiler", _FakeProfiler)
+    output = tmp_path / "profile.json"
+
+    result = runner.invoke(app, ["profile-startup", "--no-import-times", "--json", str(output)])
+
+    assert result.exit_code == 0
+    assert "AppConfig" in result.stdout
+    assert json.loads(output.read_text())["phases"][0]["kind"] == "settings"
+
+
+def test_compile_config_writes_loadable_snapshot(tmp_path, monkeypatch):
+    config = {
+        "open_ticket_ai": {
+            "services": {"jinja_default": {"use": "base:JinjaRenderer"}},
+            "orchestrator": {"id": "orchestrator", "use": "base:SimpleSequentialOrchestrator"},
+        }
+    }
+    (tmp_path / "config.yml").write_text(json.dumps(config))
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["compile-config", "--output", "snapshot.pickle"])
+
+    assert result.exit_code == 0, result.stdout
+    assert "orchestrator" in result.stdout
+    assert "config.yml" in result.stdout
+    assert load_config_snapshot(tmp_path / "snapshot.pickle").app_config.open_ticket_ai.services
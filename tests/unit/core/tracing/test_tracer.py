@@ -0,0 +1,130 @@
+import json
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import pytest
+
+from open_ticket_ai.core.config.config_models import TracingConfig
+from open_ticket_ai.core.tracing import tracer as tracer_module
+from open_ticket_ai.core.tracing.span_exporters import SpanExporter, create_span_exporter
+from open_ticket_ai.core.tracing.tracer import NON_RECORDING_SPAN, Span, Tracer
+
+
+class _CollectingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.traces: list[list[Span]] = []
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self.traces.append(list(spans))
+
+
+@pytest.fixture
+def exporter() -> _CollectingExporter:
+    return _CollectingExporter()
+
+
+@pytest.fixture
+def tracer(exporter: _CollectingExporter) -> Iterator[Tracer]:
+    tracer = Tracer()
+    tracer.configure(exporter)
+    yield tracer
+    tracer.shutdown()
+
+
+def test_nested_spans_are_exported_as_one_trace_when_the_root_ends(
+    tracer: Tracer, exporter: _CollectingExporter
+) -> None:
+    with tracer.span("cycle") as cycle:
+        with tracer.span("pipe.process", pipe_id="fetch") as pipe:
+            pipe.set_attribute("outcome", "succeeded")
+        assert exporter.traces == []
+
+    [trace] = exporter.traces
+    assert [span.name for span in trace] == ["pipe.process", "cycle"]
+    assert pipe.parent_id == cycle.span_id
+    assert pipe.trace_id == cycle.trace_id
+    assert cycle.parent_id is None
+    assert pipe.attributes == {"pipe_id": "fetch", "outcome": "succeeded"}
+    assert cycle.duration_seconds >= pipe.duration_seconds >= 0
+
+
+def test_new_trace_starts_a_separate_trace(tracer: Tracer, exporter: _CollectingExporter) -> None:
+    with tracer.span("orchestrator"):
+        with tracer.span("cycle", new_trace=True):
+            pass
+        with tracer.span("cycle", new_trace=True):
+            pass
+
+    assert [[span.name for span in trace] for trace in exporter.traces] == [["cycle"], ["cycle"], ["orchestrator"]]
+    assert len({trace[0].trace_id for trace in exporter.traces}) == len(exporter.traces)
+
+
+async def test_tasks_created_by_the_tracer_start_traces_of_their_own(
+    tracer: Tracer, exporter: _CollectingExporter
+) -> None:
+    async def heartbeat() -> None:
+        with tracer.span("claim_store.claim"):
+            pass
+
+    with tracer.span("pipe.process"):
+        await tracer.create_task(heartbeat())
+        assert [[span.name for span in trace] for trace in exporter.traces] == [["claim_store.claim"]]
+
+
+def test_spans_of_a_long_open_trace_are_exported_in_chunks(
+    tracer: Tracer, exporter: _CollectingExporter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tracer_module, "MAX_BUFFERED_SPANS", 2)
+
+    with tracer.span("orchestrator"):
+        for _ in range(3):
+            with tracer.span("renew"):
+                pass
+
+    assert [[span.name for span in trace] for trace in exporter.traces] == [
+        ["renew", "renew"],
+        ["renew", "orchestrator"],
+    ]
+
+
+def test_exception_marks_span_as_failed(tracer: Tracer, exporter: _CollectingExporter) -> None:
+    with pytest.raises(RuntimeError), tracer.span("pipe.process"):
+        raise RuntimeError("boom")
+
+    [[span]] = exporter.traces
+    assert span.status == "error"
+    assert span.error == "RuntimeError: boom"
+
+
+def test_unsampled_traces_record_nothing(exporter: _CollectingExporter) -> None:
+    tracer = Tracer()
+    tracer.configure(exporter, sample_rate=0.0)
+
+    with tracer.span("cycle") as cycle, tracer.span("pipe.process") as pipe:
+        pass
+
+    assert cycle is NON_RECORDING_SPAN
+    assert pipe is NON_RECORDING_SPAN
+    assert exporter.traces == []
+
+
+def test_disabled_tracer_yields_non_recording_spans() -> None:
+    with Tracer().span("cycle") as span:
+        span.set_attribute("ignored", True)
+
+    assert not span.is_recording
+
+
+def test_jsonl_exporter_appends_one_line_per_span(tmp_path: Path) -> None:
+    traces_file = tmp_path / "traces.jsonl"
+    tracer = Tracer()
+    tracer.configure(create_span_exporter(TracingConfig(file_path=str(traces_file))))
+
+    with tracer.span("cycle"), tracer.span("template.render", model="Params"):
+        pass
+    tracer.shutdown()
+
+    spans = [json.loads(line) for line in traces_file.read_text().splitlines()]
+    assert [span["name"] for span in spans] == ["template.render", "cycle"]
+    assert spans[0]["attributes"] == {"model": "Params"}
+    assert spans[0]["parent_id"] == spans[1]["span_id"]
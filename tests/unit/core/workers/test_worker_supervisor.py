@@ -0,0 +1,65 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.metrics.metrics_registry import METRICS
+from open_ticket_ai.core.workers.worker_shard import WorkerShard, current_shard
+from open_ticket_ai.core.workers.worker_supervisor import WorkerSupervisor
+
+TICKS = METRICS.counter("otai_test_worker_ticks_total", "Runs of the test worker.", ("worker",))
+
+
+@pytest.fixture
+def app_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AppConfig:
+    config = {
+        "open_ticket_ai": {
+            "infrastructure": {
+                "workers": {"count": 2, "restart_delay": 0.01},
+                "shutdown": {"drain_timeout": 1, "stop_timeout": 1},
+            },
+            "services": {"jinja_default": {"use": "base:JinjaRenderer"}},
+            "orchestrator": {"id": "orchestrator", "use": "base:SimpleSequentialOrchestrator"},
+        }
+    }
+    (tmp_path / "config.yml").write_text(json.dumps(config))
+    monkeypatch.chdir(tmp_path)
+    return AppConfig()
+
+
+async def crash_first_run_of_worker_zero(app_config: AppConfig) -> None:
+    shard = current_shard()
+    TICKS.labels(str(shard.index)).inc()
+    metrics = app_config.open_ticket_ai.infrastructure.metrics
+    Path(metrics.file_path).write_text(METRICS.render())
+    Path(f"ran-{shard.index}-of-{shard.count}").touch()
+    crash_marker = Path("crashed")
+    if shard.index == 0 and not crash_marker.exists():
+        crash_marker.touch()
+        raise RuntimeError("worker crashed")
+
+
+def test_crashed_worker_is_restarted_and_metrics_of_all_runs_are_summed(app_config: AppConfig, tmp_path) -> None:
+    supervisor = WorkerSupervisor(app_config, crash_first_run_of_worker_zero)
+
+    supervisor.run()
+
+    assert sorted(path.name for path in tmp_path.glob("ran-*")) == ["ran-0-of-2", "ran-1-of-2"]
+    lines = supervisor.metrics.render().splitlines()
+    assert 'otai_test_worker_ticks_total{worker="0"} 2' in lines
+    assert 'otai_test_worker_ticks_total{worker="1"} 1' in lines
+    assert 'otai_worker_restarts_total{worker="0"} 1' in lines
+
+
+def test_shards_split_keys_between_workers() -> None:
+    shards = [WorkerShard(index=index, count=3) for index in range(3)]
+    keys = [str(number) for number in range(30)]
+
+    owners = [[shard.owns(key) for shard in shards].count(True) for key in keys]
+
+    assert owners == [1] * len(keys)
+    assert all(any(shard.owns(key) for key in keys) for shard in shards)
+    assert WorkerShard().owns("anything")
+    assert shards[0].owns(None)
+    assert not shards[1].owns(None)
@@ -0,0 +1,200 @@
+import asyncio
+import contextlib
+import os
+import signal
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from injector import Injector
+
+from open_ticket_ai.app import OpenTicketAIApp
+from open_ticket_ai.core.config.app_config import AppConfig
+from open_ticket_ai.core.config.config_models import OpenTicketAIConfig
+from open_ticket_ai.core.config.errors import InjectableNotFoundError
+from open_ticket_ai.core.dependency_injection.container import AppModule
+from open_ticket_ai.core.pipes.pipe_factory import PipeFactory
+
+
+def _runner(name: str, expression: str, injects: dict[str, str] | None = None) -> dict:
+    return {
+        "id": f"runner_{name}",
+        "use": "base:SimpleSequentialRunner",
+        "params": {
+            "on": {"id": f"trigger_{name}", "use": "base:IntervalTrigger", "params": {"interval": "PT0S"}},
+            "run": {
+                "id": f"expr_{name}",
+                "use": "base:ExpressionPipe",
+                "injects": injects or {},
+                "params": {"expression": expression},
+            },
+        },
+    }
+
+
+def _config(expression_b: str = "b", queue_size: int = 10, extra_services: dict | None = None) -> OpenTicketAIConfig:
+    return OpenTicketAIConfig.model_validate(
+        {
+            "infrastructure": {"config_reload": {"enabled": False}},
+            "services": {
+                "jinja_default": {"use": "base:JinjaRenderer"},
+                "webhooks": {"use": "base:WebhookIngestionService", "params": {"port": 0, "queue_size": queue_size}},
+                **(extra_services or {}),
+            },
+            "orchestrator": {
+                "id": "orchestrator",
+                "use": "base:SimpleSequentialOrchestrator",
+                "params": {
+                    "orchestrator_sleep": "PT0.001S",
+                    "steps": [_runner("a", "a", {"webhooks": "webhooks"}), _runner("b", expression_b)],
+                },
+            },
+        }
+    )
+
+
+def _pipes_by_id(factory: PipeFactory) -> dict:
+    return {config.id: pipe for (config, _context), pipe in factory._pipes.items()}
+
+
+@pytest.fixture
+def injector(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return Injector([AppModule(AppConfig(open_ticket_ai=_config()))])
+
+
+@contextlib.asynccontextmanager
+async def _running(app: OpenTicketAIApp):
+    task = asyncio.create_task(app.run())
+    await asyncio.sleep(0.05)
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+@pytest.mark.asyncio
+async def test_reload_rebuilds_only_changed_services_and_runners(injector):
+    app, factory = injector.get(OpenTicketAIApp), injector.get(PipeFactory)
+
+    async with _running(app):
+        before = _pipes_by_id(factory)
+        jinja = await factory.get_service("jinja_default")
+        webhooks = await factory.get_service("webhooks")
+
+        diff = await app.reload(_config(expression_b="b2", queue_size=20))
+        await asyncio.sleep(0.05)
+        after = _pipes_by_id(factory)
+        assert await factory.get_service("jinja_default") is jinja
+        assert await factory.get_service("webhooks") is not webhooks
+
+    assert diff.changed_services == {"webhooks"}
+    assert {"expr_a", "expr_b", "runner_b"} <= set(diff.changed_pipes)
+    assert "runner_a" not in diff.changed_pipes
+    assert after["runner_a"] is before["runner_a"]
+    assert after["trigger_a"] is before["trigger_a"]
+    assert after["expr_a"] is not before["expr_a"]
+    assert after["runner_b"] is not before["runner_b"]
+    assert after["expr_b"]._params.expression == "b2"
+
+
+@pytest.mark.asyncio
+async def test_reload_without_changes_keeps_everything(injector):
+    app, factory = injector.get(OpenTicketAIApp), injector.get(PipeFactory)
+
+    async with _running(app):
+        before = _pipes_by_id(factory)
+        diff = await app.reload(_config())
+        after = _pipes_by_id(factory)
+
+    assert not diff.needs_reload
+    assert after == before
+
+
+@pytest.mark.asyncio
+async def test_reload_rejects_unknown_components_and_keeps_running(injector):
+    app, factory = injector.get(OpenTicketAIApp), injector.get(PipeFactory)
+    broken = _config(extra_services={"extra": {"use": "base:Missing"}})
+
+    async with _running(app):
+        before = _pipes_by_id(factory)
+        with pytest.raises(InjectableNotFoundError):
+            await app.reload(broken)
+        await asyncio.sleep(0.02)
+
+        assert _pipes_by_id(factory)["runner_a"] is before["runner_a"]
+        assert not app._orchestrator_task.done()
+
+
+@pytest.mark.asyncio
+async def test_sigterm_drains_running_cycle_and_stops_services(injector):
+    app, factory = injector.get(OpenTicketAIApp), injector.get(PipeFactory)
+    task = asyncio.create_task(app.run())
+    await asyncio.sleep(0.05)
+    webhooks = await factory.get_service("webhooks")
+
+    os.kill(os.getpid(), signal.SIGTERM)
+    summary = await asyncio.wait_for(task, timeout=5)
+
+    assert summary.drained
+    assert summary.failed == ()
+    assert summary.stopped[-1].name == "WebhookIngestionService.webhooks"
+    assert not webhooks._server.is_running
+    assert app._orchestrator_task is None
+
+
+class _StuckOrchestrator:
+    def __init__(self) -> None:
+        self.stop_requested = False
+
+    def request_stop(self) -> None:
+        self.stop_requested = True
+
+    async def process(self, _context: object) -> None:
+        await asyncio.sleep(60)
+
+
+@pytest.mark.asyncio
+async def test_running_cycle_is_cancelled_after_drain_timeout(logger_factory):
+    config = _config().model_copy(deep=True)
+    config.infrastructure.shutdown.drain_timeout = timedelta(milliseconds=20)
+    orchestrator = _StuckOrchestrator()
+    pipe_factory = MagicMock()
+    pipe_factory.create_pipe = AsyncMock(return_value=orchestrator)
+    pipe_factory.aclose = AsyncMock(return_value=[])
+    app = OpenTicketAIApp(config, pipe_factory, logger_factory)
+
+    task = asyncio.create_task(app.run())
+    await asyncio.sleep(0.01)
+    app.request_shutdown()
+    summary = await asyncio.wait_for(task, timeout=5)
+
+    assert orchestrator.stop_requested
+    assert not summary.drained
+    pipe_factory.aclose.assert_awaited_once_with(config.infrastructure.shutdown.stop_timeout)
+
+
+@pytest.mark.asyncio
+async def test_reload_cancels_a_running_cycle_after_the_drain_timeout(logger_factory):
+    config, changed = _config().model_copy(deep=True), _config(expression_b="b2").model_copy(deep=True)
+    for drained_config in (config, changed):
+        drained_config.infrastructure.shutdown.drain_timeout = timedelta(milliseconds=20)
+    stuck, rebuilt = _StuckOrchestrator(), _StuckOrchestrator()
+    pipe_factory = MagicMock()
+    pipe_factory.create_pipe = AsyncMock(side_effect=[stuck, rebuilt])
+    pipe_factory.apply_config = MagicMock(return_value=[])
+    pipe_factory.aclose = AsyncMock(return_value=[])
+    app = OpenTicketAIApp(config, pipe_factory, logger_factory)
+
+    task = asyncio.create_task(app.run())
+    await asyncio.sleep(0.01)
+    stuck_cycle = app._orchestrator_task
+    await asyncio.wait_for(app.reload(changed), timeout=5)
+
+    assert stuck.stop_requested
+    assert stuck_cycle.cancelled()
+    assert app._orchestrator is rebuilt
+    app.request_shutdown()
+    await asyncio.wait_for(task, timeout=5)